@@ -271,7 +271,7 @@ def update_prompt(request, prompt_type: str, data: PromptUpdateIn):
     if data.is_active is not None:
         prompt.is_active = data.is_active
 
-    prompt.save()
+    prompt.save_new_version()
     return prompt
 
 
@@ -350,11 +350,10 @@ def tips_endpoint(request, data: TipsIn):
             },
         )
 
-    # Clear existing tips if regenerate requested
-    if data.regenerate:
-        clear_tips(data.recipe_id)
-
     try:
+        # Clear existing tips if regenerate requested
+        if data.regenerate:
+            clear_tips(data.recipe_id)
         result = generate_tips(data.recipe_id)
     except Exception:
         release_quota(request.auth, "tips")
@@ -11,9 +11,8 @@ from apps.core.auth import SessionAuth
 from apps.profiles.models import Profile
 
 from .api import ErrorOut, handle_ai_errors
-from .models import AIDiscoverySuggestion
 from .services.quota import release_quota, reserve_quota
-from .services.discover import get_discover_suggestions, CACHE_DURATION_HOURS
+from .services.discover import get_discover_suggestions, stored_suggestions
 
 security_logger = logging.getLogger("security")
 
@@ -46,7 +45,7 @@ class DiscoverOut(Schema):
 def discover_endpoint(request, profile_id: int, refresh: bool = False):
     """Get AI discovery suggestions for a profile.
 
-    Returns cached suggestions if still valid (within 24 hours),
+    Returns stored suggestions (precomputed nightly for active profiles),
     otherwise generates new suggestions via AI.
 
     For new users (no favorites), only seasonal suggestions are returned.
@@ -68,20 +67,13 @@ def discover_endpoint(request, profile_id: int, refresh: bool = False):
         return Status(404, {"error": "not_found", "message": f"Profile {profile_id} not found"})
 
     # Only count against quota when OpenRouter is actually called (not cache hits)
-    from datetime import timedelta
-
-    from django.utils import timezone
-
-    cache_cutoff = timezone.now() - timedelta(hours=CACHE_DURATION_HOURS)
-    has_cached = (
-        not refresh and AIDiscoverySuggestion.objects.filter(profile=profile, created_at__gte=cache_cutoff).exists()
-    )
+    has_cached = not refresh and stored_suggestions(profile).exists()
 
     if not has_cached:
         allowed, info = reserve_quota(profile, "discover")
         if not allowed:
             # Quota exhausted — fall back to cached suggestions if available (e.g. refresh requested but already refreshed today)
-            fallback = AIDiscoverySuggestion.objects.filter(profile=profile, created_at__gte=cache_cutoff).exists()
+            fallback = stored_suggestions(profile).exists()
             if fallback:
                 result = get_discover_suggestions(profile_id, force_refresh=False)
                 return result
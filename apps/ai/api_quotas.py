@@ -1,5 +1,5 @@
 """
-AI quota management API endpoints.
+AI quota management and usage statistics API endpoints.
 """
 
 from ninja import Router, Schema, Status
@@ -8,6 +8,7 @@ from apps.core.auth import HomeOnlyAuth, SessionAuth
 from apps.core.models import AppSettings
 
 from .services.quota import get_usage, _next_midnight_utc_iso, ALL_FEATURES, FEATURE_LIMIT_FIELDS
+from .services.telemetry import ai_usage_stats
 
 router = Router(tags=["ai"])
 
@@ -93,3 +94,10 @@ def update_quotas(request, data: QuotaLimitsIn):
 
     profile = request.auth
     return _build_quota_response(profile, app_settings)
+
+
+@router.get("/stats", response={200: dict}, auth=HomeOnlyAuth())
+def get_ai_stats(request, days: int = 7):
+    """AI call latency (p50/p95), tokens, cost, errors and cache hit ratio per feature (admin only)."""
+    days = min(max(days, 1), 90)
+    return {"days": days, "features": ai_usage_stats(days)}
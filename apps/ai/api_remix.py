@@ -50,6 +50,7 @@ class RemixOut(Schema):
     total_time: Optional[int] = None
     yields: str = ""
     servings: Optional[int] = None
+    nutrition_pending: bool = False
 
 
 # Endpoints
@@ -201,4 +202,5 @@ def create_remix_endpoint(request, data: CreateRemixIn):
         "total_time": remix.total_time,
         "yields": remix.yields,
         "servings": remix.servings,
+        "nutrition_pending": remix.nutrition_pending,
     }
@@ -10,7 +10,7 @@ from apps.core.auth import SessionAuth
 from apps.recipes.models import Recipe
 
 from .api import ErrorOut, handle_ai_errors
-from .services.quota import release_quota, reserve_quota
+from .services.quota import QuotaExceededError, release_quota, reserve_quota
 from .services.scaling import scale_recipe, calculate_nutrition
 
 security_logger = logging.getLogger("security")
@@ -63,16 +63,11 @@ def scale_recipe_endpoint(request, data: ScaleIn):
         security_logger.warning("Rate limit hit: /ai/scale from %s", request.META.get("REMOTE_ADDR"))
         return Status(429, {"error": "rate_limited", "message": "Too many requests. Please try again later."})
 
-    allowed, info = reserve_quota(request.auth, "scale")
-    if not allowed:
-        return Status(429, {"error": "quota_exceeded", "message": "Daily limit reached for scale", **info})
-
     from apps.profiles.utils import get_current_profile_or_none
 
     profile = get_current_profile_or_none(request)
 
     if not profile:
-        release_quota(request.auth, "scale")
         return Status(
             404,
             {
@@ -83,7 +78,6 @@ def scale_recipe_endpoint(request, data: ScaleIn):
 
     # Verify the profile_id in the request matches the session profile
     if data.profile_id != profile.id:
-        release_quota(request.auth, "scale")
         return Status(
             404,
             {
@@ -95,7 +89,6 @@ def scale_recipe_endpoint(request, data: ScaleIn):
     try:
         recipe = Recipe.objects.get(id=data.recipe_id)
     except Recipe.DoesNotExist:
-        release_quota(request.auth, "scale")
         return Status(
             404,
             {
@@ -105,7 +98,6 @@ def scale_recipe_endpoint(request, data: ScaleIn):
         )
 
     if recipe.profile_id != profile.id:
-        release_quota(request.auth, "scale")
         return Status(
             404,
             {
@@ -114,15 +106,30 @@ def scale_recipe_endpoint(request, data: ScaleIn):
             },
         )
 
+    # Cached and locally scaled results cost no AI call, so quota is only
+    # reserved once scale_recipe finds it needs the AI
+    reserved = False
+
+    def reserve_for_ai():
+        nonlocal reserved
+        allowed, info = reserve_quota(request.auth, "scale")
+        if not allowed:
+            raise QuotaExceededError(info)
+        reserved = True
+
     try:
         result = scale_recipe(
             recipe_id=data.recipe_id,
             target_servings=data.target_servings,
             profile=profile,
             unit_system=data.unit_system,
+            before_ai=reserve_for_ai,
         )
+    except QuotaExceededError as e:
+        return Status(429, {"error": "quota_exceeded", "message": "Daily limit reached for scale", **e.info})
     except ValueError as e:
-        release_quota(request.auth, "scale")
+        if reserved:
+            release_quota(request.auth, "scale")
         return Status(
             400,
             {
@@ -131,20 +138,19 @@ def scale_recipe_endpoint(request, data: ScaleIn):
             },
         )
     except Exception:
-        release_quota(request.auth, "scale")
+        if reserved:
+            release_quota(request.auth, "scale")
         raise
 
-    # Calculate nutrition if available
-    nutrition = None
-    if recipe.nutrition:
-        nutrition = calculate_nutrition(
-            recipe=recipe,
-            original_servings=recipe.servings,
-            target_servings=data.target_servings,
-        )
+    # Calculate nutrition if available (scraped, or estimated from the ingredients)
+    nutrition = calculate_nutrition(
+        recipe=recipe,
+        original_servings=recipe.servings,
+        target_servings=data.target_servings,
+    )
+    if not nutrition["per_serving"]:
+        nutrition = None
 
-    if result.get("cached"):
-        release_quota(request.auth, "scale")
     return {
         "target_servings": result["target_servings"],
         "original_servings": result["original_servings"],
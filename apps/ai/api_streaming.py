@@ -0,0 +1,135 @@
+"""Streaming (Server-Sent Events) variants of the remix and tips endpoints.
+
+Each endpoint performs the same checks as its JSON counterpart, then
+streams events while the model is still writing:
+
+- ``field``: {"key": ..., "value": ...} for a finished scalar field (remix title first)
+- ``item``: {"key": ..., "value": ...} for each finished ingredient, step or tip
+- ``done``: the validated result, identical to the JSON endpoint's response
+- ``error``: {"error": ..., "message": ...} if generation or validation fails
+"""
+
+import json
+import logging
+
+from django.http import StreamingHttpResponse
+from django_ratelimit.decorators import ratelimit
+from ninja import Router, Status
+
+from apps.core.auth import SessionAuth
+from apps.profiles.utils import get_current_profile_or_none
+from apps.recipes.models import Recipe
+
+from .api import ErrorOut, TipsIn
+from .api_remix import CreateRemixIn, RemixOut
+from .services.openrouter import AIResponseError, AIUnavailableError
+from .services.quota import release_quota, reserve_quota
+from .services.remix import stream_remix
+from .services.tips import clear_tips, stream_tips
+from .services.validator import ValidationError
+
+logger = logging.getLogger(__name__)
+security_logger = logging.getLogger("security")
+
+router = Router(tags=["ai"])
+
+STREAM_ERROR_RESPONSES = {400: ErrorOut, 404: ErrorOut, 429: dict, 503: ErrorOut}
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _event_stream(request, feature: str, events, finish):
+    """Relay service events as SSE; `finish` turns the "done" value into the response payload.
+
+    Quota reserved for the request is released if generation fails.
+    """
+    try:
+        for kind, key, value in events:
+            if kind == "done":
+                yield _sse("done", finish(value))
+            elif kind == "item" or not isinstance(value, (list, dict)):
+                yield _sse(kind, {"key": key, "value": value})
+    except AIUnavailableError as e:
+        release_quota(request.auth, feature)
+        yield _sse(
+            "error",
+            {
+                "error": "ai_unavailable",
+                "message": str(e) or "AI features are not available. Please configure your API key in Settings.",
+                "action": "configure_key",
+            },
+        )
+    except (AIResponseError, ValidationError) as e:
+        release_quota(request.auth, feature)
+        yield _sse("error", {"error": "ai_error", "message": str(e)})
+    except Exception:
+        release_quota(request.auth, feature)
+        logger.exception("Streaming %s failed", feature)
+        yield _sse("error", {"error": "ai_error", "message": "Generation failed"})
+
+
+def _sse_response(stream) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(stream, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx: flush each event immediately
+    return response
+
+
+def _rate_limited(request, path: str):
+    security_logger.warning("Rate limit hit: %s from %s", path, request.META.get("REMOTE_ADDR"))
+    return Status(429, {"error": "rate_limited", "message": "Too many requests. Please try again later."})
+
+
+def _owned_recipe(profile, recipe_id: int) -> Recipe | None:
+    recipe = Recipe.objects.filter(id=recipe_id).first()
+    if not profile or not recipe or recipe.profile_id != profile.id:
+        return None
+    return recipe
+
+
+@router.post("/remix/stream", response=STREAM_ERROR_RESPONSES, auth=SessionAuth())
+@ratelimit(key="ip", rate="10/h", method="POST", block=False)
+def create_remix_stream_endpoint(request, data: CreateRemixIn):
+    """Create a remixed recipe, streaming it as Server-Sent Events."""
+    if getattr(request, "limited", False):
+        return _rate_limited(request, "/ai/remix/stream")
+
+    allowed, info = reserve_quota(request.auth, "remix")
+    if not allowed:
+        return Status(429, {"error": "quota_exceeded", "message": "Daily limit reached for remix", **info})
+
+    profile = get_current_profile_or_none(request)
+    if not profile or data.profile_id != profile.id or not _owned_recipe(profile, data.recipe_id):
+        release_quota(request.auth, "remix")
+        return Status(404, {"error": "not_found", "message": f"Recipe {data.recipe_id} not found"})
+
+    events = stream_remix(recipe_id=data.recipe_id, modification=data.modification, profile=profile)
+    return _sse_response(_event_stream(request, "remix", events, lambda remix: RemixOut.from_orm(remix).dict()))
+
+
+@router.post("/tips/stream", response=STREAM_ERROR_RESPONSES, auth=SessionAuth())
+@ratelimit(key="ip", rate="20/h", method="POST", block=False)
+def tips_stream_endpoint(request, data: TipsIn):
+    """Generate cooking tips, streaming each tip as a Server-Sent Event."""
+    if getattr(request, "limited", False):
+        return _rate_limited(request, "/ai/tips/stream")
+
+    allowed, info = reserve_quota(request.auth, "tips")
+    if not allowed:
+        return Status(429, {"error": "quota_exceeded", "message": "Daily limit reached for tips", **info})
+
+    if not _owned_recipe(get_current_profile_or_none(request), data.recipe_id):
+        release_quota(request.auth, "tips")
+        return Status(404, {"error": "not_found", "message": f"Recipe {data.recipe_id} not found"})
+
+    if data.regenerate:
+        clear_tips(data.recipe_id)
+
+    def finish(result):
+        if result["cached"]:
+            release_quota(request.auth, "tips")
+        return result
+
+    return _sse_response(_event_stream(request, "tips", stream_tips(data.recipe_id), finish))
@@ -0,0 +1,119 @@
+"""
+Management command to backfill AI cooking tips for recipes that have none.
+
+Recipes imported before an API key was configured never get tips. This packs
+several recipes into each prompt and runs the batches concurrently, starting
+at most --rate requests per minute. Each recipe's tips are validated on their
+own, so one bad entry doesn't discard its batch, and results are written with
+bulk_update as batches finish.
+
+Usage:
+    python manage.py generate_tips
+    python manage.py generate_tips --batch-size=8 --concurrency=4 --rate=60
+    python manage.py generate_tips --limit=100
+    python manage.py generate_tips --dry-run     # count recipes, no AI calls
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.ai.models import AIPrompt
+from apps.ai.services.openrouter import AIServiceError, AIUnavailableError, OpenRouterService
+from apps.ai.services.tips import build_batch_tips_prompt, parse_batch_tips
+from apps.recipes.models import Recipe
+
+# Upper bound for a batched request; the response carries tips for every recipe in it
+BATCH_TIMEOUT = 90
+
+
+class RateLimiter:
+    """Space request starts evenly so no more than `per_minute` begin in any minute."""
+
+    def __init__(self, per_minute: int):
+        self.interval = 60.0 / per_minute
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class Command(BaseCommand):
+    help = "Generate AI cooking tips for recipes that have none, several recipes per request"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5, help="Recipes per AI request (default: 5)")
+        parser.add_argument("--concurrency", type=int, default=4, help="AI requests in flight at once (default: 4)")
+        parser.add_argument("--rate", type=int, default=30, help="Maximum AI requests started per minute (default: 30)")
+        parser.add_argument("--limit", type=int, default=None, help="Only process this many recipes")
+        parser.add_argument("--dry-run", action="store_true", help="Report how many recipes need tips, then exit")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        recipes = (
+            Recipe.objects.filter(ai_tips=[])
+            .order_by("id")
+            .only("id", "title", "ingredients", "instructions", "instructions_text", "ai_tips")
+        )
+        if options["limit"]:
+            recipes = recipes[: options["limit"]]
+        recipes = list(recipes)
+
+        if options["dry_run"] or not recipes:
+            self.stdout.write(f"{len(recipes)} recipe(s) without tips.")
+            return
+
+        try:
+            service = OpenRouterService()
+            prompt = AIPrompt.get_prompt("tips_generation")
+        except AIUnavailableError as e:
+            raise CommandError(str(e))
+        except AIPrompt.DoesNotExist:
+            raise CommandError("No active tips_generation prompt")
+
+        batches = [recipes[i : i + batch_size] for i in range(0, len(recipes), batch_size)]
+        self.stdout.write(f"Generating tips for {len(recipes)} recipe(s) in {len(batches)} batch(es)...")
+
+        limiter = RateLimiter(max(1, options["rate"]))
+
+        def run_batch(batch):
+            system_prompt, user_prompt = build_batch_tips_prompt(prompt, batch)
+            limiter.wait()
+            response = service.complete(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                model=prompt.model,
+                json_response=True,
+                timeout=BATCH_TIMEOUT,
+                feature=prompt.prompt_type,
+            )
+            return parse_batch_tips(batch, response)
+
+        saved = failed = 0
+        with ThreadPoolExecutor(max_workers=max(1, options["concurrency"]), thread_name_prefix="tips") as pool:
+            futures = {pool.submit(run_batch, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    tips = future.result()
+                except AIServiceError as e:
+                    self.stderr.write(f"Batch of {len(batch)} failed: {e}")
+                    failed += len(batch)
+                    continue
+
+                updated = [recipe for recipe in batch if recipe.id in tips]
+                for recipe in updated:
+                    recipe.ai_tips = tips[recipe.id]
+                Recipe.objects.bulk_update(updated, ["ai_tips"])
+                saved += len(updated)
+                failed += len(batch) - len(updated)
+
+        self.stdout.write(self.style.SUCCESS(f"Saved tips for {saved} recipe(s), {failed} failed."))
@@ -0,0 +1,79 @@
+"""
+Management command to regenerate Discover suggestions for active profiles.
+
+Run nightly (see crontab) so the Discover page is a plain database read for
+anyone who has used Cookie recently. A profile is active if it viewed or
+imported a recipe in the last --days days. Profiles are refreshed one at a
+time, --stagger seconds apart, to keep well inside OpenRouter rate limits.
+Precomputed suggestions don't count against profiles' daily AI quotas.
+
+Usage:
+    python manage.py precompute_discover
+    python manage.py precompute_discover --days=7 --stagger=10
+    python manage.py precompute_discover --dry-run     # list active profiles, no AI calls
+"""
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.ai.services.discover import SUGGESTION_MAX_AGE_DAYS, refresh_discover_suggestions
+from apps.ai.services.openrouter import OpenRouterService
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe, RecipeViewHistory
+
+
+def active_profiles(days: int):
+    """Profiles that viewed or imported a recipe in the last `days` days."""
+    since = timezone.now() - timedelta(days=days)
+    viewed = RecipeViewHistory.objects.filter(viewed_at__gte=since).values("profile_id")
+    imported = Recipe.objects.filter(scraped_at__gte=since, profile__isnull=False).values("profile_id")
+    return Profile.objects.filter(Q(id__in=viewed) | Q(id__in=imported)).order_by("id")
+
+
+class Command(BaseCommand):
+    help = "Regenerate AI Discover suggestions for recently active profiles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=SUGGESTION_MAX_AGE_DAYS,
+            help=f"Profiles active within this many days (default: {SUGGESTION_MAX_AGE_DAYS})",
+        )
+        parser.add_argument(
+            "--stagger",
+            type=float,
+            default=10.0,
+            help="Seconds to wait between profiles (default: 10)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="List the profiles that would be refreshed")
+
+    def handle(self, *args, **options):
+        profiles = list(active_profiles(max(1, options["days"])))
+
+        if options["dry_run"]:
+            self.stdout.write(f"{len(profiles)} active profile(s): {', '.join(str(p.id) for p in profiles)}")
+            return
+
+        if not OpenRouterService.is_available():
+            self.stdout.write("AI is not configured; skipping Discover precompute.")
+            return
+
+        refreshed = failed = 0
+        for i, profile in enumerate(profiles):
+            if i:
+                time.sleep(options["stagger"])
+            suggestions = refresh_discover_suggestions(profile)
+            if suggestions:
+                refreshed += 1
+            else:
+                failed += 1
+                self.stderr.write(f"No suggestions generated for profile {profile.id}; keeping the previous set.")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed Discover suggestions for {refreshed} profile(s), {failed} failed.")
+        )
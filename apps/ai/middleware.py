@@ -0,0 +1,26 @@
+"""Middleware for AI responses."""
+
+from .services.resilience import model_fallbacks
+
+
+class AIModelFallbackMiddleware:
+    """Report AI calls that fell back to another model in an X-AI-Fallback-Model header.
+
+    The header lists "requested -> used" for each fallback made while
+    handling the request, so clients and logs can tell when a response came
+    from a fallback model (see apps/ai/services/resilience.py).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        fallbacks = []
+        token = model_fallbacks.set(fallbacks)
+        try:
+            response = self.get_response(request)
+        finally:
+            model_fallbacks.reset(token)
+        if fallbacks:
+            response["X-AI-Fallback-Model"] = ", ".join(f"{requested} -> {used}" for requested, used in fallbacks)
+        return response
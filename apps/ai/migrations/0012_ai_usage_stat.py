@@ -0,0 +1,35 @@
+# Generated by Django 6.0.3 on 2026-10-19 10:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai', '0011_remove_search_ranking_prompt'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AIUsageStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateTimeField(help_text='Start of the hour this row aggregates')),
+                ('feature', models.CharField(help_text='Prompt type (or other caller) that made the call', max_length=50)),
+                ('model', models.CharField(blank=True, help_text='Model called; blank for cache hits', max_length=100)),
+                ('outcome', models.CharField(choices=[('success', 'Success'), ('error', 'Error'), ('cache_hit', 'Cache hit')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('total_latency_ms', models.BigIntegerField(default=0)),
+                ('latency_histogram', models.JSONField(default=list, help_text='Call counts per LATENCY_BUCKETS_MS bucket (last entry: slower than the last bound)')),
+                ('prompt_tokens', models.BigIntegerField(default=0)),
+                ('completion_tokens', models.BigIntegerField(default=0)),
+                ('cost', models.FloatField(default=0, help_text='Cost in USD as reported by OpenRouter')),
+            ],
+            options={
+                'verbose_name': 'AI Usage Stat',
+                'verbose_name_plural': 'AI Usage Stats',
+                'ordering': ['-period_start', 'feature'],
+                'unique_together': {('period_start', 'feature', 'model', 'outcome')},
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.3 on 2026-10-19 11:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai", "0012_ai_usage_stat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aiprompt",
+            name="version",
+            field=models.PositiveIntegerField(default=1, help_text="Incremented on every edit (used in AI cache keys)"),
+        ),
+    ]
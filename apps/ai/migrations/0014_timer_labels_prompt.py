@@ -0,0 +1,56 @@
+# Generated by Django 6.0.3 on 2026-10-19 11:35
+
+from django.db import migrations, models
+
+
+def add_timer_labels_prompt(apps, schema_editor):
+    """Create the timer_labels prompt used to label all of a recipe's cook mode timers at once."""
+    AIPrompt = apps.get_model('ai', 'AIPrompt')
+
+    AIPrompt.objects.update_or_create(
+        prompt_type='timer_labels',
+        defaults={
+            'name': 'Cook Mode Timer Labels',
+            'description': "Label all of a recipe's cook mode timers in one request",
+            'system_prompt': '''You are a helpful kitchen assistant.
+Given a numbered list of timers from a recipe, each with its duration and the cooking step it comes from, create a short, descriptive label for every timer.
+
+Always respond with a JSON array of strings, one label per timer, in the same order as the list:
+["Simmer sauce", "Rest dough"]
+
+Each label should be:
+- Concise (2-4 words maximum)
+- Descriptive of what's being timed
+- Action-oriented (e.g., "Simmer sauce", "Rest meat")
+
+IMPORTANT: Respond with ONLY the JSON array, no additional text, explanation, or commentary.''',
+            'user_prompt_template': '''Timers:
+{timers}
+
+Create a short, descriptive label for each of these {count} timers.''',
+            'model': 'anthropic/claude-haiku-4.5',
+            'is_active': True,
+        },
+    )
+
+
+def remove_timer_labels_prompt(apps, schema_editor):
+    """Remove the timer_labels prompt."""
+    AIPrompt = apps.get_model('ai', 'AIPrompt')
+    AIPrompt.objects.filter(prompt_type='timer_labels').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai', '0013_aiprompt_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aiprompt',
+            name='prompt_type',
+            field=models.CharField(choices=[('recipe_remix', 'Recipe Remix'), ('serving_adjustment', 'Serving Adjustment'), ('tips_generation', 'Tips Generation'), ('nutrition_estimate', 'Nutrition Estimate'), ('discover_favorites', 'Discover from Favorites'), ('discover_seasonal', 'Discover Seasonal/Holiday'), ('discover_new', 'Discover Try Something New'), ('search_ranking', 'Search Result Ranking'), ('timer_naming', 'Timer Naming'), ('timer_labels', 'Cook Mode Timer Labels'), ('remix_suggestions', 'Remix Suggestions'), ('selector_repair', 'CSS Selector Repair')], help_text='Unique identifier for this prompt type', max_length=50, unique=True),
+        ),
+        migrations.RunPython(add_timer_labels_prompt, remove_timer_labels_prompt),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-19 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai', '0014_timer_labels_prompt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiusagestat',
+            name='cached_tokens',
+            field=models.BigIntegerField(default=0, help_text='Prompt tokens the provider read from its prompt cache'),
+        ),
+    ]
@@ -1,4 +1,9 @@
+import string
+
 from django.db import models
+from django.db.models import F
+
+_formatter = string.Formatter()
 
 
 class AIDiscoverySuggestion(models.Model):
@@ -49,6 +54,7 @@ class AIPrompt(models.Model):
         ("discover_new", "Discover Try Something New"),
         ("search_ranking", "Search Result Ranking"),
         ("timer_naming", "Timer Naming"),
+        ("timer_labels", "Cook Mode Timer Labels"),
         ("remix_suggestions", "Remix Suggestions"),
         ("selector_repair", "CSS Selector Repair"),
     ]
@@ -85,6 +91,7 @@ class AIPrompt(models.Model):
         help_text="AI model to use for this prompt",
     )
     is_active = models.BooleanField(default=True, help_text="Whether this prompt is enabled")
+    version = models.PositiveIntegerField(default=1, help_text="Incremented on every edit (used in AI cache keys)")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -96,11 +103,103 @@ class AIPrompt(models.Model):
     def __str__(self):
         return self.name
 
+    def save_new_version(self):
+        """Save an edit as a new version, so workers reload it and cached responses aren't reused."""
+        from .services.prompts import clear_prompt_registry
+
+        self.version = F("version") + 1
+        self.save()
+        self.refresh_from_db(fields=["version"])
+        clear_prompt_registry()
+
     def format_user_prompt(self, **kwargs) -> str:
-        """Format the user prompt template with provided variables."""
-        return self.user_prompt_template.format(**kwargs)
+        """Format the user prompt template with provided variables.
+
+        Same result as user_prompt_template.format(**kwargs), but the template
+        is parsed once per prompt instead of on every call.
+        """
+        return self._format(kwargs)
+
+    def user_prompt_prefix(self, varying: str, **kwargs) -> str:
+        """The formatted user prompt up to the first {varying} field.
+
+        Requests that differ only in `varying` (a remix's modification, a
+        target serving size) share this prefix, so it can be marked for
+        provider prompt caching. Without that field it is the whole prompt.
+        """
+        return self._format(kwargs, stop_at=varying)
+
+    def _format(self, kwargs: dict, stop_at: str | None = None) -> str:
+        parts = []
+        for literal, field_name, format_spec, conversion in self._parsed_template():
+            parts.append(literal)
+            if field_name is None:
+                continue
+            if field_name == stop_at:
+                break
+            value = _formatter.get_field(field_name, (), kwargs)[0]
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            if "{" in format_spec:
+                format_spec = _formatter.vformat(format_spec, (), kwargs)
+            parts.append(format(value, format_spec))
+        return "".join(parts)
+
+    def _parsed_template(self) -> list[tuple]:
+        """Parsed user_prompt_template, re-parsed only when the template text changes."""
+        cached = getattr(self, "_template_cache", None)
+        if cached is None or cached[0] != self.user_prompt_template:
+            cached = self._template_cache = (
+                self.user_prompt_template,
+                list(_formatter.parse(self.user_prompt_template)),
+            )
+        return cached[1]
 
     @classmethod
     def get_prompt(cls, prompt_type: str) -> "AIPrompt":
-        """Get an active prompt by type, raises DoesNotExist if not found."""
-        return cls.objects.get(prompt_type=prompt_type, is_active=True)
+        """Get an active prompt by type from the worker's registry, raises DoesNotExist if not found."""
+        from .services.prompts import get_active_prompt
+
+        return get_active_prompt(prompt_type)
+
+
+class AIUsageStat(models.Model):
+    """Hourly aggregate of AI calls per feature, model and outcome.
+
+    Upstream calls are recorded as success/error with latency and token
+    usage (including prompt tokens served from the provider's prompt cache);
+    requests answered by a cache (shared response cache, decorator
+    caches, or results stored on models) are recorded as cache_hit.
+    """
+
+    OUTCOME_SUCCESS = "success"
+    OUTCOME_ERROR = "error"
+    OUTCOME_CACHE_HIT = "cache_hit"
+    OUTCOMES = [
+        (OUTCOME_SUCCESS, "Success"),
+        (OUTCOME_ERROR, "Error"),
+        (OUTCOME_CACHE_HIT, "Cache hit"),
+    ]
+
+    period_start = models.DateTimeField(help_text="Start of the hour this row aggregates")
+    feature = models.CharField(max_length=50, help_text="Prompt type (or other caller) that made the call")
+    model = models.CharField(max_length=100, blank=True, help_text="Model called; blank for cache hits")
+    outcome = models.CharField(max_length=20, choices=OUTCOMES)
+    count = models.PositiveIntegerField(default=0)
+    total_latency_ms = models.BigIntegerField(default=0)
+    latency_histogram = models.JSONField(
+        default=list, help_text="Call counts per LATENCY_BUCKETS_MS bucket (last entry: slower than the last bound)"
+    )
+    prompt_tokens = models.BigIntegerField(default=0)
+    completion_tokens = models.BigIntegerField(default=0)
+    cached_tokens = models.BigIntegerField(default=0, help_text="Prompt tokens the provider read from its prompt cache")
+    cost = models.FloatField(default=0, help_text="Cost in USD as reported by OpenRouter")
+
+    class Meta:
+        ordering = ["-period_start", "feature"]
+        verbose_name = "AI Usage Stat"
+        verbose_name_plural = "AI Usage Stats"
+        unique_together = ["period_start", "feature", "model", "outcome"]
+
+    def __str__(self):
+        return f"{self.period_start:%Y-%m-%d %H:00} {self.feature} {self.outcome}: {self.count}"
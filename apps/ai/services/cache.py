@@ -3,16 +3,32 @@
 import hashlib
 import json
 import logging
+import threading
+import time
+from concurrent.futures import Future
+from collections.abc import Iterator
 from functools import wraps
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from django.core.cache import cache
 
+from ..models import AIPrompt
+from .streaming import json_events
+from .telemetry import record_cache_hit
+
 logger = logging.getLogger(__name__)
 
 # Cache timeout constants (in seconds)
 CACHE_TIMEOUT_SHORT = 60 * 30  # 30 minutes - for timer names
 CACHE_TIMEOUT_MEDIUM = 60 * 60 * 4  # 4 hours - for remix suggestions
+CACHE_TIMEOUT_LONG = 60 * 60 * 24 * 7  # 7 days - for content-addressed completions
+
+# How often a worker waiting on another worker's identical request checks for its result
+INFLIGHT_POLL_INTERVAL = 0.25
+
+# Identical requests currently being answered by this process: {cache key: Future}
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
 
 
 def _make_cache_key(prefix: str, *args, **kwargs) -> str:
@@ -44,6 +60,7 @@ def cache_ai_response(
     timeout: int = CACHE_TIMEOUT_MEDIUM,
     key_args: Optional[list[int]] = None,
     key_kwargs: Optional[list[str]] = None,
+    feature: Optional[str] = None,
 ) -> Callable:
     """Decorator to cache AI service responses.
 
@@ -52,6 +69,7 @@ def cache_ai_response(
         timeout: Cache timeout in seconds.
         key_args: Indices of positional args to include in cache key (default: all).
         key_kwargs: Names of kwargs to include in cache key (default: all).
+        feature: Feature name for cache hits in AI telemetry (default: prefix).
 
     Returns:
         Decorated function that caches its results.
@@ -82,6 +100,7 @@ def cache_ai_response(
             cached_result = cache.get(cache_key)
             if cached_result is not None:
                 logger.debug(f"Cache hit for {prefix}: {cache_key}")
+                record_cache_hit(feature or prefix)
                 return cached_result
 
             # Call the actual function
@@ -117,3 +136,194 @@ def invalidate_ai_cache(prefix: str, *args, **kwargs) -> bool:
     """
     cache_key = _make_cache_key(prefix, *args, **kwargs)
     return cache.delete(cache_key)
+
+
+def completion_cache_key(prompt, user_prompt: str) -> str:
+    """Content address of a rendered prompt.
+
+    Hashes (prompt type, prompt version, model, system prompt, rendered user
+    prompt), so any profile or recipe that renders the same prompt shares
+    the same entry, and editing the prompt or its model starts a new one.
+    """
+    key_data = [prompt.prompt_type, prompt.version, prompt.model, prompt.system_prompt, user_prompt]
+    key_hash = hashlib.sha256(json.dumps(key_data).encode()).hexdigest()
+    return f"ai:completion:{key_hash}"
+
+
+def cached_completion(
+    service,
+    prompt,
+    user_prompt: str,
+    validate: Callable[[Any], Any],
+    timeout: int = 30,
+    cache_prefix: str = "",
+) -> Any:
+    """Complete a rendered prompt through the shared content-addressed cache.
+
+    Concurrent identical requests share one upstream call: threads in this
+    process wait on the first caller, and other workers wait (up to
+    `timeout`) for the worker holding the in-flight lock to store its result.
+
+    Args:
+        service: The OpenRouterService to call on a miss.
+        prompt: The AIPrompt that was rendered.
+        user_prompt: The rendered user prompt.
+        validate: Turns the raw response into the value to cache and return.
+            Raising keeps an invalid response out of the cache.
+        timeout: Upstream request timeout in seconds.
+        cache_prefix: Start of user_prompt to mark for provider prompt
+            caching (see OpenRouterService.complete()).
+
+    Returns:
+        The validated response.
+    """
+    cache_key = completion_cache_key(prompt, user_prompt)
+    result = cache.get(cache_key)
+    if result is not None:
+        record_ai_cache_event(prompt.prompt_type, hit=True)
+        return result
+
+    with _inflight_lock:
+        future = _inflight.get(cache_key)
+        leader = future is None
+        if leader:
+            future = _inflight[cache_key] = Future()
+
+    if not leader:
+        result = future.result()
+        record_ai_cache_event(prompt.prompt_type, hit=True)
+        return result
+
+    try:
+        result = _complete_once(service, prompt, user_prompt, validate, timeout, cache_key, cache_prefix)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
+
+
+def _complete_once(service, prompt, user_prompt, validate, timeout, cache_key, cache_prefix=""):
+    """Call upstream unless another worker is already doing so for the same prompt."""
+    lock_key = f"{cache_key}:inflight"
+    owns_lock = cache.add(lock_key, 1, timeout + 5)
+    if not owns_lock:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(INFLIGHT_POLL_INTERVAL)
+            result = cache.get(cache_key)
+            if result is not None:
+                record_ai_cache_event(prompt.prompt_type, hit=True)
+                return result
+            if cache.get(lock_key) is None:
+                break  # the other worker failed; make the call ourselves
+        logger.debug(f"Gave up waiting for in-flight {prompt.prompt_type} request: {cache_key}")
+
+    try:
+        response = service.complete(
+            system_prompt=prompt.system_prompt,
+            user_prompt=user_prompt,
+            model=prompt.model,
+            json_response=True,
+            timeout=timeout,
+            feature=prompt.prompt_type,
+            cache_prefix=cache_prefix,
+        )
+        result = validate(response)
+        try:
+            cache.set(cache_key, result, CACHE_TIMEOUT_LONG)
+        except Exception:
+            logger.warning(f"Could not cache {prompt.prompt_type} response", exc_info=True)
+    finally:
+        if owns_lock:
+            cache.delete(lock_key)
+
+    record_ai_cache_event(prompt.prompt_type, hit=False)
+    return result
+
+
+def cached_stream_json(
+    service,
+    prompt,
+    user_prompt: str,
+    validate: Callable[[Any], Any],
+    timeout: int = 30,
+    cache_prefix: str = "",
+) -> Iterator[tuple[str, str | None, Any]]:
+    """Stream a rendered prompt's JSON response through the shared content-addressed cache.
+
+    A cached response is replayed as the events streaming it would have
+    produced; otherwise the model's events are relayed as they arrive and
+    the validated response is stored for cached_completion() and later
+    streams. Arguments are as for cached_completion().
+
+    Yields:
+        IncrementalJSONParser events, then ("done", None, validated response).
+    """
+    cache_key = completion_cache_key(prompt, user_prompt)
+    result = cache.get(cache_key)
+    if result is not None:
+        record_ai_cache_event(prompt.prompt_type, hit=True)
+        yield from json_events(result)
+        yield "done", None, result
+        return
+
+    for event in service.stream_json(
+        system_prompt=prompt.system_prompt,
+        user_prompt=user_prompt,
+        model=prompt.model,
+        timeout=timeout,
+        feature=prompt.prompt_type,
+        cache_prefix=cache_prefix,
+    ):
+        if event[0] != "done":
+            yield event
+            continue
+        result = validate(event[2])
+        try:
+            cache.set(cache_key, result, CACHE_TIMEOUT_LONG)
+        except Exception:
+            logger.warning(f"Could not cache {prompt.prompt_type} response", exc_info=True)
+        record_ai_cache_event(prompt.prompt_type, hit=False)
+        yield "done", None, result
+
+
+def invalidate_completion(prompt, user_prompt: str) -> bool:
+    """Drop the cached response for a rendered prompt (e.g. when the user asks to regenerate)."""
+    return cache.delete(completion_cache_key(prompt, user_prompt))
+
+
+def _stats_key(feature: str, outcome: str) -> str:
+    return f"ai:cache_stats:{feature}:{outcome}"
+
+
+def record_ai_cache_event(feature: str, hit: bool) -> None:
+    """Count a content-addressed cache hit or miss for a feature (prompt type)."""
+    if hit:
+        record_cache_hit(feature)
+    key = _stats_key(feature, "hits" if hit else "misses")
+    try:
+        cache.add(key, 0, None)
+        cache.incr(key)
+    except Exception:
+        logger.debug(f"Could not record AI cache stats for {feature}", exc_info=True)
+
+
+def ai_cache_stats() -> dict[str, dict]:
+    """Hit/miss counts and hit ratio per feature, for features that have been called."""
+    stats = {}
+    for feature, _ in AIPrompt.PROMPT_TYPES:
+        hits = cache.get(_stats_key(feature, "hits"), 0)
+        misses = cache.get(_stats_key(feature, "misses"), 0)
+        if hits or misses:
+            stats[feature] = {"hits": hits, "misses": misses, "hit_ratio": round(hits / (hits + misses), 3)}
+    return stats
+
+
+def reset_ai_cache_stats() -> None:
+    """Zero the per-feature hit/miss counters."""
+    cache.delete_many([_stats_key(f, outcome) for f, _ in AIPrompt.PROMPT_TYPES for outcome in ("hits", "misses")])
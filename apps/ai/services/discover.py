@@ -1,10 +1,12 @@
 """AI discovery suggestions service."""
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List
 
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import transaction
 from django.utils import timezone
 
 from apps.profiles.models import Profile
@@ -12,25 +14,39 @@ from apps.recipes.models import RecipeFavorite, RecipeViewHistory
 
 from ..models import AIPrompt, AIDiscoverySuggestion
 from .openrouter import OpenRouterService, AIUnavailableError, AIResponseError
+from .telemetry import record_cache_hit
 from .validator import AIResponseValidator, ValidationError
 
 logger = logging.getLogger(__name__)
 
-# Suggestions are cached for 24 hours
-CACHE_DURATION_HOURS = 24
+# Suggestions are regenerated nightly for active profiles by precompute_discover,
+# so requests serve stored rows up to this age and only generate inline for
+# profiles that have none (new or long-inactive users)
+SUGGESTION_MAX_AGE_DAYS = 7
+
+# Seconds allowed for each suggestion type's AI call; a type that takes
+# longer is left out of the set rather than holding up the others
+GENERATION_TIMEOUT = 30
+
+# Suggestion type -> prompt that generates it
+SUGGESTION_PROMPTS = {
+    "seasonal": "discover_seasonal",
+    "favorites": "discover_favorites",
+    "new": "discover_new",
+}
 
 
 def get_discover_suggestions(profile_id: int, force_refresh: bool = False) -> dict:
     """Get AI discovery suggestions for a profile.
 
-    Returns cached suggestions if still valid (within 24 hours),
+    Returns stored suggestions if any are younger than SUGGESTION_MAX_AGE_DAYS,
     otherwise generates new suggestions via AI.
 
     For new users (no favorites), only seasonal suggestions are returned.
 
     Args:
         profile_id: The ID of the profile to get suggestions for.
-        force_refresh: If True, bypass cache and regenerate suggestions.
+        force_refresh: If True, bypass stored suggestions and regenerate them.
 
     Returns:
         Dict with suggestions array and refresh timestamp.
@@ -41,37 +57,17 @@ def get_discover_suggestions(profile_id: int, force_refresh: bool = False) -> di
     """
     profile = Profile.objects.get(id=profile_id)
 
-    # Check for cached suggestions (within 24 hours) unless force refresh
+    # Serve stored suggestions unless force refresh
     if not force_refresh:
-        cache_cutoff = timezone.now() - timedelta(hours=CACHE_DURATION_HOURS)
-        cached = AIDiscoverySuggestion.objects.filter(profile=profile, created_at__gte=cache_cutoff)
+        cached = list(stored_suggestions(profile))
 
-        if cached.exists():
+        if cached:
             logger.info(f"Returning cached discover suggestions for profile {profile_id}")
+            for suggestion_type in {s.suggestion_type for s in cached}:
+                record_cache_hit(f"discover_{suggestion_type}")
             return _format_suggestions(cached)
 
-    # Clear old suggestions
-    AIDiscoverySuggestion.objects.filter(profile=profile).delete()
-
-    # Check if user has viewing history
-    has_history = RecipeViewHistory.objects.filter(profile=profile).exists()
-
-    # Generate new suggestions — parallelize LLM calls to avoid sequential latency
-    suggestions = []
-
-    if has_history:
-        # Run all 3 suggestion types in parallel to reduce wall-clock time (~16s → ~5s)
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            seasonal_future = executor.submit(_generate_in_thread, _generate_seasonal_suggestions, profile)
-            recommended_future = executor.submit(_generate_in_thread, _generate_recommended_suggestions, profile)
-            new_future = executor.submit(_generate_in_thread, _generate_new_suggestions, profile)
-
-            suggestions.extend(seasonal_future.result())
-            suggestions.extend(recommended_future.result())
-            suggestions.extend(new_future.result())
-    else:
-        # New user — only seasonal, no need for threads
-        suggestions.extend(_generate_seasonal_suggestions(profile))
+    suggestions = refresh_discover_suggestions(profile)
 
     if not suggestions:
         # If no suggestions generated, return empty
@@ -83,6 +79,50 @@ def get_discover_suggestions(profile_id: int, force_refresh: bool = False) -> di
     return _format_suggestions(suggestions)
 
 
+def stored_suggestions(profile: Profile):
+    """Suggestions for a profile that are recent enough to serve without regenerating."""
+    cutoff = timezone.now() - timedelta(days=SUGGESTION_MAX_AGE_DAYS)
+    return AIDiscoverySuggestion.objects.filter(profile=profile, created_at__gte=cutoff)
+
+
+def refresh_discover_suggestions(profile: Profile) -> List[AIDiscoverySuggestion]:
+    """Generate a new set of suggestions for a profile, replacing the stored set.
+
+    Synchronous entry point for views and management commands; see
+    refresh_discover_suggestions_async().
+    """
+    return async_to_sync(refresh_discover_suggestions_async)(profile)
+
+
+async def refresh_discover_suggestions_async(profile: Profile) -> List[AIDiscoverySuggestion]:
+    """Generate all suggestion types concurrently on one event loop.
+
+    Prompts and history are read in one pass, the AI calls are gathered, and
+    whatever was generated is saved in one transaction. A type that fails or
+    takes longer than GENERATION_TIMEOUT is left out, so the other types are
+    still returned. The old set is only deleted once something new has been
+    generated, so a failed refresh keeps serving the previous suggestions.
+    """
+    started = timezone.now()
+
+    requests = await sync_to_async(_load_requests)(profile)
+    if not requests:
+        return []
+
+    try:
+        service = await sync_to_async(OpenRouterService)()
+    except AIUnavailableError as e:
+        logger.warning(f"Failed to generate discover suggestions: {e}")
+        return []
+
+    results = await asyncio.gather(
+        *(_generate(service, suggestion_type, prompt, user_prompt) for suggestion_type, prompt, user_prompt in requests)
+    )
+    generated = [(suggestion_type, items) for (suggestion_type, _, _), items in zip(requests, results)]
+
+    return await sync_to_async(_save_suggestions)(profile, started, generated)
+
+
 def _format_suggestions(suggestions) -> dict:
     """Format suggestions for API response."""
     result = []
@@ -112,169 +152,93 @@ def _format_suggestions(suggestions) -> dict:
     }
 
 
-def _generate_in_thread(func, profile):
-    """Run a generation function in a thread with proper DB connection handling."""
-    from django.db import close_old_connections
-
-    close_old_connections()
-    try:
-        return func(profile)
-    finally:
-        close_old_connections()
-
-
-def _generate_seasonal_suggestions(profile: Profile) -> List[AIDiscoverySuggestion]:
-    """Generate seasonal/holiday suggestions."""
-    try:
-        prompt = AIPrompt.get_prompt("discover_seasonal")
-    except AIPrompt.DoesNotExist:
-        logger.warning("discover_seasonal prompt not found")
-        return []
-
-    # Get current date info
-    now = datetime.now()
-    date_str = now.strftime("%B %d, %Y")  # e.g., "January 15, 2024"
-    season = _get_season(now)
+def _load_requests(profile: Profile) -> list[tuple[str, AIPrompt, str]]:
+    """Build (suggestion_type, prompt, user_prompt) for each type this profile gets.
 
-    user_prompt = prompt.format_user_prompt(
-        date=date_str,
-        season=season,
+    New users (no viewing history) only get seasonal suggestions.
+    """
+    prompts = {}
+    for prompt_type in SUGGESTION_PROMPTS.values():
+        try:
+            prompts[prompt_type] = AIPrompt.get_prompt(prompt_type)
+        except AIPrompt.DoesNotExist:
+            continue
+    history = list(
+        RecipeViewHistory.objects.filter(profile=profile).select_related("recipe").order_by("-viewed_at")[:15]
     )
 
-    try:
-        service = OpenRouterService()
-        response = service.complete(
-            system_prompt=prompt.system_prompt,
-            user_prompt=user_prompt,
-            model=prompt.model,
-            json_response=True,
-        )
-
-        validator = AIResponseValidator()
-        validated = validator.validate("discover_seasonal", response)
-
-        # Create and save suggestions
-        suggestions = []
-        for item in validated:
-            suggestion = AIDiscoverySuggestion.objects.create(
-                profile=profile,
-                suggestion_type="seasonal",
-                search_query=item["search_query"],
-                title=item["title"],
-                description=item["description"],
+    now = datetime.now()
+    variables = {"seasonal": {"date": now.strftime("%B %d, %Y"), "season": _get_season(now)}}
+    if history:
+        variables["favorites"] = {
+            "favorites": "\n".join(
+                f"- {item.recipe.title} ({item.recipe.cuisine or item.recipe.category or 'uncategorized'})"
+                for item in history
             )
-            suggestions.append(suggestion)
-
-        logger.info(f"Generated {len(suggestions)} seasonal suggestions for profile {profile.id}")
-        return suggestions
-
-    except (AIUnavailableError, AIResponseError, ValidationError) as e:
-        logger.warning(f"Failed to generate seasonal suggestions: {e}")
-        return []
-
-
-def _generate_recommended_suggestions(profile: Profile) -> List[AIDiscoverySuggestion]:
-    """Generate suggestions based on user's viewing history."""
-    try:
-        prompt = AIPrompt.get_prompt("discover_favorites")
-    except AIPrompt.DoesNotExist:
-        logger.warning("discover_favorites prompt not found")
-        return []
-
-    # Get user's recently viewed recipes
-    history = RecipeViewHistory.objects.filter(profile=profile).select_related("recipe").order_by("-viewed_at")[:15]
-    if not history:
-        return []
+        }
+        variables["new"] = {
+            "history": "\n".join(
+                f"- {item.recipe.title} ({item.recipe.cuisine or 'unknown cuisine'}, "
+                f"{item.recipe.category or 'unknown category'})"
+                for item in history
+            )
+        }
 
-    # Format history list
-    history_list = "\n".join(
-        f"- {item.recipe.title} ({item.recipe.cuisine or item.recipe.category or 'uncategorized'})" for item in history
-    )
+    requests = []
+    for suggestion_type, kwargs in variables.items():
+        prompt = prompts.get(SUGGESTION_PROMPTS[suggestion_type])
+        if prompt is None:
+            logger.warning(f"{SUGGESTION_PROMPTS[suggestion_type]} prompt not found")
+            continue
+        requests.append((suggestion_type, prompt, prompt.format_user_prompt(**kwargs)))
+    return requests
 
-    user_prompt = prompt.format_user_prompt(favorites=history_list)
 
+async def _generate(service: OpenRouterService, suggestion_type: str, prompt: AIPrompt, user_prompt: str) -> list:
+    """Call the AI for one suggestion type and return its validated items, or [] on failure."""
     try:
-        service = OpenRouterService()
-        response = service.complete(
-            system_prompt=prompt.system_prompt,
-            user_prompt=user_prompt,
-            model=prompt.model,
-            json_response=True,
+        response = await asyncio.wait_for(
+            service.complete_async(
+                system_prompt=prompt.system_prompt,
+                user_prompt=user_prompt,
+                model=prompt.model,
+                json_response=True,
+                timeout=GENERATION_TIMEOUT,
+                feature=prompt.prompt_type,
+            ),
+            GENERATION_TIMEOUT,
         )
-
-        validator = AIResponseValidator()
-        validated = validator.validate("discover_favorites", response)
-
-        # Create and save suggestions
-        suggestions = []
-        for item in validated:
-            suggestion = AIDiscoverySuggestion.objects.create(
-                profile=profile,
-                suggestion_type="favorites",  # Keep type for frontend compatibility
-                search_query=item["search_query"],
-                title=item["title"],
-                description=item["description"],
-            )
-            suggestions.append(suggestion)
-
-        logger.info(f"Generated {len(suggestions)} recommended suggestions for profile {profile.id}")
-        return suggestions
-
+        return AIResponseValidator().validate(prompt.prompt_type, response)
+    except asyncio.TimeoutError:
+        logger.warning(f"Timed out generating {suggestion_type} suggestions after {GENERATION_TIMEOUT}s")
     except (AIUnavailableError, AIResponseError, ValidationError) as e:
-        logger.warning(f"Failed to generate recommended suggestions: {e}")
-        return []
-
-
-def _generate_new_suggestions(profile: Profile) -> List[AIDiscoverySuggestion]:
-    """Generate suggestions for trying something new."""
-    try:
-        prompt = AIPrompt.get_prompt("discover_new")
-    except AIPrompt.DoesNotExist:
-        logger.warning("discover_new prompt not found")
-        return []
-
-    # Get user's recent recipes from history to understand their preferences
-    history = RecipeViewHistory.objects.filter(profile=profile).select_related("recipe").order_by("-viewed_at")[:15]
-    if not history:
-        return []
-
-    recent_recipes = "\n".join(
-        f"- {item.recipe.title} ({item.recipe.cuisine or 'unknown cuisine'}, {item.recipe.category or 'unknown category'})"
-        for item in history
-    )
-
-    user_prompt = prompt.format_user_prompt(history=recent_recipes)
-
-    try:
-        service = OpenRouterService()
-        response = service.complete(
-            system_prompt=prompt.system_prompt,
-            user_prompt=user_prompt,
-            model=prompt.model,
-            json_response=True,
+        logger.warning(f"Failed to generate {suggestion_type} suggestions: {e}")
+    return []
+
+
+def _save_suggestions(profile: Profile, started, generated: list[tuple[str, list]]) -> List[AIDiscoverySuggestion]:
+    """Store the generated suggestions and drop the set they replace, in one transaction."""
+    suggestions = [
+        AIDiscoverySuggestion(
+            profile=profile,
+            suggestion_type=suggestion_type,
+            search_query=item["search_query"],
+            title=item["title"],
+            description=item["description"],
         )
+        for suggestion_type, items in generated
+        for item in items
+    ]
+    if not suggestions:
+        return []
 
-        validator = AIResponseValidator()
-        validated = validator.validate("discover_new", response)
-
-        # Create and save suggestions
-        suggestions = []
-        for item in validated:
-            suggestion = AIDiscoverySuggestion.objects.create(
-                profile=profile,
-                suggestion_type="new",
-                search_query=item["search_query"],
-                title=item["title"],
-                description=item["description"],
-            )
-            suggestions.append(suggestion)
-
-        logger.info(f"Generated {len(suggestions)} try-new suggestions for profile {profile.id}")
-        return suggestions
+    with transaction.atomic():
+        AIDiscoverySuggestion.objects.bulk_create(suggestions)
+        AIDiscoverySuggestion.objects.filter(profile=profile, created_at__lt=started).delete()
 
-    except (AIUnavailableError, AIResponseError, ValidationError) as e:
-        logger.warning(f"Failed to generate try-new suggestions: {e}")
-        return []
+    for suggestion_type, items in generated:
+        logger.info(f"Generated {len(items)} {suggestion_type} suggestions for profile {profile.id}")
+    return suggestions
 
 
 def _get_season(dt: datetime) -> str:
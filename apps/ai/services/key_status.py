@@ -0,0 +1,78 @@
+"""Shared OpenRouter API key validity, refreshed in the background.
+
+The status of each key is kept in the Django cache (the database cache in
+production), so every worker process sees the same answer. Reading it never
+calls OpenRouter: when the stored status is older than KEY_STATUS_TTL, or
+missing, a refresh job is queued for the run_jobs worker and the previous
+status is returned meanwhile. A key that has never been checked is assumed
+valid until the worker says otherwise.
+"""
+
+import hashlib
+import logging
+import time
+
+from django.core.cache import cache
+
+from apps.core.jobs import enqueue_job
+from apps.core.models import AppSettings
+
+logger = logging.getLogger(__name__)
+
+KEY_STATUS_TTL = 300  # Refresh a stored status once it is this old (5 minutes)
+KEY_STATUS_MAX_AGE = 60 * 60 * 24  # Keep serving a stale status this long if refreshes keep failing
+REFRESH_LOCK_SECONDS = 60  # At most one refresh queued per key in this window, across workers
+
+
+def _cache_key(api_key: str) -> str:
+    # SHA-256 used as a cache lookup key (not for password storage)
+    return f"ai_key_status:{hashlib.sha256(api_key.encode()).hexdigest()}"  # nosec
+
+
+def get_key_status(api_key: str) -> tuple[bool, str | None]:
+    """Return (is_valid, error) for a key, queueing a refresh if the status is stale or missing."""
+    entry = cache.get(_cache_key(api_key))
+    if entry is None or time.time() - entry["checked_at"] >= KEY_STATUS_TTL:
+        schedule_key_refresh(api_key)
+    if entry is None:
+        return True, None
+    return entry["valid"], entry["error"]
+
+
+def store_key_status(api_key: str, is_valid: bool, error: str | None = None) -> None:
+    """Record the result of a key check for every worker to read."""
+    entry = {"valid": is_valid, "error": None if is_valid else error, "checked_at": time.time()}
+    cache.set(_cache_key(api_key), entry, KEY_STATUS_MAX_AGE)
+
+
+def forget_key_status(api_key: str) -> None:
+    """Drop a key's stored status and queue a fresh check."""
+    cache.delete(_cache_key(api_key))
+    cache.delete(f"{_cache_key(api_key)}:refreshing")
+    schedule_key_refresh(api_key)
+
+
+def schedule_key_refresh(api_key: str) -> None:
+    """Queue a background check of the configured key, unless one was queued recently."""
+    if cache.add(f"{_cache_key(api_key)}:refreshing", True, REFRESH_LOCK_SECONDS):
+        enqueue_job("refresh_ai_key_status")
+
+
+def run_key_status_job(job) -> None:
+    """Background job handler: check the configured key and store its status.
+
+    Raises when OpenRouter can't be reached, so the job is retried and the
+    previous status keeps being served.
+    """
+    # Import here to avoid circular imports
+    from .openrouter import AIResponseError, OpenRouterService
+
+    api_key = AppSettings.get().openrouter_api_key
+    if not api_key:
+        return
+
+    is_valid, message = OpenRouterService.check_key(api_key)
+    if is_valid is None:
+        raise AIResponseError(message)
+    store_key_status(api_key, is_valid, message)
+    logger.info(f"OpenRouter API key is {'valid' if is_valid else 'invalid'}")
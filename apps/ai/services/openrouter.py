@@ -1,15 +1,34 @@
 """OpenRouter API service using the official SDK."""
 
-import hashlib
+import asyncio
+import importlib.util
 import json
 import logging
+import threading
 import time
+import weakref
+from collections.abc import Iterator
 from typing import Any
 
+import httpx
+from asgiref.sync import sync_to_async
 from openrouter import OpenRouter
 
 from apps.core.models import AppSettings
 
+from ..models import AIUsageStat
+from .key_status import forget_key_status, get_key_status
+from .resilience import (
+    call_with_policy,
+    call_with_policy_async,
+    choose_model,
+    get_breaker,
+    in_flight_slot,
+    is_transient,
+)
+from .streaming import IncrementalJSONParser
+from .telemetry import record_ai_call
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,13 +50,118 @@ class AIResponseError(AIServiceError):
     pass
 
 
+# Keep-alive connection pools shared by every OpenRouter call in this process,
+# so AI requests reuse TLS connections instead of handshaking each time.
+# HTTP/2 is used when the optional h2 package is installed.
+_HTTP_CLIENT_OPTIONS = {
+    "follow_redirects": True,
+    "http2": importlib.util.find_spec("h2") is not None,
+    "limits": httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+}
+_http_client: httpx.Client | None = None
+# Handed to the SDK by sync calls, which never use it, so it doesn't build one per call
+_idle_async_http_client: httpx.AsyncClient | None = None
+_http_client_lock = threading.Lock()
+# httpx.AsyncClient is bound to the event loop it first runs on, and async
+# views served under WSGI each get a fresh loop, so async pools are per loop:
+# {loop: (client, task that closes the client when the loop shuts down)}
+_async_http_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client, creating it on first use."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(**_HTTP_CLIENT_OPTIONS)
+        return _http_client
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Return the pooled async HTTP client for the running event loop.
+
+    Outside an event loop this is an idle shared client for sync calls to hand over.
+    """
+    global _idle_async_http_client
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        with _http_client_lock:
+            if _idle_async_http_client is None:
+                _idle_async_http_client = httpx.AsyncClient(**_HTTP_CLIENT_OPTIONS)
+            return _idle_async_http_client
+    entry = _async_http_clients.get(loop)
+    if entry is None:
+        client = httpx.AsyncClient(**_HTTP_CLIENT_OPTIONS)
+        entry = _async_http_clients[loop] = (client, loop.create_task(_close_with_loop(loop, client)))
+    return entry[0]
+
+
+def _pooled_clients() -> dict[str, httpx.Client | httpx.AsyncClient]:
+    """Both pooled clients as OpenRouter(...) keyword arguments.
+
+    The SDK builds (and then discards) its own client for whichever one isn't
+    passed, so every construction passes both. The async pool is per event
+    loop, so under WSGI, where each async view runs on a fresh loop, async
+    calls get no connection reuse from it; the sync pool is shared process-wide.
+    """
+    return {"client": _get_http_client(), "async_client": _get_async_http_client()}
+
+
+async def _close_with_loop(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """Hold the loop's async client open until the loop shuts down (or pools are reset), then close it."""
+    try:
+        await asyncio.Event().wait()
+    finally:
+        if _async_http_clients.get(loop, (None,))[0] is client:
+            del _async_http_clients[loop]
+        await client.aclose()
+
+
+# Prompt-cache breakpoint. Anthropic and Gemini models cache the prompt up to
+# each marked content part for a few minutes; OpenRouter drops the marker for
+# providers that cache long prefixes automatically (OpenAI, DeepSeek, ...).
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _messages(system_prompt: str, user_prompt: str, cache_prefix: str = "") -> list[dict]:
+    """Chat messages marking the system prompt, and cache_prefix of the user prompt, as cacheable.
+
+    cache_prefix is the start of user_prompt that repeats across requests
+    (usually the recipe); it is ignored if user_prompt doesn't start with it.
+    """
+    system: str | list[dict] = system_prompt
+    if system_prompt:
+        system = [{"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}]
+    user: str | list[dict] = user_prompt
+    if cache_prefix and user_prompt.startswith(cache_prefix):
+        user = [{"type": "text", "text": cache_prefix, "cache_control": _CACHE_CONTROL}]
+        if len(user_prompt) > len(cache_prefix):
+            user.append({"type": "text", "text": user_prompt[len(cache_prefix) :]})
+    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+
+def _elapsed_ms(started: float) -> int:
+    return round((time.monotonic() - started) * 1000)
+
+
+def reset_http_clients() -> None:
+    """Close the pooled clients; the next call builds fresh ones."""
+    global _http_client, _idle_async_http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+        _idle_async_http_client = None
+    if client is not None:
+        client.close()
+    for loop, (_, closer) in list(_async_http_clients.items()):
+        _async_http_clients.pop(loop, None)
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(closer.cancel)
+
+
 class OpenRouterService:
     """Service for interacting with OpenRouter API."""
 
-    # Class-level cache for API key validation: {key_hash: (is_valid, timestamp)}
-    _key_validation_cache: dict[int, tuple[bool, float]] = {}
-    KEY_VALIDATION_TTL = 300  # 5 minutes
-
     def __init__(self, api_key: str | None = None):
         if api_key is None:
             settings = AppSettings.get()
@@ -75,42 +199,45 @@ class OpenRouterService:
         model: str = "anthropic/claude-haiku-4.5",
         json_response: bool = True,
         timeout: int = 30,
+        feature: str = "",
+        cache_prefix: str = "",
     ) -> dict[str, Any]:
-        """Send a completion request to OpenRouter."""
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
-
-        timeout_ms = timeout * 1000
-
-        try:
-            with OpenRouter(api_key=self.api_key) as client:
-                response = client.chat.send(
-                    messages=messages,
-                    model=model,
-                    stream=False,
-                    timeout_ms=timeout_ms,
-                )
-
-            if not response or not hasattr(response, "choices"):
-                raise AIResponseError("Invalid response structure from OpenRouter")
-
-            if not response.choices:
-                raise AIResponseError("No choices in OpenRouter response")
-
-            content = response.choices[0].message.content
-
-            if json_response:
-                return self._parse_json_response(content)
-
-            return {"content": content}
-
-        except AIServiceError:
-            raise
-        except Exception as e:
-            logger.exception("OpenRouter API error")
-            raise AIResponseError(f"OpenRouter API error: {e}")
+        """Send a completion request to OpenRouter.
+
+        timeout is the budget for the whole call: transient failures are
+        retried and may fall back to a faster model within it (see
+        resilience.py). feature names the caller (usually the prompt type)
+        in AI telemetry. The system prompt and cache_prefix, the start of
+        user_prompt shared by repeated requests, are sent as prompt-cache
+        breakpoints (see _messages()).
+        """
+        messages = _messages(system_prompt, user_prompt, cache_prefix)
+
+        def attempt(attempt_model: str, attempt_timeout: float) -> dict[str, Any]:
+            started = time.monotonic()
+            outcome, usage = AIUsageStat.OUTCOME_ERROR, None
+            try:
+                with OpenRouter(api_key=self.api_key, **_pooled_clients()) as client:
+                    response = client.chat.send(
+                        messages=messages,
+                        model=attempt_model,
+                        stream=False,
+                        timeout_ms=round(attempt_timeout * 1000),
+                    )
+
+                result = self._read_response(response, json_response)
+                outcome, usage = AIUsageStat.OUTCOME_SUCCESS, getattr(response, "usage", None)
+                return result
+
+            except AIServiceError:
+                raise
+            except Exception as e:
+                logger.exception("OpenRouter API error")
+                raise AIResponseError(f"OpenRouter API error: {e}")
+            finally:
+                record_ai_call(feature, attempt_model, outcome, _elapsed_ms(started), usage)
+
+        return call_with_policy(attempt, model, timeout, feature)
 
     async def complete_async(
         self,
@@ -119,42 +246,120 @@ class OpenRouterService:
         model: str = "anthropic/claude-haiku-4.5",
         json_response: bool = True,
         timeout: int = 30,
+        feature: str = "",
+        cache_prefix: str = "",
     ) -> dict[str, Any]:
         """Async version of complete()."""
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
-
-        timeout_ms = timeout * 1000
+        messages = _messages(system_prompt, user_prompt, cache_prefix)
+
+        async def attempt(attempt_model: str, attempt_timeout: float) -> dict[str, Any]:
+            started = time.monotonic()
+            outcome, usage = AIUsageStat.OUTCOME_ERROR, None
+            try:
+                async with OpenRouter(api_key=self.api_key, **_pooled_clients()) as client:
+                    response = await client.chat.send_async(
+                        messages=messages,
+                        model=attempt_model,
+                        stream=False,
+                        timeout_ms=round(attempt_timeout * 1000),
+                    )
+
+                result = self._read_response(response, json_response)
+                outcome, usage = AIUsageStat.OUTCOME_SUCCESS, getattr(response, "usage", None)
+                return result
+
+            except AIServiceError:
+                raise
+            except Exception as e:
+                logger.exception("OpenRouter API error")
+                raise AIResponseError(f"OpenRouter API error: {e}")
+            finally:
+                await sync_to_async(record_ai_call)(feature, attempt_model, outcome, _elapsed_ms(started), usage)
+
+        return await call_with_policy_async(attempt, model, timeout, feature)
+
+    def _read_response(self, response, json_response: bool) -> dict[str, Any]:
+        """Extract (and optionally parse as JSON) the message content of a chat response."""
+        if not response or not hasattr(response, "choices"):
+            raise AIResponseError("Invalid response structure from OpenRouter")
+
+        if not response.choices:
+            raise AIResponseError("No choices in OpenRouter response")
+
+        content = response.choices[0].message.content
+
+        if json_response:
+            return self._parse_json_response(content)
+
+        return {"content": content}
+
+    def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str = "anthropic/claude-haiku-4.5",
+        timeout: int = 30,
+        feature: str = "",
+        cache_prefix: str = "",
+    ) -> Iterator[str]:
+        """Stream a completion from OpenRouter, yielding text deltas as they arrive.
+
+        Streams aren't retried, but they hold an in-flight slot and use a
+        fallback model while the configured one's circuit is open.
+        """
+        messages = _messages(system_prompt, user_prompt, cache_prefix)
+        model = choose_model(model, feature)
+        breaker = get_breaker(model)
+        started = time.monotonic()
+        usage = None
 
         try:
-            async with OpenRouter(api_key=self.api_key) as client:
-                response = await client.chat.send_async(
+            with in_flight_slot(), OpenRouter(api_key=self.api_key, **_pooled_clients()) as client:
+                with client.chat.send(
                     messages=messages,
                     model=model,
-                    stream=False,
-                    timeout_ms=timeout_ms,
-                )
-
-            if not response or not hasattr(response, "choices"):
-                raise AIResponseError("Invalid response structure from OpenRouter")
-
-            if not response.choices:
-                raise AIResponseError("No choices in OpenRouter response")
-
-            content = response.choices[0].message.content
-
-            if json_response:
-                return self._parse_json_response(content)
-
-            return {"content": content}
-
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    timeout_ms=timeout * 1000,
+                ) as events:
+                    for chunk in events:
+                        # With include_usage the final chunk carries token usage and no content
+                        usage = getattr(chunk, "usage", None) or usage
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            yield chunk.choices[0].delta.content
         except AIServiceError:
+            record_ai_call(feature, model, AIUsageStat.OUTCOME_ERROR, _elapsed_ms(started))
             raise
         except Exception as e:
+            record_ai_call(feature, model, AIUsageStat.OUTCOME_ERROR, _elapsed_ms(started))
+            if is_transient(e):
+                breaker.record_failure()
             logger.exception("OpenRouter API error")
             raise AIResponseError(f"OpenRouter API error: {e}")
+        breaker.record_success()
+        record_ai_call(feature, model, AIUsageStat.OUTCOME_SUCCESS, _elapsed_ms(started), usage)
+
+    def stream_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str = "anthropic/claude-haiku-4.5",
+        timeout: int = 30,
+        feature: str = "",
+        cache_prefix: str = "",
+    ) -> Iterator[tuple[str, str | None, Any]]:
+        """Stream a JSON completion as IncrementalJSONParser events.
+
+        The last event is ("done", None, parsed) with the complete response,
+        parsed the same way complete() parses it.
+        """
+        parser = IncrementalJSONParser()
+        deltas = self.stream(
+            system_prompt, user_prompt, model=model, timeout=timeout, feature=feature, cache_prefix=cache_prefix
+        )
+        for delta in deltas:
+            yield from parser.feed(delta)
+        yield "done", None, self._parse_json_response(parser.text.strip())
 
     @classmethod
     def is_available(cls) -> bool:
@@ -165,7 +370,7 @@ class OpenRouterService:
     def get_available_models(self) -> list[dict[str, str]]:
         """Get list of available models from OpenRouter."""
         try:
-            with OpenRouter(api_key=self.api_key) as client:
+            with OpenRouter(api_key=self.api_key, **_pooled_clients()) as client:
                 response = client.models.list()
 
             if not response or not hasattr(response, "data"):
@@ -194,6 +399,7 @@ class OpenRouterService:
                 model="anthropic/claude-3.5-haiku",
                 json_response=True,
                 timeout=10,
+                feature="key_test",
             )
             return True, "Connection successful"
         except AIUnavailableError:
@@ -203,9 +409,30 @@ class OpenRouterService:
         except Exception as e:
             return False, f"Connection failed: {e}"
 
+    @classmethod
+    def check_key(cls, api_key: str) -> tuple[bool | None, str]:
+        """Check an API key against OpenRouter's key endpoint (no tokens are spent).
+
+        Returns (True, message) or (False, message) when OpenRouter answered,
+        and (None, message) when it couldn't be reached.
+        """
+        try:
+            with OpenRouter(api_key=api_key, **_pooled_clients()) as client:
+                client.api_keys.get_current_key_metadata(timeout_ms=10000)
+            return True, "API key is valid"
+        except Exception as e:
+            if getattr(e, "status_code", None) in (401, 403):
+                return False, "API key is invalid or expired"
+            logger.warning(f"Could not verify OpenRouter API key: {e}")
+            return None, f"Unable to verify API key: {e}"
+
     @classmethod
     def validate_key_cached(cls, api_key: str | None = None) -> tuple[bool, str | None]:
-        """Validate API key with caching to avoid excessive API calls."""
+        """Return the shared validity status of the API key without calling OpenRouter.
+
+        Safe to call on every page render: stale or unknown statuses are
+        refreshed by a background job (see key_status.py).
+        """
         if api_key is None:
             settings = AppSettings.get()
             api_key = settings.openrouter_api_key
@@ -213,24 +440,12 @@ class OpenRouterService:
         if not api_key:
             return False, "No API key configured"
 
-        # SHA-256 used as a cache lookup key (not for password storage)
-        cache_id = hashlib.sha256(api_key.encode()).hexdigest()  # nosec
-        now = time.time()
-
-        if cache_id in cls._key_validation_cache:
-            is_valid, timestamp = cls._key_validation_cache[cache_id]
-            if now - timestamp < cls.KEY_VALIDATION_TTL:
-                return is_valid, None if is_valid else "API key is invalid or expired"
-
-        try:
-            is_valid, message = cls.test_connection(api_key)
-            cls._key_validation_cache[cache_id] = (is_valid, now)
-            return is_valid, None if is_valid else message
-        except Exception as e:
-            logger.exception("Failed to validate API key")
-            return False, f"Unable to verify API key: {e}"
+        return get_key_status(api_key)
 
     @classmethod
     def invalidate_key_cache(cls):
-        """Clear validation cache (call when key is updated)."""
-        cls._key_validation_cache.clear()
+        """Forget the stored key status and reset connection pools (call when key is updated)."""
+        settings = AppSettings.get()
+        if settings.openrouter_api_key:
+            forget_key_status(settings.openrouter_api_key)
+        reset_http_clients()
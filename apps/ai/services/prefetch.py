@@ -0,0 +1,135 @@
+"""Speculative AI prefetch when a recipe is opened.
+
+With AI_PREFETCH_ON_VIEW enabled, recording a recipe view queues a
+low-priority prefetch_ai job that generates the recipe's remix suggestions
+and scales it to the serving sizes people pick most, so the Remix button and
+the servings control answer from cache instead of waiting on the model.
+
+Prefetching never touches a passkey user's daily quota: the job doesn't
+reserve any, and the endpoints already refund cached answers. A feature
+whose quota the profile has used up today isn't prefetched, since its
+endpoint would refuse the request anyway, and anything already cached is
+left alone.
+"""
+
+import logging
+
+from django.conf import settings
+from django.db.models import Count
+
+from apps.core.jobs import enqueue_job
+from apps.core.models import AppSettings, BackgroundJob
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe, ServingAdjustment
+
+from .cache import is_ai_cache_hit
+from .openrouter import AIResponseError, AIUnavailableError, OpenRouterService
+from .quota import check_quota
+from .remix import get_remix_suggestions
+from .scaling import scale_recipe
+from .validator import ValidationError
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_SCALE_TARGETS = 2  # Serving sizes prefetched per recipe
+
+
+def scale_targets(recipe: Recipe, profile: Profile) -> list[int]:
+    """The serving sizes to prefetch for a recipe.
+
+    The ones this profile scales to most often, else the most common across
+    all profiles, else double the recipe.
+    """
+    for adjustments in (ServingAdjustment.objects.filter(profile=profile), ServingAdjustment.objects.all()):
+        targets = list(
+            adjustments.exclude(target_servings=recipe.servings)
+            .values("target_servings")
+            .annotate(uses=Count("id"))
+            .order_by("-uses", "target_servings")
+            .values_list("target_servings", flat=True)[:PREFETCH_SCALE_TARGETS]
+        )
+        if targets:
+            return targets
+    return [recipe.servings * 2]
+
+
+def queue_prefetch(recipe: Recipe, profile: Profile) -> bool:
+    """Queue a prefetch of AI results for a recipe the profile just opened.
+
+    Jobs are deduplicated per (recipe, profile), since each prefetches for
+    its own profile's quota and serving sizes.
+
+    Returns:
+        True if a prefetch_ai job was queued.
+    """
+    if not settings.AI_PREFETCH_ON_VIEW:
+        return False
+    if not AppSettings.get().openrouter_api_key:
+        return False
+    if not any(check_quota(profile, feature)[0] for feature in ("remix_suggestions", "scale")):
+        return False
+    return enqueue_job(
+        "prefetch_ai",
+        recipe_id=recipe.id,
+        payload={"profile_id": profile.id},
+        priority=BackgroundJob.PRIORITY_LOW,
+        dedup_key=str(profile.id),
+    )
+
+
+def prefetch_recipe(recipe: Recipe, profile: Profile) -> list[str]:
+    """Generate whatever the profile could ask for next on this recipe and isn't cached yet.
+
+    Returns:
+        What was generated: "remix_suggestions" and "scale:<servings>" entries.
+    """
+    done = []
+    if check_quota(profile, "remix_suggestions")[0] and not is_ai_cache_hit("remix_suggestions", recipe.id):
+        # Same positional call as the endpoint, so it fills the entry the endpoint reads
+        if _attempt(get_remix_suggestions, recipe.id):
+            done.append("remix_suggestions")
+
+    if recipe.servings and check_quota(profile, "scale")[0]:
+        unit_system = profile.unit_preference
+        for target in scale_targets(recipe, profile):
+            cached = ServingAdjustment.objects.filter(
+                recipe=recipe, profile=profile, target_servings=target, unit_system=unit_system
+            ).exists()
+            if not cached and _attempt(scale_recipe, recipe.id, target, profile, unit_system):
+                done.append(f"scale:{target}")
+    return done
+
+
+def _attempt(func, *args) -> bool:
+    """Run one prefetch, logging failures: the user's own click will try again."""
+    try:
+        func(*args)
+    except (AIUnavailableError, AIResponseError, ValidationError, ValueError) as e:
+        logger.info(f"AI prefetch {func.__name__}{args[:2]} failed: {e}")
+        return False
+    return True
+
+
+def run_prefetch_job(job) -> None:
+    """Background job handler: prefetch AI results for job.recipe_id.
+
+    Skipped without a valid API key, or if the recipe or profile is gone.
+    Failures are not retried.
+    """
+    if not AppSettings.get().openrouter_api_key:
+        return
+    is_valid, _ = OpenRouterService.validate_key_cached()
+    if not is_valid:
+        logger.debug(f"Skipping AI prefetch for recipe {job.recipe_id}: API key is not valid")
+        return
+
+    try:
+        recipe = Recipe.objects.get(id=job.recipe_id)
+        profile = Profile.objects.get(id=job.payload.get("profile_id"))
+    except (Recipe.DoesNotExist, Profile.DoesNotExist):
+        logger.debug(f"Skipping AI prefetch for deleted recipe {job.recipe_id}")
+        return
+
+    done = prefetch_recipe(recipe, profile)
+    if done:
+        logger.info(f"Prefetched {', '.join(done)} for recipe {recipe.id}")
@@ -0,0 +1,61 @@
+"""Per-worker registry of active AI prompts.
+
+Every AI feature needs its prompt, so each worker keeps the active prompts
+in memory instead of querying for one per request. Each prompt's
+`user_prompt_template` is parsed once there too (see AIPrompt.format_user_prompt).
+
+Edits made through AIPrompt.save_new_version() (the prompts API and
+`cookie_admin prompts set`) bump the prompt's version and clear the registry
+of the worker that made them. Other workers compare a signature of the
+table (prompt count, total of the versions, latest update) at most every
+REGISTRY_CHECK_SECONDS and reload when it has changed.
+"""
+
+import threading
+import time
+
+from django.db.models import Count, Max, Sum
+
+from ..models import AIPrompt
+
+REGISTRY_CHECK_SECONDS = 10
+
+_lock = threading.Lock()
+_prompts: dict[str, AIPrompt] | None = None
+_signature: tuple | None = None
+_checked_at = 0.0
+
+
+def _table_signature() -> tuple:
+    row = AIPrompt.objects.aggregate(count=Count("id"), versions=Sum("version"), updated=Max("updated_at"))
+    return row["count"], row["versions"], row["updated"]
+
+
+def _load() -> dict[str, AIPrompt]:
+    global _prompts, _signature, _checked_at
+    with _lock:
+        now = time.monotonic()
+        if _prompts is not None and now - _checked_at < REGISTRY_CHECK_SECONDS:
+            return _prompts
+        signature = _table_signature()
+        if _prompts is None or signature != _signature:
+            _prompts = {prompt.prompt_type: prompt for prompt in AIPrompt.objects.filter(is_active=True)}
+            _signature = signature
+        _checked_at = now
+        return _prompts
+
+
+def get_active_prompt(prompt_type: str) -> AIPrompt:
+    """Return the active prompt of a type from the registry, raising AIPrompt.DoesNotExist if there is none."""
+    try:
+        return _load()[prompt_type]
+    except KeyError:
+        raise AIPrompt.DoesNotExist(f"No active prompt of type {prompt_type!r}") from None
+
+
+def clear_prompt_registry() -> None:
+    """Drop this worker's prompts so the next lookup reloads them."""
+    global _prompts, _signature
+    with _lock:
+        _prompts = None
+        _signature = None
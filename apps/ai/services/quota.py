@@ -92,6 +92,17 @@ def check_quota(profile, feature: str) -> tuple[bool, dict]:
     return (True, {})
 
 
+class QuotaExceededError(Exception):
+    """Raised when a quota slot is needed but the daily limit is reached.
+
+    info is the dict reserve_quota() returned (remaining, limit, used, resets_at).
+    """
+
+    def __init__(self, info: dict):
+        super().__init__("Daily quota reached")
+        self.info = info
+
+
 def reserve_quota(profile, feature: str) -> tuple[bool, dict]:
     """Atomically reserve a quota slot BEFORE executing the AI operation.
 
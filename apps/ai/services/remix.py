@@ -1,14 +1,20 @@
 """Recipe remix service using AI."""
 
 import logging
-import threading
+from collections.abc import Iterator
 from typing import Any
 
+from django.conf import settings
+
+from apps.core.jobs import enqueue_job
 from apps.recipes.models import Recipe
+from apps.recipes.services.nutrition import calculate_recipe_nutrition
+from apps.recipes.services.timers import extract_step_timers
+from apps.recipes.services.units import build_unit_views
 from apps.profiles.models import Profile
 
 from ..models import AIPrompt
-from .cache import cache_ai_response, CACHE_TIMEOUT_MEDIUM
+from .cache import cache_ai_response, cached_completion, cached_stream_json, CACHE_TIMEOUT_MEDIUM
 from .openrouter import OpenRouterService, AIUnavailableError, AIResponseError
 from .validator import AIResponseValidator, ValidationError
 
@@ -47,20 +53,12 @@ def get_remix_suggestions(recipe_id: int) -> list[str]:
         ingredients=ingredients_str,
     )
 
-    # Call AI service
+    # Call AI service (shared with any recipe that renders the same prompt)
     service = OpenRouterService()
-    response = service.complete(
-        system_prompt=prompt.system_prompt,
-        user_prompt=user_prompt,
-        model=prompt.model,
-        json_response=True,
-    )
-
-    # Validate response
     validator = AIResponseValidator()
-    validated = validator.validate("remix_suggestions", response)
-
-    return validated
+    return cached_completion(
+        service, prompt, user_prompt, validate=lambda r: validator.validate("remix_suggestions", r)
+    )
 
 
 def create_remix(
@@ -84,6 +82,63 @@ def create_remix(
         AIResponseError: If AI returns invalid response.
         ValidationError: If response doesn't match expected schema.
     """
+    original, prompt, user_prompt, recipe_prefix = _prepare_remix(recipe_id, modification)
+
+    # Call AI service
+    service = OpenRouterService()
+    response = service.complete(
+        system_prompt=prompt.system_prompt,
+        user_prompt=user_prompt,
+        model=prompt.model,
+        json_response=True,
+        timeout=60,
+        feature=prompt.prompt_type,
+        cache_prefix=recipe_prefix,
+    )
+
+    return _save_remix(original, response, modification, profile)
+
+
+def stream_remix(
+    recipe_id: int,
+    modification: str,
+    profile: Profile,
+) -> Iterator[tuple[str, str | None, Any]]:
+    """Create a remixed recipe, streaming the AI output as it is generated.
+
+    Yields IncrementalJSONParser events ("field" for the title and other
+    scalar fields, "item" for each ingredient and instruction) while the
+    model writes, then ("done", None, remix) once the complete response has
+    been validated and saved. The same modification of the same recipe is
+    replayed from the shared completion cache instead of calling the AI.
+
+    Raises:
+        Same as create_remix().
+    """
+    original, prompt, user_prompt, recipe_prefix = _prepare_remix(recipe_id, modification)
+
+    service = OpenRouterService()
+    validator = AIResponseValidator()
+    for event in cached_stream_json(
+        service,
+        prompt,
+        user_prompt,
+        validate=lambda r: validator.validate("recipe_remix", r),
+        timeout=60,
+        cache_prefix=recipe_prefix,
+    ):
+        if event[0] == "done":
+            yield "done", None, _save_remix(original, event[2], modification, profile)
+        else:
+            yield event
+
+
+def _prepare_remix(recipe_id: int, modification: str) -> tuple[Recipe, AIPrompt, str, str]:
+    """Load the original recipe and render the recipe_remix prompt for it.
+
+    Also returns the part of the prompt before the modification, which every
+    remix of this recipe shares and so is worth caching at the provider.
+    """
     original = Recipe.objects.get(id=recipe_id)
 
     # Get the recipe_remix prompt
@@ -102,24 +157,20 @@ def create_remix(
         instructions_str = original.instructions_text or str(original.instructions)
 
     # Format the user prompt
-    user_prompt = prompt.format_user_prompt(
-        title=original.title,
-        description=original.description or "No description",
-        ingredients=ingredients_str,
-        instructions=instructions_str,
-        modification=modification,
-    )
+    fields = {
+        "title": original.title,
+        "description": original.description or "No description",
+        "ingredients": ingredients_str,
+        "instructions": instructions_str,
+        "modification": modification,
+    }
+    user_prompt = prompt.format_user_prompt(**fields)
+
+    return original, prompt, user_prompt, prompt.user_prompt_prefix("modification", **fields)
 
-    # Call AI service
-    service = OpenRouterService()
-    response = service.complete(
-        system_prompt=prompt.system_prompt,
-        user_prompt=user_prompt,
-        model=prompt.model,
-        json_response=True,
-        timeout=60,
-    )
 
+def _save_remix(original: Recipe, response: dict, modification: str, profile: Profile) -> Recipe:
+    """Validate the AI response and save it as a remix of original."""
     # Validate response
     validator = AIResponseValidator()
     validated = validator.validate("recipe_remix", response)
@@ -133,6 +184,9 @@ def create_remix(
     yields_str = validated.get("yields", "")
     servings = _parse_servings(yields_str)
 
+    # Nutrition from the bundled nutrient table when it covers the new ingredients
+    nutrition = calculate_recipe_nutrition(validated["ingredients"], servings)
+
     # Create the remixed recipe
     remix = Recipe.objects.create(
         profile=profile,  # Owner of the remix
@@ -157,29 +211,27 @@ def create_remix(
         category=original.category,
         image_url=original.image_url,
         image=original.image,
+        step_timers=extract_step_timers(validated["instructions"]),
+        unit_views=build_unit_views(validated["ingredients"], []),
+        nutrition=nutrition,
+        nutrition_source=Recipe.NUTRITION_CALCULATED if nutrition else "",
+        nutrition_pending=not nutrition and bool(original.nutrition) and settings.NUTRITION_AI_FALLBACK,
     )
 
     logger.info(f"Created remix {remix.id} from recipe {original.id} for profile {profile.id}")
 
-    # Estimate nutrition if original has nutrition data
-    if original.nutrition:
-        try:
-            nutrition = estimate_nutrition(
-                original=original,
-                new_ingredients=validated["ingredients"],
-                new_servings=servings or 1,
-                modification=modification,
-            )
-            remix.nutrition = nutrition
-            remix.save(update_fields=["nutrition"])
-            logger.info(f"Added nutrition estimate to remix {remix.id}")
-        except Exception as e:
-            # Nutrition estimation is non-critical, log and continue
-            logger.warning(f"Failed to estimate nutrition for remix {remix.id}: {e}")
-
-    # Fire-and-forget: Generate AI tips in background thread (non-blocking)
-    thread = threading.Thread(target=_generate_tips_background, args=(remix.id,), daemon=True)
-    thread.start()
+    # Otherwise estimate it with AI on the background job queue, so the remix is
+    # returned after a single AI call; clients see nutrition_pending until it's stored
+    if remix.nutrition_pending and not enqueue_job(
+        "estimate_nutrition", recipe_id=remix.id, payload={"modification": modification}
+    ):
+        remix.nutrition_pending = False
+        remix.save(update_fields=["nutrition_pending"])
+
+    # Generate AI tips on the background job queue (non-blocking)
+    enqueue_job("generate_tips", recipe_id=remix.id)
+    if any(remix.step_timers):
+        enqueue_job("label_timers", recipe_id=remix.id)
 
     return remix
 
@@ -232,20 +284,70 @@ def estimate_nutrition(
         modification=modification,
     )
 
-    # Call AI service
+    # Call AI service (identical remixes share one cached estimate)
     service = OpenRouterService()
-    response = service.complete(
-        system_prompt=prompt.system_prompt,
-        user_prompt=user_prompt,
-        model=prompt.model,
-        json_response=True,
+    validator = AIResponseValidator()
+    return cached_completion(
+        service, prompt, user_prompt, validate=lambda r: validator.validate("nutrition_estimate", r)
     )
 
-    # Validate response
-    validator = AIResponseValidator()
-    validated = validator.validate("nutrition_estimate", response)
 
-    return validated
+def estimate_remix_nutrition(recipe_id: int, modification: str) -> dict:
+    """Estimate and store nutrition for a remix whose original recipe has nutrition data.
+
+    Args:
+        recipe_id: The ID of the remix.
+        modification: The modification the remix was created with.
+
+    Returns:
+        The remix's nutrition (empty if its original has none or was deleted).
+
+    Raises:
+        Recipe.DoesNotExist: If the remix is not found.
+        AIUnavailableError: If AI service is not available.
+        AIResponseError: If AI returns invalid response.
+        ValidationError: If response doesn't match expected schema.
+    """
+    remix = Recipe.objects.select_related("remixed_from").get(id=recipe_id)
+    original = remix.remixed_from
+
+    if original is not None and original.nutrition:
+        remix.nutrition = estimate_nutrition(
+            original=original,
+            new_ingredients=remix.ingredients,
+            new_servings=remix.servings or 1,
+            modification=modification,
+        )
+        remix.nutrition_source = Recipe.NUTRITION_AI
+        logger.info(f"Added nutrition estimate to remix {remix.id}")
+
+    remix.nutrition_pending = False
+    remix.save(update_fields=["nutrition", "nutrition_source", "nutrition_pending"])
+    return remix.nutrition
+
+
+def run_nutrition_job(job) -> None:
+    """Background job handler: estimate nutrition for the remix job.recipe_id.
+
+    Without an API key, or once the last retry has failed, the remix is
+    left without nutrition rather than pending forever. AI errors
+    propagate so the job queue retries them.
+    """
+    from apps.core.models import AppSettings
+
+    if not AppSettings.get().openrouter_api_key:
+        logger.debug(f"Skipping nutrition estimate for remix {job.recipe_id}: No API key")
+        Recipe.objects.filter(id=job.recipe_id).update(nutrition_pending=False)
+        return
+
+    try:
+        estimate_remix_nutrition(job.recipe_id, job.payload.get("modification", ""))
+    except Recipe.DoesNotExist:
+        logger.debug(f"Skipping nutrition estimate for deleted remix {job.recipe_id}")
+    except Exception:
+        if job.attempts >= job.max_attempts:
+            Recipe.objects.filter(id=job.recipe_id).update(nutrition_pending=False)
+        raise
 
 
 def _parse_time(time_str: str | None) -> int | None:
@@ -285,28 +387,3 @@ def _parse_servings(yields_str: str) -> int | None:
         return int(numbers[0])
 
     return None
-
-
-def _generate_tips_background(recipe_id: int):
-    """Generate AI tips for a remix recipe in background thread."""
-    try:
-        import django
-
-        django.setup()  # Ensure Django is configured in thread
-
-        from apps.core.models import AppSettings
-        from apps.ai.services.tips import generate_tips
-
-        # Check if AI is available
-        settings_obj = AppSettings.get()
-        if not settings_obj.openrouter_api_key:
-            logger.debug(f"Skipping tips generation for remix {recipe_id}: No API key")
-            return
-
-        # Generate tips
-        generate_tips(recipe_id)
-        logger.info(f"Auto-generated tips for remix {recipe_id}")
-
-    except Exception as e:
-        # Log but don't fail - tips generation is optional
-        logger.warning(f"Failed to auto-generate tips for remix {recipe_id}: {e}")
@@ -0,0 +1,292 @@
+"""Call policy for OpenRouter: circuit breaking, retries, fallback models and an in-flight cap.
+
+Every completion goes through call_with_policy() / call_with_policy_async():
+
+- Each worker caps how many AI calls it has in flight (AI_MAX_IN_FLIGHT);
+  a call that can't get a slot within IN_FLIGHT_WAIT_SECONDS is shed.
+- Each model has a circuit breaker. FAILURE_THRESHOLD transient failures in
+  a row (timeouts, connection errors, 429s and 5xxs, or successful calls
+  that used more than SLOW_CALL_SHARE of their attempt's timeout) open it, and for OPEN_SECONDS calls skip
+  the model entirely. After that one trial call is let through: success
+  closes the circuit, failure opens it again.
+- Transient failures are retried with jittered exponential backoff, but only
+  within the caller's timeout, which is the budget for the whole call rather
+  than per attempt. While a fallback model is available, part of the budget
+  is kept back for it.
+- When the configured model is failing or its circuit is open, the call
+  falls back to a fast model from AIPrompt.AVAILABLE_MODELS (the ones
+  labelled "(Fast)"). Fallbacks are logged and listed in the
+  X-AI-Fallback-Model response header (see apps/ai/middleware.py).
+
+Breakers and the in-flight cap are per worker process: a brown-out is
+detected by each worker from its own calls.
+"""
+
+import asyncio
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+FAILURE_THRESHOLD = 5  # Consecutive transient failures that open a model's circuit
+OPEN_SECONDS = 30  # How long an open circuit skips the model before a trial call
+SLOW_CALL_SHARE = 0.8  # Successful calls using more of their attempt's timeout than this count as failures
+MAX_ATTEMPTS = 3  # Attempts per call, across the configured model and fallbacks
+BACKOFF_SECONDS = 0.5  # Base of the jittered exponential backoff between attempts
+MIN_ATTEMPT_SECONDS = 2  # Don't start an attempt with less budget than this left
+FALLBACK_SHARE = 1 / 3  # Share of the budget kept back for a fallback model
+IN_FLIGHT_WAIT_SECONDS = 5  # How long a call waits for an in-flight slot before being shed
+
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# Fallbacks made while handling the current request: [(requested model, model used)]
+model_fallbacks: contextvars.ContextVar[list | None] = contextvars.ContextVar("model_fallbacks", default=None)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one model."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_started: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self.opened_at is not None and time.monotonic() - self.opened_at < OPEN_SECONDS
+
+    def allow(self) -> bool:
+        """Whether a call may go to the model now; claims the trial call when the circuit is half-open."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at < OPEN_SECONDS:
+                return False
+            # Half-open: one trial at a time (a trial that never reported back expires)
+            if self._trial_started is not None and now - self._trial_started < OPEN_SECONDS:
+                return False
+            self._trial_started = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_started = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_started = None
+            if self.failures >= FAILURE_THRESHOLD or self.opened_at is not None:
+                self.opened_at = time.monotonic()
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_in_flight: threading.BoundedSemaphore | None = None
+_in_flight_lock = threading.Lock()
+
+
+def get_breaker(model: str) -> CircuitBreaker:
+    with _breakers_lock:
+        return _breakers.setdefault(model, CircuitBreaker())
+
+
+def reset_resilience() -> None:
+    """Close every circuit and rebuild the in-flight cap from settings."""
+    global _in_flight
+    with _breakers_lock:
+        _breakers.clear()
+    with _in_flight_lock:
+        _in_flight = None
+
+
+def _semaphore() -> threading.BoundedSemaphore:
+    global _in_flight
+    with _in_flight_lock:
+        if _in_flight is None:
+            _in_flight = threading.BoundedSemaphore(settings.AI_MAX_IN_FLIGHT)
+        return _in_flight
+
+
+def fallback_models(model: str) -> list[str]:
+    """Fast models to try when `model` is failing, in AIPrompt.AVAILABLE_MODELS order."""
+    # Import here to avoid circular imports
+    from ..models import AIPrompt
+
+    return [m for m, label in AIPrompt.AVAILABLE_MODELS if label.endswith("(Fast)") and m != model]
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether an upstream error is worth retrying: timeouts, connection errors, 408/429/5xx."""
+    while exc is not None:
+        if isinstance(exc, (httpx.TimeoutException, httpx.TransportError, asyncio.TimeoutError)):
+            return True
+        if getattr(exc, "status_code", None) in TRANSIENT_STATUS_CODES:
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def _record_fallback(requested: str, used: str, feature: str) -> None:
+    logger.warning(f"AI call {feature or 'other'} fell back from {requested} to {used}")
+    fallbacks = model_fallbacks.get()
+    if fallbacks is not None:
+        fallbacks.append((requested, used))
+
+
+class _CallPlan:
+    """Which model to try next, with what timeout and after what delay, within a time budget."""
+
+    def __init__(self, model: str, budget: float, feature: str, allow_fallback: bool = True):
+        self.model = model
+        self.feature = feature
+        self.started = time.monotonic()
+        self.deadline = self.started + budget
+        self.budget = budget
+        self.fallbacks = fallback_models(model) if allow_fallback else []
+        self.attempts = 0
+        self.failed_models: set[str] = set()
+        self.last_error: BaseException | None = None
+
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+
+    def next_attempt(self) -> tuple[str, float, float] | None:
+        """(model, timeout, delay before starting) for the next attempt, or None when out of options."""
+        if self.attempts >= MAX_ATTEMPTS:
+            return None
+        delay = random.uniform(0, BACKOFF_SECONDS * 2 ** (self.attempts - 1)) if self.attempts else 0.0  # nosec
+        candidates = [self.model] if self.model not in self.failed_models else []
+        candidates += [m for m in self.fallbacks if m not in self.failed_models]
+        for model in candidates:
+            reserve = self.budget * FALLBACK_SHARE if model == self.model and self._has_fallback() else 0
+            timeout = self.remaining() - delay - reserve
+            if timeout < MIN_ATTEMPT_SECONDS or not get_breaker(model).allow():
+                continue
+            return model, timeout, delay
+        return None
+
+    def _has_fallback(self) -> bool:
+        return any(m not in self.failed_models and not get_breaker(m).is_open for m in self.fallbacks)
+
+    def started_attempt(self) -> None:
+        self.attempts += 1
+
+    def succeeded(self, model: str, elapsed: float, timeout: float) -> None:
+        # Relative to the timeout, so a long-budget call (a big remix) isn't slow just for its size
+        if elapsed > timeout * SLOW_CALL_SHARE:
+            get_breaker(model).record_failure()
+        else:
+            get_breaker(model).record_success()
+        if model != self.model:
+            _record_fallback(self.model, model, self.feature)
+
+    def failed(self, model: str, exc: BaseException) -> None:
+        """Record a failed attempt, re-raising errors that retrying won't fix."""
+        if not is_transient(exc):
+            # The model answered (bad request, unusable output): it isn't browning out
+            get_breaker(model).record_success()
+            raise exc
+        get_breaker(model).record_failure()
+        self.last_error = exc
+        # Once the configured model has failed twice, move on to a fallback
+        if model != self.model or (self.attempts >= MAX_ATTEMPTS - 1 and self._has_fallback()):
+            self.failed_models.add(model)
+
+    def give_up(self) -> BaseException:
+        return self.last_error or _error(f"AI model {self.model} is unavailable; try again shortly")
+
+
+def _error(message: str) -> Exception:
+    # Import here to avoid circular imports
+    from .openrouter import AIResponseError
+
+    return AIResponseError(message)
+
+
+@contextmanager
+def in_flight_slot(wait: float = IN_FLIGHT_WAIT_SECONDS):
+    """Hold one of this worker's in-flight AI call slots, waiting at most `wait` seconds for one."""
+    semaphore = _semaphore()
+    if not semaphore.acquire(timeout=max(0.0, min(wait, IN_FLIGHT_WAIT_SECONDS))):
+        raise _error("Too many AI requests in progress; try again shortly")
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
+def call_with_policy(
+    attempt: Callable[[str, float], Any], model: str, timeout: float, feature: str = "", allow_fallback: bool = True
+) -> Any:
+    """Run attempt(model, timeout) under the call policy, within `timeout` seconds overall."""
+    plan = _CallPlan(model, timeout, feature, allow_fallback)
+    with in_flight_slot(plan.remaining()):
+        while (step := plan.next_attempt()) is not None:
+            candidate, attempt_timeout, delay = step
+            time.sleep(delay)
+            plan.started_attempt()
+            started = time.monotonic()
+            try:
+                result = attempt(candidate, attempt_timeout)
+            except Exception as e:
+                plan.failed(candidate, e)
+                continue
+            plan.succeeded(candidate, time.monotonic() - started, attempt_timeout)
+            return result
+    raise plan.give_up()
+
+
+async def call_with_policy_async(
+    attempt: Callable[[str, float], Awaitable[Any]], model: str, timeout: float, feature: str = ""
+) -> Any:
+    """Async version of call_with_policy()."""
+    plan = _CallPlan(model, timeout, feature)
+    semaphore = _semaphore()
+    wait_until = time.monotonic() + max(0.0, min(plan.remaining(), IN_FLIGHT_WAIT_SECONDS))
+    # Never block the event loop on the semaphore
+    while not semaphore.acquire(blocking=False):
+        if time.monotonic() >= wait_until:
+            raise _error("Too many AI requests in progress; try again shortly")
+        await asyncio.sleep(0.05)
+    try:
+        while (step := plan.next_attempt()) is not None:
+            candidate, attempt_timeout, delay = step
+            await asyncio.sleep(delay)
+            plan.started_attempt()
+            started = time.monotonic()
+            try:
+                result = await attempt(candidate, attempt_timeout)
+            except Exception as e:
+                plan.failed(candidate, e)
+                continue
+            plan.succeeded(candidate, time.monotonic() - started, attempt_timeout)
+            return result
+    finally:
+        semaphore.release()
+    raise plan.give_up()
+
+
+def choose_model(model: str, feature: str = "") -> str:
+    """The model a single-attempt call (a stream) should use: `model` unless its circuit is open."""
+    if get_breaker(model).allow():
+        return model
+    for fallback in fallback_models(model):
+        if get_breaker(fallback).allow():
+            _record_fallback(model, fallback, feature)
+            return fallback
+    raise _error(f"AI model {model} is unavailable; try again shortly")
@@ -2,13 +2,18 @@
 
 import logging
 import re
+from collections.abc import Callable
 
 from apps.recipes.models import Recipe, ServingAdjustment
+from apps.recipes.services.ingredients import scale_ingredient
+from apps.recipes.services.nutrition import calculate_recipe_nutrition
 from apps.recipes.utils import tidy_quantities
 from apps.profiles.models import Profile
 
 from ..models import AIPrompt
+from .cache import cached_completion
 from .openrouter import OpenRouterService, AIUnavailableError, AIResponseError
+from .telemetry import record_cache_hit
 from .validator import AIResponseValidator, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -53,7 +58,7 @@ def _format_time(minutes: int | None) -> str:
     return f"{minutes} minutes"
 
 
-def _build_result(recipe, target_servings, adjustment, cached: bool) -> dict:
+def _build_result(recipe, target_servings, adjustment, cached: bool, local: bool = False) -> dict:
     """Build the standard result dict from a ServingAdjustment-like object."""
     return {
         "target_servings": target_servings,
@@ -65,6 +70,7 @@ def _build_result(recipe, target_servings, adjustment, cached: bool) -> dict:
         "cook_time_adjusted": adjustment["cook_time_adjusted"],
         "total_time_adjusted": adjustment["total_time_adjusted"],
         "cached": cached,
+        "local": local,
     }
 
 
@@ -98,9 +104,11 @@ def _get_instructions_list(recipe) -> list[str]:
     return []
 
 
-def _format_recipe_data(recipe) -> tuple[str, str]:
-    """Format recipe ingredients and instructions as prompt strings."""
-    ingredients_str = "\n".join(f"- {ing}" for ing in recipe.ingredients)
+def _format_recipe_data(recipe, ingredients: list[str] | None = None) -> tuple[str, str]:
+    """Format recipe ingredients (default: all of them) and instructions as prompt strings."""
+    if ingredients is None:
+        ingredients = recipe.ingredients
+    ingredients_str = "\n".join(f"- {ing}" for ing in ingredients)
 
     steps = _get_instructions_list(recipe)
     instructions_str = "\n".join(f"{i + 1}. {step}" for i, step in enumerate(steps))
@@ -115,31 +123,34 @@ def _call_ai_and_validate(recipe, target_servings, ingredients_str, instructions
     prompt = AIPrompt.get_prompt("serving_adjustment")
 
     # Format the user prompt (QA-031 + QA-032)
-    user_prompt = prompt.format_user_prompt(
-        title=recipe.title,
-        original_servings=recipe.servings,
-        ingredients=ingredients_str,
-        instructions=instructions_str,
-        prep_time=_format_time(recipe.prep_time),
-        cook_time=_format_time(recipe.cook_time),
-        total_time=_format_time(recipe.total_time),
-        new_servings=target_servings,
-    )
+    fields = {
+        "title": recipe.title,
+        "original_servings": recipe.servings,
+        "ingredients": ingredients_str,
+        "instructions": instructions_str,
+        "prep_time": _format_time(recipe.prep_time),
+        "cook_time": _format_time(recipe.cook_time),
+        "total_time": _format_time(recipe.total_time),
+        "new_servings": target_servings,
+    }
+    user_prompt = prompt.format_user_prompt(**fields)
+    # Scaling the same recipe to another size reuses everything before the new size
+    recipe_prefix = prompt.user_prompt_prefix("new_servings", **fields)
 
     # Tell the AI which unit system to use for the scaled output
     unit_label = "metric (grams, ml, °C)" if unit_system == "metric" else "imperial (oz, cups, °F)"
     user_prompt += f"\n\nPlease express all quantities using {unit_label} units."
 
+    # Profiles scaling the same recipe the same way share one cached AI response
     service = OpenRouterService()
-    response = service.complete(
-        system_prompt=prompt.system_prompt,
-        user_prompt=user_prompt,
-        model=prompt.model,
-        json_response=True,
-    )
-
     validator = AIResponseValidator()
-    validated = validator.validate("serving_adjustment", response)
+    validated = cached_completion(
+        service,
+        prompt,
+        user_prompt,
+        validate=lambda r: validator.validate("serving_adjustment", r),
+        cache_prefix=recipe_prefix,
+    )
 
     # Tidy ingredient quantities (convert decimals to fractions) - QA-029
     return {
@@ -152,11 +163,60 @@ def _call_ai_and_validate(recipe, target_servings, ingredients_str, instructions
     }
 
 
+def _scale_ingredients(
+    recipe, target_servings, unit_system: str, before_ai: Callable[[], None] | None = None
+) -> tuple[dict, bool]:
+    """Scale ingredient lines locally, asking the AI only about lines the parser can't handle.
+
+    Fully local results leave instructions and times unadjusted. When the
+    AI is needed it sees just the unresolved lines (plus the instructions),
+    and its lines are slotted back into place. before_ai is called once,
+    just before the first AI call.
+
+    Returns:
+        (adjustment, used_ai)
+    """
+    factor = target_servings / recipe.servings
+    scaled = [scale_ingredient(line, factor, unit_system) for line in recipe.ingredients]
+    unresolved = [line for line, result in zip(recipe.ingredients, scaled) if result is None]
+
+    if not unresolved:
+        logger.info(f"Scaled recipe {recipe.id} locally to {target_servings} servings")
+        return {
+            "ingredients": scaled,
+            "instructions": [],
+            "notes": [],
+            "prep_time_adjusted": None,
+            "cook_time_adjusted": None,
+            "total_time_adjusted": None,
+        }, False
+
+    if before_ai is not None:
+        before_ai()
+    ingredients_str, instructions_str = _format_recipe_data(recipe, unresolved)
+    adjustment = _call_ai_and_validate(recipe, target_servings, ingredients_str, instructions_str, unit_system)
+    if len(unresolved) == len(recipe.ingredients):
+        return adjustment, True
+
+    if len(adjustment["ingredients"]) != len(unresolved):
+        logger.warning(
+            f"AI returned {len(adjustment['ingredients'])} lines for {len(unresolved)} unresolved ingredients "
+            f"in recipe {recipe.id}; scaling the whole recipe with AI"
+        )
+        ingredients_str, instructions_str = _format_recipe_data(recipe)
+        return _call_ai_and_validate(recipe, target_servings, ingredients_str, instructions_str, unit_system), True
+
+    ai_lines = iter(adjustment["ingredients"])
+    adjustment["ingredients"] = [line if line is not None else next(ai_lines) for line in scaled]
+    return adjustment, True
+
+
 def scale_recipe(
     recipe_id: int,
     target_servings: int,
     profile: Profile,
     unit_system: str = "metric",
+    before_ai: Callable[[], None] | None = None,
 ) -> dict:
     """Scale a recipe to a different number of servings.
 
@@ -165,9 +225,12 @@ def scale_recipe(
         target_servings: The desired number of servings.
         profile: The profile requesting the adjustment.
         unit_system: 'metric' or 'imperial'.
+        before_ai: Called only if the AI is needed (not for cached or locally
+            scaled results), e.g. to reserve quota; may raise to stop scaling.
 
     Returns:
-        Dict with scaled ingredients, notes, and cache status.
+        Dict with scaled ingredients, notes, cache status, and whether the
+        result was produced locally without calling the AI.
 
     Raises:
         Recipe.DoesNotExist: If recipe not found.
@@ -188,11 +251,10 @@ def scale_recipe(
     cached = _get_cached(recipe, profile, target_servings, unit_system)
     if cached is not None:
         logger.info(f"Returning cached adjustment for recipe {recipe_id}")
+        record_cache_hit("serving_adjustment")
         return _build_result(recipe, target_servings, cached, cached=True)
 
-    # Generate new adjustment via AI
-    ingredients_str, instructions_str = _format_recipe_data(recipe)
-    adjustment = _call_ai_and_validate(recipe, target_servings, ingredients_str, instructions_str, unit_system)
+    adjustment, used_ai = _scale_ingredients(recipe, target_servings, unit_system, before_ai)
 
     # Cache the result
     ServingAdjustment.objects.create(
@@ -205,7 +267,7 @@ def scale_recipe(
 
     logger.info(f"Created serving adjustment for recipe {recipe_id} to {target_servings} servings")
 
-    return _build_result(recipe, target_servings, adjustment, cached=False)
+    return _build_result(recipe, target_servings, adjustment, cached=False, local=not used_ai)
 
 
 def calculate_nutrition(
@@ -216,6 +278,8 @@ def calculate_nutrition(
     """Calculate scaled nutrition values.
 
     Uses simple multiplication since nutrition is typically per-serving.
+    Recipes without nutrition data use an estimate from the bundled nutrient
+    table, when it covers their ingredients.
 
     Args:
         recipe: The recipe with nutrition data.
@@ -225,18 +289,19 @@ def calculate_nutrition(
     Returns:
         Dict with per_serving and total nutrition values.
     """
-    if not recipe.nutrition:
+    nutrition = recipe.nutrition or calculate_recipe_nutrition(recipe.ingredients, original_servings)
+    if not nutrition:
         return {
             "per_serving": {},
             "total": {},
         }
 
     # Nutrition is per-serving, so per_serving stays the same
-    per_serving = recipe.nutrition.copy()
+    per_serving = nutrition.copy()
 
     # Calculate total by multiplying by target servings
     total = {}
-    for key, value in recipe.nutrition.items():
+    for key, value in nutrition.items():
         if isinstance(value, str):
             # Try to extract numeric value and unit
             import re
@@ -4,6 +4,7 @@ import logging
 from typing import Optional
 
 from apps.recipes.models import SearchSource
+from apps.recipes.services.html_skeleton import page_skeleton
 
 from ..models import AIPrompt
 from .openrouter import OpenRouterService, AIUnavailableError, AIResponseError
@@ -29,7 +30,7 @@ def repair_selector(
 
     Args:
         source: The SearchSource with the broken selector.
-        html_sample: Sample HTML from the search page (truncated to ~50KB).
+        html_sample: HTML from the search page; only its outline is sent to the AI.
         target: Description of the target element type.
         confidence_threshold: Minimum confidence to auto-update (0-1).
         auto_update: If True and confidence exceeds threshold, update the source.
@@ -52,14 +53,14 @@ def repair_selector(
     # Get the selector_repair prompt
     prompt = AIPrompt.get_prompt("selector_repair")
 
-    # Truncate HTML to avoid token limits (keep first ~50KB)
-    truncated_html = html_sample[:50000]
+    # Send the page's element structure rather than its first 50KB of markup
+    skeleton = page_skeleton(html_sample)
 
     # Format the user prompt
     user_prompt = prompt.format_user_prompt(
         selector=original_selector or "(none)",
         target=target,
-        html_sample=truncated_html,
+        html_sample=skeleton,
     )
 
     # Call AI service
@@ -70,6 +71,7 @@ def repair_selector(
         model=prompt.model,
         json_response=True,
         timeout=10,
+        feature=prompt.prompt_type,
     )
 
     # Validate response
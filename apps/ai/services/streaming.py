@@ -0,0 +1,139 @@
+"""Incremental JSON parsing for streamed AI responses."""
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+
+class IncrementalJSONParser:
+    """Report pieces of a JSON document as soon as they are complete.
+
+    Feed the model's output as it streams in. Each call to feed() returns
+    the events completed by that chunk:
+
+    - ("field", key, value) for each finished top-level value of an object
+    - ("item", key, value) for each finished element of a top-level array
+      field (e.g. one ingredient), or ("item", None, value) for elements of
+      a top-level array
+
+    Anything before the first "{" or "[" (such as a markdown code fence) is
+    ignored. The parser does not validate; the complete text should still
+    be parsed and validated once the stream ends.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._pos = 0
+        self._stack: list[str] = []
+        self._done = False
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._expect_key = False
+        self._reading_key = False
+        self._key: str | None = None
+        # depth -> (start index, kind) for the value currently open at that depth
+        self._open: dict[int, tuple[int, str]] = {}
+
+    def feed(self, chunk: str) -> list[tuple[str, str | None, Any]]:
+        """Consume the next chunk of text and return newly completed events."""
+        self.text += chunk
+        events: list[tuple[str, str | None, Any]] = []
+        while self._pos < len(self.text) and not self._done:
+            i = self._pos
+            self._pos += 1
+            self._step(self.text[i], i, events)
+        return events
+
+    def _step(self, c: str, i: int, events: list) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif c == "\\":
+                self._escape = True
+            elif c == '"':
+                self._in_string = False
+                self._finish_string(i, events)
+            return
+
+        depth = len(self._stack)
+        if not self._stack:
+            if c in "{[":
+                self._push(c)
+            return
+
+        if c == '"':
+            self._in_string = True
+            self._string_start = i
+            if self._expect_key and depth == 1:
+                self._reading_key = True
+            else:
+                self._begin(depth, i, "string")
+        elif c in "{[":
+            self._begin(depth, i, "container")
+            self._push(c)
+        elif c in "}]":
+            self._end_scalar(depth, i, events)
+            self._stack.pop()
+            self._end(len(self._stack), i + 1, events)
+            self._done = not self._stack
+        elif c == ",":
+            self._end_scalar(depth, i, events)
+            self._expect_key = depth == 1 and self._stack[0] == "{"
+        elif c == ":":
+            self._expect_key = False
+        elif c.isspace():
+            self._end_scalar(depth, i, events)
+        else:
+            self._begin(depth, i, "scalar")
+
+    def _push(self, c: str) -> None:
+        self._stack.append(c)
+        self._expect_key = c == "{" and len(self._stack) == 1
+
+    def _tracked(self, depth: int) -> bool:
+        """Values directly inside the root, or inside an array field of a root object."""
+        return depth == 1 or (depth == 2 and self._stack[:2] == ["{", "["])
+
+    def _begin(self, depth: int, i: int, kind: str) -> None:
+        if self._tracked(depth) and depth not in self._open:
+            self._open[depth] = (i, kind)
+
+    def _finish_string(self, i: int, events: list) -> None:
+        if self._reading_key:
+            self._reading_key = False
+            self._key = json.loads(self.text[self._string_start : i + 1])
+            return
+        depth = len(self._stack)
+        if self._open.get(depth) == (self._string_start, "string"):
+            self._end(depth, i + 1, events)
+
+    def _end_scalar(self, depth: int, i: int, events: list) -> None:
+        if self._open.get(depth, (0, ""))[1] == "scalar":
+            self._end(depth, i, events)
+
+    def _end(self, depth: int, end: int, events: list) -> None:
+        if depth not in self._open:
+            return
+        start, _ = self._open.pop(depth)
+        try:
+            value = json.loads(self.text[start:end])
+        except json.JSONDecodeError:
+            return
+        if depth == 1 and self._stack[0] == "{":
+            events.append(("field", self._key, value))
+        else:
+            events.append(("item", self._key if depth == 2 else None, value))
+
+
+def json_events(value: Any) -> Iterator[tuple[str, str | None, Any]]:
+    """The events IncrementalJSONParser reports while reading value, for replaying a stored response."""
+    if isinstance(value, dict):
+        for key, field in value.items():
+            if isinstance(field, list):
+                for item in field:
+                    yield "item", key, item
+            yield "field", key, field
+    elif isinstance(value, list):
+        for item in value:
+            yield "item", None, item
@@ -0,0 +1,208 @@
+"""Per-call AI telemetry: latency, tokens, cost, outcome and cache hits per feature.
+
+Each event is logged as a structured line and folded into an hourly
+AIUsageStat row, so the table stays small no matter how many calls are
+made. Latencies are kept as bucketed histograms, from which p50/p95 are
+estimated when reporting.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Func, IntegerField, JSONField, Value
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+
+from ..models import AIUsageStat
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; one extra bucket counts slower calls
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2000, 4000, 8000, 15000, 30000, 60000)
+
+
+def _usage_numbers(usage) -> tuple[int, int, int, float]:
+    """(prompt_tokens, completion_tokens, cached_tokens, cost) from an OpenRouter usage object, zero when absent.
+
+    cached_tokens is the part of prompt_tokens read from the provider's
+    prompt cache (usage.prompt_tokens_details.cached_tokens).
+    """
+
+    def number(obj, name):
+        value = getattr(obj, name, None)
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
+
+    details = getattr(usage, "prompt_tokens_details", None)
+    return (
+        int(number(usage, "prompt_tokens")),
+        int(number(usage, "completion_tokens")),
+        int(number(details, "cached_tokens")),
+        float(number(usage, "cost")),
+    )
+
+
+def _bucket_index(latency_ms: int) -> int:
+    for i, bound in enumerate(LATENCY_BUCKETS_MS):
+        if latency_ms <= bound:
+            return i
+    return len(LATENCY_BUCKETS_MS)
+
+
+def record_ai_call(feature: str, model: str, outcome: str, latency_ms: int, usage=None) -> None:
+    """Record one upstream AI call. Never raises: telemetry must not break the call it describes."""
+    prompt_tokens, completion_tokens, cached_tokens, cost = _usage_numbers(usage)
+    logger.info(
+        f"AI call {feature or 'other'} {model} {outcome} in {latency_ms}ms "
+        f"({prompt_tokens}+{completion_tokens} tokens, {cached_tokens} cached)",
+        extra={
+            "ai_call": {
+                "feature": feature or "other",
+                "model": model,
+                "outcome": outcome,
+                "latency_ms": latency_ms,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "cached_tokens": cached_tokens,
+                "cost": cost,
+            }
+        },
+    )
+    _add(feature or "other", model, outcome, latency_ms, prompt_tokens, completion_tokens, cached_tokens, cost)
+
+
+def record_cache_hit(feature: str) -> None:
+    """Record a request for a feature answered from a cache instead of the model."""
+    _add(feature, "", AIUsageStat.OUTCOME_CACHE_HIT)
+
+
+def _histogram_increment(index: int) -> Func:
+    """Expression adding one to latency_histogram[index] in the database, so concurrent updates don't lose counts."""
+    count = Coalesce(Cast(KeyTextTransform(str(index), "latency_histogram"), IntegerField()), 0)
+    return Func(
+        F("latency_histogram"),
+        Func(Value(str(index)), template="ARRAY[%(expressions)s]"),
+        Func(count + 1, function="to_jsonb"),
+        function="jsonb_set",
+        output_field=JSONField(),
+    )
+
+
+def _add(
+    feature, model, outcome, latency_ms=None, prompt_tokens=0, completion_tokens=0, cached_tokens=0, cost=0.0
+) -> None:
+    """Fold one event into its hourly row, creating the row on first use.
+
+    The row is updated with a single UPDATE of F() increments rather than a
+    locked read-modify-write, so concurrent calls don't queue on a row lock.
+    """
+    key = {
+        "period_start": timezone.now().replace(minute=0, second=0, microsecond=0),
+        "feature": feature,
+        "model": model,
+        "outcome": outcome,
+    }
+    increments = {
+        "count": F("count") + 1,
+        "prompt_tokens": F("prompt_tokens") + prompt_tokens,
+        "completion_tokens": F("completion_tokens") + completion_tokens,
+        "cached_tokens": F("cached_tokens") + cached_tokens,
+        "cost": F("cost") + cost,
+    }
+    histogram = []
+    if latency_ms is not None:
+        increments["total_latency_ms"] = F("total_latency_ms") + latency_ms
+        increments["latency_histogram"] = _histogram_increment(_bucket_index(latency_ms))
+        histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        histogram[_bucket_index(latency_ms)] = 1
+    try:
+        if AIUsageStat.objects.filter(**key).update(**increments):
+            return
+        try:
+            with transaction.atomic():
+                AIUsageStat.objects.create(
+                    **key,
+                    count=1,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    cached_tokens=cached_tokens,
+                    cost=cost,
+                    total_latency_ms=latency_ms or 0,
+                    latency_histogram=histogram,
+                )
+        except IntegrityError:
+            # Another call created the row first
+            AIUsageStat.objects.filter(**key).update(**increments)
+    except Exception:
+        logger.debug(f"Could not record AI telemetry for {feature}", exc_info=True)
+
+
+def _percentile(histogram: list[int], fraction: float) -> int | None:
+    """Estimate a latency percentile (ms) by interpolating within its histogram bucket."""
+    total = sum(histogram)
+    if not total:
+        return None
+    target = fraction * total
+    seen = 0
+    for i, count in enumerate(histogram):
+        if count and seen + count >= target:
+            lower = LATENCY_BUCKETS_MS[i - 1] if i else 0
+            if i == len(LATENCY_BUCKETS_MS):
+                return lower
+            return round(lower + (LATENCY_BUCKETS_MS[i] - lower) * (target - seen) / count)
+        seen += count
+    return None
+
+
+def ai_usage_stats(days: int = 7) -> dict[str, dict]:
+    """Per-feature totals over the last `days` days, with p50/p95 latency of upstream calls.
+
+    hit_ratio is the share of requests answered from a cache rather than by
+    the model; cached_tokens counts prompt tokens the provider served from
+    its own prompt cache on calls that did reach the model.
+    """
+    since = timezone.now() - timedelta(days=days)
+    features: dict[str, dict] = {}
+    for row in AIUsageStat.objects.filter(period_start__gte=since).order_by("feature"):
+        stats = features.setdefault(
+            row.feature,
+            {
+                "calls": 0,
+                "errors": 0,
+                "cache_hits": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "cached_tokens": 0,
+                "cost": 0.0,
+                "models": set(),
+                "_latency_ms": 0,
+                "_histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+            },
+        )
+        if row.outcome == AIUsageStat.OUTCOME_CACHE_HIT:
+            stats["cache_hits"] += row.count
+            continue
+        stats["calls"] += row.count
+        if row.outcome == AIUsageStat.OUTCOME_ERROR:
+            stats["errors"] += row.count
+        stats["prompt_tokens"] += row.prompt_tokens
+        stats["completion_tokens"] += row.completion_tokens
+        stats["cached_tokens"] += row.cached_tokens
+        stats["cost"] += row.cost
+        stats["models"].add(row.model)
+        stats["_latency_ms"] += row.total_latency_ms
+        for i, count in enumerate(row.latency_histogram or []):
+            stats["_histogram"][i] += count
+
+    for stats in features.values():
+        histogram = stats.pop("_histogram")
+        total_latency = stats.pop("_latency_ms")
+        requests = stats["calls"] + stats["cache_hits"]
+        stats["models"] = sorted(stats["models"])
+        stats["cost"] = round(stats["cost"], 6)
+        stats["hit_ratio"] = round(stats["cache_hits"] / requests, 3) if requests else 0.0
+        stats["avg_ms"] = round(total_latency / stats["calls"]) if stats["calls"] else None
+        stats["p50_ms"] = _percentile(histogram, 0.5)
+        stats["p95_ms"] = _percentile(histogram, 0.95)
+    return features
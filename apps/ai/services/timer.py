@@ -2,15 +2,18 @@
 
 import logging
 
+from apps.recipes.models import Recipe
+from apps.recipes.services.timers import MAX_LABEL_LENGTH, ensure_step_timers, recipe_instructions
+
 from ..models import AIPrompt
-from .cache import cache_ai_response, CACHE_TIMEOUT_SHORT
+from .cache import cache_ai_response, cached_completion, CACHE_TIMEOUT_SHORT
 from .openrouter import OpenRouterService
-from .validator import AIResponseValidator
+from .validator import AIResponseValidator, ValidationError
 
 logger = logging.getLogger(__name__)
 
 
-@cache_ai_response("timer_name", timeout=CACHE_TIMEOUT_SHORT)
+@cache_ai_response("timer_name", timeout=CACHE_TIMEOUT_SHORT, feature="timer_naming")
 def generate_timer_name(step_text: str, duration_minutes: int) -> dict:
     """Generate a descriptive name for a cooking timer.
 
@@ -29,43 +32,114 @@ def generate_timer_name(step_text: str, duration_minutes: int) -> dict:
     # Get the timer_naming prompt
     prompt = AIPrompt.get_prompt("timer_naming")
 
-    # Format duration nicely
-    if duration_minutes >= 60:
-        hours = duration_minutes // 60
-        mins = duration_minutes % 60
-        if mins > 0:
-            duration_str = f"{hours} hour{'s' if hours > 1 else ''} {mins} minute{'s' if mins > 1 else ''}"
-        else:
-            duration_str = f"{hours} hour{'s' if hours > 1 else ''}"
-    else:
-        duration_str = f"{duration_minutes} minute{'s' if duration_minutes > 1 else ''}"
-
     # Format the user prompt
     user_prompt = prompt.format_user_prompt(
         instruction=step_text,
-        duration=duration_str,
+        duration=_format_duration(duration_minutes * 60),
     )
 
     # Call AI service
     service = OpenRouterService()
-    response = service.complete(
-        system_prompt=prompt.system_prompt,
-        user_prompt=user_prompt,
-        model=prompt.model,
-        json_response=True,
-    )
-
-    # Validate response
     validator = AIResponseValidator()
-    result = validator.validate("timer_naming", response)
+    result = cached_completion(service, prompt, user_prompt, validate=lambda r: validator.validate("timer_naming", r))
 
     # Truncate label if too long (max 30 chars as per spec)
-    label = result["label"]
-    if len(label) > 30:
-        label = label[:27] + "..."
+    label = _truncate(result["label"])
 
     logger.info(f'Generated timer name: "{label}" for {duration_minutes}min timer')
 
     return {
         "label": label,
     }
+
+
+def label_recipe_timers(recipe_id: int) -> list[list[dict]]:
+    """Label all of a recipe's cook mode timers with a single AI call.
+
+    The timers were extracted and labelled locally at import; this replaces
+    those labels with AI ones and stores them on the recipe, so cook mode
+    never has to ask for a timer name.
+
+    Args:
+        recipe_id: The ID of the recipe whose timers to label.
+
+    Returns:
+        The recipe's step timers.
+
+    Raises:
+        Recipe.DoesNotExist: If recipe not found.
+        AIUnavailableError: If AI service is not available.
+        AIResponseError: If AI returns invalid response.
+        ValidationError: If response doesn't match expected schema.
+    """
+    recipe = Recipe.objects.get(id=recipe_id)
+    step_timers = ensure_step_timers(recipe)
+    pending = [(i, timer) for i, step in enumerate(step_timers) for timer in step if timer["source"] != "ai"]
+    if not pending:
+        return step_timers
+
+    instructions = recipe_instructions(recipe)
+    lines = [
+        f"{n}. {_format_duration(timer['seconds'])} - {instructions[i]}" for n, (i, timer) in enumerate(pending, 1)
+    ]
+
+    prompt = AIPrompt.get_prompt("timer_labels")
+    user_prompt = prompt.format_user_prompt(timers="\n".join(lines), count=len(pending))
+
+    service = OpenRouterService()
+    validator = AIResponseValidator()
+
+    def validate(response):
+        labels = validator.validate("timer_labels", response)
+        if len(labels) != len(pending):
+            raise ValidationError(f"Expected {len(pending)} timer labels, got {len(labels)}")
+        return labels
+
+    labels = cached_completion(service, prompt, user_prompt, validate=validate)
+
+    for (_, timer), label in zip(pending, labels):
+        if label.strip():
+            timer["label"] = _truncate(label.strip())
+            timer["source"] = "ai"
+    recipe.step_timers = step_timers
+    recipe.save(update_fields=["step_timers"])
+
+    logger.info(f"Labelled {len(pending)} timers for recipe {recipe_id}")
+    return step_timers
+
+
+def run_timer_labels_job(job) -> None:
+    """Background job handler: label job.recipe_id's timers if AI is configured.
+
+    Missing recipes and a missing API key are skipped rather than retried;
+    AI errors propagate so the job queue retries them.
+    """
+    from apps.core.models import AppSettings
+
+    if not AppSettings.get().openrouter_api_key:
+        logger.debug(f"Skipping timer labels for recipe {job.recipe_id}: No API key")
+        return
+
+    try:
+        label_recipe_timers(job.recipe_id)
+    except Recipe.DoesNotExist:
+        logger.debug(f"Skipping timer labels for deleted recipe {job.recipe_id}")
+
+
+def _format_duration(seconds: int) -> str:
+    """Format a duration nicely ("1 hour 20 minutes", "30 seconds")."""
+    hours, remainder = divmod(seconds, 3600)
+    mins, secs = divmod(remainder, 60)
+    parts = [
+        f"{value} {unit}{'s' if value > 1 else ''}"
+        for value, unit in ((hours, "hour"), (mins, "minute"), (secs, "second"))
+        if value
+    ]
+    return " ".join(parts) or "0 minutes"
+
+
+def _truncate(label: str) -> str:
+    """Truncate label if too long (max 30 chars as per spec)."""
+    if len(label) > MAX_LABEL_LENGTH:
+        label = label[: MAX_LABEL_LENGTH - 3] + "..."
+    return label
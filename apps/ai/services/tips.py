@@ -1,11 +1,15 @@
 """Tips generation service using AI."""
 
 import logging
+from collections.abc import Iterator
+from typing import Any
 
 from apps.recipes.models import Recipe
 
 from ..models import AIPrompt
+from .cache import cached_completion, cached_stream_json, invalidate_completion
 from .openrouter import OpenRouterService, AIUnavailableError, AIResponseError
+from .telemetry import record_cache_hit
 from .validator import AIResponseValidator, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -33,14 +37,71 @@ def generate_tips(recipe_id: int) -> dict:
     # Check for cached tips
     if recipe.ai_tips:
         logger.info(f"Returning cached tips for recipe {recipe_id}")
+        record_cache_hit("tips_generation")
         return {
             "tips": recipe.ai_tips,
             "cached": True,
         }
 
+    prompt, user_prompt = _build_tips_prompt(recipe)
+
+    # Call AI service (identical recipes share one cached response)
+    service = OpenRouterService()
+    validator = AIResponseValidator()
+    response = cached_completion(
+        service, prompt, user_prompt, validate=lambda r: validator.validate("tips_generation", r)
+    )
+
+    return {
+        "tips": _save_tips(recipe, response),
+        "cached": False,
+    }
+
+
+def stream_tips(recipe_id: int) -> Iterator[tuple[str, str | None, Any]]:
+    """Generate cooking tips, streaming each tip as soon as it is complete.
+
+    Yields ("item", None, tip) for each tip, then ("done", None, result)
+    where result is the same dict generate_tips() returns. Tips stored on
+    the recipe, or a cached response for the same prompt, are replayed
+    immediately without calling the AI.
+
+    Raises:
+        Same as generate_tips().
+    """
+    recipe = Recipe.objects.get(id=recipe_id)
+
+    if recipe.ai_tips:
+        logger.info(f"Returning cached tips for recipe {recipe_id}")
+        record_cache_hit("tips_generation")
+        for tip in recipe.ai_tips:
+            yield "item", None, tip
+        yield "done", None, {"tips": recipe.ai_tips, "cached": True}
+        return
+
+    prompt, user_prompt = _build_tips_prompt(recipe)
+
+    # Identical recipes share one cached response with generate_tips()
+    service = OpenRouterService()
+    validator = AIResponseValidator()
+    for event in cached_stream_json(
+        service, prompt, user_prompt, validate=lambda r: validator.validate("tips_generation", r)
+    ):
+        if event[0] == "done":
+            yield "done", None, {"tips": _save_tips(recipe, event[2]), "cached": False}
+        else:
+            yield event
+
+
+def _build_tips_prompt(recipe: Recipe) -> tuple[AIPrompt, str]:
+    """Render the tips_generation prompt for a recipe."""
     # Get the tips_generation prompt
     prompt = AIPrompt.get_prompt("tips_generation")
+    return prompt, prompt.format_user_prompt(**_tips_prompt_fields(recipe))
 
+
+def _tips_prompt_fields(recipe: Recipe) -> dict[str, str]:
+    """Format a recipe's title, ingredients and instructions for the tips template."""
     # Format ingredients as a string
     ingredients_str = "\n".join(f"- {ing}" for ing in recipe.ingredients)
 
@@ -53,22 +114,52 @@ def generate_tips(recipe_id: int) -> dict:
     else:
         instructions_str = recipe.instructions_text or str(recipe.instructions)
 
-    # Format the user prompt
-    user_prompt = prompt.format_user_prompt(
-        title=recipe.title,
-        ingredients=ingredients_str,
-        instructions=instructions_str,
-    )
+    return {"title": recipe.title, "ingredients": ingredients_str, "instructions": instructions_str}
 
-    # Call AI service
-    service = OpenRouterService()
-    response = service.complete(
-        system_prompt=prompt.system_prompt,
-        user_prompt=user_prompt,
-        model=prompt.model,
-        json_response=True,
+
+def build_batch_tips_prompt(prompt: AIPrompt, recipes: list[Recipe]) -> tuple[str, str]:
+    """Render one (system_prompt, user_prompt) pair asking for tips for several recipes.
+
+    Each recipe is rendered with the tips_generation user template under its
+    ID, and the model is asked for a JSON object mapping each ID to the same
+    array of tips it would return for that recipe on its own.
+    """
+    sections = [
+        f"=== Recipe ID {recipe.id} ===\n{prompt.format_user_prompt(**_tips_prompt_fields(recipe))}"
+        for recipe in recipes
+    ]
+    system_prompt = (
+        f"{prompt.system_prompt}\n\n"
+        "You will be given several recipes, each headed by its recipe ID. Respond with a single "
+        'JSON object mapping each recipe ID (as a string) to its array of tips, e.g. {"12": ["tip 1", '
+        '"tip 2", "tip 3"]}. Include every recipe ID.'
     )
+    return system_prompt, "\n\n".join(sections)
+
+
+def parse_batch_tips(recipes: list[Recipe], response) -> dict[int, list[str]]:
+    """Validate each recipe's tips from a batched response.
+
+    Returns {recipe_id: tips} for the recipes whose tips pass the
+    tips_generation schema; missing or invalid entries are logged and left
+    out so one bad recipe doesn't discard the rest of the batch.
+    """
+    if not isinstance(response, dict):
+        logger.warning(f"Batched tips response is not an object: {type(response).__name__}")
+        return {}
+
+    validator = AIResponseValidator()
+    results = {}
+    for recipe in recipes:
+        try:
+            results[recipe.id] = validator.validate("tips_generation", response.get(str(recipe.id)))
+        except ValidationError as e:
+            logger.warning(f"Discarding batched tips for recipe {recipe.id}: {e}")
+    return results
 
+
+def _save_tips(recipe: Recipe, response) -> list[str]:
+    """Validate the AI response and cache the tips on the recipe."""
     # Validate response - tips_generation returns an array directly
     validator = AIResponseValidator()
     tips = validator.validate("tips_generation", response)
@@ -77,12 +168,29 @@ def generate_tips(recipe_id: int) -> dict:
     recipe.ai_tips = tips
     recipe.save(update_fields=["ai_tips"])
 
-    logger.info(f"Generated and cached {len(tips)} tips for recipe {recipe_id}")
+    logger.info(f"Generated and cached {len(tips)} tips for recipe {recipe.id}")
 
-    return {
-        "tips": tips,
-        "cached": False,
-    }
+    return tips
+
+
+def run_tips_job(job) -> None:
+    """Background job handler: generate tips for job.recipe_id if AI is configured.
+
+    Missing recipes and a missing API key are skipped rather than retried;
+    AI errors propagate so the job queue retries them.
+    """
+    from apps.core.models import AppSettings
+
+    if not AppSettings.get().openrouter_api_key:
+        logger.debug(f"Skipping tips generation for recipe {job.recipe_id}: No API key")
+        return
+
+    try:
+        generate_tips(job.recipe_id)
+    except Recipe.DoesNotExist:
+        logger.debug(f"Skipping tips generation for deleted recipe {job.recipe_id}")
+        return
+    logger.info(f"Auto-generated tips for recipe {job.recipe_id}")
 
 
 def clear_tips(recipe_id: int) -> bool:
@@ -99,6 +207,15 @@ def clear_tips(recipe_id: int) -> bool:
     """
     recipe = Recipe.objects.get(id=recipe_id)
 
+    # Regenerating should ask the AI again rather than replay the shared response.
+    # Without an active prompt there is no cached response to invalidate.
+    try:
+        prompt, user_prompt = _build_tips_prompt(recipe)
+    except AIPrompt.DoesNotExist:
+        logger.warning("No active tips_generation prompt, skipping cache invalidation for recipe %s", recipe_id)
+    else:
+        invalidate_completion(prompt, user_prompt)
+
     if recipe.ai_tips:
         recipe.ai_tips = []
         recipe.save(update_fields=["ai_tips"])
@@ -55,6 +55,10 @@ RESPONSE_SCHEMAS = {
             "label": {"type": "string"},
         },
     },
+    "timer_labels": {
+        "type": "array",
+        "items": {"type": "string"},
+    },
     "remix_suggestions": {
         "type": "array",
         "items": {"type": "string"},
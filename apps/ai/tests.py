@@ -6,11 +6,8 @@ from django.test import TestCase
 
 from apps.core.models import AppSettings
 from .models import AIPrompt
-from .services.openrouter import (
-    OpenRouterService,
-    AIUnavailableError,
-    AIResponseError,
-)
+from .services.key_status import run_key_status_job, store_key_status
+from .services.openrouter import OpenRouterService, AIUnavailableError, AIResponseError
 from .services.validator import AIResponseValidator, ValidationError
 
 
@@ -18,8 +15,8 @@ class AIPromptModelTests(TestCase):
     """Tests for the AIPrompt model."""
 
     def test_prompts_seeded(self):
-        """Verify all 10 prompts were seeded."""
-        assert AIPrompt.objects.count() == 10
+        """Verify all 11 prompts were seeded."""
+        assert AIPrompt.objects.count() == 11
 
     def test_all_prompt_types_exist(self):
         """Verify all prompt types are present."""
@@ -186,15 +183,15 @@ class AIAPITests(TestCase):
         assert data["error_code"] == "no_api_key"
         assert "No API key configured" in data["error"]
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_ai_status_invalid_api_key(self, mock_test_connection):
-        """Test AI status shows invalid when API key fails validation."""
-        mock_test_connection.return_value = (False, "Invalid API key")
+    @patch.object(OpenRouterService, "check_key")
+    def test_ai_status_invalid_api_key(self, mock_check_key):
+        """Test AI status shows invalid once the background check rejects the key."""
+        mock_check_key.return_value = (False, "API key is invalid or expired")
 
         settings = AppSettings.get()
         settings.openrouter_api_key = "sk-or-invalid-key"
         settings.save()
-        OpenRouterService.invalidate_key_cache()
+        run_key_status_job(None)
 
         response = self.client.get("/api/ai/status")
         assert response.status_code == 200
@@ -204,15 +201,15 @@ class AIAPITests(TestCase):
         assert data["valid"] is False
         assert data["error_code"] == "invalid_api_key"
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_ai_status_valid_api_key(self, mock_test_connection):
-        """Test AI status shows valid when API key passes validation."""
-        mock_test_connection.return_value = (True, "Connection successful")
+    @patch.object(OpenRouterService, "check_key")
+    def test_ai_status_valid_api_key(self, mock_check_key):
+        """Test AI status shows valid when the background check accepts the key."""
+        mock_check_key.return_value = (True, "API key is valid")
 
         settings = AppSettings.get()
         settings.openrouter_api_key = "sk-or-valid-key"
         settings.save()
-        OpenRouterService.invalidate_key_cache()
+        run_key_status_job(None)
 
         response = self.client.get("/api/ai/status")
         assert response.status_code == 200
@@ -251,7 +248,7 @@ class AIAPITests(TestCase):
         response = self.client.get("/api/ai/prompts")
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 10  # 10 prompts seeded (search_ranking removed)
+        assert len(data) == 11  # 11 prompts seeded (search_ranking removed, timer_labels added)
 
     def test_get_prompt_endpoint(self):
         """Test getting a specific prompt."""
@@ -308,13 +305,11 @@ class AIAPITests(TestCase):
         )
         assert response.status_code == 400
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_save_api_key_invalidates_cache(self, mock_test_connection):
-        """Test that saving API key invalidates the validation cache."""
-        mock_test_connection.return_value = (True, "Connection successful")
+    def test_save_api_key_invalidates_cache(self):
+        """Test that saving API key forgets its stored status and queues a fresh check."""
+        from apps.core.models import BackgroundJob
 
-        # Pre-populate the cache
-        OpenRouterService._key_validation_cache[hash("old-key")] = (True, 0)
+        store_key_status("new-key-123", False, "API key is invalid or expired")
 
         response = self.client.post(
             "/api/ai/save-api-key",
@@ -324,8 +319,8 @@ class AIAPITests(TestCase):
         )
         assert response.status_code == 200
 
-        # Cache should be cleared
-        assert len(OpenRouterService._key_validation_cache) == 0
+        assert OpenRouterService.validate_key_cached("new-key-123") == (True, None)
+        assert BackgroundJob.objects.filter(job_type="refresh_ai_key_status").exists()
 
 
 class OpenRouterServiceTests(TestCase):
@@ -363,40 +358,27 @@ class OpenRouterServiceTests(TestCase):
 
         assert OpenRouterService.is_available() is True
 
+    @patch.object(OpenRouterService, "check_key")
     @patch.object(OpenRouterService, "test_connection")
-    def test_validate_key_cached_caches_result(self, mock_test_connection):
-        """Test that validate_key_cached caches validation results."""
-        mock_test_connection.return_value = (True, "Connection successful")
-        OpenRouterService.invalidate_key_cache()
+    def test_validate_key_cached_never_calls_api(self, mock_test_connection, mock_check_key):
+        """Test that validate_key_cached serves the stored status without calling OpenRouter."""
+        store_key_status("test-key", True)
 
-        # First call should hit the API
         is_valid1, error1 = OpenRouterService.validate_key_cached("test-key")
-        assert is_valid1 is True
-        assert error1 is None
-        assert mock_test_connection.call_count == 1
-
-        # Second call should use cache
-        is_valid2, error2 = OpenRouterService.validate_key_cached("test-key")
-        assert is_valid2 is True
-        assert error2 is None
-        assert mock_test_connection.call_count == 1  # Still 1, not called again
+        is_valid2, error2 = OpenRouterService.validate_key_cached("unchecked-key")
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_validate_key_cached_caches_invalid_result(self, mock_test_connection):
-        """Test that validate_key_cached caches invalid validation results."""
-        mock_test_connection.return_value = (False, "Invalid API key")
-        OpenRouterService.invalidate_key_cache()
+        assert (is_valid1, error1) == (True, None)
+        assert (is_valid2, error2) == (True, None)  # Unknown keys are assumed valid until checked
+        mock_test_connection.assert_not_called()
+        mock_check_key.assert_not_called()
 
-        # First call should hit the API
-        is_valid1, error1 = OpenRouterService.validate_key_cached("bad-key")
-        assert is_valid1 is False
-        assert error1 is not None
-        assert mock_test_connection.call_count == 1
+    def test_validate_key_cached_returns_stored_invalid_result(self):
+        """Test that validate_key_cached returns a stored invalid status with its error."""
+        store_key_status("bad-key", False, "API key is invalid or expired")
 
-        # Second call should use cache
-        is_valid2, error2 = OpenRouterService.validate_key_cached("bad-key")
-        assert is_valid2 is False
-        assert mock_test_connection.call_count == 1  # Still 1, not called again
+        is_valid, error = OpenRouterService.validate_key_cached("bad-key")
+        assert is_valid is False
+        assert error == "API key is invalid or expired"
 
     def test_validate_key_cached_no_key(self):
         """Test that validate_key_cached handles missing key."""
@@ -406,12 +388,14 @@ class OpenRouterServiceTests(TestCase):
         assert "No API key configured" in error
 
     def test_invalidate_key_cache(self):
-        """Test that invalidate_key_cache clears the cache."""
-        OpenRouterService._key_validation_cache["test"] = (True, 0)
-        assert len(OpenRouterService._key_validation_cache) > 0
+        """Test that invalidate_key_cache forgets the configured key's status."""
+        settings = AppSettings.get()
+        settings.openrouter_api_key = "test-key"
+        settings.save()
+        store_key_status("test-key", False, "API key is invalid or expired")
 
         OpenRouterService.invalidate_key_cache()
-        assert len(OpenRouterService._key_validation_cache) == 0
+        assert OpenRouterService.validate_key_cached("test-key") == (True, None)
 
     @patch("apps.ai.services.openrouter.OpenRouter")
     def test_complete_success(self, mock_openrouter_class):
@@ -1065,14 +1049,14 @@ class AIFeatureFallbackTests(TestCase):
         assert data["available"] is False
         assert data["configured"] is False
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_ai_status_shows_available_with_key(self, mock_test_connection):
+    @patch.object(OpenRouterService, "check_key")
+    def test_ai_status_shows_available_with_key(self, mock_check_key):
         """Test AI status endpoint shows available with valid API key."""
-        mock_test_connection.return_value = (True, "Connection successful")
+        mock_check_key.return_value = (True, "API key is valid")
         settings = AppSettings.get()
         settings.openrouter_api_key = "test-key-123"
         settings.save()
-        OpenRouterService.invalidate_key_cache()
+        run_key_status_job(None)
 
         response = self.client.get("/api/ai/status")
         assert response.status_code == 200
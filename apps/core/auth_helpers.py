@@ -20,5 +20,6 @@ def passkey_user_profile_response(user, profile):
             "avatar_color": profile.avatar_color,
             "theme": profile.theme,
             "unit_preference": profile.unit_preference,
+            "convert_units": profile.convert_units,
         },
     }
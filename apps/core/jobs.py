@@ -0,0 +1,195 @@
+"""
+Durable background job queue.
+
+Work that should not block a request (AI tips, cook mode timer labels,
+remix nutrition estimates, AI prefetch, search image caching, API key
+checks) is written to the BackgroundJob table and processed by the run_jobs
+worker command, which runs a fixed number of jobs at a time, highest
+priority first. Jobs survive web worker restarts, failed jobs are retried
+with exponential backoff, and at most one job per (job_type, recipe) can be
+queued or running at once.
+"""
+
+import logging
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Min
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+# job_type -> dotted path of a callable taking the BackgroundJob
+JOB_HANDLERS = {
+    "generate_tips": "apps.ai.services.tips.run_tips_job",
+    "cache_search_images": "apps.recipes.services.image_cache.run_cache_images_job",
+    "refresh_ai_key_status": "apps.ai.services.key_status.run_key_status_job",
+    "label_timers": "apps.ai.services.timer.run_timer_labels_job",
+    "estimate_nutrition": "apps.ai.services.remix.run_nutrition_job",
+    "prefetch_ai": "apps.ai.services.prefetch.run_prefetch_job",
+}
+
+RETRY_BACKOFF_SECONDS = 30
+STALE_JOB_SECONDS = 600  # Running jobs older than this were orphaned by a dead worker
+FINISHED_JOB_RETENTION_DAYS = 7
+
+
+def enqueue_job(
+    job_type: str,
+    recipe_id: int | None = None,
+    payload: dict | None = None,
+    priority: int = BackgroundJob.PRIORITY_NORMAL,
+    dedup_key: str = "",
+) -> bool:
+    """
+    Queue a background job.
+
+    Args:
+        job_type: Key in JOB_HANDLERS
+        recipe_id: Recipe the job is about; an active job for the same
+            (job_type, recipe_id) makes this a no-op
+        payload: JSON-serialisable arguments for the handler
+        priority: Due jobs with a higher priority are run first. Jobs below
+            PRIORITY_NORMAL are dropped once the queue is half full, leaving
+            room for work someone asked for
+        dedup_key: Set to let jobs with the same (job_type, recipe_id) be
+            active together; only an active job with the same key is a duplicate
+
+    Returns:
+        True if a job was queued, False if it was a duplicate or the queue is full
+    """
+    if job_type not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job type: {job_type}")
+
+    depth = BackgroundJob.objects.filter(status=BackgroundJob.STATUS_PENDING).count()
+    max_depth = settings.JOB_QUEUE_MAX_DEPTH
+    if priority < BackgroundJob.PRIORITY_NORMAL:
+        max_depth //= 2
+    if depth >= max_depth:
+        logger.warning("Job queue full (%d pending), dropping %s job for recipe %s", depth, job_type, recipe_id)
+        return False
+
+    try:
+        with transaction.atomic():
+            BackgroundJob.objects.create(
+                job_type=job_type, recipe_id=recipe_id, dedup_key=dedup_key, payload=payload or {}, priority=priority
+            )
+    except IntegrityError:
+        logger.debug("Skipping duplicate %s job for recipe %s", job_type, recipe_id)
+        return False
+    return True
+
+
+def claim_jobs(limit: int) -> list[BackgroundJob]:
+    """Atomically mark up to `limit` due jobs as running and return them."""
+    if limit <= 0:
+        return []
+
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            BackgroundJob.objects.select_for_update(skip_locked=True)
+            .filter(status=BackgroundJob.STATUS_PENDING, run_after__lte=now)
+            .order_by("-priority", "run_after", "id")[:limit]
+        )
+        if jobs:
+            BackgroundJob.objects.filter(id__in=[job.id for job in jobs]).update(
+                status=BackgroundJob.STATUS_RUNNING, attempts=F("attempts") + 1, started_at=now
+            )
+    for job in jobs:
+        job.status = BackgroundJob.STATUS_RUNNING
+        job.attempts += 1
+        job.started_at = now
+    return jobs
+
+
+def run_job(job: BackgroundJob) -> bool:
+    """
+    Run a claimed job and record the outcome.
+
+    A failing job goes back to pending with exponential backoff until it
+    has used max_attempts, then it is marked failed.
+
+    Returns:
+        True if the handler succeeded
+    """
+    try:
+        handler = import_string(JOB_HANDLERS[job.job_type])
+        handler(job)
+    except Exception as e:
+        job.last_error = f"{type(e).__name__}: {e}"[:1000]
+        if job.attempts >= job.max_attempts:
+            logger.error("Job %s (%s) failed after %d attempts: %s", job.id, job.job_type, job.attempts, e)
+            job.status = BackgroundJob.STATUS_FAILED
+            job.finished_at = timezone.now()
+        else:
+            delay = RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)
+            logger.warning("Job %s (%s) failed, retrying in %ds: %s", job.id, job.job_type, delay, e)
+            job.status = BackgroundJob.STATUS_PENDING
+            job.run_after = timezone.now() + timezone.timedelta(seconds=delay)
+        job.save(update_fields=["status", "last_error", "run_after", "finished_at"])
+        return False
+
+    job.status = BackgroundJob.STATUS_DONE
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "finished_at"])
+    return True
+
+
+def requeue_stale_jobs() -> int:
+    """
+    Return jobs left running by a worker that died mid-job to the queue.
+
+    A stale job that has already used max_attempts is marked failed instead,
+    so a job that kills its worker every time isn't retried forever. Remixes
+    whose nutrition job fails this way stop showing nutrition as pending.
+
+    Returns:
+        Number of jobs requeued
+    """
+    # Import here to avoid circular imports
+    from apps.recipes.models import Recipe
+
+    now = timezone.now()
+    stale = BackgroundJob.objects.filter(
+        status=BackgroundJob.STATUS_RUNNING, started_at__lt=now - timezone.timedelta(seconds=STALE_JOB_SECONDS)
+    )
+    exhausted = stale.filter(attempts__gte=F("max_attempts"))
+    with transaction.atomic():
+        nutrition_ids = list(exhausted.filter(job_type="estimate_nutrition").values_list("recipe_id", flat=True))
+        failed = exhausted.update(
+            status=BackgroundJob.STATUS_FAILED, finished_at=now, last_error="Worker died while running the job"
+        )
+        Recipe.objects.filter(id__in=nutrition_ids).update(nutrition_pending=False)
+    if failed:
+        logger.error("Marked %d stale job(s) failed after their last attempt", failed)
+    return stale.update(status=BackgroundJob.STATUS_PENDING, run_after=now)
+
+
+def purge_finished_jobs() -> int:
+    """Delete done and failed jobs older than the retention window."""
+    cutoff = timezone.now() - timezone.timedelta(days=FINISHED_JOB_RETENTION_DAYS)
+    deleted, _ = BackgroundJob.objects.filter(
+        status__in=[BackgroundJob.STATUS_DONE, BackgroundJob.STATUS_FAILED], finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+def queue_metrics() -> dict:
+    """Queue depth by status and job type, plus the age of the oldest due job."""
+    counts = {status: 0 for status, _ in BackgroundJob.STATUS_CHOICES}
+    for row in BackgroundJob.objects.values("status").annotate(n=Count("id")):
+        counts[row["status"]] = row["n"]
+
+    pending = BackgroundJob.objects.filter(status=BackgroundJob.STATUS_PENDING)
+    by_type = {row["job_type"]: row["n"] for row in pending.values("job_type").annotate(n=Count("id"))}
+    oldest = pending.filter(run_after__lte=timezone.now()).aggregate(oldest=Min("run_after"))["oldest"]
+
+    return {
+        **counts,
+        "pending_by_type": by_type,
+        "oldest_pending_seconds": int((timezone.now() - oldest).total_seconds()) if oldest else 0,
+    }
@@ -22,7 +22,7 @@ class JSONFormatter(logging.Formatter):
             log_entry["request_id"] = record.request_id
 
         # Add extra fields
-        for key in ("username", "ip", "path", "reason", "endpoint", "action", "target_username"):
+        for key in ("username", "ip", "path", "reason", "endpoint", "action", "target_username", "ai_call"):
             if hasattr(record, key):
                 log_entry[key] = getattr(record, key)
 
@@ -1,4 +1,4 @@
-"""App-config handlers for `cookie_admin`: reset, api key, prompts.
+"""App-config handlers for `cookie_admin`: reset, api key, prompts, AI cache.
 
 Split out of `cookie_admin.py` to stay under the 500-line quality gate.
 Methods assume `self` is a `Command` instance — see main module for the
@@ -20,7 +20,7 @@ security_logger = logging.getLogger("security")
 
 
 class AppConfigMixin:
-    """reset + OpenRouter/prompts subcommand handlers."""
+    """reset + OpenRouter/prompts/ai subcommand handlers."""
 
     # ------------------------------------------------------------------ #
     # reset                                                               #
@@ -198,13 +198,16 @@ class AppConfigMixin:
     def _handle_prompts_list(self, options):
         from apps.ai.models import AIPrompt
 
-        rows = list(AIPrompt.objects.order_by("prompt_type").values("prompt_type", "name", "model", "is_active"))
+        rows = list(
+            AIPrompt.objects.order_by("prompt_type").values("prompt_type", "name", "model", "is_active", "version")
+        )
         if options.get("as_json"):
             self.stdout.write(json.dumps({"ok": True, "prompts": rows}))
             return
         for r in rows:
             self.stdout.write(
-                f"{r['prompt_type']:<22} model={r['model']:<35} active={r['is_active']}  name={r['name']!r}"
+                f"{r['prompt_type']:<22} model={r['model']:<35} active={r['is_active']}  "
+                f"version={r['version']}  name={r['name']!r}"
             )
 
     def _handle_prompts_show(self, options):
@@ -220,6 +223,7 @@ class AppConfigMixin:
             "description": p.description,
             "model": p.model,
             "is_active": p.is_active,
+            "version": p.version,
             "system_prompt": p.system_prompt,
             "user_prompt_template": p.user_prompt_template,
         }
@@ -231,6 +235,7 @@ class AppConfigMixin:
         self.stdout.write(f"description: {p.description}")
         self.stdout.write(f"model:       {p.model}")
         self.stdout.write(f"is_active:   {p.is_active}")
+        self.stdout.write(f"version:     {p.version}")
         self.stdout.write("system_prompt:")
         self.stdout.write(p.system_prompt)
         self.stdout.write("user_prompt_template:")
@@ -279,13 +284,13 @@ class AppConfigMixin:
             prompt.model = options["model"]
         if options.get("active"):
             prompt.is_active = options["active"] == "true"
-        prompt.save()
+        prompt.save_new_version()
 
         security_logger.warning("cookie_admin prompts set %s: fields=%s", prompt_type, updated_fields)
         self._success(
-            f"Prompt {prompt_type} updated: fields={updated_fields}",
+            f"Prompt {prompt_type} updated to version {prompt.version}: fields={updated_fields}",
             options,
-            {"prompt_type": prompt_type, "updated_fields": updated_fields},
+            {"prompt_type": prompt_type, "updated_fields": updated_fields, "version": prompt.version},
         )
 
     def _read_text_file(self, path, options):
@@ -294,3 +299,46 @@ class AppConfigMixin:
                 return fh.read()
         except (OSError, UnicodeDecodeError) as exc:
             self._error(f"Cannot read file '{path}': {exc}", options, code=2)
+
+    # ------------------------------------------------------------------ #
+    # ai                                                                  #
+    # ------------------------------------------------------------------ #
+
+    def _handle_ai_cache(self, options):
+        from apps.ai.services.cache import ai_cache_stats, reset_ai_cache_stats
+
+        stats = ai_cache_stats()
+        if options.get("reset"):
+            reset_ai_cache_stats()
+        if options.get("as_json"):
+            self.stdout.write(json.dumps({"ok": True, "features": stats}))
+            return
+        if not stats:
+            self.stdout.write("No cached AI requests recorded yet.")
+            return
+        for feature, s in stats.items():
+            self.stdout.write(
+                f"{feature:<22} hits={s['hits']:<6} misses={s['misses']:<6} hit_ratio={s['hit_ratio']:.1%}"
+            )
+
+    def _handle_ai_stats(self, options):
+        from apps.ai.services.telemetry import ai_usage_stats
+
+        days = max(1, options.get("days") or 7)
+        stats = ai_usage_stats(days)
+        if options.get("as_json"):
+            self.stdout.write(json.dumps({"ok": True, "days": days, "features": stats}))
+            return
+        if not stats:
+            self.stdout.write(f"No AI calls recorded in the last {days} day(s).")
+            return
+
+        def ms(value):
+            return "-" if value is None else f"{value}ms"
+
+        for feature, s in stats.items():
+            self.stdout.write(
+                f"{feature:<22} calls={s['calls']:<6} errors={s['errors']:<4} hit_ratio={s['hit_ratio']:<6.1%} "
+                f"p50={ms(s['p50_ms']):<8} p95={ms(s['p95_ms']):<8} "
+                f"tokens={s['prompt_tokens']}+{s['completion_tokens']} cached={s['cached_tokens']} cost=${s['cost']:.4f}"
+            )
@@ -108,6 +108,11 @@ class UsersStatusMixin:
             "search_image_cleanup": cache.get(IMG_KEY) or "never run",
         }
 
+        # Background job queue depth
+        from apps.core.jobs import queue_metrics
+
+        status["jobs"] = queue_metrics()
+
         # Cache (image-cache health) — parity with the now-gated
         # GET /api/recipes/cache/health/ endpoint.
         try:
@@ -134,6 +139,11 @@ class UsersStatusMixin:
             f"OpenRouter:   {'configured' if status['openrouter']['configured'] else 'not configured'} (source: {src})"
         )
         self.stdout.write(f"WebAuthn RP:  {status['webauthn']['rp_id']} ({status['webauthn']['rp_name']})")
+        jobs = status["jobs"]
+        self.stdout.write(
+            f"Job queue:    {jobs['pending']} pending, {jobs['running']} running, {jobs['failed']} failed "
+            f"(oldest due {jobs['oldest_pending_seconds']}s)"
+        )
         self.stdout.write("Maintenance:")
         for label, key in [
             ("  Device codes", "device_code_cleanup"),
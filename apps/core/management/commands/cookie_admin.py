@@ -35,6 +35,8 @@ Mode-agnostic (operate on AppSettings / AIPrompt / SearchSource / Profile):
     cookie_admin sources repair <source_id> [--json]
     cookie_admin quota show [--json]
     cookie_admin quota set {remix|remix-suggestions|scale|tips|discover|timer} <N> [--json]
+    cookie_admin ai cache [--reset] [--json]
+    cookie_admin ai stats [--days N] [--json]
     cookie_admin rename <user_or_profile> --name NEW [--json]
 
 Implementation split across sibling `_cookie_admin_*.py` mixins to keep
@@ -217,6 +219,16 @@ class Command(UsersStatusMixin, AppConfigMixin, ResourcesMixin, BaseCommand):
         qt_set.add_argument("value", type=int)
         qt_set.add_argument("--json", action="store_true", dest="as_json")
 
+        # ai
+        ai = sub.add_parser("ai", help="AI response cache and usage metrics")
+        ai_sub = ai.add_subparsers(dest="ai_action")
+        ai_cache = ai_sub.add_parser("cache", help="Shared AI response cache hit ratios per feature")
+        ai_cache.add_argument("--reset", action="store_true", help="Zero the counters after reporting")
+        ai_cache.add_argument("--json", action="store_true", dest="as_json")
+        ai_stats = ai_sub.add_parser("stats", help="AI call latency (p50/p95), tokens, cost and errors per feature")
+        ai_stats.add_argument("--days", type=int, default=7, help="Look back this many days (default: 7)")
+        ai_stats.add_argument("--json", action="store_true", dest="as_json")
+
         # rename
         rn = sub.add_parser(
             "rename",
@@ -234,8 +246,13 @@ class Command(UsersStatusMixin, AppConfigMixin, ResourcesMixin, BaseCommand):
         if subcommand in self.PASSKEY_ONLY_SUBCOMMANDS and settings.AUTH_MODE != "passkey":
             self._error(f"'{subcommand}' requires AUTH_MODE=passkey.", options, code=2)
 
-        # Nested-subcommand dispatch (prompts/sources/quota have per-action handlers).
-        NESTED = {"prompts": "prompts_action", "sources": "sources_action", "quota": "quota_action"}
+        # Nested-subcommand dispatch (prompts/sources/quota/ai have per-action handlers).
+        NESTED = {
+            "prompts": "prompts_action",
+            "sources": "sources_action",
+            "quota": "quota_action",
+            "ai": "ai_action",
+        }
         if subcommand in NESTED:
             action = options.get(NESTED[subcommand])
             if not action:
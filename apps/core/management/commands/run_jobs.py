@@ -0,0 +1,102 @@
+"""
+Management command to process the background job queue.
+
+Runs up to JOB_WORKER_CONCURRENCY jobs at a time in a thread pool, polling
+the BackgroundJob table for due work. On SIGTERM/SIGINT it stops claiming
+new jobs and waits for the running ones to finish.
+
+Usage:
+    python manage.py run_jobs
+    python manage.py run_jobs --concurrency=4 --poll-interval=1
+    python manage.py run_jobs --once        # drain due jobs, then exit
+"""
+
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from apps.core.jobs import claim_jobs, purge_finished_jobs, queue_metrics, requeue_stale_jobs, run_job
+
+HOUSEKEEPING_INTERVAL = 300  # seconds between stale-job and purge sweeps
+
+
+def _run_in_thread(job):
+    """Run one job in a pool thread, releasing the thread's DB connection afterwards."""
+    try:
+        return run_job(job)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = "Process queued background jobs (AI tips, search image caching)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help="Maximum jobs to run at once (default: JOB_WORKER_CONCURRENCY)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between polls when the queue is idle (default: 2)",
+        )
+        parser.add_argument("--once", action="store_true", help="Process all due jobs, then exit")
+
+    def handle(self, *args, **options):
+        concurrency = max(1, options["concurrency"] or settings.JOB_WORKER_CONCURRENCY)
+        self._stop = threading.Event()
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, self._request_stop)
+            signal.signal(signal.SIGINT, self._request_stop)
+
+        self._housekeeping()
+        self.stdout.write(f"Job worker started (concurrency {concurrency}).")
+
+        processed = 0
+        last_housekeeping = time.monotonic()
+        running = set()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="job") as pool:
+            while not self._stop.is_set():
+                close_old_connections()
+                for job in claim_jobs(concurrency - len(running)):
+                    running.add(pool.submit(_run_in_thread, job))
+
+                if not running:
+                    if options["once"]:
+                        break
+                    self._stop.wait(options["poll_interval"])
+                else:
+                    done, running = wait(running, timeout=options["poll_interval"], return_when=FIRST_COMPLETED)
+                    processed += len(done)
+
+                if time.monotonic() - last_housekeeping > HOUSEKEEPING_INTERVAL:
+                    self._housekeeping()
+                    last_housekeeping = time.monotonic()
+
+            processed += len(running)
+
+        self.stdout.write(self.style.SUCCESS(f"Job worker stopped after {processed} job(s)."))
+
+    def _request_stop(self, signum, frame):
+        self.stdout.write("Stopping job worker after running jobs finish...")
+        self._stop.set()
+
+    def _housekeeping(self):
+        requeued = requeue_stale_jobs()
+        purged = purge_finished_jobs()
+        if requeued or purged:
+            self.stdout.write(f"Requeued {requeued} stale job(s), purged {purged} finished job(s).")
+        metrics = queue_metrics()
+        self.stdout.write(
+            f"Queue: {metrics['pending']} pending, {metrics['running']} running, {metrics['failed']} failed "
+            f"(oldest due job waiting {metrics['oldest_pending_seconds']}s)"
+        )
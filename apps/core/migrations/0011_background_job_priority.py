@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-19 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_background_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backgroundjob',
+            name='priority',
+            field=models.SmallIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.3 on 2026-10-19 16:40
+
+from django.db import migrations, models
+
+
+def drop_duplicate_recipeless_jobs(apps, schema_editor):
+    """Keep only the oldest active job of each type that has no recipe."""
+    BackgroundJob = apps.get_model("core", "BackgroundJob")
+    active = BackgroundJob.objects.filter(recipe_id__isnull=True, status__in=["pending", "running"])
+    kept = set()
+    for job in active.order_by("id"):
+        if job.job_type in kept:
+            job.delete()
+        kept.add(job.job_type)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_background_job_priority'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_recipeless_jobs, migrations.RunPython.noop),
+        migrations.RemoveConstraint(
+            model_name='backgroundjob',
+            name='unique_active_job_per_recipe',
+        ),
+        migrations.AddConstraint(
+            model_name='backgroundjob',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'running'])), fields=('job_type', 'recipe_id'), name='unique_active_job_per_recipe', nulls_distinct=False),
+        ),
+    ]
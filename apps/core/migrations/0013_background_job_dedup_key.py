@@ -0,0 +1,26 @@
+# Generated by Django 6.0.3 on 2026-10-19 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_background_job_nulls_not_distinct'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='backgroundjob',
+            name='unique_active_job_per_recipe',
+        ),
+        migrations.AddField(
+            model_name='backgroundjob',
+            name='dedup_key',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddConstraint(
+            model_name='backgroundjob',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'running'])), fields=('job_type', 'recipe_id', 'dedup_key'), name='unique_active_job_per_recipe', nulls_distinct=False),
+        ),
+    ]
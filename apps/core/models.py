@@ -131,3 +131,56 @@ class DeviceCode(models.Model):
     @property
     def is_expired(self):
         return timezone.now() >= self.expires_at
+
+
+class BackgroundJob(models.Model):
+    """Queued background work, processed by the run_jobs worker."""
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+    ACTIVE_STATUSES = [STATUS_PENDING, STATUS_RUNNING]
+
+    # Due jobs are claimed highest priority first
+    PRIORITY_NORMAL = 0
+    PRIORITY_LOW = -10
+
+    job_type = models.CharField(max_length=50)
+    recipe_id = models.PositiveIntegerField(null=True, blank=True)
+    # Lets jobs of the same type and recipe be active together (one per batch or profile)
+    dedup_key = models.CharField(max_length=64, blank=True, default="")
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    priority = models.SmallIntegerField(default=PRIORITY_NORMAL)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_after"]),
+        ]
+        constraints = [
+            # At most one queued or running job per (job_type, recipe, dedup_key).
+            # Jobs with no recipe count as the same recipe.
+            models.UniqueConstraint(
+                fields=["job_type", "recipe_id", "dedup_key"],
+                condition=models.Q(status__in=["pending", "running"]),
+                name="unique_active_job_per_recipe",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"BackgroundJob({self.job_type}, recipe={self.recipe_id}, status={self.status})"
@@ -1,8 +1,10 @@
 """URL validation utilities for SSRF protection."""
 
+import asyncio
 import ipaddress
 import logging
 import socket
+import time
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
@@ -25,6 +27,19 @@ MAX_HTML_SIZE = 10 * 1024 * 1024  # 10 MB
 MAX_IMAGE_SIZE = 50 * 1024 * 1024  # 50 MB
 MAX_REDIRECT_HOPS = 5
 
+# Validated DNS results are reused for this long. The system resolver does
+# not expose record TTLs, so keep this short enough that a host moving IPs
+# (or a rebinding attempt) is picked up on the next fetch.
+DNS_CACHE_TTL = 30  # seconds
+DNS_CACHE_MAX_ENTRIES = 1024
+
+# hostname -> (validated ip, monotonic expiry). Only IPs that passed the
+# blocklist are stored, so a cache hit can be pinned without re-checking.
+_dns_cache: dict[str, tuple[str, float]] = {}
+# (event loop id, hostname) -> in-flight lookup task, so concurrent fetches to
+# the same host share one resolution
+_dns_inflight: dict[tuple[int, str], asyncio.Task] = {}
+
 
 def is_blocked_ip(ip_str):
     """Check if an IP address falls within any blocked range."""
@@ -46,6 +61,57 @@ def resolve_hostname(hostname):
     return results[0][4][0]
 
 
+async def resolve_hostname_async(hostname):
+    """Resolve a hostname without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    try:
+        results = await loop.getaddrinfo(hostname, None, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        raise ValueError(f"Could not resolve hostname: {hostname}") from e
+    if not results:
+        raise ValueError(f"Could not resolve hostname: {hostname}")
+    return results[0][4][0]
+
+
+def _cache_validated_ip(hostname, ip_str):
+    now = time.monotonic()
+    if len(_dns_cache) >= DNS_CACHE_MAX_ENTRIES:
+        for host in [h for h, (_, expires) in _dns_cache.items() if expires <= now]:
+            _dns_cache.pop(host, None)
+        if len(_dns_cache) >= DNS_CACHE_MAX_ENTRIES:
+            _dns_cache.pop(next(iter(_dns_cache)), None)
+    _dns_cache[hostname] = (ip_str, now + DNS_CACHE_TTL)
+
+
+async def _lookup_validated_ip(hostname):
+    ip_str = await resolve_hostname_async(hostname)
+    if is_blocked_ip(ip_str):
+        raise ValueError("URL not allowed: resolves to blocked IP range.")
+    _cache_validated_ip(hostname, ip_str)
+    return ip_str
+
+
+async def _resolve_validated_ip(hostname):
+    """Resolve hostname and check it against the blocklist, via the TTL cache."""
+    cached = _dns_cache.get(hostname)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+
+    key = (id(asyncio.get_running_loop()), hostname)
+    task = _dns_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_lookup_validated_ip(hostname))
+        _dns_inflight[key] = task
+        task.add_done_callback(lambda _: _dns_inflight.pop(key, None))
+    # shield: one caller being cancelled must not cancel the lookup others await
+    return await asyncio.shield(task)
+
+
+def clear_dns_cache():
+    """Drop all cached DNS results (used by tests)."""
+    _dns_cache.clear()
+
+
 @dataclass(frozen=True)
 class ResolvedURL:
     """URL with pinned DNS resolution to prevent TOCTOU rebinding attacks.
@@ -86,6 +152,25 @@ def validate_url(url):
     return ResolvedURL(url=url, hostname=hostname, ip=ip_str)
 
 
+async def validate_url_async(url):
+    """Async validate_url: non-blocking DNS with a short TTL cache of validated IPs.
+
+    Applies the same scheme, hostname and blocklist checks, and returns the
+    same pinned ResolvedURL, so curl_resolve semantics are unchanged.
+    """
+    parsed = urlparse(url)
+
+    if parsed.scheme not in ("http", "https"):
+        raise ValueError(f"URL scheme not allowed: {parsed.scheme}")
+
+    hostname = parsed.hostname
+    if not hostname:
+        raise ValueError("URL has no hostname")
+
+    ip_str = await _resolve_validated_ip(hostname)
+    return ResolvedURL(url=url, hostname=hostname, ip=ip_str)
+
+
 def validate_redirect_url(url):
     """Validate a redirect destination URL against the SSRF blocklist.
 
@@ -119,3 +204,47 @@ def check_content_size(content, max_size):
     """Check actual content size against limit. Raises ValueError if too large."""
     if len(content) > max_size:
         raise ValueError(f"Response too large: {len(content)} bytes (limit: {max_size})")
+
+
+async def validate_redirect_url_async(url):
+    """Async validate_redirect_url, sharing validate_url_async's DNS cache."""
+    try:
+        return await validate_url_async(url)
+    except ValueError:
+        logger.warning("Blocked redirect to SSRF-unsafe URL: %s", url)
+        raise
+
+
+async def read_limited_body(response, max_size, stop_marker=None):
+    """Read a streamed response body, enforcing max_size as bytes arrive.
+
+    Raises ValueError as soon as the Content-Length header or the bytes
+    received so far exceed max_size, so oversized bodies are never fully
+    buffered. Callers must fetch with stream=True and leave the session
+    context afterwards, which aborts any unread remainder of the transfer.
+
+    If stop_marker (lowercase bytes) is given, reading stops once it has
+    been received and the body up to and including the marker is returned.
+    """
+    if not check_response_size(response, max_size):
+        raise ValueError(f"Response too large (Content-Length > {max_size})")
+
+    body = bytearray()
+    async for chunk in response.aiter_content():
+        body += chunk
+        check_content_size(body, max_size)
+        if stop_marker:
+            # Only scan the new chunk plus enough overlap to catch a split marker
+            start = max(0, len(body) - len(chunk) - len(stop_marker) + 1)
+            found = body[start:].lower().find(stop_marker)
+            if found != -1:
+                return bytes(body[: start + found + len(stop_marker)])
+    return bytes(body)
+
+
+def decode_body(response, body):
+    """Decode a body read by read_limited_body using the response's charset."""
+    try:
+        return body.decode(response.encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
@@ -9,10 +9,10 @@ Cookie.pages.play = (function() {
     'use strict';
 
     var instructions = [];
+    var stepTimers = [];
     var currentStep = 0;
     var totalSteps = 0;
     var panelExpanded = true;
-    var aiAvailable = false;
 
     var elements = {};
 
@@ -20,8 +20,6 @@ Cookie.pages.play = (function() {
         var pageEl = document.querySelector('[data-page="play-mode"]');
         if (!pageEl) return;
 
-        aiAvailable = pageEl.getAttribute('data-ai-available') === 'true';
-
         var instructionsEl = document.getElementById('recipe-instructions');
         if (instructionsEl) {
             try {
@@ -30,6 +28,14 @@ Cookie.pages.play = (function() {
                 instructions = [];
             }
         }
+        var stepTimersEl = document.getElementById('recipe-step-timers');
+        if (stepTimersEl) {
+            try {
+                stepTimers = JSON.parse(stepTimersEl.textContent);
+            } catch (e) {
+                stepTimers = [];
+            }
+        }
         totalSteps = instructions.length;
         if (totalSteps === 0) return;
 
@@ -200,13 +206,30 @@ Cookie.pages.play = (function() {
         }
     }
 
-    function updateDetectedTimes() {
-        if (!elements.detectedTimes || !elements.detectedTimesBtns) return;
+    /**
+     * Timers stored for the current step ({seconds, label}), labelled when the
+     * recipe was imported. Falls back to detecting times in the step text.
+     */
+    function currentStepTimers() {
+        if (stepTimers.length === totalSteps) {
+            return stepTimers[currentStep] || [];
+        }
 
         var instruction = instructions[currentStep] || '';
         var times = Cookie.TimeDetect.detect(instruction);
+        var timers = [];
+        for (var i = 0; i < times.length; i++) {
+            timers.push({ seconds: times[i], label: Cookie.TimeDetect.format(times[i]) });
+        }
+        return timers;
+    }
+
+    function updateDetectedTimes() {
+        if (!elements.detectedTimes || !elements.detectedTimesBtns) return;
+
+        var timers = currentStepTimers();
 
-        if (times.length === 0) {
+        if (timers.length === 0) {
             elements.detectedTimes.classList.add('hidden');
             return;
         }
@@ -214,20 +237,19 @@ Cookie.pages.play = (function() {
         elements.detectedTimes.classList.remove('hidden');
         Cookie.utils.setHtml(elements.detectedTimesBtns, '');
 
-        for (var i = 0; i < times.length; i++) {
-            var seconds = times[i];
-            var label = Cookie.TimeDetect.format(seconds);
+        for (var i = 0; i < timers.length; i++) {
+            var seconds = timers[i].seconds;
 
             var btn = document.createElement('button');
             btn.type = 'button';
             btn.className = 'detected-time-btn';
             btn.setAttribute('data-duration', seconds);
-            btn.setAttribute('data-label', label);
+            btn.setAttribute('data-label', timers[i].label);
             Cookie.utils.setHtml(btn, '<svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" '
                 + 'viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" '
                 + 'stroke-linecap="round" stroke-linejoin="round">'
                 + '<path d="M12 5v14M5 12h14"></path></svg> '
-                + Cookie.utils.escapeHtml(label));
+                + Cookie.utils.escapeHtml(Cookie.TimeDetect.format(seconds)));
             btn.addEventListener('click', handleDetectedTimer);
 
             elements.detectedTimesBtns.appendChild(btn);
@@ -253,59 +275,25 @@ Cookie.pages.play = (function() {
     }
 
     /**
-     * Handle quick timer button — uses AI for name if available
+     * Handle quick timer button — named after the current step's timer if it has one
      */
     function handleQuickTimer(e) {
         var btn = e.currentTarget;
         var duration = parseInt(btn.getAttribute('data-duration'), 10);
-        var label = btn.getAttribute('data-label');
-        var instruction = instructions[currentStep] || '';
+        var timers = currentStepTimers();
+        var label = timers.length > 0 ? timers[0].label : btn.getAttribute('data-label');
 
-        if (aiAvailable && instruction) {
-            requestAITimerName(btn, duration, label, instruction);
-        } else {
-            Cookie.pages.playTimers.addTimer(label, duration);
-        }
+        Cookie.pages.playTimers.addTimer(label, duration);
     }
 
     /**
-     * Handle detected timer button — uses AI for name if available
+     * Handle detected timer button — uses the label stored with the recipe
      */
     function handleDetectedTimer(e) {
         var btn = e.currentTarget;
         var duration = parseInt(btn.getAttribute('data-duration'), 10);
-        var label = btn.getAttribute('data-label');
-        var instruction = instructions[currentStep] || '';
-
-        if (aiAvailable && instruction) {
-            requestAITimerName(btn, duration, label, instruction);
-        } else {
-            Cookie.pages.playTimers.addTimer(label, duration);
-        }
-    }
 
-    /**
-     * Request AI-generated timer name, falling back to default label
-     */
-    function requestAITimerName(btn, duration, label, instruction) {
-        btn.disabled = true;
-        btn.classList.add('loading');
-
-        var durationMinutes = Math.ceil(duration / 60);
-
-        Cookie.ajax.post('/api/ai/timer-name', {
-            step_text: instruction,
-            duration_minutes: durationMinutes
-        }, function(err, response) {
-            btn.disabled = false;
-            btn.classList.remove('loading');
-
-            if (!err && response && response.label) {
-                Cookie.pages.playTimers.addTimer(response.label, duration);
-            } else {
-                Cookie.pages.playTimers.addTimer(label, duration);
-            }
-        });
+        Cookie.pages.playTimers.addTimer(btn.getAttribute('data-label'), duration);
     }
 
     return {
@@ -9,12 +9,15 @@ from apps.core.models import AppSettings
 from apps.profiles.models import Profile
 from apps.ai.models import AIPrompt
 from apps.ai.services.openrouter import OpenRouterService, AIUnavailableError, AIResponseError
+from apps.ai.services.prefetch import queue_prefetch
 from apps.recipes.models import (
     Recipe,
     RecipeCollection,
     RecipeFavorite,
     RecipeViewHistory,
 )
+from apps.recipes.services.timers import ensure_step_timers
+from apps.recipes.services.units import preferred_ingredients
 
 
 def require_profile(view_func):
@@ -174,6 +177,7 @@ def recipe_detail(request, recipe_id):
         recipe=recipe,
         defaults={},  # Just update viewed_at (auto_now)
     )
+    queue_prefetch(recipe, profile)
 
     # Check if recipe is favorited
     is_favorite = RecipeFavorite.objects.filter(
@@ -187,8 +191,9 @@ def recipe_detail(request, recipe_id):
     # Check if AI features are available
     ai_available = _is_ai_available()
 
-    # Prepare ingredient groups or flat list
-    has_ingredient_groups = bool(recipe.ingredient_groups)
+    # Prepare ingredient groups or flat list, in the profile's preferred units if it converts them
+    ingredients, ingredient_groups, _ = preferred_ingredients(recipe, profile)
+    has_ingredient_groups = bool(ingredient_groups)
 
     # Prepare instructions
     instructions = recipe.instructions
@@ -250,6 +255,8 @@ def recipe_detail(request, recipe_id):
             "collections": collections,
             "ai_available": ai_available,
             "has_ingredient_groups": has_ingredient_groups,
+            "ingredients": ingredients,
+            "ingredient_groups": ingredient_groups,
             "instructions": instructions,
             "linked_recipes": linked_recipes,
         },
@@ -284,6 +291,7 @@ def play_mode(request, recipe_id):
             "recipe": recipe,
             "instructions": instructions,
             "instructions_json": instructions,  # For JavaScript
+            "step_timers": ensure_step_timers(recipe),  # Labelled at import, so no per-timer AI calls
             "ai_available": ai_available,
         },
     )
@@ -30,6 +30,7 @@ class ProfileOut(Schema):
     avatar_color: str
     theme: str
     unit_preference: str
+    convert_units: bool = False
 
 
 class ProfileStatsSchema(Schema):
@@ -93,13 +94,14 @@ class PreferencesIn(Schema):
     HomeOnly. Every field is optional — only sent fields are written, so
     PATCH with {"theme": "dark"} is a noop on other fields.
 
-    Note: unit_preference is accepted to preserve API back-compat for older
-    clients but the endpoint rejects writes (feature disabled in v1.64). The
-    underlying column remains for read-only consumers (AI scaling).
+    unit_preference is the unit system for AI scaling and, when
+    convert_units is on, for recipe ingredients (the stored metric/imperial
+    views). With convert_units off, ingredients are shown as written.
     """
 
     theme: Optional[str] = None
     unit_preference: Optional[str] = None
+    convert_units: Optional[bool] = None
 
 
 class ErrorSchema(Schema):
@@ -199,7 +201,7 @@ def update_profile(request, profile_id: int, payload: ProfileIn):
     auth=SessionAuth(),
 )
 def update_preferences(request, profile_id: int, payload: PreferencesIn):
-    """Update only display preferences (theme, unit_preference) for the
+    """Update only display preferences (theme, unit_preference, convert_units) for the
     caller's own profile. Works in both home and passkey modes because the
     identity fields (name, avatar_color) are NOT writable here — only
     per-user display settings are. Callers must own the target profile.
@@ -218,20 +220,20 @@ def update_preferences(request, profile_id: int, payload: PreferencesIn):
     if not caller_profile or caller_profile.id != profile_id:
         return Status(403, {"error": "forbidden", "message": "Cannot modify another profile"})
 
-    # Reject unit_preference writes — UI toggle hidden in v1.64 because conversion
-    # is only wired into AI scaling, not recipe display / scrape / cook mode.
-    if payload.unit_preference is not None:
-        return Status(
-            400,
-            {"error": "feature_disabled", "message": "unit_preference is not currently configurable"},
-        )
-
-    # Validate allowed values. Reject unknown theme strings — no free-form input.
-    updates: dict[str, str] = {}
+    # Validate allowed values. Reject unknown theme/unit strings — no free-form input.
+    updates: dict[str, str | bool] = {}
     if payload.theme is not None:
         if payload.theme not in ("light", "dark"):
             return Status(400, {"error": "validation_error", "message": "theme must be 'light' or 'dark'"})
         updates["theme"] = payload.theme
+    if payload.unit_preference is not None:
+        if payload.unit_preference not in ("metric", "imperial"):
+            return Status(
+                400, {"error": "validation_error", "message": "unit_preference must be 'metric' or 'imperial'"}
+            )
+        updates["unit_preference"] = payload.unit_preference
+    if payload.convert_units is not None:
+        updates["convert_units"] = payload.convert_units
 
     if not updates:
         # Nothing sent — return current profile, don't touch the DB.
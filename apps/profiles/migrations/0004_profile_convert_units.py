@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-19 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0003_add_unlimited_ai'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='convert_units',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -24,6 +24,8 @@ from .models import Recipe, SearchSource
 from .services.image_cache import SearchImageCache
 from .services.scraper import RecipeScraper, FetchError, ParseError
 from .services.search import RecipeSearch
+from .services.timers import ensure_step_timers
+from .services.units import preferred_ingredients
 
 router = Router(tags=["recipes"])
 
@@ -66,15 +68,19 @@ class RecipeOut(Schema):
     dietary_restrictions: list
     equipment: list
     nutrition: dict
+    nutrition_pending: bool = False
+    nutrition_source: str = ""
     rating: Optional[float]
     rating_count: Optional[int]
     language: str
     links: list
     ai_tips: list
+    step_timers: list
     is_remix: bool
     remix_profile_id: Optional[int]
     remixed_from_id: Optional[int]
     linked_recipes: List[LinkedRecipeOut] = []
+    unit_system: Optional[str] = None  # Set when ingredients are converted to the profile's preferred units
     scraped_at: str
     updated_at: str
 
@@ -101,6 +107,10 @@ class RecipeOut(Schema):
         # Return linked_recipes if set, otherwise empty list
         return getattr(obj, "linked_recipes", [])
 
+    @staticmethod
+    def resolve_unit_system(obj):
+        return getattr(obj, "unit_system", None)
+
 
 class RecipeListOut(Schema):
     """Condensed recipe output for list views."""
@@ -297,16 +307,15 @@ def _paginate_results(
 
 
 async def _cache_and_map_images(results: list) -> None:
-    """Populate cached_image_url on each result dict, caching as needed."""
+    """Populate cached_image_url on each result dict, queueing uncached images for download."""
     image_urls = [r["image_url"] for r in results if r.get("image_url")]
     image_cache = SearchImageCache()
     cached_urls = await image_cache.get_cached_urls_batch(image_urls)
 
     uncached_urls = [url for url in image_urls if url not in cached_urls]
     if uncached_urls:
-        await image_cache.cache_images(uncached_urls)
-        new_cached = await image_cache.get_cached_urls_batch(uncached_urls)
-        cached_urls.update(new_cached)
+        # Clients fall back to image_url (legacy search polls until cached)
+        await image_cache.queue_images(uncached_urls)
 
     for result in results:
         external_url = result.get("image_url", "")
@@ -385,6 +394,8 @@ def get_recipe(request, recipe_id: int):
 
     Only returns recipes owned by the current profile.
     Includes linked_recipes for navigation between original and remixes.
+    Ingredients are returned as written, or in the profile's preferred units
+    (unit_system) when it has chosen to convert them.
     """
     profile = get_current_profile_or_none(request)
     if not profile:
@@ -392,6 +403,7 @@ def get_recipe(request, recipe_id: int):
 
     # Only allow access to recipes owned by this profile
     recipe = get_object_or_404(Recipe, id=recipe_id, profile=profile)
+    ensure_step_timers(recipe)  # Recipes imported before cook mode timers were stored
 
     # Build linked recipes list for navigation
     linked_recipes = []
@@ -442,6 +454,9 @@ def get_recipe(request, recipe_id: int):
     # Attach linked recipes to the recipe object for serialization
     recipe.linked_recipes = linked_recipes
 
+    # Stored renderings (built at import), not saved back over the original lines
+    recipe.ingredients, recipe.ingredient_groups, recipe.unit_system = preferred_ingredients(recipe, profile)
+
     return recipe
 
 
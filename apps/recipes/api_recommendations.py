@@ -0,0 +1,51 @@
+"""
+Local recipe recommendations API endpoints.
+
+"More like this" and "because you favorited" rows, found among the current
+profile's own recipes. These make no AI or network calls, so they work
+without an API key.
+"""
+
+from typing import List
+
+from django.shortcuts import get_object_or_404
+from ninja import Router, Schema
+
+from apps.core.auth import SessionAuth
+from apps.profiles.utils import get_current_profile
+
+from .api import ErrorOut, RecipeListOut
+from .models import Recipe
+from .services.similar import favorite_recommendations, similar_recipes
+
+router = Router(tags=["recommendations"])
+
+MAX_LIMIT = 20
+
+
+class FavoriteRecommendationsOut(Schema):
+    favorite: RecipeListOut
+    recipes: List[RecipeListOut]
+
+
+@router.get("/", response=List[FavoriteRecommendationsOut], auth=SessionAuth())
+def list_recommendations(request, limit: int = 6):
+    """
+    Recipes like each of the profile's most recent favorites.
+
+    - **limit**: Recipes per favorite (default 6, max 20)
+    """
+    profile = get_current_profile(request)
+    return favorite_recommendations(profile, limit=min(max(limit, 1), MAX_LIMIT))
+
+
+@router.get("/{recipe_id}/", response={200: List[RecipeListOut], 404: ErrorOut}, auth=SessionAuth())
+def more_like_this(request, recipe_id: int, limit: int = 6):
+    """
+    The profile's recipes most like the given one, best match first.
+
+    - **limit**: Number of recipes to return (default 6, max 20)
+    """
+    profile = get_current_profile(request)
+    get_object_or_404(Recipe, id=recipe_id, profile=profile)
+    return similar_recipes(profile, recipe_id, limit=min(max(limit, 1), MAX_LIMIT))
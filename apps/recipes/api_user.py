@@ -310,6 +310,11 @@ def record_view(request, payload: HistoryIn):
         defaults={},  # viewed_at auto-updates due to auto_now
     )
 
+    # Import here to avoid circular imports
+    from apps.ai.services.prefetch import queue_prefetch
+
+    queue_prefetch(recipe, profile)
+
     status_code = 201 if created else 200
     return Status(status_code, history)
 
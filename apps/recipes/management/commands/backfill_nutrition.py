@@ -0,0 +1,49 @@
+"""
+Management command to estimate nutrition for recipes saved without any.
+
+Recipes imported from sites that publish no nutrition data (and remixes
+made before local estimates existed) are given per-serving values from the
+bundled nutrient table, where it covers their ingredients. Recipes whose
+ingredients it can't cover are left as they are.
+
+Usage:
+    python manage.py backfill_nutrition
+    python manage.py backfill_nutrition --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.recipes.models import Recipe
+from apps.recipes.services.nutrition import calculate_recipe_nutrition
+
+
+class Command(BaseCommand):
+    help = "Estimate nutrition from ingredients for recipes that have none"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many recipes would be updated without saving",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        recipes = Recipe.objects.filter(nutrition={}, nutrition_pending=False, servings__gte=1).only(
+            "id", "ingredients", "servings", "nutrition", "nutrition_source"
+        )
+
+        checked = updated = 0
+        for recipe in recipes.iterator():
+            checked += 1
+            nutrition = calculate_recipe_nutrition(recipe.ingredients, recipe.servings)
+            if not nutrition:
+                continue
+            updated += 1
+            if not dry_run:
+                recipe.nutrition = nutrition
+                recipe.nutrition_source = Recipe.NUTRITION_CALCULATED
+                recipe.save(update_fields=["nutrition", "nutrition_source"])
+
+        verb = "Would update" if dry_run else "Updated"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {updated} of {checked} recipes without nutrition."))
@@ -0,0 +1,102 @@
+"""
+Management command to benchmark recipe parsing against a saved HTML corpus.
+
+Times the JSON-LD fast path and recipe-scrapers on every page in a directory
+of saved recipe pages, and reports how many pages the fast path handles and
+the parse speed-up on those pages.
+
+Usage:
+    python manage.py benchmark_recipe_parser /path/to/corpus
+    python manage.py benchmark_recipe_parser /path/to/corpus --repeat=5
+"""
+
+import time
+from functools import partial
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from recipe_scrapers import scrape_html
+
+from apps.recipes.services.jsonld import extract_jsonld_recipe
+
+
+def _best_time(func, repeat: int) -> float:
+    """Return the fastest of `repeat` runs of func(), in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _full_parse(html: str, url: str):
+    """Parse with recipe-scrapers, touching the same fields the importer reads."""
+    scraper = scrape_html(html, org_url=url, supported_only=False)
+    for attr in ("title", "ingredients", "instructions_list", "yields", "image"):
+        try:
+            getattr(scraper, attr)()
+        except Exception:  # noqa: S112 - missing fields are expected, we only time them
+            continue
+
+
+class Command(BaseCommand):
+    help = "Benchmark the JSON-LD fast path against recipe-scrapers on a directory of saved HTML pages"
+
+    def add_arguments(self, parser):
+        parser.add_argument("corpus", help="Directory containing saved recipe pages (*.html)")
+        parser.add_argument(
+            "--base-url",
+            default="https://example.com/recipes/",
+            help="URL prefix used as each page's origin (default: https://example.com/recipes/)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Time each parser this many times per page and keep the best (default: 3)",
+        )
+
+    def handle(self, *args, **options):
+        corpus = Path(options["corpus"])
+        if not corpus.is_dir():
+            raise CommandError(f"Corpus directory not found: {corpus}")
+
+        pages = sorted(corpus.glob("*.html"))
+        if not pages:
+            raise CommandError(f"No *.html files found in {corpus}")
+
+        repeat = max(1, options["repeat"])
+        fast_hits = 0
+        fast_total = 0.0
+        full_total = 0.0
+
+        for page in pages:
+            html = page.read_text(encoding="utf-8", errors="replace")
+            url = options["base_url"] + page.stem
+
+            if extract_jsonld_recipe(html, url) is None:
+                self.stdout.write(f"  {page.name}: fallback to recipe-scrapers")
+                continue
+
+            fast = _best_time(partial(extract_jsonld_recipe, html, url), repeat)
+            try:
+                full = _best_time(partial(_full_parse, html, url), repeat)
+            except Exception as e:
+                self.stdout.write(self.style.WARNING(f"  {page.name}: recipe-scrapers failed ({e})"))
+                continue
+
+            fast_hits += 1
+            fast_total += fast
+            full_total += full
+            self.stdout.write(f"  {page.name}: fast {fast * 1000:.2f}ms, full {full * 1000:.2f}ms")
+
+        self.stdout.write(f"\nFast path handled {fast_hits}/{len(pages)} page(s) ({fast_hits / len(pages):.0%})")
+        if fast_hits:
+            speedup = full_total / fast_total if fast_total else float("inf")
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Mean parse time: fast {fast_total / fast_hits * 1000:.2f}ms, "
+                    f"recipe-scrapers {full_total / fast_hits * 1000:.2f}ms ({speedup:.1f}x faster)"
+                )
+            )
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-19 11:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0013_update_broken_selectors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='step_timers',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
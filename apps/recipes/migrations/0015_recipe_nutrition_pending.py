@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-19 11:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0014_recipe_step_timers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='nutrition_pending',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-19 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0015_recipe_nutrition_pending'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='unit_views',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
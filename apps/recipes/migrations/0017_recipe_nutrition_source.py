@@ -0,0 +1,27 @@
+# Generated by Django 6.0.3 on 2026-10-19 16:55
+
+from django.db import migrations, models
+
+
+def label_existing_nutrition(apps, schema_editor):
+    """Before nutrition was calculated locally, imports had scraped nutrition and remixes an AI estimate."""
+    Recipe = apps.get_model("recipes", "Recipe")
+    with_nutrition = Recipe.objects.exclude(nutrition={})
+    with_nutrition.filter(is_remix=False).update(nutrition_source="scraped")
+    with_nutrition.filter(is_remix=True).update(nutrition_source="ai")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0016_recipe_unit_views'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='nutrition_source',
+            field=models.CharField(blank=True, choices=[('scraped', 'Scraped'), ('calculated', 'Calculated'), ('ai', 'AI estimate')], max_length=20),
+        ),
+        migrations.RunPython(label_existing_nutrition, migrations.RunPython.noop),
+    ]
@@ -4,6 +4,16 @@ from django.db import models
 class Recipe(models.Model):
     """Recipe model with full recipe-scrapers field support."""
 
+    # Where the nutrition came from: the recipe's site, or an estimate
+    NUTRITION_SCRAPED = "scraped"
+    NUTRITION_CALCULATED = "calculated"  # From the bundled nutrient table (services/nutrition.py)
+    NUTRITION_AI = "ai"  # A remix's AI estimate
+    NUTRITION_SOURCE_CHOICES = [
+        (NUTRITION_SCRAPED, "Scraped"),
+        (NUTRITION_CALCULATED, "Calculated"),
+        (NUTRITION_AI, "AI estimate"),
+    ]
+
     # Source information
     source_url = models.URLField(max_length=2000, null=True, blank=True, db_index=True)
     canonical_url = models.URLField(max_length=2000, blank=True)
@@ -46,8 +56,11 @@ class Recipe(models.Model):
     # Equipment and extras
     equipment = models.JSONField(default=list)
 
-    # Nutrition (scraped from source)
+    # Nutrition (scraped from source, or estimated - see nutrition_source)
     nutrition = models.JSONField(default=dict)
+    # A remix's nutrition estimate is queued as a background job
+    nutrition_pending = models.BooleanField(default=False)
+    nutrition_source = models.CharField(max_length=20, choices=NUTRITION_SOURCE_CHOICES, blank=True)
 
     # Ratings
     rating = models.FloatField(null=True, blank=True)
@@ -62,6 +75,12 @@ class Recipe(models.Model):
     # AI-generated content
     ai_tips = models.JSONField(default=list, blank=True)
 
+    # Cook mode timers, one list per instruction step (see services/timers.py)
+    step_timers = models.JSONField(default=list, blank=True)
+
+    # Ingredients parsed and rendered in metric and imperial (see services/units.py)
+    unit_views = models.JSONField(default=dict, blank=True)
+
     # Profile ownership - each recipe belongs to a profile
     profile = models.ForeignKey(
         "profiles.Profile",
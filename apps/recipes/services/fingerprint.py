@@ -35,6 +35,11 @@ MOBILE_PROFILES = [
 MIN_DELAY = 0.5  # Minimum delay between requests to same domain
 MAX_DELAY = 2.5  # Maximum delay between requests to same domain
 
+# Per-process memory of which profile last fetched each host successfully,
+# so repeat imports from a bot-walled site lead with the profile that works
+MAX_REMEMBERED_HOSTS = 512
+_last_good_profiles: dict[str, str] = {}
+
 
 def get_random_profile() -> str:
     """
@@ -70,3 +75,27 @@ def get_fallback_profiles(exclude: str = None) -> list[str]:
     if exclude and exclude in profiles:
         profiles.remove(exclude)
     return profiles
+
+
+def get_profiles_for_host(host: str) -> list[str]:
+    """
+    Get browser profiles to try for a host, last successful one first.
+
+    Args:
+        host: Hostname being fetched
+
+    Returns:
+        BROWSER_PROFILES, reordered to lead with the host's remembered profile
+    """
+    preferred = _last_good_profiles.get(host)
+    if preferred in BROWSER_PROFILES:
+        return [preferred] + get_fallback_profiles(exclude=preferred)
+    return BROWSER_PROFILES.copy()
+
+
+def remember_profile(host: str, profile: str) -> None:
+    """Record the profile that just fetched host successfully."""
+    _last_good_profiles.pop(host, None)
+    if len(_last_good_profiles) >= MAX_REMEMBERED_HOSTS:
+        _last_good_profiles.pop(next(iter(_last_good_profiles)))
+    _last_good_profiles[host] = profile
@@ -0,0 +1,92 @@
+"""
+Hedged requests across browser impersonation profiles.
+
+Bot walls often answer one TLS fingerprint slowly (or not at all) while
+letting another straight through. Instead of waiting out a full timeout
+before trying the next profile, first_success() starts the next attempt
+in parallel once the current one has been pending for `hedge_delay`
+seconds, and cancels the stragglers as soon as one attempt succeeds.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class AllAttemptsFailed(Exception):
+    """Every candidate failed; `errors` holds one "candidate: reason" entry each."""
+
+    def __init__(self, errors: list[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+async def first_success(
+    candidates: list[str],
+    attempt: Callable[[str], Awaitable],
+    hedge_delay: float,
+    fatal: tuple[type[BaseException], ...] = (),
+):
+    """
+    Run attempt(candidate) in order, hedging slow attempts with the next one.
+
+    A new attempt is launched when the newest running one has not finished
+    within hedge_delay seconds, or immediately when an attempt fails or
+    returns None.
+
+    Args:
+        candidates: Values to try, in preference order
+        attempt: Coroutine function called with each candidate
+        hedge_delay: Seconds to wait on pending attempts before adding another
+        fatal: Exception types that abort the whole race and propagate
+
+    Returns:
+        (candidate, result) for the first attempt returning a non-None result
+
+    Raises:
+        AllAttemptsFailed: If every candidate failed or returned None
+    """
+    remaining = list(candidates)
+    pending: dict[asyncio.Task, str] = {}
+    errors: list[str] = []
+
+    def launch():
+        candidate = remaining.pop(0)
+        pending[asyncio.ensure_future(attempt(candidate))] = candidate
+
+    launch()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=hedge_delay if remaining else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                logger.debug("Hedging: %s still pending, starting %s", list(pending.values()), remaining[0])
+                launch()
+                continue
+
+            for task in sorted(done, key=lambda t: candidates.index(pending[t])):
+                candidate = pending.pop(task)
+                try:
+                    result = task.result()
+                except fatal:
+                    raise
+                except Exception as e:
+                    errors.append(f"{candidate}: {e}")
+                else:
+                    if result is not None:
+                        return candidate, result
+                    errors.append(f"{candidate}: empty response")
+                if remaining:
+                    launch()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    raise AllAttemptsFailed(errors)
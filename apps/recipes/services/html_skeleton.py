@@ -0,0 +1,161 @@
+"""
+Compact structural outline of an HTML page for CSS selector repair.
+
+A search results page is mostly scripts, styles, inline SVG and text that
+don't help anyone write a selector. page_skeleton() keeps only the element
+tree: tag names with their id, class, href and schema.org attributes, plus
+the text of links and headings. Runs of sibling elements with the same tag
+and classes (result cards, list items) are shown once with a count, and
+the outline is kept within a character budget so the whole page structure
+fits in a prompt instead of its first 50KB.
+"""
+
+import re
+
+from bs4 import BeautifulSoup, Tag
+
+SKELETON_MAX_CHARS = 16000  # Roughly 4k tokens
+MAX_DEPTH = 60  # Unclosed tags can nest html.parser trees very deeply
+MAX_TEXT_LENGTH = 60
+MAX_CLASSES = 6
+MAX_HREF_LENGTH = 80
+
+# Elements that carry no structure worth selecting on
+DROP_TAGS = {
+    "head",
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "svg",
+    "canvas",
+    "iframe",
+    "object",
+    "embed",
+    "video",
+    "audio",
+    "source",
+    "track",
+    "link",
+    "meta",
+    "base",
+    "br",
+    "hr",
+    "wbr",
+}
+# Page chrome, dropped when the outline would otherwise be over budget
+CHROME_TAGS = {"header", "footer", "nav", "aside"}
+CHROME_ROLES = {"banner", "navigation", "contentinfo", "complementary"}
+TEXT_TAGS = {"a", "h1", "h2", "h3", "h4", "h5", "h6"}
+# Kept even without attributes or text: their presence tells the model what a card contains
+MARKER_TAGS = {"img", "picture", "time"}
+KEPT_ATTRIBUTES = ("id", "itemprop", "itemtype", "role", "data-testid")
+
+HEADER = "<!-- Page outline: nesting by indentation, text and scripts removed, repeated siblings shown once -->"
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _truncate(text: str, length: int) -> str:
+    return text if len(text) <= length else text[: length - 3].rstrip() + "..."
+
+
+def _is_chrome(element: Tag) -> bool:
+    return element.name in CHROME_TAGS or element.get("role") in CHROME_ROLES
+
+
+def _open_tag(element: Tag) -> str:
+    parts = [element.name]
+    for attr in KEPT_ATTRIBUTES:
+        value = element.get(attr)
+        if value and isinstance(value, str):
+            parts.append(f'{attr}="{_truncate(value, MAX_TEXT_LENGTH)}"')
+    classes = element.get("class") or []
+    if classes:
+        parts.append(f'class="{" ".join(classes[:MAX_CLASSES])}"')
+    href = element.get("href")
+    if element.name == "a" and isinstance(href, str) and href:
+        # Query strings are usually tracking parameters
+        parts.append(f'href="{_truncate(href.split("?")[0], MAX_HREF_LENGTH)}"')
+    return f"<{' '.join(parts)}>"
+
+
+def _text(element: Tag) -> str:
+    if element.name not in TEXT_TAGS:
+        return ""
+    # A link wrapping a whole card shows its heading's text on the heading instead
+    if element.name == "a" and element.find(list(TEXT_TAGS - {"a"})):
+        return ""
+    text = WHITESPACE_RE.sub(" ", element.get_text(" ", strip=True))
+    return _truncate(text, MAX_TEXT_LENGTH)
+
+
+def _build(element: Tag, depth: int, drop_chrome: bool) -> tuple | None:
+    """(opening tag line, [(child node, count)]) for an element, or None if nothing in it is worth showing."""
+    children = []
+    if depth < MAX_DEPTH:
+        # Group siblings by tag and classes, keeping first-seen order
+        groups: dict[tuple, list[Tag]] = {}
+        for child in element.children:
+            if not isinstance(child, Tag) or child.name in DROP_TAGS:
+                continue
+            if drop_chrome and _is_chrome(child):
+                continue
+            groups.setdefault((child.name, tuple(child.get("class") or ())), []).append(child)
+        for members in groups.values():
+            for member in members:
+                # The first member with something to show is the example for the group
+                node = _build(member, depth + 1, drop_chrome)
+                if node is not None:
+                    children.append((node, len(members)))
+                    break
+
+    line = _open_tag(element)
+    text = _text(element)
+    if text:
+        line += text
+    elif not children and line == f"<{element.name}>" and element.name not in MARKER_TAGS:
+        return None
+    return line, children
+
+
+def _render(node: tuple, count: int, depth: int, lines: list[str]) -> None:
+    line, children = node
+    suffix = f"  <!-- x{count} -->" if count > 1 else ""
+    lines.append("  " * depth + line + suffix)
+    for child, child_count in children:
+        _render(child, child_count, depth + 1, lines)
+
+
+def _outline(root: Tag, drop_chrome: bool) -> str:
+    lines: list[str] = []
+    if root.name == "body":
+        node = _build(root, 0, drop_chrome)
+        if node is not None:
+            _render(node, 1, 0, lines)
+    else:
+        # A fragment without <body>: outline each top-level element
+        for child, count in (_build(root, -1, drop_chrome) or ("", []))[1]:
+            _render(child, count, 0, lines)
+    return "\n".join(lines)
+
+
+def page_skeleton(html: str, max_chars: int = SKELETON_MAX_CHARS) -> str:
+    """Outline an HTML page's element structure in at most about `max_chars` characters.
+
+    Header, footer, nav and aside elements are dropped if the full outline is
+    too long, and anything still over budget is cut at a line boundary.
+    Input with no elements at all is returned as its first `max_chars`
+    characters.
+    """
+    soup = BeautifulSoup(html or "", "html.parser")
+    root = soup.body or soup
+
+    outline = _outline(root, drop_chrome=False)
+    if len(outline) > max_chars:
+        outline = _outline(root, drop_chrome=True) or outline
+    if not outline:
+        return (html or "")[:max_chars]
+    if len(outline) > max_chars:
+        cut = outline.rfind("\n", 0, max_chars)
+        outline = outline[: cut if cut > 0 else max_chars] + "\n<!-- outline truncated -->"
+    return f"{HEADER}\n{outline}"
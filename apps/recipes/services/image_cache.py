@@ -10,17 +10,18 @@ import hashlib
 import io
 import logging
 
-from asgiref.sync import sync_to_async
+from asgiref.sync import async_to_sync, sync_to_async
 from curl_cffi.requests import AsyncSession
 from django.core.files.base import ContentFile
+from django.utils import timezone
 from PIL import Image
 
 from apps.core.validators import (
     MAX_IMAGE_SIZE,
     MAX_REDIRECT_HOPS,
-    check_response_size,
-    validate_redirect_url,
-    validate_url,
+    read_limited_body,
+    validate_redirect_url_async,
+    validate_url_async,
 )
 from apps.recipes.services.fingerprint import BROWSER_PROFILES
 
@@ -43,6 +44,7 @@ class SearchImageCache:
 
     MAX_CONCURRENT = 5
     DOWNLOAD_TIMEOUT = 15
+    MAX_BATCH_URLS = 50
 
     async def cache_images(self, image_urls: list) -> None:
         """
@@ -140,7 +142,7 @@ class SearchImageCache:
         """
         # Validate URL for SSRF protection (returns pinned DNS resolution)
         try:
-            resolved = validate_url(url)
+            resolved = await validate_url_async(url)
         except ValueError:
             logger.warning(f"Blocked image URL (SSRF): {url}")
             return None
@@ -170,6 +172,7 @@ class SearchImageCache:
                     current_url,
                     timeout=self.DOWNLOAD_TIMEOUT,
                     allow_redirects=False,
+                    stream=True,
                 )
 
                 if response.status_code in (301, 302, 303, 307, 308):
@@ -177,7 +180,7 @@ class SearchImageCache:
                     if not location:
                         return None
                     try:
-                        resolved = validate_redirect_url(location)
+                        resolved = await validate_redirect_url_async(location)
                     except ValueError:
                         return None
                     current_url = location
@@ -187,17 +190,19 @@ class SearchImageCache:
                 if response.status_code in (404, 410):
                     return None
 
-                if response.status_code == 200 and response.content:
-                    if not check_response_size(response, MAX_IMAGE_SIZE):
+                if response.status_code == 200:
+                    try:
+                        content = await read_limited_body(response, MAX_IMAGE_SIZE)
+                    except ValueError:
                         logger.warning("Image too large: %s", current_url)
                         return None
-                    if len(response.content) > MAX_IMAGE_SIZE:
+                    if not content:
                         return None
                     content_type = response.headers.get("content-type", "")
                     if "image" in content_type:
-                        return response.content
-                    if self._looks_like_image(response.content):
-                        return response.content
+                        return content
+                    if self._looks_like_image(content):
+                        return content
 
                 return None
 
@@ -212,6 +217,47 @@ class SearchImageCache:
         # JPEG, PNG, GIF, WebP magic bytes
         return data[:2] == b"\xff\xd8" or data[:4] == b"\x89PNG" or data[:4] == b"GIF8" or data[:4] == b"RIFF"
 
+    async def queue_images(self, image_urls: list) -> int:
+        """
+        Queue background downloads for images that have no cache record yet.
+
+        New images are queued in batches of at most MAX_BATCH_URLS, each its
+        own job keyed by a hash of its URLs, so a search made while another
+        batch is running still gets its images queued. Pending rows are
+        created alongside the jobs, so repeated searches (and the legacy
+        client's image polling) don't queue the same images again.
+
+        Args:
+            image_urls: List of external image URLs to cache
+
+        Returns:
+            Number of images queued
+        """
+        # Import here to avoid circular imports
+        from apps.core.jobs import enqueue_job
+        from apps.recipes.models import CachedSearchImage
+
+        def queue():
+            known = set(
+                CachedSearchImage.objects.filter(external_url__in=image_urls).values_list("external_url", flat=True)
+            )
+            new_urls = list(dict.fromkeys(url for url in image_urls if url not in known))
+            queued = 0
+            for start in range(0, len(new_urls), self.MAX_BATCH_URLS):
+                batch = new_urls[start : start + self.MAX_BATCH_URLS]
+                batch_key = hashlib.sha256("\n".join(sorted(batch)).encode()).hexdigest()
+                if not enqueue_job("cache_search_images", payload={"urls": batch}, dedup_key=batch_key):
+                    continue
+                CachedSearchImage.objects.bulk_create(
+                    [CachedSearchImage(external_url=url) for url in batch], ignore_conflicts=True
+                )
+                queued += len(batch)
+            return queued
+
+        if not image_urls:
+            return 0
+        return await sync_to_async(queue)()
+
     async def get_cached_urls_batch(self, urls: list) -> dict:
         """
         Batch lookup of cached image URLs for API response.
@@ -249,6 +295,39 @@ class SearchImageCache:
 
         return result
 
+    async def get_cached_file(self, image_url: str) -> ContentFile | None:
+        """
+        Return a copy of a successfully cached image for reuse at import.
+
+        Touches last_accessed_at so the cleanup command keeps images that are
+        still being reused.
+
+        Args:
+            image_url: External image URL
+
+        Returns:
+            ContentFile with the cached image bytes, or None if not cached
+        """
+        # Import here to avoid circular imports
+        from apps.recipes.models import CachedSearchImage
+
+        def read_cached():
+            cached = CachedSearchImage.objects.filter(
+                external_url=image_url, status=CachedSearchImage.STATUS_SUCCESS
+            ).first()
+            if not cached or not cached.image:
+                return None
+            with cached.image.open("rb") as f:
+                content = f.read()
+            cached.last_accessed_at = timezone.now()
+            cached.save(update_fields=["last_accessed_at"])
+            return ContentFile(content)
+
+        image_file = await sync_to_async(read_cached)()
+        if image_file:
+            logger.info(f"Reused cached image for {image_url}")
+        return image_file
+
     def _generate_filename(self, image_url: str) -> str:
         """
         Generate unique hash-based filename for cached image.
@@ -304,3 +383,8 @@ class SearchImageCache:
         except Exception as e:
             logger.error(f"Failed to convert image to JPEG: {e}")
             return None
+
+
+def run_cache_images_job(job) -> None:
+    """Background job handler: download and cache job.payload["urls"]."""
+    async_to_sync(SearchImageCache().cache_images)(job.payload.get("urls", []))
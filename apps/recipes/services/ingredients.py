@@ -0,0 +1,494 @@
+"""Local ingredient quantity parsing, scaling and unit conversion.
+
+Handles the common shapes of ingredient lines without the AI: whole and
+decimal numbers, mixed and unicode fractions ("1 1/2", "1½"), ranges
+("2-3", "1 to 2"), attached metric units ("225g") and package sizes
+("1 (400 g) can"). Quantities are displayed with the same rules as
+tidy_quantities(): fractions for cups and spoons, decimals for metric.
+
+scale_ingredient() returns None for any line it cannot scale confidently,
+so callers can hand just those lines to the serving_adjustment prompt.
+"""
+
+import re
+from dataclasses import dataclass
+from fractions import Fraction
+
+from apps.recipes.utils import DECIMAL_UNITS, decimal_to_fraction
+
+UNICODE_FRACTIONS = {
+    "½": "1/2",
+    "⅓": "1/3",
+    "⅔": "2/3",
+    "¼": "1/4",
+    "¾": "3/4",
+    "⅕": "1/5",
+    "⅖": "2/5",
+    "⅗": "3/5",
+    "⅘": "4/5",
+    "⅙": "1/6",
+    "⅚": "5/6",
+    "⅛": "1/8",
+    "⅜": "3/8",
+    "⅝": "5/8",
+    "⅞": "7/8",
+}
+
+# Convertible units: canonical name -> (measure, system, size in ml or g)
+UNITS = {
+    "tsp": ("volume", "imperial", 4.92892),
+    "tbsp": ("volume", "imperial", 14.7868),
+    "cup": ("volume", "imperial", 236.588),
+    "fl oz": ("volume", "imperial", 29.5735),
+    "pint": ("volume", "imperial", 473.176),
+    "quart": ("volume", "imperial", 946.353),
+    "gallon": ("volume", "imperial", 3785.41),
+    "ml": ("volume", "metric", 1),
+    "l": ("volume", "metric", 1000),
+    "oz": ("weight", "imperial", 28.3495),
+    "lb": ("weight", "imperial", 453.592),
+    "g": ("weight", "metric", 1),
+    "kg": ("weight", "metric", 1000),
+}
+
+UNIT_ALIASES = {
+    "teaspoon": "tsp",
+    "teaspoons": "tsp",
+    "tsp": "tsp",
+    "tsps": "tsp",
+    "tablespoon": "tbsp",
+    "tablespoons": "tbsp",
+    "tbsp": "tbsp",
+    "tbsps": "tbsp",
+    "tbs": "tbsp",
+    "tbl": "tbsp",
+    "cup": "cup",
+    "cups": "cup",
+    "fl oz": "fl oz",
+    "fluid ounce": "fl oz",
+    "fluid ounces": "fl oz",
+    "pint": "pint",
+    "pints": "pint",
+    "pt": "pint",
+    "quart": "quart",
+    "quarts": "quart",
+    "qt": "quart",
+    "gallon": "gallon",
+    "gallons": "gallon",
+    "ml": "ml",
+    "milliliter": "ml",
+    "milliliters": "ml",
+    "millilitre": "ml",
+    "millilitres": "ml",
+    "l": "l",
+    "liter": "l",
+    "liters": "l",
+    "litre": "l",
+    "litres": "l",
+    "oz": "oz",
+    "ounce": "oz",
+    "ounces": "oz",
+    "lb": "lb",
+    "lbs": "lb",
+    "pound": "lb",
+    "pounds": "lb",
+    "g": "g",
+    "gram": "g",
+    "grams": "g",
+    "kg": "kg",
+    "kilogram": "kg",
+    "kilograms": "kg",
+}
+
+# Countable units: scaled but never converted (singular -> plural)
+COUNT_UNITS = {
+    "clove": "cloves",
+    "can": "cans",
+    "tin": "tins",
+    "jar": "jars",
+    "slice": "slices",
+    "piece": "pieces",
+    "pinch": "pinches",
+    "dash": "dashes",
+    "sprig": "sprigs",
+    "stick": "sticks",
+    "bunch": "bunches",
+    "head": "heads",
+    "stalk": "stalks",
+    "package": "packages",
+    "packet": "packets",
+    "handful": "handfuls",
+    "sheet": "sheets",
+    "fillet": "fillets",
+    "rasher": "rashers",
+    "knob": "knobs",
+}
+
+# Spelled-out units whose written form follows the quantity (singular -> plural)
+WORD_UNIT_PLURALS = {
+    "cup": "cups",
+    "teaspoon": "teaspoons",
+    "tablespoon": "tablespoons",
+    "fluid ounce": "fluid ounces",
+    "pint": "pints",
+    "quart": "quarts",
+    "gallon": "gallons",
+    "ounce": "ounces",
+    "pound": "pounds",
+    "gram": "grams",
+    "kilogram": "kilograms",
+    "milliliter": "milliliters",
+    "millilitre": "millilitres",
+    "liter": "liters",
+    "litre": "litres",
+    **COUNT_UNITS,
+}
+WORD_UNIT_SINGULARS = {plural: singular for singular, plural in WORD_UNIT_PLURALS.items()}
+COUNT_UNIT_NAMES = {**{unit: unit for unit in COUNT_UNITS}, **{plural: unit for unit, plural in COUNT_UNITS.items()}}
+
+# Grams per US cup, for converting cup measures of common dry ingredients to metric.
+# Longer names are matched first so "brown sugar" wins over "sugar".
+GRAMS_PER_CUP = {
+    "all-purpose flour": 125,
+    "plain flour": 125,
+    "bread flour": 130,
+    "whole wheat flour": 120,
+    "flour": 125,
+    "powdered sugar": 120,
+    "icing sugar": 120,
+    "confectioners sugar": 120,
+    "brown sugar": 220,
+    "caster sugar": 200,
+    "sugar": 200,
+    "peanut butter": 258,
+    "butter": 227,
+    "cocoa powder": 85,
+    "cocoa": 85,
+    "cornstarch": 128,
+    "cornflour": 128,
+    "rolled oats": 90,
+    "oats": 90,
+    "rice": 185,
+    "breadcrumbs": 108,
+    "chocolate chips": 170,
+    "raisins": 145,
+    "honey": 340,
+}
+
+# Ingredients measured by volume in metric recipes (cups become ml, not grams)
+LIQUIDS = (
+    "water",
+    "milk",
+    "buttermilk",
+    "cream",
+    "stock",
+    "broth",
+    "oil",
+    "juice",
+    "wine",
+    "vinegar",
+    "beer",
+    "coffee",
+    "yogurt",
+    "yoghurt",
+    "syrup",
+    "sauce",
+)
+
+IRREGULAR_PLURALS = {
+    "leaf": "leaves",
+    "loaf": "loaves",
+    "half": "halves",
+    "potato": "potatoes",
+    "tomato": "tomatoes",
+    "mango": "mangoes",
+}
+IRREGULAR_SINGULARS = {plural: singular for singular, plural in IRREGULAR_PLURALS.items()}
+
+# Count and container nouns parse_ingredient() doesn't take as units. In
+# "1 box pasta" or "2 leaves basil" the quantity counts the first word, so
+# the last word can't be inflected to agree with it.
+COUNT_NOUNS = {"bag", "bottle", "box", "bulb", "carton", "container", "cube", "ear", "leaf", "pack", "strip", "tub"}
+
+_QTY = r"\d+\s+\d+/\d+|\d+/\d+|\d+(?:\.\d+)?"
+QUANTITY_RE = re.compile(
+    rf"^(?P<qty>{_QTY})(?:\s*(?P<sep>-|–|—|\bto\b)\s*(?P<qty2>{_QTY}))?(?P<space>\s*)(?P<rest>.*)$", re.S
+)
+UNIT_RE = re.compile(r"(?P<unit>fl\.?\s*oz\.?|fluid ounces?|[A-Za-z]+\.?)(?=[\s,()]|$)\s*(?P<item>.*)", re.S)
+SIZE_RE = re.compile(r"(?P<size>\([^)]*\))\s*(?P<rest>.*)", re.S)
+ARTICLE_RE = re.compile(r"^an?\s+(?=[A-Za-z])", re.I)
+UNICODE_FRACTION_RE = re.compile(rf"(\d)?\s*([{''.join(UNICODE_FRACTIONS)}])")
+NUMBER_RE = re.compile(rf"\d|[{''.join(UNICODE_FRACTIONS)}]")
+# An amount the parser can't place: a number in the middle of the line or a spelled-out count
+HIDDEN_QUANTITY_RE = re.compile(
+    rf"{NUMBER_RE.pattern}|^(?:a|an|one|two|three|four|five|six|seven|eight|nine|ten|"
+    r"eleven|twelve|half|dozen|couple|few|several)\b",
+    re.I,
+)
+
+
+@dataclass(frozen=True)
+class ParsedIngredient:
+    """An ingredient line split into quantity, unit and the rest of the line."""
+
+    quantity: float
+    quantity_max: float | None  # upper bound of a range ("2-3 cloves")
+    unit: str | None  # canonical unit from UNITS or COUNT_UNITS; None for plain counts ("3 eggs")
+    unit_text: str  # the unit as written, e.g. "tablespoons"
+    item: str  # everything after the unit, e.g. "flour, sifted"
+    size: str = ""  # package size written before the unit, e.g. "(400 g)"
+    attached: bool = False  # unit written without a space ("225g")
+    range_sep: str = "-"
+
+
+def _normalise(text: str) -> str:
+    """Spell unicode fractions as ASCII ("1½" -> "1 1/2") and unify fraction slashes."""
+    text = text.replace("⁄", "/")
+    return UNICODE_FRACTION_RE.sub(
+        lambda m: f"{m.group(1)} {UNICODE_FRACTIONS[m.group(2)]}" if m.group(1) else UNICODE_FRACTIONS[m.group(2)],
+        text,
+    )
+
+
+def _to_float(quantity: str) -> float:
+    return float(sum(Fraction(part) for part in quantity.split()))
+
+
+def _canonical_unit(token: str) -> str | None:
+    key = re.sub(r"\s+", " ", token.lower().rstrip("."))
+    if key.startswith("fl"):
+        key = "fl oz"
+    if key in UNIT_ALIASES:
+        return UNIT_ALIASES[key]
+    return COUNT_UNIT_NAMES.get(key)
+
+
+def parse_ingredient(line: str) -> ParsedIngredient | None:
+    """Split an ingredient line into quantity, unit and item.
+
+    Returns None if the line does not start with a quantity. "a"/"an"
+    count as 1 when followed by a known unit ("a pinch of salt").
+    """
+    text = _normalise(line.strip())
+    article = ARTICLE_RE.match(text)
+    if article:
+        unit_match = UNIT_RE.match(text[article.end() :])
+        if not unit_match or not _canonical_unit(unit_match["unit"]):
+            return None
+        text = "1 " + text[article.end() :]
+
+    match = QUANTITY_RE.match(text)
+    if not match:
+        return None
+
+    rest = match["rest"]
+    size = ""
+    size_match = SIZE_RE.match(rest)
+    if size_match:
+        size, rest = size_match["size"], size_match["rest"]
+
+    unit, unit_text, item = None, "", rest
+    unit_match = UNIT_RE.match(rest)
+    canonical = _canonical_unit(unit_match["unit"]) if unit_match else None
+    if canonical:
+        unit, unit_text, item = canonical, unit_match["unit"].rstrip("."), unit_match["item"]
+
+    return ParsedIngredient(
+        quantity=_to_float(match["qty"]),
+        quantity_max=_to_float(match["qty2"]) if match["qty2"] else None,
+        unit=unit,
+        unit_text=unit_text,
+        item=item.strip(),
+        size=size,
+        attached=bool(unit) and not size and not match["space"],
+        range_sep=" to " if match["sep"] == "to" else "-",
+    )
+
+
+def _matches(item: str, name: str) -> bool:
+    return re.search(rf"\b{re.escape(name)}\b", item) is not None
+
+
+def _grams_per_cup(item: str) -> int | None:
+    item = item.lower()
+    for name in sorted(GRAMS_PER_CUP, key=len, reverse=True):
+        if _matches(item, name):
+            return GRAMS_PER_CUP[name]
+    return None
+
+
+def _metric(amounts: list[float], base_unit: str) -> tuple[list[float], str]:
+    """Express gram/ml amounts in g/ml, or kg/l from 1000 up."""
+    if min(amounts) >= 1000:
+        return [a / 1000 for a in amounts], "kg" if base_unit == "g" else "l"
+    return amounts, base_unit
+
+
+def _imperial(amounts: list[float], measure: str) -> tuple[list[float], str]:
+    """Express gram/ml amounts in the most natural imperial unit."""
+    smallest = min(amounts)
+    if measure == "weight":
+        unit = "oz" if smallest < UNITS["lb"][2] else "lb"
+    elif smallest < UNITS["tbsp"][2]:
+        unit = "tsp"
+    elif smallest < UNITS["cup"][2] / 4:
+        unit = "tbsp"
+    else:
+        unit = "cup"
+    return [a / UNITS[unit][2] for a in amounts], unit
+
+
+def _convert(parsed: ParsedIngredient, amounts: list[float], unit_system: str | None):
+    """Return (amounts, unit) in the requested unit system, or None if the conversion is a guess.
+
+    Teaspoons and tablespoons are left alone: they are used in both systems.
+    """
+    if not unit_system or parsed.unit not in UNITS or parsed.unit in ("tsp", "tbsp"):
+        return amounts, None
+    measure, system, size = UNITS[parsed.unit]
+    if system == unit_system:
+        return amounts, None
+
+    base = [a * size for a in amounts]
+    if unit_system == "imperial":
+        return _imperial(base, measure)
+    if measure == "weight":
+        return _metric(base, "g")
+
+    # Cup measures: dry ingredients go to grams, liquids to ml, anything else is a guess
+    grams_per_cup = _grams_per_cup(parsed.item)
+    if grams_per_cup:
+        return _metric([b / UNITS["cup"][2] * grams_per_cup for b in base], "g")
+    if any(_matches(parsed.item.lower(), liquid) for liquid in LIQUIDS):
+        return _metric(base, "ml")
+    return None
+
+
+def _round_amount(value: float, unit: str) -> float:
+    """Round to a sensible precision for the unit.
+
+    Grams and ml are whole (nearest 5 from 100 up), other decimal units keep
+    one or two places, and everything else snaps to the nearest eighth or
+    third so decimal_to_fraction() always finds a kitchen fraction.
+    """
+    unit = unit.lower()
+    if unit in ("g", "ml", "gram", "grams", "milliliter", "milliliters", "millilitre", "millilitres"):
+        return round(value / 5) * 5 if value >= 100 else round(value) if value >= 10 else round(value, 1)
+    if unit in DECIMAL_UNITS:
+        return round(value, 2 if unit in ("kg", "l") else 1)
+    return min(round(value * 8) / 8, round(value * 3) / 3, key=lambda v: abs(v - value))
+
+
+def _format_amount(value: float, unit: str) -> str:
+    """Format a rounded quantity: decimals for metric/weights, fractions otherwise."""
+    if unit.lower() in DECIMAL_UNITS or unit.lower() in ("millilitre", "millilitres"):
+        return f"{value:.2f}".rstrip("0").rstrip(".")
+    return decimal_to_fraction(value)
+
+
+def _inflect_unit(unit_text: str, amount: float) -> str:
+    lower = unit_text.lower()
+    if amount > 1 and lower in WORD_UNIT_PLURALS:
+        inflected = WORD_UNIT_PLURALS[lower]
+    elif amount <= 1 and lower in WORD_UNIT_SINGULARS:
+        inflected = WORD_UNIT_SINGULARS[lower]
+    else:
+        return unit_text
+    return inflected.capitalize() if unit_text[:1].isupper() else inflected
+
+
+def _pluralize(word: str) -> str:
+    if word in IRREGULAR_PLURALS:
+        return IRREGULAR_PLURALS[word]
+    if word.endswith(("s", "x", "z", "ch", "sh")):
+        return word + "es"
+    if word.endswith("y") and word[-2:-1] not in "aeiou":
+        return word[:-1] + "ies"
+    return word + "s"
+
+
+def singularize(word: str) -> str:
+    """Singular form of a lowercase English noun ("tomatoes" -> "tomato", "leaves" -> "leaf")."""
+    if word in IRREGULAR_SINGULARS:
+        return IRREGULAR_SINGULARS[word]
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith(("ches", "shes", "xes", "sses")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _inflect_item(item: str, old_amount: float, new_amount: float) -> str | None:
+    """Make a counted item agree with its new quantity ("1 onion" -> "2 onions").
+
+    Only the last word before any comma or parenthesis is changed. Returns
+    None when the noun phrase is too complex to inflect safely.
+    """
+    if (old_amount > 1) == (new_amount > 1):
+        return item
+    phrase = re.split(r"[,(]", item, maxsplit=1)[0].rstrip()
+    words = phrase.split()
+    if not words or not words[-1].isalpha() or {"and", "or", "of", "with"} & {w.lower() for w in words}:
+        return None
+    if len(words) > 1 and singularize(words[0].lower()) in COUNT_NOUNS:
+        return None
+    last = words[-1]
+    inflected = _pluralize(last.lower()) if new_amount > 1 else singularize(last.lower())
+    if last[0].isupper():
+        inflected = inflected.capitalize()
+    return phrase[: -len(last)] + inflected + item[len(phrase) :]
+
+
+def scale_ingredient(line: str, factor: float, unit_system: str | None = None) -> str | None:
+    """Scale one ingredient line by `factor`, optionally converting it to `unit_system`.
+
+    Lines with no quantity ("Salt to taste") are returned unchanged.
+
+    Returns:
+        The scaled line, or None if the line needs a human (or the AI) to
+        scale it: amounts buried mid-line ("Juice of 2 lemons"), spelled-out
+        counts, unknown ingredients measured in cups when converting to
+        metric, or amounts too small to display.
+    """
+    parsed = parse_ingredient(line)
+    if parsed is None:
+        return None if HIDDEN_QUANTITY_RE.search(line.strip()) else line
+    if NUMBER_RE.search(parsed.item):
+        return None
+
+    amounts = [parsed.quantity * factor]
+    if parsed.quantity_max is not None:
+        amounts.append(parsed.quantity_max * factor)
+
+    converted = _convert(parsed, amounts, unit_system)
+    if converted is None:
+        return None
+    amounts, new_unit = converted
+    if new_unit is None and parsed.unit in ("g", "ml") and min(amounts) >= 1000:
+        amounts, new_unit = _metric(amounts, parsed.unit)
+    if factor == 1 and new_unit is None:
+        return line
+
+    unit_name = new_unit or parsed.unit_text
+    amounts = [_round_amount(a, unit_name) for a in amounts]
+    if min(amounts) <= 0:
+        return None
+
+    if new_unit:
+        unit_text = "cups" if new_unit == "cup" and max(amounts) > 1 else new_unit
+    else:
+        unit_text = _inflect_unit(parsed.unit_text, max(amounts))
+    item = parsed.item
+    if parsed.unit is None:
+        old_max = parsed.quantity_max if parsed.quantity_max is not None else parsed.quantity
+        item = _inflect_item(item, old_max, max(amounts))
+        if item is None:
+            return None
+
+    quantity = parsed.range_sep.join(_format_amount(a, unit_name) for a in amounts)
+
+    attached = parsed.attached and unit_text in ("g", "kg", "ml", "l")
+    parts = [quantity + unit_text if attached else quantity, parsed.size, "" if attached else unit_text, item]
+    return " ".join(part for part in parts if part)
@@ -0,0 +1,355 @@
+"""
+Fast-path recipe extraction from schema.org JSON-LD.
+
+Most recipe pages embed a schema.org ``Recipe`` object in a
+``<script type="application/ld+json">`` block. Scanning only those blocks
+with a regex and mapping them straight into the scraper's field dict skips
+the BeautifulSoup DOM, extruct and site-class machinery that recipe-scrapers
+builds for every page.
+
+Field semantics mirror recipe-scrapers' SchemaOrg accessors (and reuse its
+normalisation helpers) so a recipe looks the same whichever path parsed it.
+Pages without a usable Recipe return None and the caller falls back to
+recipe-scrapers.
+"""
+
+import json
+import logging
+import re
+from itertools import chain
+from urllib.parse import urljoin
+
+from recipe_scrapers._utils import (
+    csv_to_tags,
+    format_diet_name,
+    get_equipment,
+    get_minutes,
+    get_yields,
+    normalize_string,
+)
+
+logger = logging.getLogger(__name__)
+
+_JSONLD_RE = re.compile(
+    r"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_LINK_OR_META_RE = re.compile(r"<(?:link|meta)\b[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(r"([\w:-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'>]+))")
+_HTML_LANG_RE = re.compile(r"<html\b[^>]*\blang\s*=\s*[\"']?([\w-]+)", re.IGNORECASE)
+
+# Ingredient group headings only exist in the DOM (WP Recipe Maker, Tasty
+# Recipes). Pages carrying them go through recipe-scrapers so groups survive.
+GROUPED_INGREDIENT_MARKERS = ("wprm-recipe-group-name", "tasty-recipes-ingredients")
+
+
+def iter_jsonld_blocks(html: str):
+    """Yield the decoded payload of every parseable JSON-LD block in the page."""
+    for match in _JSONLD_RE.finditer(html):
+        raw = match.group(1).strip()
+        if raw.startswith("<!--"):
+            raw = raw.removeprefix("<!--").removesuffix("-->").strip()
+        if not raw:
+            continue
+        try:
+            yield json.loads(raw, strict=False)
+        except ValueError:
+            logger.debug("Skipping malformed JSON-LD block", exc_info=True)
+
+
+def _iter_nodes(data):
+    """Yield every dict node from a JSON-LD payload, descending into @graph."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        graph = data.get("@graph")
+        if graph:
+            yield from _iter_nodes(graph)
+
+
+def _has_type(node: dict, schematype: str) -> bool:
+    types = node.get("@type", "")
+    types = types if isinstance(types, list) else [types]
+    return any(isinstance(t, str) and t.lower() == schematype.lower() for t in types)
+
+
+def _find_recipe_node(nodes: list[dict]) -> dict | None:
+    for node in nodes:
+        if _has_type(node, "Recipe"):
+            return node
+        main_entity = node.get("mainEntity")
+        if _has_type(node, "WebPage") and isinstance(main_entity, dict) and _has_type(main_entity, "Recipe"):
+            return main_entity
+    return None
+
+
+def _head_tag_attrs(html: str):
+    """Yield attribute dicts for <link>/<meta> tags in the document head."""
+    head_end = html.lower().find("</head>")
+    head = html[:head_end] if head_end != -1 else html
+    for tag in _LINK_OR_META_RE.finditer(head):
+        yield {
+            name.lower(): next(v for v in values if v is not None) for name, *values in _ATTR_RE.findall(tag.group(0))
+        }
+
+
+def _head_meta(html: str) -> dict[str, str]:
+    """Collect canonical link and OpenGraph values needed by the fast path."""
+    found: dict[str, str] = {}
+    for attrs in _head_tag_attrs(html):
+        if attrs.get("rel", "").lower() == "canonical" and attrs.get("href"):
+            found.setdefault("canonical", attrs["href"])
+        prop = attrs.get("property") or attrs.get("name") or ""
+        if prop in ("og:site_name", "og:image") and attrs.get("content"):
+            found.setdefault(prop, attrs["content"])
+    return found
+
+
+def _text(value) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("text") or ""
+    return normalize_string(str(value)) if value else ""
+
+
+def _author(recipe: dict, people: dict) -> str:
+    author = recipe.get("author") or recipe.get("Author")
+    if isinstance(author, list) and author:
+        author = author[0]
+    if isinstance(author, dict):
+        key = author.get("@id") or author.get("url")
+        author = people.get(key, author).get("name") if key else author.get("name")
+    return author.strip() if isinstance(author, str) else ""
+
+
+def _image(recipe: dict) -> str:
+    image = recipe.get("image")
+    if isinstance(image, list):
+        image = image[0] if image else None
+    if isinstance(image, dict):
+        image = image.get("url")
+    if not isinstance(image, str) or not image.startswith(("http://", "https://")):
+        return ""
+    return image
+
+
+def _ingredient_to_string(ingredient) -> str:
+    if isinstance(ingredient, dict) and _has_type(ingredient, "PropertyValue"):
+        unit = ingredient.get("unitText") or ingredient.get("unitCode") or ""
+        parts = [ingredient.get("value", ""), unit, ingredient.get("name", "")]
+        return " ".join(str(p) for p in parts if p)
+    return str(ingredient)
+
+
+def _ingredients(recipe: dict) -> list[str]:
+    ingredients = recipe.get("recipeIngredient") or recipe.get("ingredients") or []
+    if isinstance(ingredients, str):
+        ingredients = [ingredients]
+    if ingredients and isinstance(ingredients[0], list):
+        ingredients = list(chain(*ingredients))
+    cleaned = (normalize_string(_ingredient_to_string(i)) for i in ingredients if i is not None)
+    return [i for i in cleaned if i]
+
+
+def _instruction_lines(item) -> list[str]:
+    if isinstance(item, str):
+        return [item]
+    if not isinstance(item, dict):
+        return []
+    if _has_type(item, "HowToSection"):
+        lines = [item["name"]] if item.get("name") else []
+        elements = item.get("itemListElement") or []
+        for element in elements if isinstance(elements, list) else [elements]:
+            lines += _instruction_lines(element)
+        return lines
+    text = item.get("text") or ""
+    name = item.get("name") or ""
+    if name and not text.startswith(name.rstrip(".")):
+        return [name, text]
+    return [text]
+
+
+def _instructions(recipe: dict) -> list[str]:
+    instructions = recipe.get("recipeInstructions") or recipe.get("RecipeInstructions") or []
+    if isinstance(instructions, dict):
+        instructions = instructions.get("itemListElement") or []
+    if isinstance(instructions, str):
+        instructions = instructions.split("\n")
+    if instructions and all(isinstance(i, list) for i in instructions):
+        instructions = list(chain(*instructions))
+    lines = chain.from_iterable(_instruction_lines(i) for i in instructions)
+    return [line for line in (normalize_string(str(raw)) for raw in lines if raw) if line]
+
+
+def _minutes(recipe: dict, key: str) -> int | None:
+    value = recipe.get(key)
+    if isinstance(value, dict):
+        value = value.get("maxValue")
+    if value is None:
+        return None
+    try:
+        return get_minutes(value)
+    except Exception:
+        return None
+
+
+def _yields(recipe: dict) -> str:
+    value = recipe.get("recipeYield") or recipe.get("yield")
+    if not value:
+        return ""
+    try:
+        return get_yields(value) or ""
+    except Exception:
+        return ""
+
+
+def _joined(value) -> str:
+    if isinstance(value, list):
+        return ",".join(normalize_string(str(v)) for v in value if v)
+    return normalize_string(str(value)) if value else ""
+
+
+def _keywords(recipe: dict) -> list[str]:
+    keywords = recipe.get("keywords")
+    if not keywords:
+        return []
+    if isinstance(keywords, list):
+        keywords = ", ".join(normalize_string(str(k)) for k in keywords)
+    return csv_to_tags(normalize_string(str(keywords)))
+
+
+def _dietary_restrictions(recipe: dict) -> list[str]:
+    diets = recipe.get("suitableForDiet")
+    if not diets:
+        return []
+    diets = diets if isinstance(diets, list) else [diets]
+    return csv_to_tags(", ".join(filter(None, (format_diet_name(str(d)) for d in diets))))
+
+
+def _equipment(recipe: dict) -> list[str]:
+    tools = recipe.get("tool") or []
+    tools = tools if isinstance(tools, list) else [tools]
+    return get_equipment([name for name in (_text(t) for t in tools) if name])
+
+
+def _nutrition(recipe: dict) -> dict:
+    nutrition = recipe.get("nutrition")
+    if not isinstance(nutrition, dict):
+        return {}
+    return {
+        normalize_string(key): normalize_string(str(value))
+        for key, value in nutrition.items()
+        if key and value and not key.startswith("@") and key != "type"
+    }
+
+
+def _aggregate_rating(recipe: dict, ratings: dict) -> dict:
+    rating = recipe.get("aggregateRating")
+    if isinstance(rating, dict) and rating.get("@id") in ratings:
+        rating = ratings[rating["@id"]]
+    return rating if isinstance(rating, dict) else {}
+
+
+def _rating(aggregate: dict) -> float | None:
+    try:
+        return round(float(aggregate["ratingValue"]), 2)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _rating_count(aggregate: dict) -> int | None:
+    try:
+        count = int(float(aggregate.get("ratingCount") or aggregate.get("reviewCount")))
+    except (TypeError, ValueError):
+        return None
+    return count or None
+
+
+def _total_time(recipe: dict, prep_time: int | None, cook_time: int | None) -> int | None:
+    total = _minutes(recipe, "totalTime")
+    if total:
+        return total
+    if prep_time or cook_time:
+        return (prep_time or 0) + (cook_time or 0)
+    return None
+
+
+def peek_image_url(html: str) -> str:
+    """
+    Find the recipe image URL without a full parse.
+
+    Uses the same precedence as extract_jsonld_recipe (JSON-LD Recipe image,
+    then og:image) so an import can start downloading the image while the
+    page is still being parsed.
+    """
+    nodes = [node for block in iter_jsonld_blocks(html) for node in _iter_nodes(block)]
+    recipe = _find_recipe_node(nodes)
+    return (_image(recipe) if recipe else "") or _head_meta(html).get("og:image", "")
+
+
+def extract_jsonld_recipe(html: str, url: str) -> dict | None:
+    """
+    Extract recipe fields from the page's JSON-LD blocks.
+
+    Args:
+        html: Raw page HTML
+        url: Page URL (used to resolve a relative canonical link)
+
+    Returns:
+        Field dict in the same shape as RecipeScraper._parse_recipe builds
+        (minus host/servings), or None if the page has no Recipe with a name,
+        ingredients and instructions, or carries grouped-ingredient markup.
+    """
+    if any(marker in html for marker in GROUPED_INGREDIENT_MARKERS):
+        return None
+
+    nodes = [node for block in iter_jsonld_blocks(html) for node in _iter_nodes(block)]
+    recipe = _find_recipe_node(nodes)
+    if recipe is None:
+        return None
+
+    title = _text(recipe.get("name"))
+    ingredients = _ingredients(recipe)
+    instructions = _instructions(recipe)
+    if not (title and ingredients and instructions):
+        return None
+
+    people = {node.get("@id") or node.get("url"): node for node in nodes if _has_type(node, "Person")}
+    ratings = {node["@id"]: node for node in nodes if _has_type(node, "AggregateRating") and node.get("@id")}
+    website = next((node for node in nodes if _has_type(node, "WebSite")), {})
+    head = _head_meta(html)
+    lang = _HTML_LANG_RE.search(html)
+    aggregate = _aggregate_rating(recipe, ratings)
+    prep_time = _minutes(recipe, "prepTime")
+    cook_time = _minutes(recipe, "cookTime")
+
+    return {
+        "title": title,
+        "canonical_url": urljoin(url, head["canonical"]) if "canonical" in head else url,
+        "site_name": _text(website.get("name")) or normalize_string(head.get("og:site_name", "")),
+        "author": _author(recipe, people),
+        "description": _text(recipe.get("description")),
+        "image_url": _image(recipe) or head.get("og:image", ""),
+        "ingredients": ingredients,
+        "ingredient_groups": [{"purpose": None, "ingredients": ingredients}],
+        "instructions": instructions,
+        "instructions_text": "\n".join(instructions),
+        "prep_time": prep_time,
+        "cook_time": cook_time,
+        "total_time": _total_time(recipe, prep_time, cook_time),
+        "yields": _yields(recipe),
+        "category": _joined(recipe.get("recipeCategory")),
+        "cuisine": _joined(recipe.get("recipeCuisine")),
+        "cooking_method": _text(recipe.get("cookingMethod")),
+        "keywords": _keywords(recipe),
+        "dietary_restrictions": _dietary_restrictions(recipe),
+        "equipment": _equipment(recipe),
+        "nutrition": _nutrition(recipe),
+        "rating": _rating(aggregate),
+        "rating_count": _rating_count(aggregate),
+        "language": lang.group(1) if lang else _text(recipe.get("inLanguage")),
+        "links": [],
+    }
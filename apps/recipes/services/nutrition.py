@@ -0,0 +1,190 @@
+"""Offline nutrition estimates from a bundled ingredient nutrient table.
+
+data/nutrients.csv holds per-100 g values for about 150 common ingredients
+(rounded from USDA FoodData Central), plus a density for volume measures
+and a typical weight for counted items ("2 eggs", "1 onion"). The table is
+loaded once per process into flat arrays. Each ingredient line is parsed
+with parse_ingredient(), weighed in grams and matched to a table row by
+name: the longest listed name found as whole words, then a fuzzy match for
+misspellings and unlisted plurals. Grams are accumulated per row and the
+nutrients summed in one pass over the table.
+
+calculate_recipe_nutrition() only answers when it could match and weigh
+most of a recipe's measured lines; otherwise it returns {} so callers can
+fall back to the nutrition_estimate prompt.
+"""
+
+import csv
+import difflib
+import re
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from apps.recipes.models import Recipe
+
+from .ingredients import HIDDEN_QUANTITY_RE, UNITS, ParsedIngredient, parse_ingredient
+
+TABLE_PATH = Path(__file__).resolve().parent.parent / "data" / "nutrients.csv"
+MIN_COVERAGE = 0.8  # Share of measured lines that must be matched and weighed
+FUZZY_CUTOFF = 0.85
+MAX_NAME_WORDS = 4
+
+# (table column, nutrition key as scraped from schema.org NutritionInformation, display unit)
+NUTRIENTS = (
+    ("kcal", "calories", "kcal"),
+    ("fat", "fatContent", "g"),
+    ("saturated_fat", "saturatedFatContent", "g"),
+    ("carbs", "carbohydrateContent", "g"),
+    ("sugar", "sugarContent", "g"),
+    ("fiber", "fiberContent", "g"),
+    ("protein", "proteinContent", "g"),
+    ("sodium_mg", "sodiumContent", "mg"),
+)
+
+# Count units that weigh about the same whatever the ingredient
+COUNT_UNIT_GRAMS = {"pinch": 0.4, "dash": 0.6, "sprig": 1, "knob": 15, "handful": 30, "bunch": 30}
+# Count units meaning one of the ingredient's own pieces ("2 cloves garlic", "4 slices bread")
+PIECE_UNITS = {"clove", "slice", "piece", "stick", "fillet", "rasher", "head", "stalk", "sheet"}
+# "1 can chickpeas" without a package size
+PACKAGE_UNITS = {"can": 400, "tin": 400}
+PACKAGE_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(g|kg|ml|l|oz|lb)\b", re.I)
+WORD_RE = re.compile(r"[a-z][a-z-]*")
+
+
+@dataclass(frozen=True)
+class NutrientTable:
+    """The bundled table in flat arrays: row i's nutrients are values[i * width : (i + 1) * width]."""
+
+    labels: list[str]  # first listed name of each row
+    names: dict[str, int]  # every listed name -> row
+    values: array  # per 100 g, in NUTRIENTS order
+    density: array  # g per ml, 0 when volume measures can't be weighed
+    each: array  # g per piece, 0 when the ingredient isn't counted
+    width: int = len(NUTRIENTS)
+
+
+@lru_cache(maxsize=1)
+def load_table() -> NutrientTable:
+    """Load data/nutrients.csv (once per process)."""
+    labels, names = [], {}
+    values, density, each = array("d"), array("d"), array("d")
+    with TABLE_PATH.open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            aliases = row["names"].split("|")
+            for name in aliases:
+                names[name] = len(labels)
+            labels.append(aliases[0])
+            values.extend(float(row[column]) for column, _, _ in NUTRIENTS)
+            density.append(float(row["g_per_ml"] or 0))
+            each.append(float(row["g_each"] or 0))
+    return NutrientTable(labels=labels, names=names, values=values, density=density, each=each)
+
+
+def _match_row(item: str, table: NutrientTable) -> int | None:
+    """Table row for an ingredient's name, or None if nothing is close."""
+    words = WORD_RE.findall(re.split(r"[,(]", item.lower(), maxsplit=1)[0])
+    # Longest listed name first ("brown sugar" over "sugar"), rightmost first since the
+    # noun comes last ("chicken stock cube" is a stock cube)
+    for length in range(min(MAX_NAME_WORDS, len(words)), 0, -1):
+        for start in range(len(words) - length, -1, -1):
+            row = table.names.get(" ".join(words[start : start + length]))
+            if row is not None:
+                return row
+    for length in range(min(3, len(words)), 0, -1):
+        close = difflib.get_close_matches(" ".join(words[-length:]), table.names, n=1, cutoff=FUZZY_CUTOFF)
+        if close:
+            return table.names[close[0]]
+    return None
+
+
+def _unit_grams(amount: float, unit: str, row: int, table: NutrientTable) -> float | None:
+    measure, _, size = UNITS[unit]
+    if measure == "weight":
+        return amount * size
+    return amount * size * table.density[row] if table.density[row] else None
+
+
+def _grams(parsed: ParsedIngredient, row: int, table: NutrientTable) -> float | None:
+    """Weight of a parsed line in grams, or None if it can't be weighed."""
+    quantity = parsed.quantity if parsed.quantity_max is None else (parsed.quantity + parsed.quantity_max) / 2
+    package = PACKAGE_SIZE_RE.search(parsed.size)
+    if package:
+        # "1 (400 g) can", "2 (14 oz) tins"
+        grams = _unit_grams(float(package[1]), package[2].lower(), row, table)
+        return quantity * grams if grams else None
+    if parsed.unit in UNITS:
+        return _unit_grams(quantity, parsed.unit, row, table)
+    if parsed.unit in COUNT_UNIT_GRAMS:
+        return quantity * COUNT_UNIT_GRAMS[parsed.unit]
+    if parsed.unit in PACKAGE_UNITS:
+        return quantity * PACKAGE_UNITS[parsed.unit]
+    if (parsed.unit is None or parsed.unit in PIECE_UNITS) and table.each[row]:
+        return quantity * table.each[row]
+    return None
+
+
+def ingredient_grams(line: str) -> tuple[str, float] | None:
+    """Match and weigh one ingredient line: (table ingredient, grams), or None."""
+    parsed = parse_ingredient(line)
+    if parsed is None:
+        return None
+    table = load_table()
+    row = _match_row(parsed.item, table)
+    grams = _grams(parsed, row, table) if row is not None else None
+    return (table.labels[row], grams) if grams is not None else None
+
+
+def _format(value: float, unit: str) -> str:
+    if unit == "g" and value < 10:
+        return f"{value:.1f} g"
+    return f"{round(value)} {unit}"
+
+
+def calculate_recipe_nutrition(ingredients: list[str], servings: int | None) -> dict:
+    """Estimate per-serving nutrition from ingredient lines, in the same format as scraped nutrition.
+
+    Lines without an amount ("Salt to taste") are left out. Returns {} when
+    servings is unknown or fewer than MIN_COVERAGE of the measured lines
+    could be matched and weighed.
+    """
+    if not servings or servings < 1 or not ingredients:
+        return {}
+    table = load_table()
+    grams_per_row = array("d", bytes(8 * len(table.labels)))
+    measured = matched = 0
+    for line in ingredients:
+        parsed = parse_ingredient(line) if isinstance(line, str) else None
+        if parsed is None:
+            # An amount buried in the line ("Juice of 2 lemons") still counts as unmatched
+            if isinstance(line, str) and HIDDEN_QUANTITY_RE.search(line.strip()):
+                measured += 1
+            continue
+        measured += 1
+        row = _match_row(parsed.item, table)
+        grams = _grams(parsed, row, table) if row is not None else None
+        if grams is not None:
+            grams_per_row[row] += grams
+            matched += 1
+
+    if not matched or matched < MIN_COVERAGE * measured:
+        return {}
+
+    totals = [0.0] * table.width
+    for row, grams in enumerate(grams_per_row):
+        if grams:
+            offset = row * table.width
+            for column in range(table.width):
+                totals[column] += grams * table.values[offset + column]
+    if totals[0] <= 0:
+        return {}
+    return {key: _format(total / 100 / servings, unit) for (_, key, unit), total in zip(NUTRIENTS, totals)}
+
+
+def nutrition_fields(scraped: dict | None, ingredients: list[str], servings: int | None) -> dict:
+    """Recipe nutrition and nutrition_source: the scraped values, else an estimate from the ingredients."""
+    if scraped:
+        return {"nutrition": scraped, "nutrition_source": Recipe.NUTRITION_SCRAPED}
+    nutrition = calculate_recipe_nutrition(ingredients, servings)
+    return {"nutrition": nutrition, "nutrition_source": Recipe.NUTRITION_CALCULATED if nutrition else ""}
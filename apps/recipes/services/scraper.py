@@ -2,32 +2,39 @@
 Recipe scraper service using curl_cffi and recipe-scrapers.
 """
 
+import asyncio
 import hashlib
 import logging
 import re
-import threading
 from io import BytesIO
 from urllib.parse import urlparse
 
+from apps.recipes.services.nutrition import nutrition_fields
 from apps.recipes.services.sanitizer import sanitize_recipe_data
+from apps.recipes.services.timers import extract_step_timers, recipe_instructions
+from apps.recipes.services.units import build_unit_views
 
 from PIL import Image
 from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.core.files.base import ContentFile
-from django.utils import timezone
 from curl_cffi.requests import AsyncSession
 from recipe_scrapers import scrape_html
 
+from apps.core.jobs import enqueue_job
 from apps.core.validators import (
     MAX_HTML_SIZE,
     MAX_IMAGE_SIZE,
     MAX_REDIRECT_HOPS,
-    check_content_size,
-    check_response_size,
-    validate_url,
-    validate_redirect_url,
+    decode_body,
+    read_limited_body,
+    validate_url_async,
+    validate_redirect_url_async,
 )
-from apps.recipes.services.fingerprint import BROWSER_PROFILES
+from apps.recipes.services.fingerprint import get_profiles_for_host, remember_profile
+from apps.recipes.services.hedging import AllAttemptsFailed, first_success
+from apps.recipes.services.image_cache import SearchImageCache
+from apps.recipes.services.jsonld import extract_jsonld_recipe, peek_image_url
 
 # Limit decompression bomb attacks via PIL
 Image.MAX_IMAGE_PIXELS = 178_956_970  # ~180 megapixels
@@ -54,6 +61,7 @@ class RecipeScraper:
 
     def __init__(self):
         self.timeout = self.DEFAULT_TIMEOUT
+        self.hedge_delay = settings.SCRAPER_HEDGE_DELAY
 
     async def scrape_url(self, url: str, profile: "Profile") -> "Recipe":
         """
@@ -70,49 +78,55 @@ class RecipeScraper:
             FetchError: If the URL cannot be fetched
             ParseError: If the HTML cannot be parsed as a recipe
         """
-        # Import here to avoid circular imports
-        from apps.recipes.models import Recipe
-
         # Validate URL for SSRF protection (returns pinned DNS resolution)
         try:
-            resolved = validate_url(url)
+            resolved = await validate_url_async(url)
         except ValueError as e:
             raise FetchError(str(e))
 
         # Fetch HTML using pinned DNS to prevent TOCTOU rebinding
         html = await self._fetch_html(url, resolved.curl_resolve)
 
-        # Parse recipe data
-        data = self._parse_recipe(html, url)
-
-        # Check for cached search image first, then download if needed
-        image_file = None
-        if data.get("image_url"):
-            # Try to reuse cached image from search results
-            from apps.recipes.models import CachedSearchImage
-
-            try:
-                cached = await sync_to_async(CachedSearchImage.objects.get)(
-                    external_url=data["image_url"], status=CachedSearchImage.STATUS_SUCCESS
-                )
+        # Start on the image as soon as its URL is known so the download
+        # overlaps parsing and saving the recipe
+        image_url = peek_image_url(html)
+        image_task = self._start_image_task(image_url)
+        try:
+            data = await sync_to_async(self._parse_recipe, thread_sensitive=False)(html, url)
+            if data.get("image_url", "") != image_url:
+                if image_task:
+                    image_task.cancel()
+                image_task = self._start_image_task(data.get("image_url", ""))
+            recipe = await self._save_recipe(data, url, profile, image_task)
+        except BaseException:
+            if image_task:
+                image_task.cancel()
+            raise
+
+        # Generate AI tips on the background job queue (non-blocking)
+        await sync_to_async(enqueue_job)("generate_tips", recipe_id=recipe.id)
+        if any(recipe.step_timers):
+            await sync_to_async(enqueue_job)("label_timers", recipe_id=recipe.id)
 
-                if cached.image:
-                    # Reuse cached image file
-                    with cached.image.open("rb") as f:
-                        image_file = ContentFile(f.read())
+        return recipe
 
-                    # Update access time to prevent cleanup
-                    cached.last_accessed_at = timezone.now()
-                    await sync_to_async(cached.save)(update_fields=["last_accessed_at"])
+    def _start_image_task(self, image_url: str) -> asyncio.Task | None:
+        """Fetch the recipe image in the background: cached search image first, else download."""
+        if not image_url:
+            return None
 
-                    logger.info(f"Reused cached image for {data['image_url']}")
+        async def fetch():
+            try:
+                return await SearchImageCache().get_cached_file(image_url) or await self._download_image(image_url)
+            except Exception:
+                logger.warning("Failed to fetch image %s, saving the recipe without it", image_url, exc_info=True)
+                return None
 
-            except CachedSearchImage.DoesNotExist:
-                pass
+        return asyncio.ensure_future(fetch())
 
-            # If no cache, download as normal
-            if not image_file:
-                image_file = await self._download_image(data["image_url"])
+    async def _save_recipe(self, data: dict, url: str, profile: "Profile", image_task) -> "Recipe":
+        """Save the recipe row while image_task runs, then attach the image."""
+        from apps.recipes.models import Recipe
 
         # Create recipe record
         recipe = Recipe(
@@ -140,80 +154,55 @@ class RecipeScraper:
             keywords=data.get("keywords", []),
             dietary_restrictions=data.get("dietary_restrictions", []),
             equipment=data.get("equipment", []),
-            nutrition=data.get("nutrition", {}),
+            **nutrition_fields(data.get("nutrition"), data.get("ingredients", []), data.get("servings")),
             rating=data.get("rating"),
             rating_count=data.get("rating_count"),
             language=data.get("language", ""),
             links=data.get("links", []),
         )
+        recipe.step_timers = extract_step_timers(recipe_instructions(recipe))
+        recipe.unit_views = build_unit_views(recipe.ingredients, recipe.ingredient_groups)
 
-        # Save first to get an ID for the image path
+        # Save first to get an ID for the image path (the image task keeps running meanwhile)
         await sync_to_async(recipe.save)()
 
         # Attach image if downloaded
+        image_file = await image_task if image_task else None
         if image_file:
             filename = self._generate_image_filename(url, data.get("image_url", ""))
             await sync_to_async(recipe.image.save)(filename, image_file, save=True)
 
-        # Fire-and-forget: Generate AI tips in background thread (non-blocking)
-        thread = threading.Thread(target=self._generate_tips_background, args=(recipe.id,), daemon=True)
-        thread.start()
-
         return recipe
 
-    def _generate_tips_background(self, recipe_id: int):
-        """Generate AI tips for a recipe in background thread."""
-        try:
-            import django
-
-            django.setup()  # Ensure Django is configured in thread
-
-            from apps.core.models import AppSettings
-            from apps.ai.services.tips import generate_tips
-
-            # Check if AI is available
-            settings_obj = AppSettings.get()
-            if not settings_obj.openrouter_api_key:
-                logger.debug(f"Skipping tips generation for recipe {recipe_id}: No API key")
-                return
-
-            # Generate tips
-            generate_tips(recipe_id)
-            logger.info(f"Auto-generated tips for recipe {recipe_id}")
-
-        except Exception as e:
-            # Log but don't fail - tips generation is optional
-            logger.warning(f"Failed to auto-generate tips for recipe {recipe_id}: {e}")
-
     async def _fetch_html(self, url: str, curl_resolve: list[str] | None = None) -> str:
         """
         Fetch HTML from URL with browser impersonation.
 
         Follows redirects manually with per-hop SSRF validation (max 5 hops).
-        Enforces response size limit (10MB).
-        Tries multiple browser profiles if initial request fails.
+        Streams the body and aborts once it exceeds the size limit (10MB).
+        Tries browser profiles (last successful for the host first), hedging:
+        if a profile hasn't answered within hedge_delay the next one starts in
+        parallel, and the losers are cancelled once one succeeds.
 
         Args:
             url: URL to fetch
             curl_resolve: DNS pinning list from validate_url to prevent TOCTOU rebinding
         """
-        errors = []
+        host = urlparse(url).netloc
 
-        for profile in BROWSER_PROFILES:
-            try:
-                html = await self._fetch_with_redirects(url, profile, MAX_HTML_SIZE, curl_resolve)
-                if html is not None:
-                    return html
-                errors.append(f"{profile}: empty response")
-            except FetchError:
-                raise
-            except ValueError as e:
-                raise FetchError(str(e))
-            except Exception as e:
-                errors.append(f"{profile}: {str(e)}")
-                continue
-
-        raise FetchError(f"Failed to fetch {url}: {'; '.join(errors)}")
+        async def attempt(profile):
+            return await self._fetch_with_redirects(url, profile, MAX_HTML_SIZE, curl_resolve)
+
+        try:
+            profile, html = await first_success(
+                get_profiles_for_host(host), attempt, self.hedge_delay, fatal=(FetchError, ValueError)
+            )
+        except ValueError as e:
+            raise FetchError(str(e))
+        except AllAttemptsFailed as e:
+            raise FetchError(f"Failed to fetch {url}: {e}")
+        remember_profile(host, profile)
+        return html
 
     async def _fetch_with_redirects(self, url, profile, max_size, curl_resolve=None):
         """Fetch URL following redirects with per-hop SSRF validation and DNS pinning."""
@@ -228,23 +217,24 @@ class RecipeScraper:
                     current_url,
                     timeout=self.timeout,
                     allow_redirects=False,
+                    stream=True,
                 )
 
                 if response.status_code in (301, 302, 303, 307, 308):
                     location = response.headers.get("location")
                     if not location:
                         raise FetchError("Redirect without Location header")
-                    resolved = validate_redirect_url(location)
+                    resolved = await validate_redirect_url_async(location)
                     current_url = location
                     current_resolve = resolved.curl_resolve
                     continue
 
                 if response.status_code == 200:
-                    if not check_response_size(response, max_size):
-                        raise FetchError(f"Response too large (Content-Length > {max_size})")
-                    content = response.text
-                    check_content_size(content.encode("utf-8", errors="replace"), max_size)
-                    return content
+                    try:
+                        body = await read_limited_body(response, max_size)
+                    except ValueError as e:
+                        raise FetchError(str(e))
+                    return decode_body(response, body)
 
                 if response.status_code == 404:
                     raise FetchError("Recipe page not found at that URL")
@@ -256,21 +246,37 @@ class RecipeScraper:
 
     def _parse_recipe(self, html: str, url: str) -> dict:
         """
-        Parse recipe data from HTML using recipe-scrapers.
+        Parse recipe data from HTML.
+
+        Uses the JSON-LD fast path when the page embeds a usable schema.org
+        Recipe, otherwise falls back to recipe-scrapers.
         """
+        data = extract_jsonld_recipe(html, url)
+        if data is None:
+            data = self._parse_with_recipe_scrapers(html, url)
+
+        # Extract host from URL
+        data["host"] = urlparse(url).netloc.replace("www.", "")
+        data["servings"] = self._parse_servings(data["yields"])
+
+        if not data["title"]:
+            raise ParseError("Recipe has no title")
+
+        # Sanitize all text fields to strip HTML (defense-in-depth against stored XSS)
+        sanitize_recipe_data(data)
+
+        return data
+
+    def _parse_with_recipe_scrapers(self, html: str, url: str) -> dict:
+        """Parse recipe data with recipe-scrapers (full DOM + schema.org/microdata)."""
         try:
             # supported_only=False allows scraping from any domain using schema.org
             scraper = scrape_html(html, org_url=url, supported_only=False)
         except Exception as e:
             raise ParseError(f"Failed to parse recipe: {str(e)}")
 
-        # Extract host from URL
-        parsed_url = urlparse(url)
-        host = parsed_url.netloc.replace("www.", "")
-
         # Build recipe data dict with safe attribute access
-        data = {
-            "host": host,
+        return {
             "title": self._safe_get(scraper, "title", ""),
             "canonical_url": self._safe_get(scraper, "canonical_url", ""),
             "site_name": self._safe_get(scraper, "site_name", ""),
@@ -285,7 +291,6 @@ class RecipeScraper:
             "cook_time": self._parse_time(self._safe_get(scraper, "cook_time")),
             "total_time": self._parse_time(self._safe_get(scraper, "total_time")),
             "yields": self._safe_get(scraper, "yields", ""),
-            "servings": self._parse_servings(self._safe_get(scraper, "yields", "")),
             "category": self._safe_get(scraper, "category", ""),
             "cuisine": self._safe_get(scraper, "cuisine", ""),
             "cooking_method": self._safe_get(scraper, "cooking_method", ""),
@@ -299,14 +304,6 @@ class RecipeScraper:
             "links": self._safe_get(scraper, "links", []),
         }
 
-        if not data["title"]:
-            raise ParseError("Recipe has no title")
-
-        # Sanitize all text fields to strip HTML (defense-in-depth against stored XSS)
-        sanitize_recipe_data(data)
-
-        return data
-
     def _safe_get(self, scraper, attr: str, default=None):
         """Safely get an attribute from the scraper."""
         try:
@@ -377,7 +374,8 @@ class RecipeScraper:
 
         Validates image URL against SSRF blocklist before fetching.
         Follows redirects manually with per-hop validation (max 5 hops).
-        Enforces response size limit (50MB).
+        Streams the body and aborts once it exceeds the size limit (50MB).
+        Profiles are hedged the same way as page fetches.
         WebP images are converted to JPEG for iOS 9 compatibility.
         """
         if not image_url:
@@ -385,27 +383,23 @@ class RecipeScraper:
 
         # Validate image URL for SSRF protection (FR-001)
         try:
-            resolved = validate_url(image_url)
+            resolved = await validate_url_async(image_url)
         except ValueError:
             logger.warning("Blocked image URL (SSRF): %s", image_url)
             return None
 
-        for profile in BROWSER_PROFILES:
-            try:
-                content = await self._fetch_image_with_redirects(image_url, profile, resolved.curl_resolve)
-                if content is not None:
-                    content = self._convert_webp_to_jpeg(content)
-                    return ContentFile(content)
-            except Exception as e:
-                logger.warning(
-                    "Failed to download image %s with %s: %s",
-                    image_url,
-                    profile,
-                    e,
-                )
-                continue
+        host = urlparse(image_url).netloc
 
-        return None
+        async def attempt(profile):
+            return await self._fetch_image_with_redirects(image_url, profile, resolved.curl_resolve)
+
+        try:
+            profile, content = await first_success(get_profiles_for_host(host), attempt, self.hedge_delay)
+        except AllAttemptsFailed as e:
+            logger.warning("Failed to download image %s: %s", image_url, e)
+            return None
+        remember_profile(host, profile)
+        return ContentFile(self._convert_webp_to_jpeg(content))
 
     async def _fetch_image_with_redirects(self, url, profile, curl_resolve=None):
         """Fetch image following redirects with per-hop SSRF validation and DNS pinning."""
@@ -420,6 +414,7 @@ class RecipeScraper:
                     current_url,
                     timeout=self.timeout,
                     allow_redirects=False,
+                    stream=True,
                 )
 
                 if response.status_code in (301, 302, 303, 307, 308):
@@ -427,7 +422,7 @@ class RecipeScraper:
                     if not location:
                         return None
                     try:
-                        resolved = validate_redirect_url(location)
+                        resolved = await validate_redirect_url_async(location)
                     except ValueError:
                         return None
                     current_url = location
@@ -438,14 +433,11 @@ class RecipeScraper:
                     content_type = response.headers.get("content-type", "")
                     if "image" not in content_type and not self._is_image_url(current_url):
                         return None
-                    if not check_response_size(response, MAX_IMAGE_SIZE):
+                    try:
+                        return await read_limited_body(response, MAX_IMAGE_SIZE)
+                    except ValueError:
                         logger.warning("Image too large: %s", current_url)
                         return None
-                    content = response.content
-                    if len(content) > MAX_IMAGE_SIZE:
-                        logger.warning("Image content too large: %s", current_url)
-                        return None
-                    return content
 
                 return None
 
@@ -16,9 +16,9 @@ from django.utils import timezone
 from apps.core.validators import (
     MAX_HTML_SIZE,
     MAX_REDIRECT_HOPS,
-    check_content_size,
-    check_response_size,
-    validate_redirect_url,
+    decode_body,
+    read_limited_body,
+    validate_redirect_url_async,
 )
 from apps.recipes.services.fingerprint import (
     get_fallback_profiles,
@@ -53,6 +53,8 @@ class RecipeSearch:
 
     MAX_CONCURRENT = 10
     DEFAULT_TIMEOUT = 30
+    # Search results live inside <main>; the footer and trailing scripts after it are never parsed
+    EARLY_STOP_MARKER = b"</main>"
 
     def __init__(self):
         self.timeout = self.DEFAULT_TIMEOUT
@@ -251,16 +253,16 @@ class RecipeSearch:
     async def _try_fetch_and_parse(self, session, url, profile, source):
         """Attempt a single fetch+parse. Returns (results, None) or (None, error)."""
         try:
-            response = await self._fetch_with_profile(session, url, profile)
-            if response.status_code == 200:
+            status_code, html = await self._fetch_with_profile(session, url, profile)
+            if status_code == 200:
                 return self._parse_search_results(
-                    response.text,
+                    html,
                     source.host,
                     source.result_selector,
                     url,
                 ), None
-            error = Exception(f"HTTP {response.status_code}")
-            if not self._should_retry_status(response.status_code):
+            error = Exception(f"HTTP {status_code}")
+            if not self._should_retry_status(status_code):
                 raise error
             return None, error
         except asyncio.TimeoutError:
@@ -298,8 +300,14 @@ class RecipeSearch:
             return True
         return any(code in error_str for code in ("403", "404", "429", "500", "502", "503"))
 
-    async def _fetch_url(self, session: AsyncSession, url: str):
-        """Fetch a URL with timeout handling, redirect validation, and size limits."""
+    async def _fetch_url(self, session: AsyncSession, url: str) -> tuple[int, str]:
+        """
+        Fetch a URL with timeout handling, redirect validation, and size limits.
+
+        The body is streamed and reading stops at EARLY_STOP_MARKER, so the
+        footer, trailing scripts and anything past the size limit are never
+        downloaded. Returns (status_code, html); html is empty unless 200.
+        """
         from curl_cffi import CurlOpt
 
         current_url = url
@@ -311,25 +319,26 @@ class RecipeSearch:
                 curl_options=curl_opts,
             ) as pin_session:
                 response = await asyncio.wait_for(
-                    pin_session.get(current_url, timeout=self.timeout, allow_redirects=False),
+                    pin_session.get(current_url, timeout=self.timeout, allow_redirects=False, stream=True),
                     timeout=self.timeout + 5,
                 )
+                if response.status_code == 200:
+                    body = await asyncio.wait_for(
+                        read_limited_body(response, MAX_HTML_SIZE, self.EARLY_STOP_MARKER),
+                        timeout=self.timeout + 5,
+                    )
+                    return response.status_code, decode_body(response, body)
 
             if response.status_code in (301, 302, 303, 307, 308):
                 location = response.headers.get("location")
                 if not location:
-                    return response
-                resolved = validate_redirect_url(location)
+                    return response.status_code, ""
+                resolved = await validate_redirect_url_async(location)
                 current_url = location
                 current_resolve = resolved.curl_resolve
                 continue
 
-            if response.status_code == 200:
-                if not check_response_size(response, MAX_HTML_SIZE):
-                    raise ValueError(f"Search response too large for {url}")
-                check_content_size(response.content, MAX_HTML_SIZE)
-
-            return response
+            return response.status_code, ""
 
         raise ValueError(f"Too many redirects (>{MAX_REDIRECT_HOPS}) for {url}")
 
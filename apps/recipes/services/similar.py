@@ -0,0 +1,241 @@
+"""Local "more like this" recommendations from a profile's saved recipes.
+
+Each recipe is described by a sparse TF-IDF vector over prefixed terms:
+ingredient names (the item part of parse_ingredient()), keywords, cuisine,
+category and title words, weighted by FIELD_WEIGHTS. Vectors are compared
+by cosine similarity, scored for every candidate in one pass over the
+postings of the query's terms, so recipes sharing nothing with it are
+never touched.
+
+Indexes are kept per profile in process memory and brought up to date on
+each lookup: recipes added or edited since the last sync are (re)indexed
+and deleted ones dropped, so a new recipe costs one small query rather
+than a rebuild. Nothing here calls the network or the AI.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from django.db.models import Q
+
+from apps.recipes.models import Recipe, RecipeFavorite
+
+from .ingredients import parse_ingredient, singularize
+
+FIELD_WEIGHTS = {
+    "ingredient": 1.0,  # each word of an ingredient name
+    "name": 1.0,  # the whole name, so "brown sugar" is more than "brown" + "sugar"
+    "keyword": 1.5,
+    "cuisine": 2.0,
+    "category": 1.5,
+    "title": 1.0,
+}
+MIN_SIMILARITY = 0.1
+SEED_FAVORITES = 3  # most recent favorites that get a "because you favorited" row
+INDEXED_FIELDS = ("id", "title", "ingredients", "keywords", "cuisine", "category", "updated_at")
+
+WORD_RE = re.compile(r"[a-z][a-z'-]+")
+STOP_WORDS = {
+    "a",
+    "an",
+    "and",
+    "the",
+    "of",
+    "with",
+    "for",
+    "in",
+    "on",
+    "or",
+    "to",
+    "into",
+    "from",
+    "plus",
+    "optional",
+    "taste",
+    "about",
+    "fresh",
+    "large",
+    "small",
+    "medium",
+    "chopped",
+    "diced",
+    "sliced",
+    "minced",
+    "grated",
+    "finely",
+    "roughly",
+    "easy",
+    "quick",
+    "best",
+    "simple",
+    "homemade",
+    "recipe",
+}
+
+
+def _words(text: str) -> list[str]:
+    return [singularize(word) for word in WORD_RE.findall(text.lower()) if word not in STOP_WORDS]
+
+
+def recipe_terms(recipe: Recipe) -> Counter:
+    """Weighted term counts for a recipe: the TF half of its vector."""
+    terms = Counter()
+
+    def add(kind: str, words: list[str]):
+        if words:
+            terms[f"{kind}:{' '.join(words)}"] += FIELD_WEIGHTS[kind]
+
+    for line in recipe.ingredients or []:
+        if not isinstance(line, str):
+            continue
+        parsed = parse_ingredient(line)
+        name = _words(re.split(r"[,(]", parsed.item if parsed else line, maxsplit=1)[0])
+        for word in name:
+            add("ingredient", [word])
+        if len(name) > 1:
+            add("name", name)
+    for keyword in recipe.keywords or []:
+        if isinstance(keyword, str):
+            add("keyword", _words(keyword))
+    for kind, value in (("cuisine", recipe.cuisine), ("category", recipe.category)):
+        for part in (value or "").split(","):
+            add(kind, _words(part))
+    for word in _words(recipe.title):
+        add("title", [word])
+    return terms
+
+
+@dataclass
+class _Index:
+    """One profile's vectors: term counts per recipe plus postings (term -> {recipe id: count})."""
+
+    terms: dict[int, Counter] = field(default_factory=dict)
+    postings: dict[str, dict[int, float]] = field(default_factory=dict)
+    norms: dict[int, float] = field(default_factory=dict)  # cleared whenever document frequencies change
+    synced_at: datetime | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, recipe_id: int, terms: Counter):
+        self.remove(recipe_id)
+        self.terms[recipe_id] = terms
+        for term, count in terms.items():
+            self.postings.setdefault(term, {})[recipe_id] = count
+        self.norms.clear()
+
+    def remove(self, recipe_id: int):
+        for term in self.terms.pop(recipe_id, ()):
+            posting = self.postings[term]
+            del posting[recipe_id]
+            if not posting:
+                del self.postings[term]
+        self.norms.clear()
+
+    def idf(self, term: str) -> float:
+        return math.log((1 + len(self.terms)) / (1 + len(self.postings.get(term, ())))) + 1
+
+    def norm(self, recipe_id: int) -> float:
+        if recipe_id not in self.norms:
+            weights = (count * self.idf(term) for term, count in self.terms[recipe_id].items())
+            self.norms[recipe_id] = math.sqrt(sum(weight * weight for weight in weights))
+        return self.norms[recipe_id]
+
+    def scores(self, terms: Counter) -> dict[int, float]:
+        """Cosine similarity to the given terms of every recipe sharing at least one."""
+        idfs = {term: self.idf(term) for term in terms}
+        query_norm = math.sqrt(sum((count * idfs[term]) ** 2 for term, count in terms.items()))
+        dots: dict[int, float] = {}
+        for term, count in terms.items():
+            weight = count * idfs[term] * idfs[term]
+            for recipe_id, other in self.postings.get(term, {}).items():
+                dots[recipe_id] = dots.get(recipe_id, 0.0) + weight * other
+        return {recipe_id: dot / (query_norm * self.norm(recipe_id)) for recipe_id, dot in dots.items()}
+
+
+_indexes: dict[int, _Index] = {}
+_lock = threading.Lock()  # guards _indexes itself; each _Index has its own lock
+
+
+def _synced_index(profile) -> _Index:
+    """The profile's index, after indexing recipes added or changed since the last lookup.
+
+    Queries and term extraction run unlocked; the profile's own lock is held
+    only while its index is updated, so one profile's sync never waits on
+    another's.
+    """
+    with _lock:
+        index = _indexes.setdefault(profile.id, _Index())
+    with index.lock:
+        synced_at = index.synced_at
+        indexed = set(index.terms)
+
+    recipes = Recipe.objects.filter(profile=profile)
+    ids = set(recipes.values_list("id", flat=True))
+    changed = recipes.only(*INDEXED_FIELDS)
+    if synced_at:
+        # Also pick up recipes committed late with an older updated_at
+        changed = changed.filter(Q(updated_at__gte=synced_at) | Q(id__in=ids - indexed))
+    fetched = [(recipe.id, recipe.updated_at, recipe_terms(recipe)) for recipe in changed]
+
+    with index.lock:
+        for recipe_id in set(index.terms) - ids:
+            index.remove(recipe_id)
+        for recipe_id, updated_at, terms in fetched:
+            if index.terms.get(recipe_id) != terms:
+                index.add(recipe_id, terms)
+            if not index.synced_at or updated_at > index.synced_at:
+                index.synced_at = updated_at
+    return index
+
+
+def _top(index: _Index, recipe_id: int, limit: int, exclude: set[int]) -> list[int]:
+    terms = index.terms.get(recipe_id)
+    if not terms:
+        return []
+    ranked = sorted(
+        (
+            (score, other)
+            for other, score in index.scores(terms).items()
+            if other != recipe_id and other not in exclude and score >= MIN_SIMILARITY
+        ),
+        reverse=True,
+    )
+    return [other for _, other in ranked[:limit]]
+
+
+def _in_order(ids: list[int]) -> list[Recipe]:
+    recipes = Recipe.objects.in_bulk(ids)
+    return [recipes[recipe_id] for recipe_id in ids if recipe_id in recipes]
+
+
+def similar_recipes(profile, recipe_id: int, limit: int = 6) -> list[Recipe]:
+    """The profile's recipes most like one of its own, best match first."""
+    return _in_order(_top(_synced_index(profile), recipe_id, limit, set()))
+
+
+def favorite_recommendations(profile, limit: int = 6) -> list[dict]:
+    """Rows of recipes like each of the profile's most recent favorites ("because you favorited X").
+
+    Returns [{"favorite": Recipe, "recipes": [Recipe, ...]}], leaving out
+    favorites with nothing similar. Favorites themselves and recipes already
+    shown in an earlier row are not recommended.
+    """
+    favorites = list(
+        RecipeFavorite.objects.filter(profile=profile, recipe__profile=profile)
+        .select_related("recipe")
+        .order_by("-created_at")
+    )
+    if not favorites:
+        return []
+    index = _synced_index(profile)
+    shown = {favorite.recipe_id for favorite in favorites}
+    rows = []
+    for favorite in favorites[:SEED_FAVORITES]:
+        ids = _top(index, favorite.recipe_id, limit, shown)
+        if ids:
+            shown.update(ids)
+            rows.append({"favorite": favorite.recipe, "recipes": _in_order(ids)})
+    return rows
@@ -0,0 +1,237 @@
+"""Local timer extraction for cook mode.
+
+Finds durations in instruction steps ("simmer for 20 minutes", "bake 1 hour
+15 minutes", "rest 5-10 mins", "half an hour") and gives each one a short
+label from the step's wording ("Simmer Sauce", "Rest Dough"), so cook mode
+can offer named timers without calling the AI. Timers are stored on the
+recipe as step_timers: one list per instruction step of
+{"seconds", "label", "source"} dicts, where source is "local" or, once the
+AI has relabelled them (see apps/ai/services/timer.py), "ai".
+"""
+
+import re
+from fractions import Fraction
+
+from .ingredients import UNICODE_FRACTIONS
+
+MAX_LABEL_LENGTH = 30
+
+WORD_NUMBERS = {
+    "a": 1,
+    "an": 1,
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+    "fifteen": 15,
+    "twenty": 20,
+    "thirty": 30,
+    "forty": 40,
+    "forty-five": 45,
+    "sixty": 60,
+}
+
+UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1}
+
+_FRACTIONS = "".join(UNICODE_FRACTIONS)
+_WORDS = "|".join(sorted(WORD_NUMBERS, key=len, reverse=True))
+_AMOUNT = rf"\d+\s+\d+/\d+|\d+/\d+|\d+(?:\.\d+)?\s*[{_FRACTIONS}]?|[{_FRACTIONS}]|{_WORDS}"
+# Single-letter units only count glued to the number ("2h") or followed by a
+# space or the end of the text, so "2 s-shaped cookies" and "4 M&Ms" are not timers.
+_UNIT = rf"hours?|hrs?|minutes?|mins?|seconds?|secs?|(?<=[\d{_FRACTIONS}])[hms]|[hms](?=\s|$)"
+_MINUTE = r"minutes?|mins?|(?<=\d)m|m(?=\s|$)"
+DURATION_RE = re.compile(
+    rf"\b(?:(?P<half>half an? hour)|(?P<amount>{_AMOUNT})(?:\s*(?:-|–|to|or)\s*(?P<upper>{_AMOUNT}))?\s*"
+    rf"(?P<unit>{_UNIT})\b(?:\s*(?:and\s+)?(?P<minutes>\d+)\s*(?:{_MINUTE})\b)?)",
+    re.I,
+)
+
+# Cooking verbs that make a good timer label, and the verb to show for them
+VERBS = {
+    "bake": "Bake",
+    "boil": "Boil",
+    "simmer": "Simmer",
+    "roast": "Roast",
+    "rest": "Rest",
+    "stand": "Rest",
+    "sit": "Rest",
+    "chill": "Chill",
+    "refrigerate": "Chill",
+    "freeze": "Freeze",
+    "marinate": "Marinate",
+    "fry": "Fry",
+    "saute": "Sauté",
+    "sauté": "Sauté",
+    "cook": "Cook",
+    "knead": "Knead",
+    "rise": "Rise",
+    "prove": "Prove",
+    "proof": "Proof",
+    "steam": "Steam",
+    "grill": "Grill",
+    "broil": "Broil",
+    "cool": "Cool",
+    "soak": "Soak",
+    "stir": "Stir",
+    "whisk": "Whisk",
+    "beat": "Beat",
+    "blend": "Blend",
+    "microwave": "Microwave",
+    "toast": "Toast",
+    "brown": "Brown",
+    "sear": "Sear",
+    "braise": "Braise",
+    "poach": "Poach",
+    "reduce": "Reduce",
+    "heat": "Heat",
+    "melt": "Melt",
+    "blanch": "Blanch",
+    "steep": "Steep",
+    "infuse": "Infuse",
+    "thaw": "Thaw",
+    "smoke": "Smoke",
+    "caramelize": "Caramelise",
+    "caramelise": "Caramelise",
+}
+# "Let the dough rest", "leave the batter to stand": the real verb comes after the object
+DEFERRING_VERBS = {"let", "leave", "allow", "set"}
+SKIP_WORDS = {"the", "a", "an", "your", "some", "it", "them", "all", "gently", "covered", "uncovered", "aside"}
+STOP_WORDS = {
+    "for",
+    "until",
+    "in",
+    "on",
+    "at",
+    "over",
+    "with",
+    "to",
+    "about",
+    "around",
+    "approximately",
+    "or",
+    "and",
+    "then",
+    "while",
+    "before",
+    "after",
+    "under",
+    "into",
+    "from",
+    "covered",
+    "uncovered",
+    "another",
+    "further",
+}
+WORD_RE = re.compile(r"[A-Za-zÀ-ÿ'-]+|\d+")
+# A decimal point ("1.5 hours") does not end a sentence
+SENTENCE_RE = re.compile(r"(?:[^.;!?]|(?<=\d)\.(?=\d))+[.;!?]?")
+
+
+def _amount(text: str) -> float:
+    text = text.strip().lower()
+    if text in WORD_NUMBERS:
+        return WORD_NUMBERS[text]
+    for char, fraction in UNICODE_FRACTIONS.items():
+        text = text.replace(char, f" {fraction}")
+    return float(sum(Fraction(part) for part in text.split()))
+
+
+def _seconds(match: re.Match) -> int:
+    if match.group("half"):
+        return 1800
+    seconds = _amount(match.group("amount")) * UNIT_SECONDS[match.group("unit")[0].lower()]
+    if match.group("minutes"):
+        seconds += int(match.group("minutes")) * 60
+    return round(seconds)
+
+
+def _label_words(words: list[str]) -> list[str]:
+    """The object of a verb: up to two words before a preposition or other stop word."""
+    label = []
+    for word in words:
+        lower = word.lower()
+        if lower in STOP_WORDS or lower.isdigit() or lower in VERBS:
+            break
+        if lower in SKIP_WORDS:
+            continue
+        label.append(word)
+        if len(label) == 2:
+            break
+    return label
+
+
+def timer_label(sentence: str) -> str | None:
+    """A short label for the timer in a sentence ("Let the dough rest for 1 hour" -> "Rest Dough")."""
+    words = WORD_RE.findall(sentence)
+    lowered = [word.lower() for word in words]
+    for i, word in enumerate(lowered):
+        if word in DEFERRING_VERBS:
+            for j in range(i + 1, len(lowered)):
+                if lowered[j] in VERBS:
+                    obj = _label_words(words[i + 1 : j])
+                    return _format_label([VERBS[lowered[j]], *obj])
+            continue
+        if word in VERBS:
+            return _format_label([VERBS[word], *_label_words(words[i + 1 :])])
+    return None
+
+
+def _format_label(words: list[str]) -> str:
+    label = " ".join(word if word.isupper() else word.capitalize() for word in words)
+    if len(label) > MAX_LABEL_LENGTH:
+        label = label[: MAX_LABEL_LENGTH - 3].rstrip() + "..."
+    return label
+
+
+def step_durations(text: str) -> list[tuple[int, str]]:
+    """(seconds, sentence) for each distinct duration in an instruction step.
+
+    Ranges ("25-30 minutes") use the lower bound, so food is checked early.
+    """
+    found = []
+    seen = set()
+    for sentence in SENTENCE_RE.findall(text or ""):
+        for match in DURATION_RE.finditer(sentence):
+            seconds = _seconds(match)
+            if seconds > 0 and seconds not in seen:
+                seen.add(seconds)
+                found.append((seconds, sentence.strip()))
+    return found
+
+
+def extract_step_timers(instructions: list[str]) -> list[list[dict]]:
+    """Structured timers for each instruction step, labelled locally.
+
+    Steps without a recognisable cooking verb get "Step N" as their label.
+    """
+    step_timers = []
+    for number, step in enumerate(instructions, start=1):
+        step_timers.append(
+            [
+                {"seconds": seconds, "label": timer_label(sentence) or f"Step {number}", "source": "local"}
+                for seconds, sentence in step_durations(step)
+            ]
+        )
+    return step_timers
+
+
+def recipe_instructions(recipe) -> list[str]:
+    """The recipe's instruction steps as text, falling back to splitting instructions_text into lines."""
+    if recipe.instructions:
+        return [step.get("text", "") if isinstance(step, dict) else str(step) for step in recipe.instructions]
+    return [line.strip() for line in recipe.instructions_text.split("\n") if line.strip()]
+
+
+def ensure_step_timers(recipe) -> list[list[dict]]:
+    """Return the recipe's step timers, extracting and saving them for recipes imported before timers existed."""
+    instructions = recipe_instructions(recipe)
+    if len(recipe.step_timers) != len(instructions):
+        recipe.step_timers = extract_step_timers(instructions)
+        recipe.save(update_fields=["step_timers"])
+    return recipe.step_timers
@@ -0,0 +1,80 @@
+"""Stored metric and imperial views of a recipe's ingredients.
+
+Each ingredient line is parsed once with parse_ingredient() into a
+{"quantity", "quantity_max", "unit", "item"} record and rendered in both
+unit systems with scale_ingredient() at a factor of 1. The result is
+stored on the recipe as unit_views when it is imported or remixed:
+
+    {"parsed": [record or None, ...],
+     "metric": {"ingredients": [...], "ingredient_groups": [...]},
+     "imperial": {"ingredients": [...], "ingredient_groups": [...]}}
+
+Recipe.ingredients keeps the lines as written, which is what recipes show
+by default. A profile with convert_units on is shown the view for its
+unit_preference instead (see preferred_ingredients()), with no parsing and
+no AI call. Recipes imported before unit views existed get them the first
+time such a profile opens them. Lines that can't be converted confidently
+(no quantity, an amount buried mid-line, cups of an ingredient with no
+known weight) are kept as written.
+"""
+
+from .ingredients import parse_ingredient, scale_ingredient
+
+UNIT_SYSTEMS = ("metric", "imperial")
+
+
+def parse_record(line) -> dict | None:
+    """Structured (quantity, unit, item) record for a line, or None if it has no leading quantity."""
+    parsed = parse_ingredient(line) if isinstance(line, str) else None
+    if parsed is None:
+        return None
+    return {
+        "quantity": parsed.quantity,
+        "quantity_max": parsed.quantity_max,
+        "unit": parsed.unit,
+        "item": parsed.item,
+    }
+
+
+def _render(line, unit_system: str):
+    if not isinstance(line, str):
+        return line
+    return scale_ingredient(line, 1, unit_system) or line
+
+
+def build_unit_views(ingredients: list, ingredient_groups: list) -> dict:
+    """Parse ingredient lines and render them in every unit system."""
+    views = {"parsed": [parse_record(line) for line in ingredients]}
+    for unit_system in UNIT_SYSTEMS:
+        views[unit_system] = {
+            "ingredients": [_render(line, unit_system) for line in ingredients],
+            "ingredient_groups": [
+                {**group, "ingredients": [_render(line, unit_system) for line in group.get("ingredients") or []]}
+                if isinstance(group, dict)
+                else group
+                for group in ingredient_groups
+            ],
+        }
+    return views
+
+
+def ensure_unit_views(recipe) -> dict:
+    """Return the recipe's unit views, building and saving them for recipes imported before they were stored."""
+    views = recipe.unit_views
+    if not views or len(views.get("parsed", ())) != len(recipe.ingredients):
+        recipe.unit_views = build_unit_views(recipe.ingredients, recipe.ingredient_groups)
+        recipe.save(update_fields=["unit_views"])
+    return recipe.unit_views
+
+
+def preferred_ingredients(recipe, profile) -> tuple[list, list, str | None]:
+    """The recipe's (ingredients, ingredient_groups, unit system) as the profile wants them shown.
+
+    As written unless the profile has chosen to convert units, in which case
+    the stored view for its unit_preference is used. The unit system is None
+    for lines as written.
+    """
+    if not profile.convert_units or profile.unit_preference not in UNIT_SYSTEMS:
+        return recipe.ingredients, recipe.ingredient_groups, None
+    view = ensure_unit_views(recipe)[profile.unit_preference]
+    return view["ingredients"], view["ingredient_groups"], profile.unit_preference
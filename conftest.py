@@ -27,3 +27,23 @@ def client():
     from django.test import Client
 
     return Client()
+
+
+@pytest.fixture(autouse=True)
+def _clear_prompt_registry():
+    """Reload AI prompts in every test; tests create and edit prompts inside their own transactions."""
+    from apps.ai.services.prompts import clear_prompt_registry
+
+    clear_prompt_registry()
+    yield
+    clear_prompt_registry()
+
+
+@pytest.fixture(autouse=True)
+def _reset_ai_resilience():
+    """Close every AI circuit breaker so failures in one test don't shed calls in the next."""
+    from apps.ai.services.resilience import reset_resilience
+
+    reset_resilience()
+    yield
+    reset_resilience()
@@ -122,6 +122,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "apps.core.middleware.RequestIDMiddleware",
     "apps.core.middleware.DeviceDetectionMiddleware",
+    "apps.ai.middleware.AIModelFallbackMiddleware",
 ]
 
 # Add Django auth middleware in passkey mode (user accounts required)
@@ -236,6 +237,25 @@ CACHES = {
 # Search result cache: 5 days (shared globally across all profiles)
 SEARCH_CACHE_TIMEOUT = 432000  # 5 days in seconds
 
+# Recipe import: if a browser profile hasn't answered within this many
+# seconds, start the next profile in parallel (hedged fetch)
+SCRAPER_HEDGE_DELAY = float(os.environ.get("SCRAPER_HEDGE_DELAY", "3"))
+
+# AI calls each worker process may have in flight at once (see apps/ai/services/resilience.py)
+AI_MAX_IN_FLIGHT = int(os.environ.get("AI_MAX_IN_FLIGHT", "6"))
+
+# Generate remix suggestions and common serving adjustments in the background
+# when a recipe is opened (see apps/ai/services/prefetch.py)
+AI_PREFETCH_ON_VIEW = os.environ.get("AI_PREFETCH_ON_VIEW", "false").lower() == "true"
+
+# Ask the AI for a remix's nutrition when the bundled nutrient table can't
+# cover its ingredients (see apps/recipes/services/nutrition.py)
+NUTRITION_AI_FALLBACK = os.environ.get("NUTRITION_AI_FALLBACK", "true").lower() == "true"
+
+# Background job queue (processed by `manage.py run_jobs`)
+JOB_WORKER_CONCURRENCY = int(os.environ.get("JOB_WORKER_CONCURRENCY", "2"))
+JOB_QUEUE_MAX_DEPTH = int(os.environ.get("JOB_QUEUE_MAX_DEPTH", "500"))
+
 # Session settings
 # Database-backed sessions: intentional for single-server deployment.
 # Upgrade path: switch to django.contrib.sessions.backends.cache with Redis
@@ -12,9 +12,11 @@ from apps.ai.api_remix import router as ai_remix_router
 from apps.ai.api_scaling import router as ai_scaling_router
 from apps.ai.api_discover import router as ai_discover_router
 from apps.ai.api_quotas import router as ai_quota_router
+from apps.ai.api_streaming import router as ai_streaming_router
 from apps.core.api import router as system_router
 from apps.profiles.api import router as profiles_router
 from apps.recipes.api import router as recipes_router
+from apps.recipes.api_recommendations import router as recommendations_router
 from apps.recipes.api_user import (
     collections_router,
     favorites_router,
@@ -37,11 +39,13 @@ api.add_router("/ai", ai_remix_router)
 api.add_router("/ai", ai_scaling_router)
 api.add_router("/ai", ai_discover_router)
 api.add_router("/ai", ai_quota_router)
+api.add_router("/ai", ai_streaming_router)
 api.add_router("/profiles", profiles_router)
 api.add_router("/recipes", recipes_router)
 api.add_router("/favorites", favorites_router)
 api.add_router("/collections", collections_router)
 api.add_router("/history", history_router)
+api.add_router("/recommendations", recommendations_router)
 api.add_router("/sources", sources_router)
 api.add_router("/system", system_router)
 
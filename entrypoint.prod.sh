@@ -65,8 +65,8 @@ supercronic -test /app/crontab || { echo "FATAL: crontab validation failed — c
 # Process supervision: if any process exits, terminate the others and exit
 cleanup() {
     echo "Shutting down..."
-    kill -TERM "$GUNICORN_PID" "$NGINX_PID" "$SUPERCRONIC_PID" 2>/dev/null
-    wait "$GUNICORN_PID" "$NGINX_PID" "$SUPERCRONIC_PID" 2>/dev/null
+    kill -TERM "$GUNICORN_PID" "$NGINX_PID" "$SUPERCRONIC_PID" "$WORKER_PID" 2>/dev/null
+    wait "$GUNICORN_PID" "$NGINX_PID" "$SUPERCRONIC_PID" "$WORKER_PID" 2>/dev/null
     exit 0
 }
 trap cleanup SIGTERM SIGINT
@@ -91,6 +91,11 @@ echo "Starting supercronic (device codes hourly, sessions + images daily 3am)...
 su -s /bin/bash app -c "supercronic /app/crontab" &
 SUPERCRONIC_PID=$!
 
+# Start the background job worker as the non-root app user (AI tips, search image caching)
+echo "Starting job worker (concurrency ${JOB_WORKER_CONCURRENCY:-2})..."
+su -s /bin/bash app -c "exec python /app/manage.py run_jobs" &
+WORKER_PID=$!
+
 # Start Nginx in background (requires root for port 80)
 echo "Starting Nginx on 0.0.0.0:80..."
 nginx -g 'daemon off;' &
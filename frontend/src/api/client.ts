@@ -10,8 +10,10 @@ import type {
   NutritionValues,
   ScaleResponse,
   TipsResponse,
+  StreamEvent,
   DiscoverSuggestion,
   DiscoverResponse,
+  FavoriteRecommendations,
   TimerNameResponse,
   TestApiKeyResponse,
   SaveApiKeyResponse,
@@ -62,8 +64,10 @@ export type {
   NutritionValues,
   ScaleResponse,
   TipsResponse,
+  StreamEvent,
   DiscoverSuggestion,
   DiscoverResponse,
+  FavoriteRecommendations,
   TimerNameResponse,
   TestApiKeyResponse,
   SaveApiKeyResponse,
@@ -78,6 +82,7 @@ export type {
   IngredientGroup,
   LinkedRecipe,
   RecipeDetail,
+  StepTimer,
   Favorite,
   HistoryItem,
   Collection,
@@ -110,6 +115,34 @@ function getCsrfToken(): string {
   return ''
 }
 
+type ApiError = Error & { status: number; body: Record<string, unknown> | null }
+
+function apiError(message: string, status: number, body: Record<string, unknown> | null): ApiError {
+  const error = new Error(message) as ApiError
+  error.status = status
+  error.body = body
+  return error
+}
+
+async function responseError(response: Response): Promise<ApiError> {
+  const errorText = await response.text()
+  let errorBody: Record<string, unknown> | null = null
+  let errorMessage: string
+
+  try {
+    errorBody = JSON.parse(errorText)
+    errorMessage = (errorBody as Record<string, string>).detail
+      || (errorBody as Record<string, string>).message
+      || `Request failed (${response.status})`
+  } catch {
+    // Non-JSON response (e.g. HTML error page) — never expose raw server
+    // output to the user as it may leak internal details.
+    errorMessage = `Request failed (${response.status})`
+  }
+
+  return apiError(errorMessage, response.status, errorBody)
+}
+
 async function request<T>(
   endpoint: string,
   options: RequestInit = {}
@@ -131,25 +164,7 @@ async function request<T>(
   const response = await fetch(url, config)
 
   if (!response.ok) {
-    const errorText = await response.text()
-    let errorBody: Record<string, unknown> | null = null
-    let errorMessage: string
-
-    try {
-      errorBody = JSON.parse(errorText)
-      errorMessage = (errorBody as Record<string, string>).detail
-        || (errorBody as Record<string, string>).message
-        || `Request failed (${response.status})`
-    } catch {
-      // Non-JSON response (e.g. HTML error page) — never expose raw server
-      // output to the user as it may leak internal details.
-      errorMessage = `Request failed (${response.status})`
-    }
-
-    const error = new Error(errorMessage) as Error & { status: number; body: Record<string, unknown> | null }
-    error.status = response.status
-    error.body = errorBody
-    throw error
+    throw await responseError(response)
   }
 
   // Handle 204 No Content
@@ -160,6 +175,51 @@ async function request<T>(
   return response.json()
 }
 
+// POST to a Server-Sent Events endpoint, calling onEvent for each piece as
+// it arrives. Resolves with the "done" payload; a streamed "error" is thrown
+// with the status the JSON endpoint would have used.
+async function streamRequest<T>(
+  endpoint: string,
+  body: unknown,
+  onEvent: (event: StreamEvent) => void,
+): Promise<T> {
+  const response = await fetch(`${API_BASE}${endpoint}`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      Accept: 'text/event-stream',
+      'X-CSRFToken': getCsrfToken(),
+    },
+    body: JSON.stringify(body),
+  })
+
+  if (!response.ok) {
+    throw await responseError(response)
+  }
+
+  const reader = response.body!.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  for (;;) {
+    const { done, value } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+    let boundary: number
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+      const event = block.match(/^event: (.*)$/m)?.[1]
+      const data = JSON.parse(block.match(/^data: (.*)$/m)?.[1] ?? 'null')
+      if (event === 'done') return data as T
+      if (event === 'error') {
+        throw apiError(data.message || 'Generation failed', data.error === 'ai_unavailable' ? 503 : 400, data)
+      }
+      if (event === 'field' || event === 'item') onEvent({ event, key: data.key, value: data.value })
+    }
+  }
+  throw apiError('Generation was interrupted', 502, null)
+}
+
 export const api = {
   ai: {
     status: () => request<AIStatus>('/ai/status'),
@@ -206,6 +266,14 @@ export const api = {
             profile_id: profileId,
           }),
         }),
+
+      // Same as create, reporting the title, ingredients and steps as they are written
+      stream: (recipeId: number, modification: string, profileId: number, onEvent: (event: StreamEvent) => void) =>
+        streamRequest<RemixResponse>(
+          '/ai/remix/stream',
+          { recipe_id: recipeId, modification, profile_id: profileId },
+          onEvent,
+        ),
     },
 
     scale: (recipeId: number, targetServings: number, profileId: number, unitSystem: string = 'metric') =>
@@ -225,6 +293,10 @@ export const api = {
         body: JSON.stringify({ recipe_id: recipeId, regenerate }),
       }),
 
+    // Same as tips, reporting each tip as soon as it is written
+    streamTips: (recipeId: number, regenerate: boolean, onEvent: (event: StreamEvent) => void) =>
+      streamRequest<TipsResponse>('/ai/tips/stream', { recipe_id: recipeId, regenerate }, onEvent),
+
     discover: (profileId: number, refresh = false) =>
       request<DiscoverResponse>(`/ai/discover/${profileId}/${refresh ? '?refresh=true' : ''}`),
 
@@ -264,13 +336,13 @@ export const api = {
         body: JSON.stringify(data),
       }),
 
-    // Update per-profile display preferences (theme, unit_preference) for the
+    // Update per-profile display preferences (theme, unit_preference, convert_units) for the
     // caller's OWN profile. Works in both home and passkey modes — unlike the
     // PUT above which is HomeOnly. Use this from the theme toggle / unit
     // selector; use PUT for full-profile edits (home mode only).
     updatePreferences: (
       id: number,
-      data: { theme?: 'light' | 'dark'; unit_preference?: 'metric' | 'imperial' },
+      data: { theme?: 'light' | 'dark'; unit_preference?: 'metric' | 'imperial'; convert_units?: boolean },
     ) =>
       request<Profile>(`/profiles/${id}/preferences/`, {
         method: 'PATCH',
@@ -334,6 +406,14 @@ export const api = {
       }),
   },
 
+  recommendations: {
+    list: (limit: number = 6) =>
+      request<FavoriteRecommendations[]>(`/recommendations/?limit=${limit}`),
+
+    similar: (recipeId: number, limit: number = 6) =>
+      request<Recipe[]>(`/recommendations/${recipeId}/?limit=${limit}`),
+  },
+
   collections: {
     list: () => request<Collection[]>('/collections/'),
 
@@ -53,6 +53,7 @@ export interface RemixResponse {
   total_time: number | null
   yields: string
   servings: number | null
+  nutrition_pending: boolean
 }
 
 export interface NutritionValues {
@@ -78,6 +79,14 @@ export interface TipsResponse {
   cached: boolean
 }
 
+// A finished piece of a streamed AI response: a field such as the remix
+// title, or one item (an ingredient, step or tip) of a list field
+export interface StreamEvent {
+  event: 'field' | 'item'
+  key: string | null
+  value: unknown
+}
+
 export interface DiscoverSuggestion {
   type: string
   title: string
@@ -90,6 +99,11 @@ export interface DiscoverResponse {
   refreshed_at: string
 }
 
+export interface FavoriteRecommendations {
+  favorite: Recipe
+  recipes: Recipe[]
+}
+
 export interface TimerNameResponse {
   label: string
 }
@@ -110,6 +124,7 @@ export interface Profile {
   avatar_color: string
   theme: string
   unit_preference: string
+  convert_units?: boolean
 }
 
 export interface ProfileStats {
@@ -187,6 +202,12 @@ export interface LinkedRecipe {
   relationship: 'original' | 'remix' | 'sibling'
 }
 
+export interface StepTimer {
+  seconds: number
+  label: string
+  source: 'local' | 'ai'
+}
+
 export interface RecipeDetail extends Recipe {
   source_url: string | null
   canonical_url: string
@@ -208,13 +229,17 @@ export interface RecipeDetail extends Recipe {
   dietary_restrictions: string[]
   equipment: string[]
   nutrition: Record<string, string>
+  nutrition_pending: boolean
+  nutrition_source?: '' | 'scraped' | 'calculated' | 'ai'  // calculated and ai are estimates
   rating_count: number | null
   language: string
   links: string[]
   ai_tips: string[]
+  step_timers: StepTimer[][]
   remix_profile_id: number | null
   remixed_from_id: number | null
   linked_recipes: LinkedRecipe[]
+  unit_system?: string | null  // Set when ingredients are shown in the profile's preferred units
   updated_at: string
 }
 
@@ -1,19 +1,18 @@
-import { Plus, Loader2 } from 'lucide-react'
+import { Plus } from 'lucide-react'
+import type { StepTimer } from '../api/client'
 
 interface DetectedTimersProps {
-  detectedTimes: number[]
-  loadingTimerId: string | null
+  detectedTimers: StepTimer[]
   formatTime: (seconds: number) => string
-  onAdd: (seconds: number, index: number) => void
+  onAdd: (timer: StepTimer) => void
 }
 
 export default function DetectedTimers({
-  detectedTimes,
-  loadingTimerId,
+  detectedTimers,
   formatTime,
   onAdd,
 }: DetectedTimersProps) {
-  if (detectedTimes.length === 0) return null
+  if (detectedTimers.length === 0) return null
 
   return (
     <div>
@@ -21,19 +20,15 @@ export default function DetectedTimers({
         Detected in this step:
       </p>
       <div className="flex flex-wrap gap-2">
-        {detectedTimes.map((seconds, idx) => (
+        {detectedTimers.map((timer, idx) => (
           <button
             key={idx}
-            onClick={() => onAdd(seconds, idx)}
-            disabled={loadingTimerId !== null}
-            className="flex items-center gap-1.5 rounded-full bg-primary/10 px-4 py-2 text-sm font-medium text-primary transition-colors hover:bg-primary/20 active:bg-primary/30 disabled:opacity-50"
+            onClick={() => onAdd(timer)}
+            title={timer.label}
+            className="flex items-center gap-1.5 rounded-full bg-primary/10 px-4 py-2 text-sm font-medium text-primary transition-colors hover:bg-primary/20 active:bg-primary/30"
           >
-            {loadingTimerId === `detected-${idx}` ? (
-              <Loader2 className="h-3.5 w-3.5 animate-spin" />
-            ) : (
-              <Plus className="h-3.5 w-3.5" />
-            )}
-            {formatTime(seconds)}
+            <Plus className="h-3.5 w-3.5" />
+            {formatTime(timer.seconds)}
           </button>
         ))}
       </div>
@@ -1,4 +1,4 @@
-import { Plus, Sparkles, Loader2 } from 'lucide-react'
+import { Plus, Sparkles } from 'lucide-react'
 
 interface QuickTimer {
   label: string
@@ -7,37 +7,28 @@ interface QuickTimer {
 
 interface QuickTimerButtonsProps {
   quickTimers: QuickTimer[]
-  loadingTimerId: string | null
-  aiAvailable: boolean
-  instructionText?: string
-  onAdd: (label: string, duration: number, index: number) => void
+  aiLabelled: boolean
+  onAdd: (label: string, duration: number) => void
 }
 
 export default function QuickTimerButtons({
   quickTimers,
-  loadingTimerId,
-  aiAvailable,
-  instructionText,
+  aiLabelled,
   onAdd,
 }: QuickTimerButtonsProps) {
   return (
     <div className="flex flex-wrap gap-2">
-      {quickTimers.map(({ label, duration }, idx) => (
+      {quickTimers.map(({ label, duration }) => (
         <button
           key={label}
-          onClick={() => onAdd(label, duration, idx)}
-          disabled={loadingTimerId !== null}
-          className="flex items-center gap-1.5 rounded-full border border-border bg-background px-4 py-2 text-sm font-medium text-foreground transition-colors hover:bg-muted active:bg-muted/70 disabled:opacity-50"
+          onClick={() => onAdd(label, duration)}
+          className="flex items-center gap-1.5 rounded-full border border-border bg-background px-4 py-2 text-sm font-medium text-foreground transition-colors hover:bg-muted active:bg-muted/70"
         >
-          {loadingTimerId === `quick-${idx}` ? (
-            <Loader2 className="h-3.5 w-3.5 animate-spin" />
-          ) : (
-            <Plus className="h-3.5 w-3.5" />
-          )}
+          <Plus className="h-3.5 w-3.5" />
           {label}
         </button>
       ))}
-      {aiAvailable && instructionText && <Sparkles className="h-4 w-4 self-center text-primary" />}
+      {aiLabelled && <Sparkles className="h-4 w-4 self-center text-primary" />}
     </div>
   )
 }
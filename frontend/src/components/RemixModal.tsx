@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react'
 import { X, Sparkles, Loader2 } from 'lucide-react'
 import { toast } from 'sonner'
-import { api, type RecipeDetail } from '../api/client'
+import { api, type RecipeDetail, type StreamEvent } from '../api/client'
 import { cn, handleQuotaError, extractQuotaResetsAt } from '../lib/utils'
 import { useAIStatus } from '../contexts/AIStatusContext'
 import SuggestionSelector from './SuggestionSelector'
@@ -71,6 +71,45 @@ function RemixCreateButton({ creating, enabled, onClick }: RemixCreateButtonProp
   )
 }
 
+// The remix as far as the model has written it
+interface RemixDraft {
+  title: string
+  ingredients: string[]
+  instructions: string[]
+}
+
+const EMPTY_DRAFT: RemixDraft = { title: '', ingredients: [], instructions: [] }
+
+function applyStreamEvent(draft: RemixDraft, { event, key, value }: StreamEvent): RemixDraft {
+  if (event === 'field' && key === 'title') return { ...draft, title: String(value) }
+  if (event === 'item' && (key === 'ingredients' || key === 'instructions')) {
+    return { ...draft, [key]: [...draft[key], String(value)] }
+  }
+  return draft
+}
+
+function RemixPreview({ draft }: { draft: RemixDraft }) {
+  return (
+    <div className="mb-4 max-h-72 overflow-y-auto rounded-lg border border-border bg-background p-4 text-sm">
+      <h3 className="mb-2 font-semibold text-foreground">{draft.title || 'Writing your remix...'}</h3>
+      {draft.ingredients.length > 0 && (
+        <ul className="mb-3 list-disc space-y-1 pl-5 text-foreground">
+          {draft.ingredients.map((ingredient, index) => (
+            <li key={index}>{ingredient}</li>
+          ))}
+        </ul>
+      )}
+      {draft.instructions.length > 0 && (
+        <ol className="list-decimal space-y-1 pl-5 text-muted-foreground">
+          {draft.instructions.map((step, index) => (
+            <li key={index}>{step}</li>
+          ))}
+        </ol>
+      )}
+    </div>
+  )
+}
+
 function toggleSuggestion(
   prev: string[],
   suggestion: string,
@@ -107,6 +146,7 @@ export default function RemixModal({
   const [selectedSuggestions, setSelectedSuggestions] = useState<string[]>([])
   const [customInput, setCustomInput] = useState('')
   const [creating, setCreating] = useState(false)
+  const [draft, setDraft] = useState<RemixDraft | null>(null)
 
   // Load suggestions when modal opens
   useEffect(() => {
@@ -151,8 +191,11 @@ export default function RemixModal({
     const modification = getModification(customInput, selectedSuggestions)
     if (!modification) return
     setCreating(true)
+    setDraft(EMPTY_DRAFT)
     try {
-      const remix = await api.ai.remix.create(recipe.id, modification, profileId)
+      const remix = await api.ai.remix.stream(recipe.id, modification, profileId, (event) =>
+        setDraft((prev) => applyStreamEvent(prev ?? EMPTY_DRAFT, event))
+      )
       toast.success(`Created "${remix.title}"`)
       onRemixCreated(remix.id)
       onClose()
@@ -164,6 +207,7 @@ export default function RemixModal({
       }
     } finally {
       setCreating(false)
+      setDraft(null)
     }
   }
 
@@ -177,18 +221,24 @@ export default function RemixModal({
           <p className="mb-4 text-sm text-muted-foreground">
             Choose one or more modifications, or describe your own remix of "{recipe.title}"
           </p>
-          <SuggestionSelector
-            suggestions={suggestions}
-            selectedSuggestions={selectedSuggestions}
-            loadingSuggestions={loadingSuggestions}
-            disabled={creating}
-            onSuggestionClick={handleSuggestionClick}
-          />
-          <CustomRemixInput
-            value={customInput}
-            onChange={handleCustomInputChange}
-            disabled={creating}
-          />
+          {draft ? (
+            <RemixPreview draft={draft} />
+          ) : (
+            <>
+              <SuggestionSelector
+                suggestions={suggestions}
+                selectedSuggestions={selectedSuggestions}
+                loadingSuggestions={loadingSuggestions}
+                disabled={creating}
+                onSuggestionClick={handleSuggestionClick}
+              />
+              <CustomRemixInput
+                value={customInput}
+                onChange={handleCustomInputChange}
+                disabled={creating}
+              />
+            </>
+          )}
           <RemixCreateButton creating={creating} enabled={canSubmit} onClick={handleCreateRemix} />
         </div>
       </div>
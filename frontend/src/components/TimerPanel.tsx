@@ -2,7 +2,7 @@ import { Timer as TimerIcon, ChevronUp, ChevronDown } from 'lucide-react'
 import { useState } from 'react'
 import type { UseTimersReturn } from '../hooks/useTimers'
 import { detectTimes } from '../hooks/useTimers'
-import { api } from '../api/client'
+import type { StepTimer } from '../api/client'
 import { cn } from '../lib/utils'
 import QuickTimerButtons from './QuickTimerButtons'
 import DetectedTimers from './DetectedTimers'
@@ -11,7 +11,8 @@ import TimerList from './TimerList'
 interface TimerPanelProps {
   timers: UseTimersReturn
   instructionText?: string
-  aiAvailable?: boolean
+  /** Timers stored with the recipe for this step, labelled at import (detected from instructionText if absent) */
+  stepTimers?: StepTimer[]
   isLandscape?: boolean
 }
 
@@ -74,37 +75,25 @@ function TimerPanelHeader({ expanded, timerCount, activeCount, isLandscape, onTo
   )
 }
 
-export default function TimerPanel({ timers, instructionText, aiAvailable = false, isLandscape = false }: TimerPanelProps) {
+export default function TimerPanel({ timers, instructionText, stepTimers, isLandscape = false }: TimerPanelProps) {
   const [expanded, setExpanded] = useState(true)
-  const [loadingTimerId, setLoadingTimerId] = useState<string | null>(null)
 
-  const detectedTimes = instructionText ? detectTimes(instructionText) : []
+  const detectedTimers =
+    stepTimers ??
+    (instructionText ? detectTimes(instructionText) : []).map((seconds) => ({
+      seconds,
+      label: formatDetectedTime(seconds),
+      source: 'local' as const,
+    }))
   const showContent = isLandscape || expanded
 
-  const handleAddTimer = async (id: string, fallbackLabel: string, duration: number) => {
-    const durationMinutes = Math.ceil(duration / 60)
-
-    if (aiAvailable && instructionText) {
-      setLoadingTimerId(id)
-      try {
-        const response = await api.ai.timerName(instructionText, durationMinutes)
-        timers.addTimer(response.label, duration)
-      } catch {
-        timers.addTimer(fallbackLabel, duration)
-      } finally {
-        setLoadingTimerId(null)
-      }
-    } else {
-      timers.addTimer(fallbackLabel, duration)
-    }
-  }
-
-  const handleAddQuickTimer = (label: string, duration: number, index: number) => {
-    handleAddTimer(`quick-${index}`, label, duration)
+  const handleAddQuickTimer = (label: string, duration: number) => {
+    // Name it after what this step is timing, when the step has a timer
+    timers.addTimer(stepTimers?.[0]?.label ?? label, duration)
   }
 
-  const handleAddDetectedTimer = (seconds: number, index: number) => {
-    handleAddTimer(`detected-${index}`, formatDetectedTime(seconds), seconds)
+  const handleAddDetectedTimer = (timer: StepTimer) => {
+    timers.addTimer(timer.label, timer.seconds)
   }
 
   const activeTimerCount = timers.timers.filter((t) => t.isRunning).length
@@ -134,14 +123,11 @@ export default function TimerPanel({ timers, instructionText, aiAvailable = fals
         >
           <QuickTimerButtons
             quickTimers={QUICK_TIMERS}
-            loadingTimerId={loadingTimerId}
-            aiAvailable={aiAvailable}
-            instructionText={instructionText}
+            aiLabelled={detectedTimers.some((t) => t.source === 'ai')}
             onAdd={handleAddQuickTimer}
           />
           <DetectedTimers
-            detectedTimes={detectedTimes}
-            loadingTimerId={loadingTimerId}
+            detectedTimers={detectedTimers}
             formatTime={formatDetectedTime}
             onAdd={handleAddDetectedTimer}
           />
@@ -9,6 +9,12 @@ import AIQuotaSection from './AIQuotaSection'
 import AIUsageSection from './AIUsageSection'
 import DeleteAccountSection from './DeleteAccountSection'
 
+const UNIT_OPTIONS: { label: string; system: 'metric' | 'imperial' | null }[] = [
+  { label: 'As written', system: null },
+  { label: 'Metric', system: 'metric' },
+  { label: 'Imperial', system: 'imperial' },
+]
+
 interface SettingsGeneralProps {
   aiStatus: AIStatus | null
   models: AIModel[]
@@ -28,7 +34,7 @@ export default function SettingsGeneral({
   quotaData,
   onQuotaSave,
 }: SettingsGeneralProps) {
-  const { profile, theme, toggleTheme } = useProfile()
+  const { profile, theme, toggleTheme, setUnits } = useProfile()
   const auth = useOptionalAuth()
   const logout = auth?.logout
   const mode = useMode()
@@ -70,6 +76,32 @@ export default function SettingsGeneral({
             </button>
           </div>
         </div>
+
+        {/* Units: recipe ingredients as written, or converted to one system */}
+        <div className="mt-4">
+          <label className="mb-2 block text-sm font-medium text-foreground">Units</label>
+          <div className="flex gap-2">
+            {UNIT_OPTIONS.map((option) => {
+              const selected = option.system
+                ? profile?.convert_units && profile.unit_preference === option.system
+                : !profile?.convert_units
+              return (
+                <button
+                  key={option.label}
+                  onClick={() => !selected && setUnits(option.system !== null, option.system ?? undefined)}
+                  className={cn(
+                    'rounded-lg border px-4 py-2 text-sm font-medium transition-colors',
+                    selected
+                      ? 'border-primary bg-primary text-primary-foreground'
+                      : 'border-border bg-background text-foreground hover:bg-muted'
+                  )}
+                >
+                  {option.label}
+                </button>
+              )
+            })}
+          </div>
+        </div>
       </div>
 
       {/* OpenRouter API — admin only */}
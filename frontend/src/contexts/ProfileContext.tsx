@@ -11,6 +11,7 @@ interface ProfileContextType {
   selectProfile: (profile: Profile) => Promise<void>
   logout: () => void
   toggleTheme: () => Promise<void>
+  setUnits: (convertUnits: boolean, unitPreference?: 'metric' | 'imperial') => Promise<void>
   toggleFavorite: (recipe: RecipeDetail) => Promise<void>
   isFavorite: (recipeId: number) => boolean
 }
@@ -32,6 +33,7 @@ interface AuthProfile {
   avatar_color: string
   theme: string
   unit_preference: string
+  convert_units?: boolean
 }
 
 interface ProfileProviderProps {
@@ -83,11 +85,24 @@ export function ProfileProvider({ children, authProfile, onProfileSelected }: Pr
     }
   }, [profile, theme, setProfile, setTheme])
 
+  const setUnits = useCallback(async (convertUnits: boolean, unitPreference?: 'metric' | 'imperial') => {
+    if (!profile) return
+    try {
+      const updated = await api.profiles.updatePreferences(profile.id, {
+        convert_units: convertUnits,
+        ...(unitPreference && { unit_preference: unitPreference }),
+      })
+      setProfile(updated)
+    } catch (error) {
+      console.error('Failed to update units:', error)
+    }
+  }, [profile, setProfile])
+
   return (
     <ProfileContext.Provider
       value={{
         profile, theme, favoriteRecipeIds, loading,
-        selectProfile, logout, toggleTheme,
+        selectProfile, logout, toggleTheme, setUnits,
         toggleFavorite, isFavorite,
       }}
     >
@@ -1,5 +1,5 @@
 import { useState, useRef, useEffect, useCallback } from 'react'
-import { api, type DiscoverSuggestion } from '../api/client'
+import { api, type DiscoverSuggestion, type FavoriteRecommendations } from '../api/client'
 import { handleQuotaError, extractQuotaResetsAt } from '../lib/utils'
 import { useAIStatus } from '../contexts/AIStatusContext'
 
@@ -10,6 +10,7 @@ interface UseDiscoverTabOptions {
 
 interface UseDiscoverTabResult {
   suggestions: DiscoverSuggestion[]
+  recommendations: FavoriteRecommendations[]
   loading: boolean
   error: boolean
   load: (refresh?: boolean) => void
@@ -19,6 +20,7 @@ interface UseDiscoverTabResult {
 export function useDiscoverTab({ profileId, aiAvailable }: UseDiscoverTabOptions): UseDiscoverTabResult {
   const { setFeatureQuotaExhausted } = useAIStatus()
   const [suggestions, setSuggestions] = useState<DiscoverSuggestion[]>([])
+  const [recommendations, setRecommendations] = useState<FavoriteRecommendations[]>([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(false)
   const mountedRef = useRef(true)
@@ -28,8 +30,19 @@ export function useDiscoverTab({ profileId, aiAvailable }: UseDiscoverTabOptions
     return () => { mountedRef.current = false }
   }, [])
 
+  // Similar recipes from the profile's own library, found locally without the AI
+  const loadRecommendations = useCallback(async () => {
+    try {
+      const rows = await api.recommendations.list()
+      if (mountedRef.current) setRecommendations(rows)
+    } catch (err) {
+      console.debug('Recommendations fetch failed:', err)
+    }
+  }, [])
+
   const load = useCallback(async (refresh = false) => {
     if (!profileId) return
+    loadRecommendations()
     setLoading(true)
     setError(false)
     try {
@@ -53,7 +66,7 @@ export function useDiscoverTab({ profileId, aiAvailable }: UseDiscoverTabOptions
         setLoading(false)
       }
     }
-  }, [profileId, setFeatureQuotaExhausted])
+  }, [profileId, setFeatureQuotaExhausted, loadRecommendations])
 
   const loadIfEmpty = useCallback(() => {
     if (suggestions.length === 0 && !loading && !error && aiAvailable) {
@@ -61,5 +74,5 @@ export function useDiscoverTab({ profileId, aiAvailable }: UseDiscoverTabOptions
     }
   }, [suggestions.length, loading, error, aiAvailable, load])
 
-  return { suggestions, loading, error, load, loadIfEmpty }
+  return { suggestions, recommendations, loading, error, load, loadIfEmpty }
 }
@@ -1,25 +1,19 @@
 import { useState, useEffect, useCallback } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { toast } from 'sonner'
-import { api, type RecipeDetail } from '../api/client'
+import { api, type RecipeDetail, type StepTimer } from '../api/client'
 import { playTimerAlert } from '../lib/audio'
 
 export function usePlayModeData(recipeId: number) {
   const navigate = useNavigate()
   const [recipe, setRecipe] = useState<RecipeDetail | null>(null)
   const [loading, setLoading] = useState(true)
-  const [aiAvailable, setAiAvailable] = useState(false)
 
   useEffect(() => {
     if (!recipeId) return
     const load = async () => {
       try {
-        const [recipeData, aiStatus] = await Promise.all([
-          api.recipes.get(recipeId),
-          api.ai.status(),
-        ])
-        setRecipe(recipeData)
-        setAiAvailable(aiStatus.available)
+        setRecipe(await api.recipes.get(recipeId))
       } catch (error) {
         console.error('Failed to load recipe:', error)
         toast.error('Failed to load recipe')
@@ -31,7 +25,7 @@ export function usePlayModeData(recipeId: number) {
     load()
   }, [recipeId, navigate])
 
-  return { recipe, loading, aiAvailable }
+  return { recipe, loading }
 }
 
 export function useTimerComplete() {
@@ -51,6 +45,12 @@ export function useTimerComplete() {
   }, [])
 }
 
+export function getStepTimers(recipe: RecipeDetail | null, step: number, totalSteps: number): StepTimer[] | undefined {
+  // Stored timers line up with the steps; otherwise TimerPanel detects times itself
+  if (!recipe?.step_timers || recipe.step_timers.length !== totalSteps) return undefined
+  return recipe.step_timers[step]
+}
+
 export function getInstructions(recipe: RecipeDetail | null): string[] {
   if (!recipe) return []
   if (recipe.instructions.length > 0) return recipe.instructions
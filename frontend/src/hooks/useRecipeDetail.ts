@@ -9,6 +9,9 @@ import { useServingScale } from './useServingScale'
 
 type Tab = 'ingredients' | 'instructions' | 'nutrition' | 'tips'
 
+const NUTRITION_POLL_INTERVAL = 3000 // 3 seconds
+const MAX_NUTRITION_POLL_DURATION = 60000 // 60 seconds
+
 export function useRecipeDetail() {
   const navigate = useNavigate()
   const { id } = useParams<{ id: string }>()
@@ -59,7 +62,32 @@ export function useRecipeDetail() {
     // eslint-disable-next-line react-hooks/exhaustive-deps -- only re-run when recipeId changes
   }, [recipeId])
 
-  const canShowServingAdjustment = aiStatus.isFeatureAvailable('scale') && recipe?.servings !== null
+  // A new remix's nutrition is estimated in the background: poll until it's stored
+  useEffect(() => {
+    if (!recipe?.nutrition_pending) return
+    const startTime = Date.now()
+    const interval = setInterval(async () => {
+      if (Date.now() - startTime > MAX_NUTRITION_POLL_DURATION) {
+        clearInterval(interval)
+        return
+      }
+      try {
+        const updated = await api.recipes.get(recipe.id)
+        if (!updated.nutrition_pending) {
+          setRecipe((prev) => prev ? { ...prev, nutrition: updated.nutrition, nutrition_source: updated.nutrition_source, nutrition_pending: false } : prev)
+          clearInterval(interval)
+        }
+      } catch {
+        // Ignore polling errors, will retry on next interval
+      }
+    }, NUTRITION_POLL_INTERVAL)
+    return () => clearInterval(interval)
+    // eslint-disable-next-line react-hooks/exhaustive-deps -- recipe object changes on fetch, only care about id/pending changes
+  }, [recipe?.id, recipe?.nutrition_pending])
+
+  // Most recipes scale locally, so the control doesn't depend on AI; the server
+  // only uses AI (and quota) for lines it can't scale itself
+  const canShowServingAdjustment = Boolean(recipe?.servings)
 
   const handleFavoriteToggle = async () => {
     if (!recipe) return
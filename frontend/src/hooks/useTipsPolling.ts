@@ -1,6 +1,6 @@
 import { useState, useEffect, type Dispatch, type SetStateAction } from 'react'
 import { toast } from 'sonner'
-import { api, type RecipeDetail as RecipeDetailType } from '../api/client'
+import { api, type RecipeDetail as RecipeDetailType, type StreamEvent } from '../api/client'
 import { handleQuotaError, extractQuotaResetsAt } from '../lib/utils'
 import { useAIStatus } from '../contexts/AIStatusContext'
 
@@ -8,6 +8,13 @@ const POLL_INTERVAL = 3000 // 3 seconds
 const MAX_POLL_DURATION = 30000 // 30 seconds
 const RECENT_THRESHOLD = 60000 // 60 seconds
 
+// Show each tip as soon as it has been written
+function appendTip(setTips: Dispatch<SetStateAction<string[]>>) {
+  return ({ event, value }: StreamEvent) => {
+    if (event === 'item') setTips((prev) => [...prev, String(value)])
+  }
+}
+
 interface UseTipsPollingOptions {
   recipe: RecipeDetailType | null
   aiAvailable: boolean
@@ -86,14 +93,17 @@ export function useTipsPolling({
   const handleGenerateTips = async (regenerate: boolean = false) => {
     if (!recipe || tipsLoading) return
 
+    const previousTips = tips
     setTipsLoading(true)
+    setTips([])
     try {
-      const result = await api.ai.tips(recipe.id, regenerate)
+      const result = await api.ai.streamTips(recipe.id, regenerate, appendTip(setTips))
       setTips(result.tips)
       setRecipe((prev) => prev ? { ...prev, ai_tips: result.tips } : prev)
       toast.success(regenerate ? 'Tips regenerated!' : 'Tips generated!')
     } catch (error) {
       console.error('Failed to generate tips:', error)
+      setTips(previousTips)
       if (handleQuotaError(error, 'Failed to generate tips')) {
         setFeatureQuotaExhausted('tips', extractQuotaResetsAt(error))
       }
@@ -110,7 +120,9 @@ export function useTipsPolling({
     ;(async () => {
       setTipsLoading(true)
       try {
-        const result = await api.ai.tips(recipe.id, false)
+        const result = await api.ai.streamTips(recipe.id, false, (event) => {
+          if (!cancelled) appendTip(setTips)(event)
+        })
         if (!cancelled) {
           setTips(result.tips)
           setRecipe((prev) => prev ? { ...prev, ai_tips: result.tips } : prev)
@@ -119,6 +131,7 @@ export function useTipsPolling({
       } catch (error) {
         if (!cancelled) {
           console.error('Failed to generate tips:', error)
+          setTips([])
           if (handleQuotaError(error, 'Failed to generate tips')) {
             setFeatureQuotaExhausted('tips', extractQuotaResetsAt(error))
           }
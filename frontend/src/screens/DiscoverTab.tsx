@@ -1,10 +1,13 @@
 import { useNavigate } from 'react-router-dom'
 import { Search, Sparkles, RefreshCw } from 'lucide-react'
-import type { DiscoverSuggestion } from '../api/client'
+import type { DiscoverSuggestion, FavoriteRecommendations } from '../api/client'
+import RecipeCard from '../components/RecipeCard'
 import { cn } from '../lib/utils'
 
 interface DiscoverTabProps {
   suggestions: DiscoverSuggestion[]
+  recommendations: FavoriteRecommendations[]
+  onRecipeClick: (recipeId: number) => void
   loading: boolean
   error: boolean
   aiAvailable: boolean
@@ -94,7 +97,42 @@ function SuggestionsGrid({ suggestions, loading, onRefresh, onSuggestionClick }:
   )
 }
 
-export default function DiscoverTab({
+function BecauseYouFavorited({ rows, onRecipeClick }: {
+  rows: FavoriteRecommendations[]
+  onRecipeClick: (recipeId: number) => void
+}) {
+  return (
+    <>
+      {rows.map((row) => (
+        <section key={row.favorite.id} className="mb-8">
+          <h2 className="mb-4 text-lg font-medium text-foreground">
+            Because you favorited {row.favorite.title}
+          </h2>
+          <div className="grid grid-cols-2 gap-4 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-6">
+            {row.recipes.map((recipe) => (
+              <RecipeCard
+                key={recipe.id}
+                recipe={recipe}
+                onClick={() => onRecipeClick(recipe.id)}
+              />
+            ))}
+          </div>
+        </section>
+      ))}
+    </>
+  )
+}
+
+export default function DiscoverTab({ recommendations, onRecipeClick, ...props }: DiscoverTabProps) {
+  return (
+    <>
+      <BecauseYouFavorited rows={recommendations} onRecipeClick={onRecipeClick} />
+      <AISuggestions {...props} />
+    </>
+  )
+}
+
+function AISuggestions({
   suggestions,
   loading,
   error,
@@ -102,7 +140,7 @@ export default function DiscoverTab({
   onRefresh,
   onRetry,
   onSwitchToFavorites,
-}: DiscoverTabProps) {
+}: Omit<DiscoverTabProps, 'recommendations' | 'onRecipeClick'>) {
   const navigate = useNavigate()
 
   if (loading) {
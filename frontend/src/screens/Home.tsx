@@ -139,6 +139,8 @@ export default function Home() {
           ) : (
             <DiscoverTab
               suggestions={discover.suggestions}
+              recommendations={discover.recommendations}
+              onRecipeClick={handleRecipeClick}
               loading={discover.loading}
               error={discover.error}
               aiAvailable={discoverAvailable}
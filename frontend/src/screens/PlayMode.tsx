@@ -4,7 +4,7 @@ import { X } from 'lucide-react'
 import { type RecipeDetail } from '../api/client'
 import { useTimers } from '../hooks/useTimers'
 import { useWakeLock } from '../hooks/useWakeLock'
-import { usePlayModeData, useTimerComplete, getInstructions } from '../hooks/usePlayModeData'
+import { usePlayModeData, useTimerComplete, getInstructions, getStepTimers } from '../hooks/usePlayModeData'
 import TimerPanel from '../components/TimerPanel'
 import InstructionDisplay from '../components/InstructionDisplay'
 import PlayModeControls from '../components/PlayModeControls'
@@ -17,7 +17,7 @@ export default function PlayMode() {
   const { id } = useParams<{ id: string }>()
   const recipeId = Number(id)
 
-  const { recipe, loading, aiAvailable } = usePlayModeData(recipeId)
+  const { recipe, loading } = usePlayModeData(recipeId)
   const [currentStep, setCurrentStep] = useState(0)
   const isLandscape = useIsLandscape()
 
@@ -66,7 +66,12 @@ export default function PlayMode() {
             onNext={handleNext}
           />
         </div>
-        <TimerPanel timers={timers} instructionText={currentInstruction} aiAvailable={aiAvailable} isLandscape={isLandscape} />
+        <TimerPanel
+          timers={timers}
+          instructionText={currentInstruction}
+          stepTimers={getStepTimers(recipe, currentStep, totalSteps)}
+          isLandscape={isLandscape}
+        />
       </div>
     </div>
   )
@@ -83,8 +83,23 @@ export default function RecipeTabs({
   )
 }
 
+// Shown under nutrition that wasn't published with the recipe
+const NUTRITION_ESTIMATE_LABELS: Record<string, string> = {
+  calculated: 'Estimated from the ingredients',
+  ai: 'Estimated by AI',
+}
+
 function NutritionTab({ recipe }: { recipe: RecipeDetail }) {
   const nutritionEntries = Object.entries(recipe.nutrition || {})
+  const estimateLabel = NUTRITION_ESTIMATE_LABELS[recipe.nutrition_source ?? '']
+
+  if (nutritionEntries.length === 0 && recipe.nutrition_pending) {
+    return (
+      <p className="text-muted-foreground">
+        Estimating nutrition for this remix...
+      </p>
+    )
+  }
 
   if (nutritionEntries.length === 0) {
     return (
@@ -101,6 +116,9 @@ function NutritionTab({ recipe }: { recipe: RecipeDetail }) {
           Per serving (recipe makes {recipe.servings})
         </p>
       )}
+      {estimateLabel && (
+        <p className="mb-4 text-sm text-muted-foreground">{estimateLabel}</p>
+      )}
       <div className="grid grid-cols-2 gap-3 sm:grid-cols-3">
         {nutritionEntries.map(([key, value]) => (
           <div
@@ -190,7 +208,8 @@ function TipsTab({
   polling: boolean
   onGenerateTips: (regenerate: boolean) => void
 }) {
-  if (loading) return <TipsLoadingState />
+  // Streamed tips are shown as they arrive
+  if (loading && tips.length === 0) return <TipsLoadingState />
 
   const hasTips = tips.length > 0
   const hasContent = hasTips || scalingNotes.length > 0
@@ -220,7 +239,7 @@ function TipsTab({
         </ol>
       )}
 
-      {aiAvailable && (
+      {aiAvailable && !loading && (
         <div className="text-center pt-4">
           <button
             onClick={() => onGenerateTips(hasTips)}
@@ -80,6 +80,9 @@ vi.mock('../api/client', () => ({
     recipes: {
       list: vi.fn(() => Promise.resolve(mockRecipes)),
     },
+    recommendations: {
+      list: vi.fn(() => Promise.resolve([])),
+    },
     ai: {
       discover: vi.fn(),
     },
@@ -82,10 +82,12 @@ const mockRecipe: RecipeDetail = {
   dietary_restrictions: [],
   equipment: [],
   nutrition: {},
+  nutrition_pending: false,
   rating_count: 100,
   language: 'en',
   links: [],
   ai_tips: [],
+  step_timers: [],
   remix_profile_id: null,
   remixed_from_id: null,
   linked_recipes: [],
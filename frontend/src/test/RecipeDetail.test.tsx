@@ -89,10 +89,12 @@ const mockRecipe = {
   dietary_restrictions: [],
   equipment: ['mixing bowl', 'oven'],
   nutrition: { calories: '150', fat: '7g' },
+  nutrition_pending: false,
   rating_count: 42,
   language: 'en',
   links: [],
   ai_tips: [],
+  step_timers: [],
   remix_profile_id: null,
   remixed_from_id: null,
   linked_recipes: [],
@@ -184,6 +186,26 @@ describe('RecipeDetail', () => {
     expect(screen.getByText('Nutrition')).toBeInTheDocument()
   })
 
+  it('labels estimated nutrition', () => {
+    mockUseRecipeDetail.mockReturnValue({
+      ...defaultHookReturn,
+      recipe: { ...mockRecipe, nutrition_source: 'calculated' as const },
+      activeTab: 'nutrition' as const,
+    })
+    render(<RecipeDetail />)
+    expect(screen.getByText('Estimated from the ingredients')).toBeInTheDocument()
+  })
+
+  it('does not label nutrition published with the recipe', () => {
+    mockUseRecipeDetail.mockReturnValue({
+      ...defaultHookReturn,
+      recipe: { ...mockRecipe, nutrition_source: 'scraped' as const },
+      activeTab: 'nutrition' as const,
+    })
+    render(<RecipeDetail />)
+    expect(screen.queryByText(/^Estimated/)).not.toBeInTheDocument()
+  })
+
   it('does not show Tips tab when AI is unavailable', () => {
     render(<RecipeDetail />)
     expect(screen.queryByText('Tips')).not.toBeInTheDocument()
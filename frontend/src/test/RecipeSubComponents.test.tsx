@@ -59,10 +59,12 @@ const baseRecipe: RecipeDetail = {
   dietary_restrictions: [],
   equipment: [],
   nutrition: {},
+  nutrition_pending: false,
   rating_count: 200,
   language: 'en',
   links: [],
   ai_tips: [],
+  step_timers: [],
   remix_profile_id: null,
   remixed_from_id: null,
   linked_recipes: [],
@@ -11,6 +11,7 @@ vi.mock('../api/client', () => ({
       remix: {
         getSuggestions: vi.fn(),
         create: vi.fn(),
+        stream: vi.fn(),
       },
     },
   },
@@ -41,6 +42,7 @@ const mockRecipe: RecipeDetail = {
   instructions: ['Mix ingredients', 'Bake at 350F'],
   instructions_text: '',
   nutrition: {},
+  nutrition_pending: false,
   servings: 24,
   prep_time: 15,
   cook_time: 12,
@@ -49,6 +51,7 @@ const mockRecipe: RecipeDetail = {
   rating: 4.5,
   rating_count: 100,
   ai_tips: [],
+  step_timers: [],
   scraped_at: '2024-01-01T00:00:00Z',
   is_remix: false,
   category: 'Dessert',
@@ -234,7 +237,7 @@ describe('RemixModal', () => {
     vi.mocked(api.ai.remix.getSuggestions).mockResolvedValue({
       suggestions: ['Make it vegan', 'Make it spicy'],
     })
-    vi.mocked(api.ai.remix.create).mockResolvedValue({
+    vi.mocked(api.ai.remix.stream).mockResolvedValue({
       id: 2,
       title: 'Vegan Spicy Chocolate Chip Cookies',
       description: '',
@@ -274,10 +277,11 @@ describe('RemixModal', () => {
 
     await waitFor(() => {
       // Should combine suggestions with AND
-      expect(api.ai.remix.create).toHaveBeenCalledWith(
+      expect(api.ai.remix.stream).toHaveBeenCalledWith(
         1,
         'Make it vegan AND Make it spicy',
-        1
+        1,
+        expect.any(Function)
       )
       expect(handleRemixCreated).toHaveBeenCalledWith(2)
     })
@@ -423,7 +427,7 @@ describe('RemixModal', () => {
     vi.mocked(api.ai.remix.getSuggestions).mockResolvedValue({
       suggestions: ['Make it vegan'],
     })
-    vi.mocked(api.ai.remix.create).mockResolvedValue({
+    vi.mocked(api.ai.remix.stream).mockResolvedValue({
       id: 2,
       title: 'Vegan Chocolate Chip Cookies',
       description: '',
@@ -460,9 +464,44 @@ describe('RemixModal', () => {
     fireEvent.click(screen.getByText('Create Remix'))
 
     await waitFor(() => {
-      expect(api.ai.remix.create).toHaveBeenCalledWith(1, 'Make it vegan', 1)
+      expect(api.ai.remix.stream).toHaveBeenCalledWith(1, 'Make it vegan', 1, expect.any(Function))
       expect(handleRemixCreated).toHaveBeenCalledWith(2)
       expect(handleClose).toHaveBeenCalled()
     })
   })
+
+  it('shows the remix as it is streamed', async () => {
+    vi.mocked(api.ai.remix.getSuggestions).mockResolvedValue({
+      suggestions: ['Make it vegan'],
+    })
+    vi.mocked(api.ai.remix.stream).mockImplementation((_recipeId, _modification, _profileId, onEvent) => {
+      onEvent({ event: 'field', key: 'title', value: 'Vegan Cookies' })
+      onEvent({ event: 'item', key: 'ingredients', value: '2 cups oat flour' })
+      onEvent({ event: 'item', key: 'instructions', value: 'Mix everything' })
+      return new Promise(() => {})
+    })
+
+    render(
+      <RemixModal
+        recipe={mockRecipe}
+        profileId={1}
+        isOpen={true}
+        onClose={vi.fn()}
+        onRemixCreated={vi.fn()}
+      />
+    )
+
+    await waitFor(() => {
+      expect(screen.getByText('Make it vegan')).toBeInTheDocument()
+    })
+
+    fireEvent.click(screen.getByText('Make it vegan'))
+    fireEvent.click(screen.getByText('Create Remix'))
+
+    await waitFor(() => {
+      expect(screen.getByText('Vegan Cookies')).toBeInTheDocument()
+      expect(screen.getByText('2 cups oat flour')).toBeInTheDocument()
+      expect(screen.getByText('Mix everything')).toBeInTheDocument()
+    })
+  })
 })
@@ -1,8 +1,9 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest'
 import { render, screen, fireEvent, waitFor, act } from '@testing-library/react'
 
-const { mockToggleTheme, mockApi } = vi.hoisted(() => {
+const { mockToggleTheme, mockSetUnits, mockApi } = vi.hoisted(() => {
   const mockToggleTheme = vi.fn()
+  const mockSetUnits = vi.fn()
   const mockApi = {
     ai: {
       testApiKey: vi.fn(() => Promise.resolve({ valid: true, message: 'Key is valid' })),
@@ -91,7 +92,7 @@ const { mockToggleTheme, mockApi } = vi.hoisted(() => {
       deleteCredential: vi.fn(() => Promise.resolve(null)),
     },
   }
-  return { mockToggleTheme, mockApi }
+  return { mockToggleTheme, mockSetUnits, mockApi }
 })
 
 // Mock sonner
@@ -105,6 +106,7 @@ vi.mock('../contexts/ProfileContext', () => ({
     profile: { id: 1, name: 'Test', avatar_color: '#000', theme: 'light', unit_preference: 'metric' },
     theme: 'light',
     toggleTheme: mockToggleTheme,
+    setUnits: mockSetUnits,
   }),
 }))
 
@@ -418,6 +420,12 @@ describe('SettingsGeneral', () => {
     fireEvent.click(screen.getByText('Dark'))
     expect(mockToggleTheme).toHaveBeenCalled()
   })
+
+  it('clicking Imperial converts units to imperial', () => {
+    render(<SettingsGeneral {...defaultProps} />)
+    fireEvent.click(screen.getByText('Imperial'))
+    expect(mockSetUnits).toHaveBeenCalledWith(true, 'imperial')
+  })
 })
 
 // --- SourceItem ---
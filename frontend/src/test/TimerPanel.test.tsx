@@ -1,17 +1,7 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest'
-import { render, screen, fireEvent, waitFor } from '@testing-library/react'
+import { render, screen, fireEvent } from '@testing-library/react'
 import TimerPanel from '../components/TimerPanel'
 import type { UseTimersReturn, Timer } from '../hooks/useTimers'
-import { api } from '../api/client'
-
-// Mock the API
-vi.mock('../api/client', () => ({
-  api: {
-    ai: {
-      timerName: vi.fn(),
-    },
-  },
-}))
 
 const createMockTimer = (overrides: Partial<Timer> = {}): Timer => ({
   id: 'timer-1',
@@ -67,52 +57,43 @@ describe('TimerPanel', () => {
     expect(screen.getByText('15 min')).toBeInTheDocument()
   })
 
-  it('adds timer when quick timer button is clicked (no AI)', async () => {
+  it('adds timer when quick timer button is clicked', () => {
     const mockTimers = createMockTimersReturn()
-    render(<TimerPanel timers={mockTimers} aiAvailable={false} />)
+    render(<TimerPanel timers={mockTimers} />)
 
     fireEvent.click(screen.getByText('5 min'))
 
     expect(mockTimers.addTimer).toHaveBeenCalledWith('5 min', 300)
   })
 
-  it('uses AI to generate timer name when available', async () => {
-    vi.mocked(api.ai.timerName).mockResolvedValue({ label: 'Browning onions' })
-
+  it('names quick timers after the stored step timer', () => {
     const mockTimers = createMockTimersReturn()
     render(
       <TimerPanel
         timers={mockTimers}
-        aiAvailable={true}
-        instructionText="Sauté onions until soft"
+        instructionText="Sauté onions for 8 minutes until soft"
+        stepTimers={[{ seconds: 480, label: 'Browning onions', source: 'ai' }]}
       />
     )
 
     fireEvent.click(screen.getByText('5 min'))
 
-    await waitFor(() => {
-      expect(api.ai.timerName).toHaveBeenCalledWith('Sauté onions until soft', 5)
-      expect(mockTimers.addTimer).toHaveBeenCalledWith('Browning onions', 300)
-    })
+    expect(mockTimers.addTimer).toHaveBeenCalledWith('Browning onions', 300)
   })
 
-  it('falls back to default label when AI fails', async () => {
-    vi.mocked(api.ai.timerName).mockRejectedValue(new Error('API error'))
-
+  it('adds stored step timers with their labels', () => {
     const mockTimers = createMockTimersReturn()
     render(
       <TimerPanel
         timers={mockTimers}
-        aiAvailable={true}
-        instructionText="Sauté onions until soft"
+        instructionText="Simmer the sauce for 20 minutes"
+        stepTimers={[{ seconds: 1200, label: 'Simmer Sauce', source: 'local' }]}
       />
     )
 
-    fireEvent.click(screen.getByText('5 min'))
+    fireEvent.click(screen.getByText('20 min'))
 
-    await waitFor(() => {
-      expect(mockTimers.addTimer).toHaveBeenCalledWith('5 min', 300)
-    })
+    expect(mockTimers.addTimer).toHaveBeenCalledWith('Simmer Sauce', 1200)
   })
 
   it('detects times in instruction text', () => {
@@ -146,7 +127,6 @@ describe('TimerPanel', () => {
     render(
       <TimerPanel
         timers={mockTimers}
-        aiAvailable={false}
         instructionText="Bake for 15 minutes"
       />
     )
@@ -194,13 +174,13 @@ describe('TimerPanel', () => {
     expect(screen.queryByText('5 min')).not.toBeInTheDocument()
   })
 
-  it('shows AI sparkle icon when AI is available and has instruction text', () => {
+  it('shows AI sparkle icon when the step timers were labelled by AI', () => {
     const mockTimers = createMockTimersReturn()
     const { container } = render(
       <TimerPanel
         timers={mockTimers}
-        aiAvailable={true}
-        instructionText="Some instruction"
+        instructionText="Rest for 10 minutes"
+        stepTimers={[{ seconds: 600, label: 'Rest Meat', source: 'ai' }]}
       />
     )
 
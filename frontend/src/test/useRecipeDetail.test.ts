@@ -71,6 +71,7 @@ const mockRecipe: RecipeDetail = {
   dietary_restrictions: [],
   equipment: [],
   nutrition: {},
+  nutrition_pending: false,
   rating_count: 50,
   language: 'en',
   links: [],
@@ -83,6 +84,7 @@ const mockRecipe: RecipeDetail = {
 
 // Mock API client
 const mockGetRecipe = vi.fn(() => Promise.resolve(mockRecipe))
+const mockStreamTips = vi.fn()
 vi.mock('../api/client', () => ({
   api: {
     recipes: {
@@ -91,6 +93,7 @@ vi.mock('../api/client', () => ({
     ai: {
       scale: vi.fn(),
       tips: vi.fn(),
+      streamTips: (...args: unknown[]) => mockStreamTips(...args),
     },
     history: {
       record: vi.fn(),
@@ -141,6 +144,32 @@ describe('useRecipeDetail', () => {
     expect(result.current.tips).toEqual(['Tip 1', 'Tip 2'])
   })
 
+  it('regenerates tips as they stream in', async () => {
+    let streamedTip: () => void = () => {}
+    let finish: () => void = () => {}
+    mockStreamTips.mockImplementationOnce((_id, _regenerate, onEvent) => {
+      streamedTip = () => onEvent({ event: 'item', key: null, value: 'New tip' })
+      return new Promise((resolve) => {
+        finish = () => resolve({ tips: ['New tip', 'Another tip'], cached: false })
+      })
+    })
+    const { result } = renderHook(() => useRecipeDetail())
+    await waitFor(() => {
+      expect(result.current.loading).toBe(false)
+    })
+
+    act(() => {
+      result.current.handleGenerateTips(true)
+    })
+    act(() => streamedTip())
+    expect(result.current.tips).toEqual(['New tip'])
+    expect(result.current.tipsLoading).toBe(true)
+
+    await act(async () => finish())
+    expect(result.current.tips).toEqual(['New tip', 'Another tip'])
+    expect(mockStreamTips).toHaveBeenCalledWith(42, true, expect.any(Function))
+  })
+
   it('handles API error gracefully', async () => {
     mockGetRecipe.mockRejectedValueOnce(new Error('Not found'))
 
@@ -153,7 +182,7 @@ describe('useRecipeDetail', () => {
     expect(result.current.recipe).toBeNull()
   })
 
-  it('provides canShowServingAdjustment when AI is available and servings exist', async () => {
+  it('provides canShowServingAdjustment when servings exist', async () => {
     const { result } = renderHook(() => useRecipeDetail())
 
     await waitFor(() => {
@@ -163,6 +192,17 @@ describe('useRecipeDetail', () => {
     expect(result.current.canShowServingAdjustment).toBe(true)
   })
 
+  it('hides serving adjustment when the recipe has no servings', async () => {
+    mockGetRecipe.mockResolvedValueOnce({ ...mockRecipe, servings: null })
+    const { result } = renderHook(() => useRecipeDetail())
+
+    await waitFor(() => {
+      expect(result.current.loading).toBe(false)
+    })
+
+    expect(result.current.canShowServingAdjustment).toBe(false)
+  })
+
   it('provides recipeIsFavorite from context', async () => {
     const { result } = renderHook(() => useRecipeDetail())
 
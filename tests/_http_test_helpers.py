@@ -0,0 +1,23 @@
+"""
+Shared helpers for tests that mock curl_cffi responses.
+
+Fetches read bodies in stream mode (read_limited_body iterates
+response.aiter_content()), so a MagicMock response needs an async
+iterator rather than .text/.content. Consumed by the scraper, search and
+image-cache tests.
+"""
+
+
+def stream_body(response, body, encoding="utf-8", chunk_size=None):
+    """Make a MagicMock response stream `body` (str or bytes) via aiter_content()."""
+    if isinstance(body, str):
+        body = body.encode(encoding)
+    size = chunk_size or max(len(body), 1)
+
+    async def aiter_content():
+        for start in range(0, len(body), size):
+            yield body[start : start + size]
+
+    response.aiter_content = aiter_content
+    response.encoding = encoding
+    return response
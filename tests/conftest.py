@@ -36,6 +36,20 @@ def _clear_cached_search_images(db):
     # No cleanup needed after - each test gets a fresh transaction anyway
 
 
+@pytest.fixture(autouse=True)
+def _clear_dns_cache():
+    """
+    Reset the validated-DNS cache between tests.
+
+    Tests patch resolve_hostname_async to simulate blocked or public IPs for
+    the same hostnames; a cached result from an earlier test would bypass it.
+    """
+    from apps.core.validators import clear_dns_cache
+
+    clear_dns_cache()
+    yield
+
+
 # --- Shared nginx fixtures for runtime scanner-block tests ----------------
 #
 # These live in conftest.py so multiple test files (test_nginx_runtime.py,
@@ -0,0 +1,176 @@
+"""
+Tests for the content-addressed AI response cache.
+
+Covers cached_completion() keying, in-flight deduplication within a process
+and across workers, per-feature hit ratios, and `cookie_admin ai cache`.
+"""
+
+import json
+import threading
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.ai.models import AIPrompt
+from apps.ai.services.cache import (
+    ai_cache_stats,
+    cached_completion,
+    completion_cache_key,
+    invalidate_completion,
+)
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _prompt(**overrides):
+    fields = {
+        "prompt_type": "tips_generation",
+        "system_prompt": "You are a chef.",
+        "user_prompt_template": "{title}",
+        "model": "anthropic/claude-haiku-4.5",
+        "updated_at": timezone.now(),
+    }
+    return AIPrompt(**{**fields, **overrides})
+
+
+def _service(response=None):
+    service = MagicMock()
+    service.complete.return_value = response if response is not None else ["Tip"]
+    return service
+
+
+def _identity(response):
+    return response
+
+
+class TestCachedCompletion:
+    def test_identical_prompts_share_one_call(self):
+        service = _service(["Rest the dough"])
+        prompt = _prompt()
+
+        first = cached_completion(service, prompt, "Bread", validate=_identity)
+        second = cached_completion(_service(), _prompt(updated_at=prompt.updated_at), "Bread", validate=_identity)
+
+        assert first == second == ["Rest the dough"]
+        service.complete.assert_called_once()
+        assert ai_cache_stats() == {"tips_generation": {"hits": 1, "misses": 1, "hit_ratio": 0.5}}
+
+    def test_key_covers_type_version_model_and_prompt(self):
+        prompt = _prompt()
+        key = completion_cache_key(prompt, "Bread")
+
+        assert completion_cache_key(prompt, "Cake") != key
+        assert completion_cache_key(_prompt(updated_at=prompt.updated_at, model="openai/gpt-4o"), "Bread") != key
+        assert completion_cache_key(_prompt(updated_at=prompt.updated_at, version=2), "Bread") != key
+        assert completion_cache_key(_prompt(updated_at=prompt.updated_at, prompt_type="timer_naming"), "Bread") != key
+
+    def test_invalid_response_is_not_cached(self):
+        service = _service({"wrong": "shape"})
+        prompt = _prompt()
+
+        def reject(response):
+            raise ValueError("bad shape")
+
+        with pytest.raises(ValueError):
+            cached_completion(service, prompt, "Bread", validate=reject)
+        cached_completion(service, prompt, "Bread", validate=_identity)
+
+        assert service.complete.call_count == 2
+
+    def test_invalidate_forces_a_fresh_call(self):
+        service = _service()
+        prompt = _prompt()
+        cached_completion(service, prompt, "Bread", validate=_identity)
+
+        assert invalidate_completion(prompt, "Bread")
+        cached_completion(service, prompt, "Bread", validate=_identity)
+
+        assert service.complete.call_count == 2
+
+
+class TestInflightDeduplication:
+    def test_concurrent_threads_share_one_upstream_call(self):
+        release = threading.Event()
+        service = _service()
+
+        def slow_complete(**kwargs):
+            release.wait(5)
+            return ["Shared tip"]
+
+        service.complete.side_effect = slow_complete
+        prompt = _prompt()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cached_completion(service, prompt, "Bread", _identity)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        while service.complete.call_count == 0:
+            release.wait(0.01)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert results == [["Shared tip"]] * 4
+        service.complete.assert_called_once()
+
+    def test_waits_for_result_from_another_worker(self):
+        service = _service()
+        prompt = _prompt()
+        key = completion_cache_key(prompt, "Bread")
+        cache.add(f"{key}:inflight", 1, 60)
+
+        def other_worker_finishes(seconds):
+            cache.set(key, ["From another worker"])
+
+        with patch("apps.ai.services.cache.time.sleep", side_effect=other_worker_finishes):
+            result = cached_completion(service, prompt, "Bread", validate=_identity)
+
+        assert result == ["From another worker"]
+        service.complete.assert_not_called()
+
+    def test_calls_upstream_when_other_worker_gives_up(self):
+        service = _service(["Fresh"])
+        prompt = _prompt()
+        key = completion_cache_key(prompt, "Bread")
+        cache.add(f"{key}:inflight", 1, 60)
+
+        with patch("apps.ai.services.cache.time.sleep", side_effect=lambda s: cache.delete(f"{key}:inflight")):
+            result = cached_completion(service, prompt, "Bread", validate=_identity)
+
+        assert result == ["Fresh"]
+        service.complete.assert_called_once()
+
+
+class TestAiCacheCommand:
+    def test_reports_hit_ratio_per_feature(self):
+        service = _service({"label": "Boil pasta"})
+        prompt = _prompt(prompt_type="timer_naming")
+        for _ in range(4):
+            cached_completion(service, prompt, "Boil", validate=_identity)
+        out = StringIO()
+
+        call_command("cookie_admin", "ai", "cache", "--json", stdout=out)
+
+        payload = json.loads(out.getvalue())
+        assert payload["features"] == {"timer_naming": {"hits": 3, "misses": 1, "hit_ratio": 0.75}}
+
+    def test_reset_zeroes_counters(self):
+        cached_completion(_service(), _prompt(), "Bread", validate=_identity)
+        out = StringIO()
+
+        call_command("cookie_admin", "ai", "cache", "--reset", stdout=out)
+
+        assert "tips_generation" in out.getvalue()
+        assert ai_cache_stats() == {}
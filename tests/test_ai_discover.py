@@ -10,7 +10,7 @@ Tests the discover service at apps/ai/services/discover.py:
 
 import json
 from datetime import timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 import pytest
 from django.test import Client
@@ -20,7 +20,7 @@ from apps.ai.models import AIDiscoverySuggestion, AIPrompt
 from apps.ai.services.discover import (
     get_discover_suggestions,
     _get_season,
-    CACHE_DURATION_HOURS,
+    SUGGESTION_MAX_AGE_DAYS,
 )
 from apps.profiles.models import Profile
 from apps.recipes.models import Recipe, RecipeViewHistory
@@ -203,7 +203,7 @@ def test_returns_cached_suggestions(profile, seasonal_prompt):
 
 @pytest.mark.django_db
 def test_expired_cache_triggers_new_generation(profile, seasonal_prompt):
-    """Suggestions older than 24h are expired and regenerated."""
+    """Suggestions older than SUGGESTION_MAX_AGE_DAYS are expired and regenerated."""
     # Create an old cached suggestion
     old_suggestion = AIDiscoverySuggestion.objects.create(
         profile=profile,
@@ -212,12 +212,12 @@ def test_expired_cache_triggers_new_generation(profile, seasonal_prompt):
         description="Expired",
         search_query="old recipe",
     )
-    # Manually set created_at to >24h ago
-    expired_time = timezone.now() - timedelta(hours=CACHE_DURATION_HOURS + 1)
+    # Manually set created_at past the maximum age
+    expired_time = timezone.now() - timedelta(days=SUGGESTION_MAX_AGE_DAYS, hours=1)
     AIDiscoverySuggestion.objects.filter(id=old_suggestion.id).update(created_at=expired_time)
 
     mock_service_instance = MagicMock()
-    mock_service_instance.complete.return_value = "mocked response"
+    mock_service_instance.complete_async = AsyncMock(return_value="mocked response")
 
     mock_validator_instance = MagicMock()
     mock_validator_instance.validate.return_value = _mock_ai_suggestions("seasonal")
@@ -243,7 +243,7 @@ def test_expired_cache_triggers_new_generation(profile, seasonal_prompt):
 def test_new_user_gets_only_seasonal(profile, seasonal_prompt):
     """User with no view history gets only seasonal suggestions."""
     mock_service_instance = MagicMock()
-    mock_service_instance.complete.return_value = "mocked"
+    mock_service_instance.complete_async = AsyncMock(return_value="mocked")
 
     mock_validator_instance = MagicMock()
     mock_validator_instance.validate.return_value = _mock_ai_suggestions("seasonal")
@@ -262,13 +262,13 @@ def test_new_user_gets_only_seasonal(profile, seasonal_prompt):
 # --- User with history ---
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 def test_user_with_history_gets_all_types(profile, all_prompts, recipe_with_history):
     """User with view history gets seasonal, favorites, and new suggestions."""
     mock_service_instance = MagicMock()
-    mock_service_instance.complete.return_value = "mocked"
+    mock_service_instance.complete_async = AsyncMock(return_value="mocked")
 
-    # Map prompt_type to suggestion type — thread-safe since each thread calls with a different prompt_type
+    # Map prompt_type to suggestion type
     prompt_to_type = {
         "discover_seasonal": "seasonal",
         "discover_favorites": "favorites",
@@ -349,7 +349,7 @@ def test_discover_endpoint_returns_cached(auth_client, profile):
 def test_discover_endpoint_with_mocked_ai(auth_client, profile, seasonal_prompt):
     """GET /api/ai/discover/{id}/ generates suggestions via mocked AI."""
     mock_service_instance = MagicMock()
-    mock_service_instance.complete.return_value = "mocked"
+    mock_service_instance.complete_async = AsyncMock(return_value="mocked")
 
     mock_validator_instance = MagicMock()
     mock_validator_instance.validate.return_value = [
@@ -381,7 +381,7 @@ def test_ai_failure_returns_empty_suggestions(profile, seasonal_prompt):
     from apps.ai.services.openrouter import AIUnavailableError
 
     mock_service_instance = MagicMock()
-    mock_service_instance.complete.side_effect = AIUnavailableError("No API key")
+    mock_service_instance.complete_async = AsyncMock(side_effect=AIUnavailableError("No API key"))
 
     with patch("apps.ai.services.discover.OpenRouterService", return_value=mock_service_instance):
         result = get_discover_suggestions(profile.id)
@@ -400,12 +400,12 @@ def test_missing_prompt_returns_empty(profile):
     assert result["suggestions"] == []
 
 
-# --- Cache duration constant ---
+# --- Maximum suggestion age ---
 
 
-def test_cache_duration_is_24_hours():
-    """Verify cache duration constant is 24 hours."""
-    assert CACHE_DURATION_HOURS == 24
+def test_max_age_is_one_week():
+    """Stored suggestions are served for up to a week (the precompute active window)."""
+    assert SUGGESTION_MAX_AGE_DAYS == 7
 
 
 # --- Format suggestions ---
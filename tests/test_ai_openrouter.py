@@ -6,23 +6,30 @@ Tests apps/ai/services/openrouter.py:
 - complete() with success and failure
 - _parse_json_response() with plain JSON and markdown code blocks
 - test_connection() success and failure
-- validate_key_cached() with cache hit and miss
+- check_key() valid, rejected and unreachable
+- validate_key_cached() serving the shared status, queueing background refreshes
 - invalidate_key_cache()
+- pooled HTTP clients
 - get_available_models()
 - is_available()
 """
 
+import asyncio
 import time
 from unittest.mock import patch, MagicMock
 
+import httpx
 import pytest
+from django.core.cache import cache
 
+from apps.ai.services import key_status, openrouter
 from apps.ai.services.openrouter import (
     OpenRouterService,
     AIUnavailableError,
     AIResponseError,
     AIServiceError,
 )
+from apps.core.models import AppSettings, BackgroundJob
 
 
 # --- Initialization ---
@@ -214,60 +221,89 @@ class TestTestConnection:
         assert "Connection failed" in message
 
 
+# --- check_key() ---
+
+
+def _key_error(status_code):
+    error = RuntimeError("API error occurred")
+    error.status_code = status_code
+    return error
+
+
+class TestCheckKey:
+    """Tests for OpenRouterService.check_key() (GET /key, no tokens spent)."""
+
+    @patch("apps.ai.services.openrouter.OpenRouter")
+    def test_valid_key(self, mock_openrouter_cls):
+        is_valid, _ = OpenRouterService.check_key("sk-good")
+        assert is_valid is True
+        mock_openrouter_cls.return_value.__enter__.return_value.api_keys.get_current_key_metadata.assert_called_once()
+
+    @patch("apps.ai.services.openrouter.OpenRouter")
+    def test_rejected_key(self, mock_openrouter_cls):
+        client = mock_openrouter_cls.return_value.__enter__.return_value
+        client.api_keys.get_current_key_metadata.side_effect = _key_error(401)
+        assert OpenRouterService.check_key("sk-bad") == (False, "API key is invalid or expired")
+
+    @patch("apps.ai.services.openrouter.OpenRouter")
+    def test_unreachable_is_unknown(self, mock_openrouter_cls):
+        client = mock_openrouter_cls.return_value.__enter__.return_value
+        client.api_keys.get_current_key_metadata.side_effect = _key_error(503)
+        is_valid, message = OpenRouterService.check_key("sk-test")
+        assert is_valid is None
+        assert "Unable to verify" in message
+
+
 # --- validate_key_cached() ---
 
 
+def _configure_key(api_key):
+    settings = AppSettings.get()
+    settings.openrouter_api_key = api_key
+    settings.save()
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.mark.django_db
+@pytest.mark.usefixtures("locmem_cache")
 class TestValidateKeyCached:
-    """Tests for OpenRouterService.validate_key_cached()."""
-
-    def setup_method(self):
-        # Clear cache before each test
-        OpenRouterService._key_validation_cache.clear()
+    """Tests for OpenRouterService.validate_key_cached() and the shared key status."""
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_cache_miss_calls_api(self, mock_test):
-        mock_test.return_value = (True, "Connection successful")
+    @patch.object(OpenRouterService, "check_key")
+    def test_unknown_key_queues_check_without_calling_api(self, mock_check):
         is_valid, error = OpenRouterService.validate_key_cached("sk-new-key")
-        assert is_valid is True
-        assert error is None
-        mock_test.assert_called_once_with("sk-new-key")
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_cache_hit_skips_api(self, mock_test):
-        """Second call within TTL uses cache."""
-        mock_test.return_value = (True, "Connection successful")
+        assert (is_valid, error) == (True, None)
+        mock_check.assert_not_called()
+        assert BackgroundJob.objects.filter(job_type="refresh_ai_key_status").count() == 1
 
-        # First call populates cache
-        OpenRouterService.validate_key_cached("sk-cached")
-        # Second call should use cache
-        is_valid, error = OpenRouterService.validate_key_cached("sk-cached")
+    @patch.object(OpenRouterService, "check_key")
+    def test_fresh_status_is_served_without_refresh(self, mock_check):
+        key_status.store_key_status("sk-cached", True)
 
-        assert is_valid is True
-        assert error is None
-        # Only called once (first call)
-        mock_test.assert_called_once()
+        for _ in range(3):
+            assert OpenRouterService.validate_key_cached("sk-cached") == (True, None)
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_cache_expired_calls_api_again(self, mock_test):
-        """Expired cache entry triggers new API call."""
-        mock_test.return_value = (True, "Connection successful")
+        mock_check.assert_not_called()
+        assert not BackgroundJob.objects.exists()
 
-        # Populate cache with expired entry
-        key_hash = hash("sk-expired")
-        expired_time = time.time() - OpenRouterService.KEY_VALIDATION_TTL - 1
-        OpenRouterService._key_validation_cache[key_hash] = (True, expired_time)
+    def test_stale_status_is_served_while_refresh_is_queued(self):
+        key_status.store_key_status("sk-stale", False, "API key is invalid or expired")
+        later = time.time() + key_status.KEY_STATUS_TTL + 1
 
-        is_valid, error = OpenRouterService.validate_key_cached("sk-expired")
-        assert is_valid is True
-        mock_test.assert_called_once()
+        with patch("apps.ai.services.key_status.time.time", return_value=later):
+            assert OpenRouterService.validate_key_cached("sk-stale")[0] is False
+            OpenRouterService.validate_key_cached("sk-stale")
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_invalid_key_cached(self, mock_test):
-        mock_test.return_value = (False, "Invalid API key")
-        is_valid, error = OpenRouterService.validate_key_cached("sk-invalid")
-        assert is_valid is False
-        assert error == "Invalid API key"
+        # Two stale reads queue a single refresh
+        assert BackgroundJob.objects.filter(job_type="refresh_ai_key_status").count() == 1
 
     def test_no_key_returns_false(self):
         """No API key returns False without calling API."""
@@ -277,36 +313,99 @@ class TestValidateKeyCached:
             assert is_valid is False
             assert "No API key" in error
 
-    @patch.object(OpenRouterService, "test_connection")
-    def test_cached_invalid_returns_error_message(self, mock_test):
-        """Cached invalid key returns proper error on subsequent calls."""
-        mock_test.return_value = (False, "API key is invalid or expired")
+    @patch.object(OpenRouterService, "check_key", return_value=(False, "API key is invalid or expired"))
+    def test_job_stores_status_for_every_worker(self, mock_check):
+        _configure_key("sk-bad")
+
+        key_status.run_key_status_job(None)
+
+        mock_check.assert_called_once_with("sk-bad")
+        assert OpenRouterService.validate_key_cached("sk-bad") == (False, "API key is invalid or expired")
 
-        # First call
-        OpenRouterService.validate_key_cached("sk-bad")
-        # Second call from cache
-        is_valid, error = OpenRouterService.validate_key_cached("sk-bad")
-        assert is_valid is False
-        assert error == "API key is invalid or expired"
+    @patch.object(OpenRouterService, "check_key", return_value=(None, "Unable to verify API key: timeout"))
+    def test_job_keeps_previous_status_when_unreachable(self, mock_check):
+        _configure_key("sk-good")
+        key_status.store_key_status("sk-good", True)
+
+        with pytest.raises(AIResponseError):
+            key_status.run_key_status_job(None)
+
+        assert OpenRouterService.validate_key_cached("sk-good") == (True, None)
 
 
 # --- invalidate_key_cache() ---
 
 
+@pytest.mark.usefixtures("locmem_cache")
 class TestInvalidateKeyCache:
     """Tests for OpenRouterService.invalidate_key_cache()."""
 
-    def test_clears_cache(self):
-        OpenRouterService._key_validation_cache[12345] = (True, time.time())
-        assert len(OpenRouterService._key_validation_cache) > 0
+    def test_forgets_status_of_configured_key(self):
+        _configure_key("sk-replaced")
+        key_status.store_key_status("sk-replaced", False, "API key is invalid or expired")
+
         OpenRouterService.invalidate_key_cache()
-        assert len(OpenRouterService._key_validation_cache) == 0
 
-    def test_clears_empty_cache(self):
-        """Clearing an already empty cache doesn't raise."""
-        OpenRouterService._key_validation_cache.clear()
+        assert cache.get(key_status._cache_key("sk-replaced")) is None
+        assert BackgroundJob.objects.filter(job_type="refresh_ai_key_status").exists()
+
+    def test_without_configured_key(self):
+        """Invalidating with no key configured doesn't raise."""
+        _configure_key("")
         OpenRouterService.invalidate_key_cache()
-        assert len(OpenRouterService._key_validation_cache) == 0
+        assert not BackgroundJob.objects.exists()
+
+
+# --- Pooled HTTP clients ---
+
+
+class TestPooledClients:
+    """OpenRouter calls share keep-alive HTTP clients until the key changes."""
+
+    @patch("apps.ai.services.openrouter.OpenRouter")
+    def test_sync_calls_reuse_client_until_invalidated(self, mock_openrouter_cls):
+        mock_openrouter_cls.return_value.__enter__.return_value.chat.send.side_effect = RuntimeError("down")
+        service = OpenRouterService(api_key="sk-test")
+
+        clients = []
+        for _ in range(3):
+            with pytest.raises(AIResponseError):
+                service.complete(system_prompt="s", user_prompt="u")
+            clients.append(mock_openrouter_cls.call_args.kwargs["client"])
+            if len(clients) == 2:
+                OpenRouterService.invalidate_key_cache()
+
+        assert clients[0] is clients[1]
+        assert clients[0].is_closed
+        assert clients[2] is not clients[0] and not clients[2].is_closed
+
+    @patch("apps.ai.services.openrouter.OpenRouter")
+    def test_sync_and_async_calls_pass_both_pooled_clients(self, mock_openrouter_cls):
+        mock_openrouter_cls.return_value.__enter__.return_value.chat.send.side_effect = RuntimeError("down")
+        mock_openrouter_cls.return_value.__aenter__.return_value.chat.send_async.side_effect = RuntimeError("down")
+        service = OpenRouterService(api_key="sk-test")
+
+        with pytest.raises(AIResponseError):
+            service.complete(system_prompt="s", user_prompt="u")
+        sync_kwargs = mock_openrouter_cls.call_args.kwargs
+        with pytest.raises(AIResponseError):
+            asyncio.run(service.complete_async(system_prompt="s", user_prompt="u"))
+        async_kwargs = mock_openrouter_cls.call_args.kwargs
+
+        assert sync_kwargs["client"] is async_kwargs["client"]
+        assert isinstance(sync_kwargs["async_client"], httpx.AsyncClient)
+        assert isinstance(async_kwargs["async_client"], httpx.AsyncClient)
+
+    def test_async_client_is_per_loop_and_closed_with_loop(self):
+        async def get_twice():
+            return openrouter._get_async_http_client(), openrouter._get_async_http_client()
+
+        first, again = asyncio.run(get_twice())
+        second, _ = asyncio.run(get_twice())
+
+        assert first is again
+        assert first is not second
+        assert first.is_closed and second.is_closed
 
 
 # --- get_available_models() ---
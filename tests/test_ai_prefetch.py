@@ -0,0 +1,188 @@
+"""
+Tests for speculative AI prefetch on recipe views.
+
+Tests apps/ai/services/prefetch.py:
+- Views queue a low-priority prefetch_ai job only when AI_PREFETCH_ON_VIEW
+  is enabled and the profile has quota left
+- The job generates remix suggestions and the most used serving sizes,
+  skipping anything already cached
+- Prefetching never counts against a passkey user's daily quota, and the
+  endpoints answer from the prefetched results
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+
+from apps.ai.services.prefetch import prefetch_recipe, queue_prefetch, run_prefetch_job, scale_targets
+from apps.ai.services.quota import get_usage
+from apps.core.models import AppSettings, BackgroundJob
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe, ServingAdjustment
+
+SUGGESTIONS = ["Make it vegan", "Add spice", "Go Thai", "Make it lighter", "Add cheese", "Make it smoky"]
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def prefetch_on(settings):
+    settings.AI_PREFETCH_ON_VIEW = True
+    app = AppSettings.get()
+    app.openrouter_api_key = "sk-or-test"
+    app.save()
+
+
+@pytest.fixture
+def profile():
+    user = User.objects.create_user(username="cook", password="!", email="", is_active=True)
+    return Profile.objects.create(user=user, name="Cook", avatar_color="#d97850")
+
+
+@pytest.fixture
+def recipe(profile):
+    return Recipe.objects.create(
+        profile=profile,
+        title="Pancakes",
+        host="example.com",
+        servings=4,
+        ingredients=["200 g flour", "2 eggs", "300 ml milk"],
+        instructions=["Whisk everything together.", "Fry in a hot pan."],
+    )
+
+
+@pytest.fixture
+def ai():
+    """Mock the model for remix suggestions and report the key as valid."""
+    service = MagicMock()
+    service.complete.return_value = SUGGESTIONS
+    with (
+        patch("apps.ai.services.remix.OpenRouterService", return_value=service),
+        patch("apps.ai.services.prefetch.OpenRouterService.validate_key_cached", return_value=(True, None)),
+    ):
+        yield service
+
+
+class TestQueuePrefetch:
+    def test_off_by_default(self, recipe, profile):
+        assert queue_prefetch(recipe, profile) is False
+        assert not BackgroundJob.objects.exists()
+
+    def test_record_view_queues_low_priority_job(self, client, prefetch_on, recipe, profile):
+        client.post(f"/api/profiles/{profile.id}/select/")
+
+        response = client.post("/api/history/", {"recipe_id": recipe.id}, content_type="application/json")
+
+        assert response.status_code == 201
+        job = BackgroundJob.objects.get(job_type="prefetch_ai")
+        assert job.recipe_id == recipe.id
+        assert job.payload == {"profile_id": profile.id}
+        assert job.priority == BackgroundJob.PRIORITY_LOW
+
+    def test_legacy_detail_queues_job(self, client, prefetch_on, recipe, profile):
+        client.post(f"/api/profiles/{profile.id}/select/")
+
+        client.get(f"/legacy/recipe/{recipe.id}/")
+
+        assert BackgroundJob.objects.filter(job_type="prefetch_ai", recipe_id=recipe.id).exists()
+
+    def test_one_job_per_profile(self, prefetch_on, recipe, profile):
+        other = Profile.objects.create(name="Other", avatar_color="#000000")
+
+        assert queue_prefetch(recipe, profile) is True
+        assert queue_prefetch(recipe, profile) is False
+        assert queue_prefetch(recipe, other) is True
+
+        payloads = BackgroundJob.objects.filter(job_type="prefetch_ai").values_list("payload", flat=True)
+        assert sorted(payload["profile_id"] for payload in payloads) == [profile.id, other.id]
+
+    def test_not_queued_when_quota_is_used_up(self, settings, prefetch_on, recipe, profile):
+        settings.AUTH_MODE = "passkey"
+        app = AppSettings.get()
+        app.daily_limit_remix_suggestions = 0
+        app.daily_limit_scale = 0
+        app.save()
+
+        assert queue_prefetch(recipe, profile) is False
+
+
+class TestPrefetchRecipe:
+    def test_generates_suggestions_and_common_serving_sizes(self, ai, recipe, profile):
+        for title, targets in (("Waffles", [6, 2]), ("Crepes", [6])):
+            other = Recipe.objects.create(profile=profile, title=title, host="example.com", servings=4)
+            for target in targets:
+                ServingAdjustment.objects.create(recipe=other, profile=profile, target_servings=target)
+
+        done = prefetch_recipe(recipe, profile)
+
+        assert done == ["remix_suggestions", "scale:6", "scale:2"]
+        ai.complete.assert_called_once()
+        assert ServingAdjustment.objects.filter(recipe=recipe).count() == 2
+
+    def test_doubles_the_recipe_without_history(self, recipe, profile):
+        assert scale_targets(recipe, profile) == [8]
+
+    def test_cached_results_are_left_alone(self, ai, recipe, profile):
+        prefetch_recipe(recipe, profile)
+
+        assert prefetch_recipe(recipe, profile) == []
+        ai.complete.assert_called_once()
+
+    def test_used_up_feature_is_skipped(self, settings, ai, recipe, profile):
+        settings.AUTH_MODE = "passkey"
+        app = AppSettings.get()
+        app.daily_limit_remix_suggestions = 0
+        app.save()
+
+        assert prefetch_recipe(recipe, profile) == ["scale:8"]
+        ai.complete.assert_not_called()
+
+    def test_failures_are_not_raised(self, ai, recipe, profile):
+        from apps.ai.services.openrouter import AIResponseError
+
+        ai.complete.side_effect = AIResponseError("upstream down")
+
+        assert prefetch_recipe(recipe, profile) == ["scale:8"]
+
+
+class TestPrefetchJob:
+    def _job(self, recipe, profile):
+        return BackgroundJob(job_type="prefetch_ai", recipe_id=recipe.id, payload={"profile_id": profile.id})
+
+    def test_skips_without_api_key(self, ai, recipe, profile):
+        run_prefetch_job(self._job(recipe, profile))
+
+        ai.complete.assert_not_called()
+
+    def test_skips_deleted_recipe(self, ai, prefetch_on, recipe, profile):
+        job = self._job(recipe, profile)
+        recipe.delete()
+
+        run_prefetch_job(job)
+
+        ai.complete.assert_not_called()
+
+    def test_prefetch_is_free_for_passkey_users(self, client, settings, ai, prefetch_on, recipe, profile):
+        settings.AUTH_MODE = "passkey"
+        run_prefetch_job(self._job(recipe, profile))
+        assert set(get_usage(profile.id).values()) == {0}
+
+        client.force_login(profile.user)
+        session = client.session
+        session["profile_id"] = profile.id
+        session.save()
+        response = client.post("/api/ai/remix-suggestions", {"recipe_id": recipe.id}, content_type="application/json")
+
+        assert response.status_code == 200
+        assert response.json()["suggestions"] == SUGGESTIONS
+        ai.complete.assert_called_once()
+        assert get_usage(profile.id)["remix_suggestions"] == 0
@@ -0,0 +1,155 @@
+"""
+Tests for provider prompt caching.
+
+Tests apps/ai/services/openrouter.py message building and its callers:
+- The system prompt is sent as a cacheable content part
+- A shared start of the user prompt (the recipe, for remix and scaling) is
+  sent as a second cache breakpoint, the per-request remainder after it
+- AIPrompt.user_prompt_prefix() renders the template up to the varying field
+- Cached prompt tokens reported by OpenRouter are recorded in AI telemetry
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from apps.ai.models import AIPrompt, AIUsageStat
+from apps.ai.services.openrouter import OpenRouterService, _messages
+from apps.ai.services.telemetry import ai_usage_stats, record_ai_call
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe
+
+EPHEMERAL = {"type": "ephemeral"}
+
+
+def _response(content="{}", usage=None):
+    return Mock(choices=[Mock(message=Mock(content=content))], usage=usage)
+
+
+def _usage(prompt_tokens, completion_tokens, cached_tokens):
+    return Mock(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        cost=None,
+        prompt_tokens_details=Mock(cached_tokens=cached_tokens),
+    )
+
+
+@pytest.fixture
+def openrouter_client():
+    client = MagicMock()
+    client.chat.send.return_value = _response()
+    with patch("apps.ai.services.openrouter.OpenRouter") as mock_openrouter_class:
+        mock_openrouter_class.return_value.__enter__ = Mock(return_value=client)
+        mock_openrouter_class.return_value.__exit__ = Mock(return_value=False)
+        yield client
+
+
+class TestMessages:
+    def test_system_prompt_is_cacheable(self):
+        system, user = _messages("You are a chef.", "Scale this.")
+
+        assert system == {
+            "role": "system",
+            "content": [{"type": "text", "text": "You are a chef.", "cache_control": EPHEMERAL}],
+        }
+        assert user == {"role": "user", "content": "Scale this."}
+
+    def test_shared_prefix_is_a_second_breakpoint(self):
+        _, user = _messages("system", "Recipe: Pancakes\nMake it vegan", cache_prefix="Recipe: Pancakes\n")
+
+        assert user["content"] == [
+            {"type": "text", "text": "Recipe: Pancakes\n", "cache_control": EPHEMERAL},
+            {"type": "text", "text": "Make it vegan"},
+        ]
+
+    def test_prefix_that_does_not_match_is_ignored(self):
+        _, user = _messages("system", "Recipe: Waffles", cache_prefix="Recipe: Pancakes")
+
+        assert user["content"] == "Recipe: Waffles"
+
+    def test_whole_prompt_as_prefix(self):
+        _, user = _messages("system", "Recipe: Pancakes", cache_prefix="Recipe: Pancakes")
+
+        assert user["content"] == [{"type": "text", "text": "Recipe: Pancakes", "cache_control": EPHEMERAL}]
+
+
+@pytest.mark.django_db
+class TestServiceCalls:
+    def test_complete_sends_breakpoints(self, openrouter_client):
+        OpenRouterService(api_key="test-key").complete("system", "recipe\nchange", cache_prefix="recipe\n")
+
+        messages = openrouter_client.chat.send.call_args.kwargs["messages"]
+        assert messages == _messages("system", "recipe\nchange", "recipe\n")
+
+    def test_cached_tokens_are_recorded(self, openrouter_client):
+        AIUsageStat.objects.all().delete()
+        openrouter_client.chat.send.return_value = _response(usage=_usage(1500, 200, 1200))
+
+        OpenRouterService(api_key="test-key").complete("system", "user", feature="recipe_remix")
+        record_ai_call("recipe_remix", "anthropic/claude-haiku-4.5", "success", 500, _usage(1500, 180, 1300))
+
+        assert AIUsageStat.objects.get().cached_tokens == 2500
+        assert ai_usage_stats()["recipe_remix"]["cached_tokens"] == 2500
+
+    def test_usage_without_details_counts_nothing_cached(self):
+        AIUsageStat.objects.all().delete()
+
+        record_ai_call(
+            "tips_generation", "openai/gpt-4o", "success", 500, Mock(spec=["prompt_tokens"], prompt_tokens=9)
+        )
+
+        assert AIUsageStat.objects.get().cached_tokens == 0
+
+
+@pytest.mark.django_db
+class TestCallers:
+    @pytest.fixture
+    def recipe(self):
+        profile = Profile.objects.create(name="Cook", avatar_color="#d97850")
+        return Recipe.objects.create(
+            profile=profile,
+            title="Pancakes",
+            host="example.com",
+            servings=4,
+            ingredients=["200 g flour", "2 eggs"],
+            instructions=["Whisk.", "Fry."],
+        )
+
+    def test_user_prompt_prefix_stops_at_the_varying_field(self):
+        prompt = AIPrompt(user_prompt_template="Recipe: {title}\nChange: {modification}\nThanks")
+
+        assert prompt.user_prompt_prefix("modification", title="Pancakes", modification="vegan") == (
+            "Recipe: Pancakes\nChange: "
+        )
+        assert prompt.user_prompt_prefix("servings", title="Pancakes", modification="vegan") == (
+            "Recipe: Pancakes\nChange: vegan\nThanks"
+        )
+
+    def test_remix_caches_the_recipe(self, recipe):
+        from apps.ai.services.remix import create_remix
+
+        service = MagicMock()
+        service.complete.side_effect = RuntimeError("stop after the call")
+
+        with patch("apps.ai.services.remix.OpenRouterService", return_value=service), pytest.raises(RuntimeError):
+            create_remix(recipe.id, "Make it vegan", recipe.profile)
+
+        kwargs = service.complete.call_args.kwargs
+        assert "200 g flour" in kwargs["cache_prefix"]
+        assert "Make it vegan" not in kwargs["cache_prefix"]
+        assert kwargs["user_prompt"].startswith(kwargs["cache_prefix"])
+
+    def test_scaling_caches_the_recipe(self, recipe):
+        from apps.ai.services.scaling import _call_ai_and_validate
+
+        service = MagicMock()
+        service.complete.side_effect = RuntimeError("stop after the call")
+
+        with patch("apps.ai.services.scaling.OpenRouterService", return_value=service), pytest.raises(RuntimeError):
+            _call_ai_and_validate(recipe, 8, "- 200 g flour", "1. Whisk.")
+
+        kwargs = service.complete.call_args.kwargs
+        assert "200 g flour" in kwargs["cache_prefix"]
+        assert kwargs["user_prompt"].startswith(kwargs["cache_prefix"])
+        assert kwargs["user_prompt"][len(kwargs["cache_prefix"]) :].startswith("8")
@@ -0,0 +1,133 @@
+"""
+Tests for the per-worker AI prompt registry.
+
+Tests apps/ai/services/prompts.py and AIPrompt versioning:
+- Prompts are loaded once per worker, not queried per AI call (discover included)
+- Edits through the prompts API and `cookie_admin prompts set` bump the
+  version and are visible immediately; other workers pick up changes
+  after REGISTRY_CHECK_SECONDS
+- Pre-parsed templates format exactly like str.format
+"""
+
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db.models import F
+
+from apps.ai.models import AIPrompt
+from apps.ai.services import prompts
+from apps.profiles.models import Profile
+
+
+@pytest.mark.django_db
+class TestRegistry:
+    def test_lookups_after_first_load_do_not_query(self, django_assert_num_queries):
+        AIPrompt.get_prompt("tips_generation")
+
+        with django_assert_num_queries(0):
+            for prompt_type in ("tips_generation", "timer_naming", "recipe_remix"):
+                assert AIPrompt.get_prompt(prompt_type).prompt_type == prompt_type
+
+    def test_inactive_prompt_is_not_found(self):
+        AIPrompt.objects.filter(prompt_type="timer_naming").update(is_active=False)
+
+        with pytest.raises(AIPrompt.DoesNotExist):
+            AIPrompt.get_prompt("timer_naming")
+
+    def test_save_new_version_is_visible_immediately(self):
+        prompt = AIPrompt.objects.get(prompt_type="tips_generation")
+        AIPrompt.get_prompt("tips_generation")
+
+        prompt.system_prompt = "You are a pastry chef."
+        prompt.save_new_version()
+
+        assert prompt.version == 2
+        assert AIPrompt.get_prompt("tips_generation").system_prompt == "You are a pastry chef."
+
+    def test_other_workers_reload_after_check_interval(self):
+        AIPrompt.get_prompt("tips_generation")
+        # An edit made by another worker: this worker's registry isn't cleared
+        AIPrompt.objects.filter(prompt_type="tips_generation").update(
+            system_prompt="Edited elsewhere.", version=F("version") + 1
+        )
+
+        assert AIPrompt.get_prompt("tips_generation").system_prompt != "Edited elsewhere."
+        with patch.object(prompts, "REGISTRY_CHECK_SECONDS", 0):
+            assert AIPrompt.get_prompt("tips_generation").system_prompt == "Edited elsewhere."
+
+    def test_unchanged_table_is_not_reloaded(self, django_assert_num_queries):
+        AIPrompt.get_prompt("tips_generation")
+
+        with patch.object(prompts, "REGISTRY_CHECK_SECONDS", 0), django_assert_num_queries(1):
+            AIPrompt.get_prompt("tips_generation")
+
+    def test_discover_reads_prompts_from_registry(self, django_assert_num_queries):
+        from apps.ai.services.discover import _load_requests
+
+        profile = Profile.objects.create(name="New", avatar_color="#d97850")
+        AIPrompt.get_prompt("discover_seasonal")
+
+        with django_assert_num_queries(1):  # Only the profile's viewing history
+            requests = _load_requests(profile)
+
+        assert [(kind, prompt.prompt_type) for kind, prompt, _ in requests] == [("seasonal", "discover_seasonal")]
+
+
+@pytest.mark.django_db
+class TestVersionBumps:
+    def test_prompts_api_update_bumps_version(self, client):
+        profile = Profile.objects.create(name="Admin", avatar_color="#d97850")
+        session = client.session
+        session["profile_id"] = profile.id
+        session.save()
+
+        response = client.put(
+            "/api/ai/prompts/timer_naming",
+            data={"system_prompt": "Name the timer."},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert AIPrompt.objects.get(prompt_type="timer_naming").version == 2
+        assert AIPrompt.get_prompt("timer_naming").system_prompt == "Name the timer."
+
+    def test_cookie_admin_prompts_set_bumps_version(self, settings):
+        settings.AUTH_MODE = "home"
+        new_model = AIPrompt.AVAILABLE_MODELS[1][0]
+        out = StringIO()
+
+        call_command("cookie_admin", "prompts", "set", "recipe_remix", "--model", new_model, stdout=out)
+
+        assert "version 2" in out.getvalue()
+        assert AIPrompt.get_prompt("recipe_remix").model == new_model
+
+
+class TestFormatUserPrompt:
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "Recipe: {title}\nServes {servings}",
+            "Literal {{braces}} around {title}",
+            "{title!r} scaled to {servings:>4}",
+            "{servings:{width}} wide",
+            "No placeholders at all",
+        ],
+    )
+    def test_matches_str_format(self, template):
+        values = {"title": "Soup", "servings": 4, "width": 6}
+
+        assert AIPrompt(user_prompt_template=template).format_user_prompt(**values) == template.format(**values)
+
+    def test_edited_template_is_reparsed(self):
+        prompt = AIPrompt(user_prompt_template="Old {title}")
+        prompt.format_user_prompt(title="Soup")
+
+        prompt.user_prompt_template = "New {title}"
+
+        assert prompt.format_user_prompt(title="Soup") == "New Soup"
+
+    def test_missing_variable_raises_key_error(self):
+        with pytest.raises(KeyError):
+            AIPrompt(user_prompt_template="{title}").format_user_prompt()
@@ -7,6 +7,7 @@ Tests apps/ai/services/remix.py:
 - Error for non-existent recipe
 - _parse_time() and _parse_servings() helpers
 - estimate_nutrition() with mocked AI
+- Remix nutrition estimated by a background job, with nutrition_pending set meanwhile
 """
 
 from unittest.mock import patch, MagicMock
@@ -17,10 +18,13 @@ from apps.ai.services.remix import (
     get_remix_suggestions,
     create_remix,
     estimate_nutrition,
+    estimate_remix_nutrition,
+    run_nutrition_job,
     _parse_time,
     _parse_servings,
 )
 from apps.ai.services.openrouter import AIUnavailableError, AIResponseError
+from apps.core.models import AppSettings, BackgroundJob
 from apps.profiles.models import Profile
 from apps.recipes.models import Recipe
 
@@ -239,7 +243,7 @@ class TestGetRemixSuggestions:
 class TestCreateRemix:
     """Tests for create_remix()."""
 
-    @patch("apps.ai.services.remix._generate_tips_background")
+    @patch("apps.ai.services.remix.enqueue_job")
     @patch("apps.ai.services.remix.AIResponseValidator")
     @patch("apps.ai.services.remix.OpenRouterService")
     def test_creates_remix_recipe(
@@ -287,30 +291,28 @@ class TestCreateRemix:
         assert len(remix.ingredients) == 4
         assert len(remix.instructions) == 3
 
-    @patch("apps.ai.services.remix._generate_tips_background")
+    @patch("apps.ai.services.remix.enqueue_job")
     @patch("apps.ai.services.remix.AIResponseValidator")
     @patch("apps.ai.services.remix.OpenRouterService")
     def test_remix_with_nutrition_estimation(
         self,
         mock_service_cls,
         mock_validator_cls,
-        mock_tips_bg,
+        mock_enqueue,
         recipe,
         profile,
         recipe_remix_prompt,
         nutrition_estimate_prompt,
     ):
-        """When original has nutrition, estimate_nutrition is called."""
+        """When the nutrient table can't cover the remix, AI estimates it in a background job after the remix is returned."""
         mock_service_instance = MagicMock()
         mock_service_cls.return_value = mock_service_instance
         mock_service_instance.complete.return_value = "mocked"
 
-        # First call: recipe_remix, second call: nutrition_estimate
-        call_count = {"n": 0}
         remix_response = {
             "title": "Light Chocolate Cake",
             "description": "Lower calorie version",
-            "ingredients": ["1 cup flour", "1/2 cup sugar"],
+            "ingredients": ["1 cup aquafaba", "1/2 cup erythritol"],
             "instructions": ["Mix", "Bake"],
             "yields": "8 servings",
         }
@@ -318,26 +320,53 @@ class TestCreateRemix:
 
         mock_validator_instance = MagicMock()
         mock_validator_cls.return_value = mock_validator_instance
+        mock_validator_instance.validate.return_value = remix_response
 
-        def validate_side_effect(prompt_type, response):
-            call_count["n"] += 1
-            if call_count["n"] == 1:
-                return remix_response
-            return nutrition_response
+        remix = create_remix(recipe.id, "Make it lighter", profile)
 
-        mock_validator_instance.validate.side_effect = validate_side_effect
+        # Only the remix itself is generated on the request path
+        mock_service_instance.complete.assert_called_once()
+        mock_enqueue.assert_any_call(
+            "estimate_nutrition", recipe_id=remix.id, payload={"modification": "Make it lighter"}
+        )
+        remix.refresh_from_db()
+        assert remix.nutrition == {}
+        assert remix.nutrition_pending is True
 
-        remix = create_remix(recipe.id, "Make it lighter", profile)
+        mock_validator_instance.validate.return_value = nutrition_response
+        estimate_remix_nutrition(remix.id, "Make it lighter")
 
-        # Nutrition should have been estimated and saved
         remix.refresh_from_db()
         assert remix.nutrition == {"calories": "200 kcal", "fat": "6 g"}
+        assert remix.nutrition_source == "ai"
+        assert remix.nutrition_pending is False
+        assert "Make it lighter" in mock_service_instance.complete.call_args.kwargs["user_prompt"]
+
+    @patch("apps.ai.services.remix.enqueue_job", return_value=False)
+    @patch("apps.ai.services.remix.AIResponseValidator")
+    @patch("apps.ai.services.remix.OpenRouterService")
+    def test_full_queue_leaves_nutrition_not_pending(
+        self, mock_service_cls, mock_validator_cls, mock_enqueue, recipe, profile, recipe_remix_prompt
+    ):
+        mock_service_cls.return_value.complete.return_value = "mocked"
+        mock_validator_cls.return_value.validate.return_value = {
+            "title": "Light Chocolate Cake",
+            "description": "Lower calorie version",
+            "ingredients": ["1 cup flour"],
+            "instructions": ["Mix"],
+            "yields": "",
+        }
+
+        remix = create_remix(recipe.id, "Make it lighter", profile)
+
+        remix.refresh_from_db()
+        assert remix.nutrition_pending is False
 
     def test_nonexistent_recipe_raises(self, profile):
         with pytest.raises(Recipe.DoesNotExist):
             create_remix(99999, "Make it vegan", profile)
 
-    @patch("apps.ai.services.remix._generate_tips_background")
+    @patch("apps.ai.services.remix.enqueue_job")
     @patch("apps.ai.services.remix.AIResponseValidator")
     @patch("apps.ai.services.remix.OpenRouterService")
     def test_remix_without_times(
@@ -400,3 +429,69 @@ class TestEstimateNutrition:
 
         assert result == expected
         mock_service_instance.complete.assert_called_once()
+
+
+# --- run_nutrition_job ---
+
+
+@pytest.mark.django_db
+class TestNutritionJob:
+    """Tests for the estimate_nutrition background job."""
+
+    @pytest.fixture
+    def remix(self, recipe, profile):
+        return Recipe.objects.create(
+            profile=profile,
+            title="Light Chocolate Cake",
+            host="user-generated",
+            ingredients=["1 cup flour"],
+            is_remix=True,
+            remixed_from=recipe,
+            nutrition_pending=True,
+        )
+
+    def _job(self, remix, attempts=1):
+        return BackgroundJob(
+            job_type="estimate_nutrition",
+            recipe_id=remix.id,
+            payload={"modification": "Make it lighter"},
+            attempts=attempts,
+        )
+
+    @pytest.fixture
+    def api_key(self, db):
+        settings = AppSettings.get()
+        settings.openrouter_api_key = "sk-or-test"
+        settings.save()
+
+    def test_skips_without_api_key(self, remix):
+        with patch("apps.ai.services.remix.OpenRouterService") as mock_service_cls:
+            run_nutrition_job(self._job(remix))
+
+        mock_service_cls.assert_not_called()
+        remix.refresh_from_db()
+        assert remix.nutrition_pending is False
+
+    @patch("apps.ai.services.remix.estimate_nutrition", side_effect=AIResponseError("boom"))
+    def test_failure_is_retried_and_stays_pending(self, mock_estimate, remix, api_key):
+        with pytest.raises(AIResponseError):
+            run_nutrition_job(self._job(remix))
+
+        remix.refresh_from_db()
+        assert remix.nutrition_pending is True
+
+    @patch("apps.ai.services.remix.estimate_nutrition", side_effect=AIResponseError("boom"))
+    def test_last_failure_clears_pending(self, mock_estimate, remix, api_key):
+        job = self._job(remix, attempts=BackgroundJob().max_attempts)
+
+        with pytest.raises(AIResponseError):
+            run_nutrition_job(job)
+
+        remix.refresh_from_db()
+        assert remix.nutrition_pending is False
+
+    def test_skips_deleted_remix(self, remix, api_key):
+        job = self._job(remix)
+        remix.delete()
+
+        run_nutrition_job(job)
@@ -0,0 +1,232 @@
+"""
+Tests for the AI call policy.
+
+Tests apps/ai/services/resilience.py through OpenRouterService:
+- Transient failures (timeouts, 429/5xx) are retried within the call's
+  budget; other errors are raised at once
+- Repeated failures open a model's circuit, which recovers after a trial call
+- A failing configured model falls back to a fast model, reported in the
+  X-AI-Fallback-Model response header
+- Each worker caps its in-flight AI calls
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from apps.ai.middleware import AIModelFallbackMiddleware
+from apps.ai.services import resilience
+from apps.ai.services.openrouter import AIResponseError, OpenRouterService
+
+PRIMARY = "anthropic/claude-sonnet-4"
+FAST = "anthropic/claude-haiku-4.5"
+
+
+class UpstreamError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _response(content='{"ok": true}'):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+@pytest.fixture
+def upstream():
+    """Patch the OpenRouter SDK; set `behaviour[model]` to a list of results or exceptions per call."""
+    behaviour = {}
+    calls = []
+
+    def send(messages, model, stream, timeout_ms):
+        calls.append((model, timeout_ms))
+        results = behaviour.get(model, [])
+        result = results.pop(0) if results else _response()
+        if callable(result):
+            result = result(model, timeout_ms)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    client = MagicMock()
+    client.chat.send.side_effect = send
+
+    async def send_async(**kwargs):
+        return send(**kwargs)
+
+    client.chat.send_async.side_effect = send_async
+    sdk = MagicMock()
+    sdk.return_value.__enter__.return_value = client
+    sdk.return_value.__aenter__.return_value = client
+    with (
+        patch("apps.ai.services.openrouter.OpenRouter", sdk),
+        patch("apps.ai.services.openrouter.record_ai_call"),
+        patch.object(resilience, "BACKOFF_SECONDS", 0),
+    ):
+        yield SimpleNamespace(behaviour=behaviour, calls=calls)
+
+
+def _complete(model=PRIMARY, timeout=30):
+    return OpenRouterService(api_key="sk-test").complete("system", "user", model=model, timeout=timeout)
+
+
+class TestRetries:
+    def test_transient_failure_is_retried(self, upstream):
+        upstream.behaviour[PRIMARY] = [httpx.ConnectTimeout("slow"), _response('{"ok": 1}')]
+
+        assert _complete() == {"ok": 1}
+        assert [model for model, _ in upstream.calls] == [PRIMARY, PRIMARY]
+
+    def test_client_error_is_not_retried(self, upstream):
+        upstream.behaviour[PRIMARY] = [UpstreamError(400)]
+
+        with pytest.raises(AIResponseError, match="HTTP 400"):
+            _complete()
+        assert len(upstream.calls) == 1
+
+    def test_timeout_is_a_budget_for_the_whole_call(self, upstream):
+        clock = [1000.0]
+
+        def timed_out(model, timeout_ms):
+            clock[0] += timeout_ms / 1000
+            return httpx.ReadTimeout("timed out")
+
+        upstream.behaviour[PRIMARY] = [timed_out]
+
+        with patch("apps.ai.services.resilience.time.monotonic", lambda: clock[0]):
+            assert _complete(timeout=30) == {"ok": True}
+
+        # The configured model's attempt leaves a third of the budget for the fallback
+        assert upstream.calls == [(PRIMARY, 20000), (FAST, 10000)]
+
+    def test_no_attempt_without_enough_budget(self, upstream):
+        with pytest.raises(AIResponseError, match="unavailable"):
+            _complete(timeout=1)
+        assert upstream.calls == []
+
+
+class TestFallback:
+    def test_falls_back_to_fast_model(self, upstream):
+        upstream.behaviour[PRIMARY] = [UpstreamError(502), UpstreamError(502)]
+
+        assert _complete() == {"ok": True}
+        assert [model for model, _ in upstream.calls] == [PRIMARY, PRIMARY, FAST]
+
+    def test_fallback_is_reported_in_response_header(self, upstream):
+        upstream.behaviour[PRIMARY] = [UpstreamError(429), UpstreamError(429)]
+
+        def view(request):
+            _complete()
+            return HttpResponse()
+
+        response = AIModelFallbackMiddleware(view)(RequestFactory().get("/api/ai/tips"))
+
+        assert response["X-AI-Fallback-Model"] == f"{PRIMARY} -> {FAST}"
+
+    def test_fast_models_are_the_labelled_ones(self):
+        assert resilience.fallback_models(FAST) == ["openai/gpt-4o-mini", "google/gemini-2.5-flash-preview"]
+
+    def test_async_complete_falls_back(self, upstream):
+        upstream.behaviour[PRIMARY] = [httpx.ReadTimeout("slow"), httpx.ReadTimeout("slow")]
+        service = OpenRouterService(api_key="sk-test")
+
+        result = asyncio.run(service.complete_async("system", "user", model=PRIMARY))
+
+        assert result == {"ok": True}
+        assert upstream.calls[-1][0] == FAST
+
+
+class TestCircuitBreaker:
+    def _open(self, model):
+        for _ in range(resilience.FAILURE_THRESHOLD):
+            resilience.get_breaker(model).record_failure()
+
+    def test_open_circuit_skips_the_model(self, upstream):
+        self._open(PRIMARY)
+
+        assert _complete() == {"ok": True}
+        assert [model for model, _ in upstream.calls] == [FAST]
+
+    def test_half_open_allows_one_trial(self):
+        self._open(PRIMARY)
+        breaker = resilience.get_breaker(PRIMARY)
+        breaker.opened_at -= resilience.OPEN_SECONDS
+
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.allow()
+
+    def test_failed_trial_reopens(self):
+        self._open(PRIMARY)
+        breaker = resilience.get_breaker(PRIMARY)
+        breaker.opened_at -= resilience.OPEN_SECONDS
+        breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.is_open
+
+    def _complete_taking(self, upstream, seconds, timeout):
+        clock = [1000.0]
+
+        def slow(model, timeout_ms):
+            clock[0] += seconds
+            return _response()
+
+        upstream.behaviour[PRIMARY] = [slow]
+        with patch("apps.ai.services.resilience.time.monotonic", lambda: clock[0]):
+            _complete(timeout=timeout)
+
+    def test_slow_success_counts_as_failure(self, upstream):
+        # 17s of a 20s attempt (a 30s budget less the fallback's share)
+        self._complete_taking(upstream, 17, timeout=30)
+
+        assert resilience.get_breaker(PRIMARY).failures == 1
+
+    def test_long_budget_call_is_not_slow(self, upstream):
+        # 60s is well within a 200s attempt
+        self._complete_taking(upstream, 60, timeout=300)
+
+        assert resilience.get_breaker(PRIMARY).failures == 0
+
+    def test_every_model_open_is_shed(self, upstream):
+        for model in [PRIMARY, *resilience.fallback_models(PRIMARY)]:
+            self._open(model)
+
+        with pytest.raises(AIResponseError, match="unavailable"):
+            _complete()
+        assert upstream.calls == []
+
+
+class TestInFlightCap:
+    def test_calls_beyond_the_cap_are_shed(self, settings, upstream):
+        settings.AI_MAX_IN_FLIGHT = 1
+        resilience.reset_resilience()
+        held, release = threading.Event(), threading.Event()
+
+        def hold():
+            with resilience.in_flight_slot():
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        held.wait(5)
+        try:
+            with (
+                patch.object(resilience, "IN_FLIGHT_WAIT_SECONDS", 0.05),
+                pytest.raises(AIResponseError, match="Too many AI requests"),
+            ):
+                _complete()
+        finally:
+            release.set()
+            holder.join()
+
+        assert upstream.calls == []
+        assert _complete() == {"ok": True}
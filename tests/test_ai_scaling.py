@@ -3,17 +3,21 @@ Tests for the AI serving adjustment (scaling) service (T045).
 
 Tests apps/ai/services/scaling.py:
 - scale_recipe() scaling up and down
+- Local scaling, with AI only for lines the parser can't handle
 - Cached results returned on duplicate request
+- POST /api/ai/scale only uses quota when the AI is needed
 - Missing servings raises ValueError
 - Invalid target servings raises ValueError
 - calculate_nutrition() basic calculation
 - _parse_time() and _format_time() helpers
 """
 
+import json
 from unittest.mock import patch, MagicMock
 
 import pytest
 
+from apps.ai.services.quota import get_usage
 from apps.ai.services.scaling import (
     scale_recipe,
     calculate_nutrition,
@@ -21,8 +25,11 @@ from apps.ai.services.scaling import (
     _format_time,
 )
 from apps.profiles.models import Profile
+from apps.core.models import AppSettings
 from apps.recipes.models import Recipe, ServingAdjustment
 
+from tests._profile_test_helpers import create_user, login
+
 
 @pytest.fixture
 def profile(db):
@@ -38,7 +45,8 @@ def recipe(profile, db):
         title="Chocolate Cake",
         host="example.com",
         servings=4,
-        ingredients=["2 cups flour", "1 cup sugar", "3 eggs"],
+        # Lines the local scaler hands to the AI (amount mid-line, vague, spelled out)
+        ingredients=["Flour, about 2 cups", "A little sugar", "Three eggs"],
         instructions=["Mix dry ingredients", "Add wet ingredients", "Bake at 350F"],
         prep_time=15,
         cook_time=30,
@@ -262,6 +270,88 @@ class TestScaleRecipe:
             target_servings=6,
         ).exists()
 
+    @patch("apps.ai.services.scaling.OpenRouterService")
+    def test_parseable_recipe_scaled_locally(self, mock_service_cls, recipe, profile):
+        """Recipes the parser understands are scaled without calling AI."""
+        recipe.ingredients = ["2 cups flour", "1 cup milk", "3 eggs", "Salt to taste"]
+        recipe.save()
+
+        result = scale_recipe(recipe.id, 8, profile, unit_system="metric")
+
+        assert result["ingredients"] == ["500 g flour", "475 ml milk", "6 eggs", "Salt to taste"]
+        assert result["instructions"] == []
+        assert result["prep_time_adjusted"] is None
+        assert result["local"] is True
+        mock_service_cls.assert_not_called()
+        assert ServingAdjustment.objects.filter(recipe=recipe, target_servings=8).exists()
+
+    @patch("apps.ai.services.scaling.AIResponseValidator")
+    @patch("apps.ai.services.scaling.OpenRouterService")
+    def test_only_unresolved_lines_sent_to_ai(
+        self, mock_service_cls, mock_validator_cls, recipe, profile, serving_adjustment_prompt
+    ):
+        recipe.ingredients = ["2 cups flour", "Juice of 1 lemon", "3 eggs"]
+        recipe.save()
+        mock_service = mock_service_cls.return_value
+        mock_service.complete.return_value = "mocked"
+        mock_validator_cls.return_value.validate.return_value = {
+            "ingredients": ["Juice of 2 lemons"],
+            "instructions": ["Mix", "Bake"],
+            "notes": ["Use a larger tin"],
+        }
+
+        result = scale_recipe(recipe.id, 8, profile, unit_system="imperial")
+
+        assert result["ingredients"] == ["4 cups flour", "Juice of 2 lemons", "6 eggs"]
+        assert result["notes"] == ["Use a larger tin"]
+        assert result["local"] is False
+        user_prompt = mock_service.complete.call_args.kwargs["user_prompt"]
+        assert "- Juice of 1 lemon" in user_prompt
+        assert "flour" not in user_prompt
+
+
+@pytest.mark.django_db
+class TestScaleEndpointQuota:
+    """Quota is reserved only once scaling needs the AI."""
+
+    @pytest.fixture
+    def user(self, client, settings):
+        settings.AUTH_MODE = "passkey"
+        app = AppSettings.get()
+        app.daily_limit_scale = 0
+        app.save()
+        user = create_user("scaler")
+        login(client, user)
+        return user
+
+    def _scale(self, client, user, ingredients):
+        recipe = Recipe.objects.create(
+            profile=user.profile, title="Cake", host="example.com", servings=4, ingredients=ingredients
+        )
+        return client.post(
+            "/api/ai/scale",
+            data=json.dumps({"recipe_id": recipe.id, "target_servings": 8, "profile_id": user.profile.id}),
+            content_type="application/json",
+        )
+
+    @patch("apps.ai.services.scaling.OpenRouterService")
+    def test_local_scaling_works_without_quota(self, mock_service_cls, client, user):
+        response = self._scale(client, user, ["2 cups flour", "3 eggs"])
+
+        assert response.status_code == 200
+        assert response.json()["ingredients"] == ["500 g flour", "6 eggs"]
+        mock_service_cls.assert_not_called()
+        assert get_usage(user.profile.pk)["scale"] == 0
+
+    @patch("apps.ai.services.scaling.OpenRouterService")
+    def test_ai_scaling_needs_quota(self, mock_service_cls, client, user):
+        response = self._scale(client, user, ["Juice of 1 lemon"])
+
+        assert response.status_code == 429
+        assert response.json()["error"] == "quota_exceeded"
+        mock_service_cls.assert_not_called()
+        assert not ServingAdjustment.objects.exists()
+
 
 # --- calculate_nutrition ---
 
@@ -0,0 +1,323 @@
+"""
+Tests for streamed remix and tips generation.
+
+Covers the incremental JSON parser and its replay, OpenRouterService.stream_json(),
+stream_remix()/stream_tips(), and the SSE endpoints.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+
+from apps.ai.services.openrouter import AIResponseError, OpenRouterService
+from apps.ai.services.remix import stream_remix
+from apps.ai.services.streaming import IncrementalJSONParser, json_events
+from apps.ai.services.tips import stream_tips
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe
+
+REMIX_JSON = json.dumps(
+    {
+        "title": 'Vegan "Chocolate" Cake',
+        "description": "Plant-based, [still] rich",
+        "ingredients": ["2 cups flour", "1 cup sugar, sifted"],
+        "instructions": ["Mix dry", "Bake at 350F"],
+        "prep_time": "20 minutes",
+        "yields": "8 servings",
+    }
+)
+
+
+def _feed_in_chunks(text, size):
+    parser = IncrementalJSONParser()
+    events = []
+    for i in range(0, len(text), size):
+        events += parser.feed(text[i : i + size])
+    return events
+
+
+def _sse_events(response):
+    """Parse a streamed SSE response into (event, data) pairs."""
+    body = b"".join(response.streaming_content).decode()
+    events = []
+    for block in body.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return events
+
+
+class TestIncrementalJSONParser:
+    @pytest.mark.parametrize("size", [1, 5, 1000])
+    def test_object_fields_and_array_items_in_order(self, size):
+        events = _feed_in_chunks("```json\n" + REMIX_JSON + "\n```", size)
+
+        assert events[:2] == [
+            ("field", "title", 'Vegan "Chocolate" Cake'),
+            ("field", "description", "Plant-based, [still] rich"),
+        ]
+        assert events[2:5] == [
+            ("item", "ingredients", "2 cups flour"),
+            ("item", "ingredients", "1 cup sugar, sifted"),
+            ("field", "ingredients", ["2 cups flour", "1 cup sugar, sifted"]),
+        ]
+        assert ("item", "instructions", "Bake at 350F") in events
+        assert events[-1] == ("field", "yields", "8 servings")
+
+    def test_replayed_events_match_parsed_events(self):
+        assert list(json_events(json.loads(REMIX_JSON))) == _feed_in_chunks(REMIX_JSON, 7)
+        assert list(json_events(["a", "b"])) == _feed_in_chunks('["a", "b"]', 3)
+
+    def test_top_level_array_and_scalars(self):
+        parser = IncrementalJSONParser()
+
+        assert parser.feed('["Use cold butter", "Rest') == [("item", None, "Use cold butter")]
+        assert parser.feed(' the dough"]') == [("item", None, "Rest the dough")]
+        assert _feed_in_chunks('{"n": 4, "ok": true, "x": null, "nested": {"a": [1]}}', 1) == [
+            ("field", "n", 4),
+            ("field", "ok", True),
+            ("field", "x", None),
+            ("field", "nested", {"a": [1]}),
+        ]
+
+
+def _stream_chunks(*texts):
+    chunks = []
+    for text in texts:
+        chunk = MagicMock()
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = text
+        chunks.append(chunk)
+    return chunks
+
+
+class TestStreamJson:
+    @patch("apps.ai.services.openrouter.OpenRouter")
+    def test_yields_events_then_parsed_response(self, mock_openrouter_cls):
+        client = mock_openrouter_cls.return_value.__enter__.return_value
+        client.chat.send.return_value.__enter__.return_value = iter(_stream_chunks('["a",', ' "b"]'))
+
+        events = list(OpenRouterService(api_key="sk-test").stream_json("system", "user"))
+
+        assert events == [("item", None, "a"), ("item", None, "b"), ("done", None, ["a", "b"])]
+        assert client.chat.send.call_args.kwargs["stream"] is True
+
+    @patch("apps.ai.services.openrouter.OpenRouter")
+    def test_api_error_raises_ai_response_error(self, mock_openrouter_cls):
+        client = mock_openrouter_cls.return_value.__enter__.return_value
+        client.chat.send.side_effect = RuntimeError("Connection reset")
+
+        with pytest.raises(AIResponseError, match="OpenRouter API error"):
+            list(OpenRouterService(api_key="sk-test").stream_json("system", "user"))
+
+
+@pytest.fixture
+def profile(db):
+    return Profile.objects.create(name="Stream Chef", avatar_color="#d97850")
+
+
+@pytest.fixture
+def recipe(profile):
+    return Recipe.objects.create(
+        profile=profile,
+        title="Classic Chocolate Cake",
+        host="example.com",
+        ingredients=["2 cups flour", "1 cup sugar"],
+        instructions=["Mix", "Bake"],
+    )
+
+
+def _streaming_service(text):
+    """A real OpenRouterService whose raw stream delivers `text` in two chunks."""
+    service = OpenRouterService(api_key="sk-test")
+    service.stream = MagicMock(return_value=iter([text[:10], text[10:]]))
+    return service
+
+
+@pytest.mark.django_db
+class TestStreamServices:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    @patch("apps.ai.services.remix.enqueue_job")
+    @patch("apps.ai.services.remix.OpenRouterService")
+    def test_stream_remix_saves_validated_remix(self, mock_service_cls, mock_enqueue, recipe, profile):
+        mock_service_cls.return_value = _streaming_service(REMIX_JSON)
+
+        events = list(stream_remix(recipe.id, "Make it vegan", profile))
+
+        assert events[0] == ("field", "title", 'Vegan "Chocolate" Cake')
+        kind, _, remix = events[-1]
+        assert kind == "done"
+        assert remix.remixed_from_id == recipe.id
+        assert remix.ingredients == ["2 cups flour", "1 cup sugar, sifted"]
+        assert remix.servings == 8
+
+    @patch("apps.ai.services.remix.enqueue_job")
+    @patch("apps.ai.services.remix.OpenRouterService")
+    def test_stream_remix_replays_cached_response(self, mock_service_cls, mock_enqueue, recipe, profile):
+        mock_service_cls.return_value = _streaming_service(REMIX_JSON)
+        first = list(stream_remix(recipe.id, "Make it vegan", profile))
+
+        mock_service_cls.return_value = MagicMock()
+        again = list(stream_remix(recipe.id, "Make it vegan", profile))
+
+        mock_service_cls.return_value.stream_json.assert_not_called()
+        assert again[:-1] == first[:-1]
+        assert again[-1][2].title == 'Vegan "Chocolate" Cake'
+        assert again[-1][2].id != first[-1][2].id
+
+    @patch("apps.ai.services.tips.OpenRouterService")
+    def test_stream_tips_caches_tips(self, mock_service_cls, recipe):
+        tips = ["Sift the flour", "Do not overmix", "Cool before slicing"]
+        mock_service_cls.return_value = _streaming_service(json.dumps(tips))
+
+        events = list(stream_tips(recipe.id))
+
+        assert [value for kind, _, value in events if kind == "item"] == tips
+        assert events[-1] == ("done", None, {"tips": tips, "cached": False})
+        recipe.refresh_from_db()
+        assert recipe.ai_tips == tips
+
+    @patch("apps.ai.services.tips.OpenRouterService")
+    def test_stream_tips_replays_cached_response_for_identical_recipe(self, mock_service_cls, recipe, profile):
+        tips = ["Sift the flour", "Do not overmix", "Cool before slicing"]
+        mock_service_cls.return_value = _streaming_service(json.dumps(tips))
+        list(stream_tips(recipe.id))
+        twin = Recipe.objects.create(
+            profile=profile,
+            title=recipe.title,
+            host="example.com",
+            ingredients=recipe.ingredients,
+            instructions=["Mix", "Bake"],
+        )
+
+        mock_service_cls.return_value = MagicMock()
+        events = list(stream_tips(twin.id))
+
+        mock_service_cls.return_value.stream_json.assert_not_called()
+        assert [value for kind, _, value in events if kind == "item"] == tips
+        twin.refresh_from_db()
+        assert twin.ai_tips == tips
+
+    @patch("apps.ai.services.tips.OpenRouterService")
+    def test_stream_tips_replays_cached_tips(self, mock_service_cls, recipe):
+        recipe.ai_tips = ["Cached tip"]
+        recipe.save()
+
+        events = list(stream_tips(recipe.id))
+
+        assert events == [("item", None, "Cached tip"), ("done", None, {"tips": ["Cached tip"], "cached": True})]
+        mock_service_cls.assert_not_called()
+
+
+@pytest.fixture
+def auth_client(client, profile):
+    cache.clear()
+    session = client.session
+    session["profile_id"] = profile.id
+    session.save()
+    return client
+
+
+def _post(client, path, payload):
+    return client.post(path, data=json.dumps(payload), content_type="application/json")
+
+
+@pytest.mark.django_db
+class TestStreamEndpoints:
+    def test_requires_auth(self, client):
+        assert _post(client, "/api/ai/tips/stream", {"recipe_id": 1}).status_code == 401
+
+    @patch("apps.ai.api_streaming.reserve_quota", return_value=(True, {}))
+    @patch("apps.ai.api_streaming.stream_tips")
+    def test_tips_stream(self, mock_stream, mock_quota, auth_client, recipe):
+        mock_stream.return_value = iter(
+            [
+                ("item", None, "Tip 1"),
+                ("item", None, "Tip 2"),
+                ("done", None, {"tips": ["Tip 1", "Tip 2"], "cached": False}),
+            ]
+        )
+
+        response = _post(auth_client, "/api/ai/tips/stream", {"recipe_id": recipe.id})
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/event-stream"
+        assert response["X-Accel-Buffering"] == "no"
+        assert _sse_events(response) == [
+            ("item", {"key": None, "value": "Tip 1"}),
+            ("item", {"key": None, "value": "Tip 2"}),
+            ("done", {"tips": ["Tip 1", "Tip 2"], "cached": False}),
+        ]
+
+    @patch("apps.ai.api_streaming.reserve_quota", return_value=(True, {}))
+    @patch("apps.ai.api_streaming.release_quota")
+    @patch("apps.ai.api_streaming.stream_remix")
+    def test_remix_stream_skips_list_fields_and_returns_remix(
+        self, mock_stream, mock_release, mock_quota, auth_client, recipe, profile
+    ):
+        remix = Recipe.objects.create(
+            profile=profile,
+            title="Vegan Cake",
+            host="user-generated",
+            ingredients=["flour"],
+            instructions=["Bake"],
+            is_remix=True,
+        )
+        mock_stream.return_value = iter(
+            [
+                ("field", "title", "Vegan Cake"),
+                ("item", "ingredients", "flour"),
+                ("field", "ingredients", ["flour"]),
+                ("done", None, remix),
+            ]
+        )
+
+        response = _post(
+            auth_client,
+            "/api/ai/remix/stream",
+            {"recipe_id": recipe.id, "modification": "vegan", "profile_id": profile.id},
+        )
+        events = _sse_events(response)
+
+        assert [e[0] for e in events] == ["field", "item", "done"]
+        assert events[-1][1]["id"] == remix.id
+        assert events[-1][1]["is_remix"] is True
+        mock_release.assert_not_called()
+
+    @patch("apps.ai.api_streaming.reserve_quota", return_value=(True, {}))
+    @patch("apps.ai.api_streaming.release_quota")
+    @patch("apps.ai.api_streaming.stream_tips")
+    def test_error_mid_stream_releases_quota(self, mock_stream, mock_release, mock_quota, auth_client, recipe):
+        def failing():
+            yield "item", None, "Tip 1"
+            raise AIResponseError("Invalid JSON in AI response")
+
+        mock_stream.return_value = failing()
+
+        events = _sse_events(_post(auth_client, "/api/ai/tips/stream", {"recipe_id": recipe.id}))
+
+        assert events[-1] == ("error", {"error": "ai_error", "message": "Invalid JSON in AI response"})
+        mock_release.assert_called_once()
+
+    @patch("apps.ai.api_streaming.reserve_quota", return_value=(True, {}))
+    @patch("apps.ai.api_streaming.release_quota")
+    def test_recipe_not_owned_returns_404(self, mock_release, mock_quota, auth_client, profile):
+        other = Profile.objects.create(name="Other", avatar_color="#000000")
+        other_recipe = Recipe.objects.create(
+            profile=other, title="Other", host="example.com", ingredients=[], instructions=[]
+        )
+
+        response = _post(
+            auth_client,
+            "/api/ai/remix/stream",
+            {"recipe_id": other_recipe.id, "modification": "x", "profile_id": profile.id},
+        )
+
+        assert response.status_code == 404
+        mock_release.assert_called_once()
@@ -0,0 +1,196 @@
+"""
+Tests for AI call telemetry.
+
+Covers apps/ai/services/telemetry.py (hourly aggregation, p50/p95, hit
+ratio), recording from OpenRouterService.complete() and the caches, the
+admin /api/ai/stats endpoint and `cookie_admin ai stats`.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+
+from apps.ai.models import AIUsageStat
+from apps.ai.services.openrouter import AIResponseError, OpenRouterService
+from apps.ai.services.telemetry import ai_usage_stats, record_ai_call, record_cache_hit
+from apps.profiles.models import Profile
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_usage_stats(db):
+    """Start from an empty table: calls made from worker threads in other tests commit outside the test transaction."""
+    AIUsageStat.objects.all().delete()
+
+
+def _usage(prompt_tokens, completion_tokens, cost=None):
+    return Mock(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, cost=cost)
+
+
+@pytest.mark.django_db
+class TestRecording:
+    def test_calls_fold_into_one_hourly_row(self):
+        record_ai_call("tips_generation", "anthropic/claude-haiku-4.5", "success", 800, _usage(100, 40, 0.001))
+        record_ai_call("tips_generation", "anthropic/claude-haiku-4.5", "success", 1200, _usage(120, 50, 0.002))
+
+        row = AIUsageStat.objects.get()
+        assert (row.count, row.total_latency_ms, row.prompt_tokens, row.completion_tokens) == (2, 2000, 220, 90)
+        assert row.cost == pytest.approx(0.003)
+        assert sum(row.latency_histogram) == 2
+
+    def test_outcomes_and_cache_hits_are_separate_rows(self):
+        record_ai_call("recipe_remix", "openai/gpt-4o", "success", 5000)
+        record_ai_call("recipe_remix", "openai/gpt-4o", "error", 30000)
+        record_cache_hit("recipe_remix")
+
+        assert set(AIUsageStat.objects.values_list("outcome", "model")) == {
+            ("success", "openai/gpt-4o"),
+            ("error", "openai/gpt-4o"),
+            ("cache_hit", ""),
+        }
+
+    def test_histogram_counts_each_bucket(self):
+        for latency in (80, 800, 900, 5000):
+            record_ai_call("tips_generation", "openai/gpt-4o", "success", latency)
+
+        histogram = AIUsageStat.objects.get().latency_histogram
+        assert (histogram[0], histogram[3], histogram[6], sum(histogram)) == (1, 2, 1, 4)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_calls_are_all_counted():
+    n = 8
+    barrier = threading.Barrier(n)
+
+    def record():
+        try:
+            barrier.wait()
+            record_ai_call("tips_generation", "openai/gpt-4o", "success", 300, _usage(10, 5))
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=n) as ex:
+        list(ex.map(lambda _: record(), range(n)))
+
+    row = AIUsageStat.objects.get()
+    assert (row.count, row.prompt_tokens, sum(row.latency_histogram)) == (n, 10 * n, n)
+
+
+@pytest.mark.django_db
+class TestAiUsageStats:
+    def test_percentiles_errors_and_hit_ratio(self):
+        for latency in [300] * 18 + [6000, 6000]:
+            record_ai_call("serving_adjustment", "anthropic/claude-haiku-4.5", "success", latency)
+        record_ai_call("serving_adjustment", "anthropic/claude-haiku-4.5", "error", 3000)
+        for _ in range(7):
+            record_cache_hit("serving_adjustment")
+
+        stats = ai_usage_stats()["serving_adjustment"]
+
+        assert (stats["calls"], stats["errors"], stats["cache_hits"]) == (21, 1, 7)
+        assert stats["hit_ratio"] == 0.25
+        assert 250 < stats["p50_ms"] <= 500
+        assert 4000 < stats["p95_ms"] <= 8000
+        assert stats["models"] == ["anthropic/claude-haiku-4.5"]
+
+    def test_cache_only_feature_has_no_latency(self):
+        record_cache_hit("timer_naming")
+
+        stats = ai_usage_stats()["timer_naming"]
+
+        assert stats["hit_ratio"] == 1.0
+        assert stats["p50_ms"] is None
+
+
+def _mock_openrouter(mock_openrouter_class, response):
+    client = MagicMock()
+    mock_openrouter_class.return_value.__enter__ = Mock(return_value=client)
+    mock_openrouter_class.return_value.__exit__ = Mock(return_value=False)
+    client.chat.send.return_value = response
+    return client
+
+
+@pytest.mark.django_db
+class TestServiceInstrumentation:
+    @patch("apps.ai.services.openrouter.OpenRouter")
+    def test_complete_records_feature_model_and_usage(self, mock_openrouter_class):
+        response = Mock(choices=[Mock(message=Mock(content='["tip"]'))], usage=_usage(250, 60, 0.0004))
+        _mock_openrouter(mock_openrouter_class, response)
+
+        OpenRouterService(api_key="test-key").complete(
+            "system", "user", model="openai/gpt-4o", feature="tips_generation"
+        )
+
+        row = AIUsageStat.objects.get()
+        assert (row.feature, row.model, row.outcome) == ("tips_generation", "openai/gpt-4o", "success")
+        assert (row.prompt_tokens, row.completion_tokens) == (250, 60)
+
+    @patch("apps.ai.services.openrouter.OpenRouter")
+    def test_complete_records_failures(self, mock_openrouter_class):
+        _mock_openrouter(mock_openrouter_class, Mock(choices=[Mock(message=Mock(content="not json"))]))
+
+        with pytest.raises(AIResponseError):
+            OpenRouterService(api_key="test-key").complete("system", "user", feature="recipe_remix")
+
+        assert AIUsageStat.objects.get().outcome == "error"
+
+    def test_decorator_cache_hit_is_recorded(self):
+        from apps.ai.services.cache import cache_ai_response
+
+        @cache_ai_response("timer_name", feature="timer_naming")
+        def name_timer(step):
+            return {"label": "Boil"}
+
+        name_timer("Boil the pasta")
+        name_timer("Boil the pasta")
+
+        assert AIUsageStat.objects.get().outcome == "cache_hit"
+        assert AIUsageStat.objects.get().feature == "timer_naming"
+
+
+@pytest.mark.django_db
+class TestStatsReporting:
+    def test_cookie_admin_ai_stats_json(self):
+        record_ai_call("remix_suggestions", "anthropic/claude-haiku-4.5", "success", 900, _usage(10, 5))
+        out = StringIO()
+
+        call_command("cookie_admin", "ai", "stats", "--json", stdout=out)
+
+        payload = json.loads(out.getvalue())
+        assert payload["days"] == 7
+        assert payload["features"]["remix_suggestions"]["calls"] == 1
+
+    def test_cookie_admin_ai_stats_text(self):
+        record_ai_call("selector_repair", "anthropic/claude-haiku-4.5", "success", 900)
+        out = StringIO()
+
+        call_command("cookie_admin", "ai", "stats", stdout=out)
+
+        assert "selector_repair" in out.getvalue()
+        assert "p95=" in out.getvalue()
+
+    def test_admin_endpoint(self, client):
+        profile = Profile.objects.create(name="Admin", avatar_color="#d97850")
+        session = client.session
+        session["profile_id"] = profile.id
+        session.save()
+        record_ai_call("nutrition_estimate", "anthropic/claude-haiku-4.5", "success", 400)
+
+        response = client.get("/api/ai/stats?days=1")
+
+        assert response.status_code == 200
+        assert response.json()["features"]["nutrition_estimate"]["calls"] == 1
@@ -225,6 +225,16 @@ def test_clear_tips_without_existing_tips(recipe):
     assert result is False
 
 
+@pytest.mark.django_db
+def test_clear_tips_without_active_prompt(recipe_with_cached_tips):
+    """Tips are still cleared when the tips_generation prompt is missing or inactive."""
+    with patch("apps.ai.services.tips.AIPrompt.get_prompt", side_effect=AIPrompt.DoesNotExist):
+        assert clear_tips(recipe_with_cached_tips.id) is True
+
+    recipe_with_cached_tips.refresh_from_db()
+    assert recipe_with_cached_tips.ai_tips == []
+
+
 @pytest.mark.django_db
 def test_clear_tips_recipe_not_found():
     """Raises DoesNotExist for non-existent recipe."""
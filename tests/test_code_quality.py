@@ -16,7 +16,6 @@ MAX_FILE_LINES = 500
 
 EXEMPT_FILES: dict[str, int] = {
     "apps/ai/api.py": 535,
-    "apps/recipes/services/scraper.py": 517,
     "apps/ai/tests.py": 1852,
     "apps/recipes/tests.py": 564,
     "tests/test_passkey_api.py": 920,
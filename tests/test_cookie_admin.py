@@ -800,6 +800,7 @@ class TestStatusCacheBlock:
         text, payload = _call("status", as_json=True)
         assert "cache" in payload
         assert "cache_stats" in payload["cache"]
+        assert payload["jobs"]["pending"] == 0
 
 
 @pytest.mark.django_db
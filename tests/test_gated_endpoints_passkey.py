@@ -86,6 +86,7 @@ def _endpoints(source_id: int, profile_id: int) -> list[tuple[str, str, dict | N
             {"remix": 99, "remix_suggestions": 99, "scale": 99, "tips": 99, "discover": 99, "timer": 99},
             "quotas",
         ),
+        ("GET", "/api/ai/stats", None, "ai-stats"),
         ("GET", "/api/system/reset-preview/", None, "reset-preview"),
         ("POST", "/api/system/reset/", {"confirmation_text": "RESET"}, "reset"),
         ("POST", f"/api/sources/{source_id}/toggle/", None, "source-toggle"),
@@ -164,6 +165,7 @@ _HOME_ONLY_PROBE_PATHS = (
     "/api/ai/prompts/tips_generation",
     "/api/ai/sources-needing-attention",
     "/api/ai/repair-selector",
+    "/api/ai/stats",
     "/api/sources/bulk-toggle/",
     "/api/sources/test-all/",
     "/api/sources/1/toggle/",
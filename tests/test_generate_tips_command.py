@@ -0,0 +1,161 @@
+"""
+Tests for the generate_tips backfill command.
+
+Tests apps/ai/management/commands/generate_tips.py and the batch helpers in
+apps/ai/services/tips.py:
+- Several recipes packed into one prompt, keyed by recipe ID
+- Per-recipe validation (one bad entry doesn't discard the batch)
+- Recipes that already have tips are skipped
+- Request starts spaced by the rate limiter
+"""
+
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.ai.management.commands.generate_tips import RateLimiter
+from apps.ai.models import AIPrompt
+from apps.ai.services.openrouter import AIResponseError, AIUnavailableError
+from apps.ai.services.tips import build_batch_tips_prompt
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe
+
+TIPS = ["Rest the dough.", "Preheat the oven.", "Weigh your flour."]
+
+
+@pytest.fixture
+def tips_prompt(db):
+    prompt, _ = AIPrompt.objects.update_or_create(
+        prompt_type="tips_generation",
+        defaults={
+            "name": "Tips Generation",
+            "system_prompt": "You are a cooking tips assistant.",
+            "user_prompt_template": "Tips for '{title}'.\n{ingredients}\n{instructions}",
+            "model": "anthropic/claude-haiku-4.5",
+            "is_active": True,
+        },
+    )
+    return prompt
+
+
+@pytest.fixture
+def recipes(db):
+    profile = Profile.objects.create(name="Backfill", avatar_color="#d97850")
+    return [
+        Recipe.objects.create(
+            profile=profile,
+            title=f"Recipe {i}",
+            ingredients=[f"{i} cups flour"],
+            instructions=[{"text": "Mix and bake"}],
+        )
+        for i in range(5)
+    ]
+
+
+def _run(service, *args):
+    out = StringIO()
+    with patch("apps.ai.management.commands.generate_tips.OpenRouterService", return_value=service):
+        call_command("generate_tips", *args, "--rate=6000", stdout=out, stderr=StringIO())
+    return out.getvalue()
+
+
+def _echo_service():
+    """A service that returns valid tips for every recipe ID in the prompt."""
+    service = MagicMock()
+
+    def complete(system_prompt, user_prompt, **kwargs):
+        ids = [line.split()[3] for line in user_prompt.splitlines() if line.startswith("=== Recipe ID")]
+        return dict.fromkeys(ids, TIPS)
+
+    service.complete.side_effect = complete
+    return service
+
+
+class TestBuildBatchTipsPrompt:
+    def test_each_recipe_rendered_under_its_id(self, tips_prompt, recipes):
+        system_prompt, user_prompt = build_batch_tips_prompt(tips_prompt, recipes[:2])
+
+        assert system_prompt.startswith("You are a cooking tips assistant.")
+        assert "JSON object mapping each recipe ID" in system_prompt
+        assert f"=== Recipe ID {recipes[0].id} ===\nTips for 'Recipe 0'." in user_prompt
+        assert f"=== Recipe ID {recipes[1].id} ===\nTips for 'Recipe 1'." in user_prompt
+
+
+class TestGenerateTipsCommand:
+    def test_backfills_recipes_in_batches(self, tips_prompt, recipes):
+        service = _echo_service()
+
+        output = _run(service, "--batch-size=2")
+
+        assert service.complete.call_count == 3
+        assert all(r.ai_tips == TIPS for r in Recipe.objects.all())
+        assert "Saved tips for 5 recipe(s), 0 failed." in output
+
+    def test_skips_recipes_that_have_tips(self, tips_prompt, recipes):
+        Recipe.objects.filter(id=recipes[0].id).update(ai_tips=["Existing"])
+        service = _echo_service()
+
+        _run(service, "--batch-size=10")
+
+        user_prompt = service.complete.call_args.kwargs["user_prompt"]
+        assert f"Recipe ID {recipes[0].id} " not in user_prompt
+        assert Recipe.objects.get(id=recipes[0].id).ai_tips == ["Existing"]
+
+    def test_invalid_entry_does_not_discard_batch(self, tips_prompt, recipes):
+        service = MagicMock()
+        service.complete.return_value = {str(recipes[0].id): TIPS, str(recipes[1].id): ["Too few"]}
+
+        output = _run(service, "--batch-size=2", "--limit=2")
+
+        assert Recipe.objects.get(id=recipes[0].id).ai_tips == TIPS
+        assert Recipe.objects.get(id=recipes[1].id).ai_tips == []
+        assert "Saved tips for 1 recipe(s), 1 failed." in output
+
+    def test_failed_batch_leaves_others_saved(self, tips_prompt, recipes):
+        service = _echo_service()
+        echo = service.complete.side_effect
+        first_id = str(recipes[0].id)
+
+        def complete(system_prompt, user_prompt, **kwargs):
+            if f"Recipe ID {first_id} " in user_prompt:
+                raise AIResponseError("Upstream error")
+            return echo(system_prompt, user_prompt, **kwargs)
+
+        service.complete.side_effect = complete
+
+        output = _run(service, "--batch-size=2", "--concurrency=1")
+
+        assert Recipe.objects.exclude(ai_tips=[]).count() == 3
+        assert "Saved tips for 3 recipe(s), 2 failed." in output
+
+    def test_dry_run_makes_no_calls(self, tips_prompt, recipes):
+        service = _echo_service()
+
+        output = _run(service, "--dry-run")
+
+        service.complete.assert_not_called()
+        assert "5 recipe(s) without tips." in output
+
+    def test_requires_api_key(self, tips_prompt, recipes):
+        with patch(
+            "apps.ai.management.commands.generate_tips.OpenRouterService",
+            side_effect=AIUnavailableError("OpenRouter API key not configured"),
+        ):
+            with pytest.raises(CommandError, match="API key"):
+                call_command("generate_tips", stdout=StringIO())
+
+
+class TestRateLimiter:
+    def test_spaces_request_starts(self):
+        limiter = RateLimiter(per_minute=60)
+        with patch("apps.ai.management.commands.generate_tips.time.sleep") as sleep:
+            for _ in range(3):
+                limiter.wait()
+
+        waits = [c.args[0] for c in sleep.call_args_list]
+        assert len(waits) == 2
+        assert waits[0] == pytest.approx(1.0, abs=0.05)
+        assert waits[1] == pytest.approx(2.0, abs=0.05)
@@ -0,0 +1,110 @@
+"""
+Tests for the HTML outline sent with selector repair prompts.
+
+Tests apps/recipes/services/html_skeleton.py and its use in repair_selector():
+- Scripts, styles, SVG and body text are removed; id/class/href and link
+  and heading text are kept
+- Repeated sibling elements are shown once with a count
+- The outline stays within its character budget, dropping page chrome first
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.ai.models import AIPrompt
+from apps.ai.services.selector import repair_selector
+from apps.recipes.models import SearchSource
+from apps.recipes.services.html_skeleton import page_skeleton
+
+
+def _card(i):
+    return (
+        f'<article class="card" id="post-{i}">'
+        f'<a class="card-link" href="/recipe/{i}/?utm_source=feed"><img src="/{i}.jpg">'
+        f'<h3 class="card-title">Recipe {i}</h3></a>'
+        f"<p>A long description of recipe {i} that nobody selects on.</p>"
+        '<svg viewBox="0 0 10 10"><path d="M0 0L10 10"/></svg>'
+        "</article>"
+    )
+
+
+def _page(cards=40, chrome=""):
+    return (
+        "<html><head><title>Search</title><script>var tracking = 1;</script>"
+        "<style>.card { color: red; }</style></head><body>"
+        f'{chrome}<main id="content"><div class="results">{"".join(_card(i) for i in range(cards))}</div></main>'
+        "<script>window.dataLayer = [];</script></body></html>"
+    )
+
+
+class TestPageSkeleton:
+    def test_keeps_structure_and_drops_content(self):
+        skeleton = page_skeleton(_page(cards=1))
+
+        assert '<main id="content">' in skeleton
+        assert '<a class="card-link" href="/recipe/0/">' in skeleton
+        assert '<h3 class="card-title">Recipe 0' in skeleton
+        assert "<img>" in skeleton
+        for removed in ("tracking", "color: red", "description", "svg", "utm_source", "<p>"):
+            assert removed not in skeleton
+
+    def test_repeated_siblings_are_collapsed(self):
+        skeleton = page_skeleton(_page(cards=40))
+
+        assert '<article id="post-0" class="card">  <!-- x40 -->' in skeleton
+        assert "Recipe 1" not in skeleton
+
+    def test_fits_a_page_in_a_fraction_of_its_size(self):
+        html = _page(cards=200)
+
+        assert len(page_skeleton(html)) < len(html) / 50
+
+    def test_page_chrome_is_dropped_when_over_budget(self):
+        nav = "<nav>" + "".join(f'<a class="nav-{i}" href="/c/{i}/">Category {i}</a>' for i in range(40)) + "</nav>"
+        html = _page(cards=3, chrome=f'<header class="site">{nav}</header>')
+
+        assert "nav-1" in page_skeleton(html)
+        skeleton = page_skeleton(html, max_chars=600)
+        assert "nav-1" not in skeleton
+        assert "card-title" in skeleton
+
+    def test_truncates_at_a_line_boundary(self):
+        html = "<div>" + "".join(f'<section class="s{i}"><h2>Section {i}</h2></section>' for i in range(100)) + "</div>"
+
+        skeleton = page_skeleton(html, max_chars=300)
+
+        assert skeleton.endswith("\n<!-- outline truncated -->")
+        assert len(skeleton) < 300 + 200
+
+    def test_text_without_markup_is_truncated(self):
+        assert page_skeleton("x" * 100000, max_chars=1000) == "x" * 1000
+
+
+@pytest.mark.django_db
+def test_repair_selector_sends_outline():
+    AIPrompt.objects.update_or_create(
+        prompt_type="selector_repair",
+        defaults={
+            "name": "Selector Repair",
+            "system_prompt": "Fix CSS selectors.",
+            "user_prompt_template": "Fix this selector: {selector}\nHTML:\n{html_sample}",
+            "model": "anthropic/claude-haiku-4.5",
+            "is_active": True,
+        },
+    )
+    source = SearchSource.objects.create(
+        host="example.com",
+        name="Example",
+        search_url_template="https://example.com/?q={query}",
+        result_selector=".old a",
+    )
+    service = MagicMock()
+    service.complete.return_value = {"suggestions": [".card-link"], "confidence": 0.9}
+
+    with patch("apps.ai.services.selector.OpenRouterService", return_value=service):
+        repair_selector(source, _page(cards=200), auto_update=False)
+
+    user_prompt = service.complete.call_args.kwargs["user_prompt"]
+    assert "<!-- x200 -->" in user_prompt
+    assert len(user_prompt) < 2000
@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from PIL import Image
 
 from apps.recipes.services.image_cache import SearchImageCache
+from tests._http_test_helpers import stream_body
 
 
 @pytest.fixture
@@ -234,7 +235,7 @@ class TestImageCaching:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"content-type": "image/jpeg"}
-        mock_response.content = sample_jpeg_bytes
+        stream_body(mock_response, sample_jpeg_bytes)
 
         mock_session = MagicMock()
         mock_session.get = AsyncMock(return_value=mock_response)
@@ -265,10 +266,7 @@ class TestImageCaching:
     @patch("apps.recipes.services.image_cache.AsyncSession")
     async def test_fetch_image_non_image_content_type_returns_none(self, mock_session_class, image_cache):
         """Test fetch returns None when content-type is not image."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.content = b"<html></html>"
+        mock_response = stream_body(MagicMock(status_code=200, headers={"content-type": "text/html"}), b"<html></html>")
 
         mock_session = MagicMock()
         mock_session.get = AsyncMock(return_value=mock_response)
@@ -295,7 +293,7 @@ class TestImageCaching:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {"content-type": "image/jpeg"}
-            mock_response.content = sample_jpeg_bytes
+            stream_body(mock_response, sample_jpeg_bytes)
             return mock_response
 
         mock_session = MagicMock()
@@ -322,7 +320,7 @@ class TestImageCaching:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"content-type": "image/jpeg"}
-        mock_response.content = sample_jpeg_bytes
+        stream_body(mock_response, sample_jpeg_bytes)
 
         mock_session = MagicMock()
         mock_session.get = AsyncMock(return_value=mock_response)
@@ -434,7 +432,7 @@ class TestImageCaching:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"content-type": "image/jpeg"}
-        mock_response.content = sample_jpeg_bytes
+        stream_body(mock_response, sample_jpeg_bytes)
 
         mock_session = MagicMock()
         mock_session.get = AsyncMock(return_value=mock_response)
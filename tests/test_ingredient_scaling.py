@@ -0,0 +1,117 @@
+"""
+Tests for local ingredient parsing and scaling.
+
+Tests apps/recipes/services/ingredients.py:
+- parse_ingredient() quantity/unit/item splitting
+- scale_ingredient() scaling, unit conversion and pluralisation
+- scale_ingredient() declining lines it can't scale confidently
+- singularize() for ingredient names
+"""
+
+import pytest
+
+from apps.recipes.services.ingredients import parse_ingredient, scale_ingredient, singularize
+
+
+class TestParseIngredient:
+    """Tests for parse_ingredient()."""
+
+    def test_mixed_fraction_and_unit(self):
+        parsed = parse_ingredient("1 1/2 cups flour, sifted")
+        assert (parsed.quantity, parsed.unit, parsed.unit_text, parsed.item) == (1.5, "cup", "cups", "flour, sifted")
+
+    def test_unicode_fraction(self):
+        assert parse_ingredient("1½ tbsp butter").quantity == 1.5
+        assert parse_ingredient("¾ cup milk").quantity == 0.75
+
+    def test_range(self):
+        parsed = parse_ingredient("2-3 cloves garlic")
+        assert (parsed.quantity, parsed.quantity_max, parsed.unit) == (2, 3, "clove")
+
+    def test_attached_metric_unit(self):
+        parsed = parse_ingredient("225g butter")
+        assert (parsed.quantity, parsed.unit, parsed.attached, parsed.item) == (225, "g", True, "butter")
+
+    def test_package_size(self):
+        parsed = parse_ingredient("1 (400 g) can chopped tomatoes")
+        assert (parsed.size, parsed.unit, parsed.item) == ("(400 g)", "can", "chopped tomatoes")
+
+    def test_plain_count(self):
+        parsed = parse_ingredient("3 large eggs")
+        assert (parsed.quantity, parsed.unit, parsed.item) == (3, None, "large eggs")
+
+    def test_article_with_unit(self):
+        assert parse_ingredient("a pinch of salt").quantity == 1
+
+    def test_no_quantity(self):
+        assert parse_ingredient("Salt to taste") is None
+        assert parse_ingredient("a little oil") is None
+
+
+class TestScaleIngredient:
+    """Tests for scale_ingredient()."""
+
+    @pytest.mark.parametrize(
+        "line,factor,expected",
+        [
+            ("2 cups flour", 2, "4 cups flour"),
+            ("1 cup sugar", 0.5, "1/2 cup sugar"),
+            ("1 1/2 tsp salt", 2, "3 tsp salt"),
+            ("1 to 2 tbsp olive oil", 0.5, "1/2 to 1 tbsp olive oil"),
+            ("2-3 cloves garlic, minced", 2, "4-6 cloves garlic, minced"),
+            ("1 (400 g) can chopped tomatoes", 2, "2 (400 g) cans chopped tomatoes"),
+            ("1 Tablespoon honey", 3, "3 Tablespoons honey"),
+            ("a pinch of salt", 2, "2 pinches of salt"),
+            ("3 eggs", 0.5, "1 1/2 eggs"),
+            ("1 large onion, diced", 2, "2 large onions, diced"),
+            ("2 onions", 0.5, "1 onion"),
+            ("1 bay leaf", 3, "3 bay leaves"),
+            ("500 ml stock", 3, "1.5 l stock"),
+            ("Salt and pepper to taste", 2, "Salt and pepper to taste"),
+        ],
+    )
+    def test_scales(self, line, factor, expected):
+        assert scale_ingredient(line, factor) == expected
+
+    @pytest.mark.parametrize(
+        "line,unit_system,expected",
+        [
+            ("2 cups flour", "metric", "250 g flour"),
+            ("½ cup butter, softened", "metric", "115 g butter, softened"),
+            ("1 cup milk", "metric", "235 ml milk"),
+            ("2 lb chicken thighs", "metric", "905 g chicken thighs"),
+            ("3 tbsp butter", "metric", "3 tbsp butter"),
+            ("225g butter", "imperial", "7.9 oz butter"),
+            ("250 ml water", "imperial", "1 cup water"),
+            ("2 cups flour", "imperial", "2 cups flour"),
+        ],
+    )
+    def test_converts_units(self, line, unit_system, expected):
+        assert scale_ingredient(line, 1, unit_system) == expected
+
+    def test_attached_unit_stays_attached(self):
+        assert scale_ingredient("225g butter", 2, "metric") == "450g butter"
+
+    @pytest.mark.parametrize(
+        "line,unit_system",
+        [
+            ("Juice of 2 lemons", None),
+            ("One onion", None),
+            ("2 x 400g tins beans", None),
+            ("1/8 tsp cayenne", None),
+            ("1 cup chopped parsley", "metric"),
+            ("1 box pasta", None),
+            ("2 leaves basil", None),
+        ],
+    )
+    def test_declines_lines_it_cannot_scale_confidently(self, line, unit_system):
+        factor = 0.25 if line.startswith(("1/8", "2 leaves")) else 2
+        assert scale_ingredient(line, factor, unit_system) is None
+
+
+@pytest.mark.parametrize(
+    "word,expected",
+    [("onions", "onion"), ("berries", "berry"), ("peaches", "peach"), ("leaves", "leaf"), ("glass", "glass")],
+)
+def test_singularize(word, expected):
+    assert singularize(word) == expected
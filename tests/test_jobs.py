@@ -0,0 +1,242 @@
+"""
+Tests for the background job queue and the run_jobs worker command.
+"""
+
+from io import StringIO
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.core import jobs
+from apps.core.jobs import claim_jobs, enqueue_job, purge_finished_jobs, queue_metrics, requeue_stale_jobs, run_job
+from apps.core.models import BackgroundJob
+from apps.profiles.models import Profile
+from apps.recipes.models import CachedSearchImage, Recipe
+from apps.recipes.services.image_cache import SearchImageCache
+
+pytestmark = pytest.mark.django_db
+
+
+_calls = []
+
+
+def _record(job):
+    _calls.append(job.recipe_id)
+
+
+def _fail(job):
+    raise RuntimeError("upstream down")
+
+
+@pytest.fixture
+def handlers():
+    """Route tips jobs to a recorder and image jobs to a failing handler."""
+    _calls.clear()
+    with patch.dict(
+        jobs.JOB_HANDLERS, {"generate_tips": f"{__name__}._record", "cache_search_images": f"{__name__}._fail"}
+    ):
+        yield _calls
+
+
+class TestEnqueue:
+    def test_deduplicates_active_jobs_per_recipe(self):
+        assert enqueue_job("generate_tips", recipe_id=1) is True
+        assert enqueue_job("generate_tips", recipe_id=1) is False
+        assert enqueue_job("generate_tips", recipe_id=2) is True
+        assert BackgroundJob.objects.count() == 2
+
+    def test_deduplicates_active_jobs_without_a_recipe(self):
+        assert enqueue_job("refresh_ai_key_status") is True
+        assert enqueue_job("refresh_ai_key_status") is False
+        assert BackgroundJob.objects.count() == 1
+
+    def test_finished_job_does_not_block_requeue(self):
+        enqueue_job("generate_tips", recipe_id=1)
+        BackgroundJob.objects.update(status=BackgroundJob.STATUS_DONE)
+
+        assert enqueue_job("generate_tips", recipe_id=1) is True
+
+    def test_queue_is_bounded(self, settings):
+        settings.JOB_QUEUE_MAX_DEPTH = 2
+        for recipe_id in range(3):
+            enqueue_job("generate_tips", recipe_id=recipe_id)
+
+        assert BackgroundJob.objects.count() == 2
+
+    def test_low_priority_jobs_only_fill_half_the_queue(self, settings):
+        settings.JOB_QUEUE_MAX_DEPTH = 4
+        for recipe_id in range(3):
+            enqueue_job("prefetch_ai", recipe_id=recipe_id, priority=BackgroundJob.PRIORITY_LOW)
+
+        assert BackgroundJob.objects.count() == 2
+        assert enqueue_job("generate_tips", recipe_id=1) is True
+
+    def test_unknown_job_type_raises(self):
+        with pytest.raises(ValueError, match="Unknown job type"):
+            enqueue_job("nope")
+
+
+class TestClaimAndRun:
+    def test_claims_due_jobs_up_to_limit(self):
+        for recipe_id in range(3):
+            enqueue_job("generate_tips", recipe_id=recipe_id)
+        BackgroundJob.objects.filter(recipe_id=0).update(run_after=timezone.now() + timezone.timedelta(hours=1))
+
+        claimed = claim_jobs(1)
+
+        assert [job.recipe_id for job in claimed] == [1]
+        assert claimed[0].attempts == 1
+        assert BackgroundJob.objects.get(recipe_id=1).status == BackgroundJob.STATUS_RUNNING
+        assert len(claim_jobs(5)) == 1
+
+    def test_higher_priority_jobs_are_claimed_first(self):
+        enqueue_job("prefetch_ai", recipe_id=1, priority=BackgroundJob.PRIORITY_LOW)
+        enqueue_job("generate_tips", recipe_id=2)
+
+        assert [job.job_type for job in claim_jobs(2)] == ["generate_tips", "prefetch_ai"]
+
+    def test_success_marks_done(self, handlers):
+        enqueue_job("generate_tips", recipe_id=7)
+
+        assert run_job(claim_jobs(1)[0]) is True
+        assert handlers == [7]
+        job = BackgroundJob.objects.get()
+        assert job.status == BackgroundJob.STATUS_DONE
+        assert job.finished_at is not None
+
+    def test_failure_retries_with_backoff_then_fails(self, handlers):
+        enqueue_job("cache_search_images", payload={"urls": []})
+
+        assert run_job(claim_jobs(1)[0]) is False
+        job = BackgroundJob.objects.get()
+        assert job.status == BackgroundJob.STATUS_PENDING
+        assert job.last_error == "RuntimeError: upstream down"
+        assert job.run_after > timezone.now() + timezone.timedelta(seconds=jobs.RETRY_BACKOFF_SECONDS - 5)
+
+        BackgroundJob.objects.update(attempts=job.max_attempts - 1, run_after=timezone.now())
+        run_job(claim_jobs(1)[0])
+        assert BackgroundJob.objects.get().status == BackgroundJob.STATUS_FAILED
+
+
+class TestHousekeeping:
+    def test_requeues_stale_running_jobs(self):
+        enqueue_job("generate_tips", recipe_id=1)
+        enqueue_job("generate_tips", recipe_id=2)
+        claim_jobs(2)
+        stale = timezone.now() - timezone.timedelta(seconds=jobs.STALE_JOB_SECONDS + 1)
+        BackgroundJob.objects.filter(recipe_id=1).update(started_at=stale)
+
+        assert requeue_stale_jobs() == 1
+        assert BackgroundJob.objects.get(recipe_id=1).status == BackgroundJob.STATUS_PENDING
+
+    def test_stale_job_on_its_last_attempt_fails(self):
+        enqueue_job("generate_tips", recipe_id=1)
+        stale = timezone.now() - timezone.timedelta(seconds=jobs.STALE_JOB_SECONDS + 1)
+        BackgroundJob.objects.update(status=BackgroundJob.STATUS_RUNNING, attempts=3, started_at=stale)
+
+        assert requeue_stale_jobs() == 0
+        job = BackgroundJob.objects.get()
+        assert job.status == BackgroundJob.STATUS_FAILED
+        assert job.finished_at is not None
+        assert job.last_error
+
+    def test_failed_stale_nutrition_job_clears_pending(self):
+        profile = Profile.objects.create(name="Cook", avatar_color="#d97850")
+        remix = Recipe.objects.create(profile=profile, title="Remix", nutrition_pending=True)
+        other = Recipe.objects.create(profile=profile, title="Still estimating", nutrition_pending=True)
+        enqueue_job("estimate_nutrition", recipe_id=remix.id)
+        enqueue_job("estimate_nutrition", recipe_id=other.id)
+        stale = timezone.now() - timezone.timedelta(seconds=jobs.STALE_JOB_SECONDS + 1)
+        BackgroundJob.objects.update(status=BackgroundJob.STATUS_RUNNING, attempts=1, started_at=stale)
+        BackgroundJob.objects.filter(recipe_id=remix.id).update(attempts=3)
+
+        assert requeue_stale_jobs() == 1
+        remix.refresh_from_db()
+        other.refresh_from_db()
+        assert remix.nutrition_pending is False
+        assert other.nutrition_pending is True
+
+    def test_purges_old_finished_jobs(self):
+        enqueue_job("generate_tips", recipe_id=1)
+        enqueue_job("generate_tips", recipe_id=2)
+        old = timezone.now() - timezone.timedelta(days=jobs.FINISHED_JOB_RETENTION_DAYS + 1)
+        BackgroundJob.objects.filter(recipe_id=1).update(status=BackgroundJob.STATUS_DONE, finished_at=old)
+
+        assert purge_finished_jobs() == 1
+        assert BackgroundJob.objects.count() == 1
+
+    def test_queue_metrics(self):
+        enqueue_job("generate_tips", recipe_id=1)
+        enqueue_job("cache_search_images", payload={"urls": ["https://example.com/a.jpg"]})
+        BackgroundJob.objects.update(run_after=timezone.now() - timezone.timedelta(seconds=30))
+
+        metrics = queue_metrics()
+
+        assert metrics["pending"] == 2
+        assert metrics["running"] == 0
+        assert metrics["pending_by_type"] == {"generate_tips": 1, "cache_search_images": 1}
+        assert metrics["oldest_pending_seconds"] >= 30
+
+
+class TestHandlers:
+    def test_tips_job_skips_without_api_key(self, monkeypatch):
+        from apps.ai.services.tips import run_tips_job
+
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        with patch("apps.ai.services.tips.generate_tips") as mock_generate:
+            run_tips_job(BackgroundJob(job_type="generate_tips", recipe_id=1))
+        mock_generate.assert_not_called()
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_queue_images_only_queues_unknown_urls(self):
+        await CachedSearchImage.objects.acreate(external_url="https://example.com/known.jpg")
+        urls = ["https://example.com/known.jpg", "https://example.com/new.jpg", "https://example.com/new.jpg"]
+
+        assert await SearchImageCache().queue_images(urls) == 1
+        assert await SearchImageCache().queue_images(urls) == 0
+
+        job = await BackgroundJob.objects.aget()
+        assert job.payload == {"urls": ["https://example.com/new.jpg"]}
+        assert await CachedSearchImage.objects.filter(status=CachedSearchImage.STATUS_PENDING).acount() == 2
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_queue_images_queues_a_batch_while_another_runs(self):
+        assert await SearchImageCache().queue_images(["https://example.com/a.jpg"]) == 1
+        await BackgroundJob.objects.aupdate(status=BackgroundJob.STATUS_RUNNING)
+
+        assert await SearchImageCache().queue_images(["https://example.com/b.jpg"]) == 1
+
+        job = await BackgroundJob.objects.aget(status=BackgroundJob.STATUS_PENDING)
+        assert job.payload == {"urls": ["https://example.com/b.jpg"]}
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_queue_images_caps_the_batch_size(self):
+        urls = [f"https://example.com/{i}.jpg" for i in range(SearchImageCache.MAX_BATCH_URLS + 1)]
+
+        assert await SearchImageCache().queue_images(urls) == len(urls)
+
+        sizes = [len(job.payload["urls"]) async for job in BackgroundJob.objects.order_by("id")]
+        assert sizes == [SearchImageCache.MAX_BATCH_URLS, 1]
+
+    def test_cache_images_job_downloads_payload(self):
+        from apps.recipes.services.image_cache import run_cache_images_job
+
+        with patch.object(SearchImageCache, "cache_images", new_callable=AsyncMock) as mock_cache:
+            run_cache_images_job(BackgroundJob(payload={"urls": ["https://example.com/a.jpg"]}))
+        mock_cache.assert_awaited_once_with(["https://example.com/a.jpg"])
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRunJobsCommand:
+    def test_once_drains_due_jobs(self, handlers):
+        for recipe_id in range(5):
+            enqueue_job("generate_tips", recipe_id=recipe_id)
+        out = StringIO()
+
+        call_command("run_jobs", "--once", "--concurrency=2", stdout=out)
+
+        assert sorted(handlers) == [0, 1, 2, 3, 4]
+        assert BackgroundJob.objects.filter(status=BackgroundJob.STATUS_DONE).count() == 5
+        assert "stopped after 5 job(s)" in out.getvalue()
@@ -213,6 +213,21 @@ class TestLegacyRecipeDetail:
         assert "Calories" in content  # format_nutrition_key capitalizes
         assert "200" in content
 
+    def test_recipe_detail_labels_estimated_nutrition(self, client):
+        """Nutrition that wasn't published with the recipe is labelled as an estimate."""
+        profile = Profile.objects.create(name="Test", avatar_color="#d97850")
+        recipe = Recipe.objects.create(
+            profile=profile,
+            title="Test Recipe",
+            host="example.com",
+            nutrition={"calories": "200 kcal"},
+            nutrition_source=Recipe.NUTRITION_CALCULATED,
+        )
+        client.post(f"/api/profiles/{profile.id}/select/")
+
+        response = client.get(f"/legacy/recipe/{recipe.id}/")
+        assert "Estimated from the ingredients" in response.content.decode()
+
     def test_recipe_detail_records_view_history(self, client):
         """Recipe detail creates/updates view history."""
         profile = Profile.objects.create(name="Test", avatar_color="#d97850")
@@ -0,0 +1,205 @@
+"""
+Tests for offline nutrition estimates.
+
+Tests apps/recipes/services/nutrition.py and where it is used:
+- Ingredient names are matched to the bundled table (longest name, then fuzzy)
+- Lines are weighed from metric, imperial, volume, package and count amounts
+- Recipes are only estimated when most measured lines are covered
+- Remixes, scaled nutrition and the backfill_nutrition command use the estimate
+- Recipes record whether their nutrition was scraped or estimated
+"""
+
+import asyncio
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+
+from apps.ai.services.remix import create_remix
+from apps.ai.services.scaling import calculate_nutrition
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe
+from apps.recipes.services.nutrition import calculate_recipe_nutrition, ingredient_grams, load_table
+
+PANCAKES = ["200 g plain flour", "2 eggs", "300 ml milk", "1 tbsp butter", "Salt to taste"]
+
+
+class TestIngredientGrams:
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("200g unsalted butter", ("butter", 200)),
+            ("1 lb ground beef", ("ground beef", 453.6)),
+            ("1 cup whole milk", ("milk", 243.7)),
+            ("2 tbsp extra-virgin olive oil", ("olive oil", 26.9)),
+            ("1 (400 g) can chickpeas, drained", ("chickpeas", 400)),
+            ("2 cans chopped tomatoes", ("canned tomatoes", 800)),
+            ("3 large eggs, beaten", ("egg", 150)),
+            ("2 cloves garlic, minced", ("garlic", 8)),
+            ("a pinch of salt", ("salt", 0.4)),
+            ("1-2 onions, finely chopped", ("onion", 225)),
+        ],
+    )
+    def test_weighs_common_lines(self, line, expected):
+        name, grams = ingredient_grams(line)
+
+        assert name == expected[0]
+        assert grams == pytest.approx(expected[1], abs=0.1)
+
+    def test_longest_and_last_name_wins(self):
+        assert ingredient_grams("1 cup brown sugar")[0] == "brown sugar"
+        assert ingredient_grams("2 tbsp peanut butter")[0] == "peanut butter"
+        assert ingredient_grams("1 chicken stock cube")[0] == "stock cube"
+
+    def test_misspellings_are_matched(self):
+        assert ingredient_grams("500 g chiken breast")[0] == "chicken breast"
+        assert ingredient_grams("3 tomatos")[0] == "tomato"
+
+    def test_unknown_or_unweighable_lines(self):
+        assert ingredient_grams("1 cup aquafaba") is None
+        assert ingredient_grams("2 chicken") is None  # no typical weight per piece
+        assert ingredient_grams("Salt to taste") is None
+
+    def test_table_is_one_row_per_ingredient(self):
+        table = load_table()
+
+        assert len(table.labels) == len(table.density) == len(table.each)
+        assert len(table.values) == len(table.labels) * table.width
+
+
+class TestCalculateRecipeNutrition:
+    def test_per_serving_values(self):
+        nutrition = calculate_recipe_nutrition(PANCAKES, 4)
+
+        assert nutrition["calories"] == "290 kcal"
+        assert nutrition["proteinContent"] == "11 g"
+        assert nutrition["sodiumContent"] == "70 mg"
+        assert set(nutrition) == {
+            "calories",
+            "fatContent",
+            "saturatedFatContent",
+            "carbohydrateContent",
+            "sugarContent",
+            "fiberContent",
+            "proteinContent",
+            "sodiumContent",
+        }
+
+    def test_more_servings_means_less_per_serving(self):
+        assert calculate_recipe_nutrition(PANCAKES, 8)["calories"] == "145 kcal"
+
+    def test_needs_servings(self):
+        assert calculate_recipe_nutrition(PANCAKES, None) == {}
+
+    def test_mostly_unknown_ingredients_are_not_estimated(self):
+        lines = ["200 g plain flour", "1 cup aquafaba", "2 tbsp erythritol", "Juice of 2 lemons"]
+
+        assert calculate_recipe_nutrition(lines, 4) == {}
+
+    def test_water_and_salt_alone_are_not_estimated(self):
+        assert calculate_recipe_nutrition(["1 l water", "1 tsp salt"], 2) == {}
+
+
+@pytest.mark.django_db
+class TestUses:
+    @pytest.fixture
+    def recipe(self):
+        profile = Profile.objects.create(name="Cook", avatar_color="#d97850")
+        return Recipe.objects.create(
+            profile=profile, title="Pancakes", host="example.com", servings=4, ingredients=PANCAKES
+        )
+
+    @patch("apps.ai.services.remix.enqueue_job")
+    @patch("apps.ai.services.remix.AIPrompt.get_prompt")
+    @patch("apps.ai.services.remix.OpenRouterService")
+    def test_remix_nutrition_is_calculated_without_ai(self, mock_service_cls, mock_get_prompt, mock_enqueue, recipe):
+        recipe.nutrition = {"calories": "300 kcal"}
+        recipe.save()
+        mock_service_cls.return_value.complete.return_value = {
+            "title": "Oat Pancakes",
+            "description": "With oats",
+            "ingredients": ["100 g plain flour", "100 g oats", "2 eggs", "300 ml milk"],
+            "instructions": ["Mix.", "Fry."],
+            "yields": "4 servings",
+        }
+
+        remix = create_remix(recipe.id, "Add oats", recipe.profile)
+
+        assert remix.nutrition["calories"] == "269 kcal"
+        assert remix.nutrition_source == Recipe.NUTRITION_CALCULATED
+        assert remix.nutrition_pending is False
+        assert "estimate_nutrition" not in [c.args[0] for c in mock_enqueue.call_args_list]
+
+    def test_scaled_nutrition_falls_back_to_the_estimate(self, recipe):
+        result = calculate_nutrition(recipe, 4, 8)
+
+        assert result["per_serving"]["calories"] == "290 kcal"
+        assert result["total"]["calories"] == "2320 kcal"
+
+    def test_scraped_nutrition_is_kept(self, recipe):
+        recipe.nutrition = {"calories": "500 kcal"}
+
+        assert calculate_nutrition(recipe, 4, 4)["per_serving"] == {"calories": "500 kcal"}
+
+    def test_backfill_command(self, recipe):
+        unknown = Recipe.objects.create(
+            profile=recipe.profile, title="Mystery", host="example.com", servings=2, ingredients=["1 cup aquafaba"]
+        )
+        out = StringIO()
+
+        call_command("backfill_nutrition", "--dry-run", stdout=out)
+        assert "Would update 1 of 2" in out.getvalue()
+        recipe.refresh_from_db()
+        assert recipe.nutrition == {}
+
+        call_command("backfill_nutrition", stdout=StringIO())
+        recipe.refresh_from_db()
+        unknown.refresh_from_db()
+        assert recipe.nutrition["calories"] == "290 kcal"
+        assert recipe.nutrition_source == Recipe.NUTRITION_CALCULATED
+        assert unknown.nutrition == {}
+        assert unknown.nutrition_source == ""
+
+    def test_api_reports_the_source(self, recipe):
+        recipe.nutrition = {"calories": "290 kcal"}
+        recipe.nutrition_source = Recipe.NUTRITION_CALCULATED
+        recipe.save()
+        client = Client()
+        client.post(f"/api/profiles/{recipe.profile.id}/select/")
+
+        assert client.get(f"/api/recipes/{recipe.id}/").json()["nutrition_source"] == "calculated"
+
+
+def _scraped_fields(**data):
+    from apps.recipes.services.scraper import RecipeScraper
+
+    data = {"host": "example.com", "title": "Pancakes", "ingredients": PANCAKES, "servings": 4, **data}
+    with (
+        patch("apps.recipes.models.Recipe") as recipe_cls,
+        patch("apps.recipes.services.scraper.sync_to_async", side_effect=_as_async),
+    ):
+        asyncio.run(RecipeScraper()._save_recipe(data, "https://example.com/p", MagicMock(), None))
+    return recipe_cls.call_args.kwargs
+
+
+def test_scraper_estimates_missing_nutrition():
+    fields = _scraped_fields()
+
+    assert fields["nutrition"]["calories"] == "290 kcal"
+    assert fields["nutrition_source"] == "calculated"
+
+
+def test_scraper_keeps_published_nutrition():
+    fields = _scraped_fields(nutrition={"calories": "500 kcal"})
+
+    assert fields["nutrition"] == {"calories": "500 kcal"}
+    assert fields["nutrition_source"] == "scraped"
+
+
+def _as_async(func):
+    async def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,213 @@
+"""
+Tests for nightly Discover precomputation.
+
+Tests apps/ai/management/commands/precompute_discover.py and the
+refresh/serve split in apps/ai/services/discover.py:
+- Only recently active profiles are refreshed, one at a time
+- A failed refresh keeps the previous suggestions
+- Requests serve precomputed rows without calling the AI
+- Suggestion types are generated concurrently, and a type that times out
+  is left out without losing the others
+"""
+
+import asyncio
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.ai.models import AIDiscoverySuggestion, AIPrompt
+from apps.ai.services.discover import get_discover_suggestions, refresh_discover_suggestions
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe, RecipeViewHistory
+
+SUGGESTIONS = [
+    {"title": "Autumn Soups", "description": "Warming bowls", "search_query": "autumn soup"},
+]
+
+
+@pytest.fixture
+def seasonal_prompt(db):
+    prompt, _ = AIPrompt.objects.update_or_create(
+        prompt_type="discover_seasonal",
+        defaults={
+            "name": "Discover Seasonal",
+            "system_prompt": "You are a helpful cooking assistant.",
+            "user_prompt_template": "Suggest seasonal recipes for {date} ({season}).",
+            "model": "anthropic/claude-haiku-4.5",
+            "is_active": True,
+        },
+    )
+    return prompt
+
+
+@pytest.fixture
+def all_prompts(seasonal_prompt):
+    for prompt_type, template in [
+        ("discover_favorites", "Based on these favorites:\n{favorites}\nSuggest similar recipes."),
+        ("discover_new", "Based on this history:\n{history}\nSuggest something new."),
+    ]:
+        AIPrompt.objects.update_or_create(
+            prompt_type=prompt_type,
+            defaults={
+                "name": prompt_type,
+                "system_prompt": "You are a helpful cooking assistant.",
+                "user_prompt_template": template,
+                "model": "anthropic/claude-haiku-4.5",
+                "is_active": True,
+            },
+        )
+
+
+def _profile(name, viewed_days_ago=None):
+    profile = Profile.objects.create(name=name, avatar_color="#d97850")
+    if viewed_days_ago is not None:
+        recipe = Recipe.objects.create(profile=profile, title=f"{name}'s Stew")
+        RecipeViewHistory.objects.create(profile=profile, recipe=recipe)
+        Recipe.objects.filter(id=recipe.id).update(scraped_at=timezone.now() - timedelta(days=viewed_days_ago))
+        RecipeViewHistory.objects.filter(profile=profile).update(
+            viewed_at=timezone.now() - timedelta(days=viewed_days_ago)
+        )
+    return profile
+
+
+def _ai(response=SUGGESTIONS, error=None):
+    service = MagicMock()
+    service.complete_async = AsyncMock(return_value="mocked")
+    validator = MagicMock()
+    validator.validate.return_value = response
+    if error:
+        service.complete_async = AsyncMock(side_effect=error)
+    return (
+        patch("apps.ai.services.discover.OpenRouterService", return_value=service),
+        patch("apps.ai.services.discover.AIResponseValidator", return_value=validator),
+    )
+
+
+@pytest.mark.django_db
+class TestRefreshDiscoverSuggestions:
+    def test_replaces_previous_set(self, seasonal_prompt):
+        profile = _profile("Ada")
+        old = AIDiscoverySuggestion.objects.create(
+            profile=profile, suggestion_type="seasonal", title="Old", description="", search_query="old"
+        )
+        service_patch, validator_patch = _ai()
+
+        with service_patch, validator_patch:
+            refresh_discover_suggestions(profile)
+
+        assert not AIDiscoverySuggestion.objects.filter(id=old.id).exists()
+        assert AIDiscoverySuggestion.objects.get(profile=profile).title == "Autumn Soups"
+
+    def test_failed_refresh_keeps_previous_set(self, seasonal_prompt):
+        from apps.ai.services.openrouter import AIResponseError
+
+        profile = _profile("Ada")
+        AIDiscoverySuggestion.objects.create(
+            profile=profile, suggestion_type="seasonal", title="Old", description="", search_query="old"
+        )
+        service_patch, validator_patch = _ai(error=AIResponseError("Upstream error"))
+
+        with service_patch, validator_patch:
+            assert refresh_discover_suggestions(profile) == []
+
+        assert AIDiscoverySuggestion.objects.get(profile=profile).title == "Old"
+
+    def test_day_old_suggestions_are_served_without_ai(self, seasonal_prompt):
+        profile = _profile("Ada")
+        suggestion = AIDiscoverySuggestion.objects.create(
+            profile=profile, suggestion_type="seasonal", title="Last Night", description="", search_query="soup"
+        )
+        AIDiscoverySuggestion.objects.filter(id=suggestion.id).update(created_at=timezone.now() - timedelta(hours=30))
+
+        with patch("apps.ai.services.discover.OpenRouterService") as mock_service:
+            result = get_discover_suggestions(profile.id)
+
+        mock_service.assert_not_called()
+        assert result["suggestions"][0]["title"] == "Last Night"
+
+    def test_types_are_generated_concurrently(self, all_prompts):
+        profile = _profile("Ada", viewed_days_ago=1)
+        in_flight = {"now": 0, "max": 0}
+
+        async def complete_async(**kwargs):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.05)
+            in_flight["now"] -= 1
+            return "mocked"
+
+        service_patch, validator_patch = _ai()
+        with service_patch as service_class, validator_patch:
+            service_class.return_value.complete_async = complete_async
+            suggestions = refresh_discover_suggestions(profile)
+
+        assert in_flight["max"] == 3
+        assert sorted(s.suggestion_type for s in suggestions) == ["favorites", "new", "seasonal"]
+
+    def test_timed_out_type_is_left_out(self, all_prompts):
+        profile = _profile("Ada", viewed_days_ago=1)
+
+        async def complete_async(feature, **kwargs):
+            if feature == "discover_new":
+                await asyncio.sleep(5)
+            return "mocked"
+
+        service_patch, validator_patch = _ai()
+        with (
+            service_patch as service_class,
+            validator_patch,
+            patch("apps.ai.services.discover.GENERATION_TIMEOUT", 0.1),
+        ):
+            service_class.return_value.complete_async = complete_async
+            result = get_discover_suggestions(profile.id)
+
+        assert sorted(s["type"] for s in result["suggestions"]) == ["favorites", "seasonal"]
+        assert AIDiscoverySuggestion.objects.filter(profile=profile).count() == 2
+
+
+@pytest.mark.django_db
+class TestPrecomputeDiscoverCommand:
+    def _run(self, *args):
+        out = StringIO()
+        with (
+            patch("apps.ai.management.commands.precompute_discover.OpenRouterService.is_available", return_value=True),
+            patch("apps.ai.management.commands.precompute_discover.time.sleep") as sleep,
+        ):
+            call_command("precompute_discover", *args, stdout=out, stderr=StringIO())
+        return out.getvalue(), sleep
+
+    def test_refreshes_only_active_profiles_staggered(self, seasonal_prompt):
+        active = [_profile("Ada", viewed_days_ago=1), _profile("Grace", viewed_days_ago=3)]
+        inactive = _profile("Linus", viewed_days_ago=30)
+        service_patch, validator_patch = _ai()
+
+        with service_patch, validator_patch:
+            output, sleep = self._run("--stagger=5")
+
+        assert {s.profile_id for s in AIDiscoverySuggestion.objects.all()} == {p.id for p in active}
+        assert not AIDiscoverySuggestion.objects.filter(profile=inactive).exists()
+        sleep.assert_called_once_with(5.0)
+        assert "Refreshed Discover suggestions for 2 profile(s), 0 failed." in output
+
+    def test_dry_run_lists_profiles(self, seasonal_prompt):
+        profile = _profile("Ada", viewed_days_ago=1)
+
+        with patch("apps.ai.services.discover.OpenRouterService") as mock_service:
+            output, _ = self._run("--dry-run")
+
+        mock_service.assert_not_called()
+        assert f"1 active profile(s): {profile.id}" in output
+
+    def test_skips_without_api_key(self, seasonal_prompt):
+        _profile("Ada", viewed_days_ago=1)
+        out = StringIO()
+
+        with patch("apps.ai.services.discover.OpenRouterService") as mock_service:
+            call_command("precompute_discover", stdout=out)
+
+        mock_service.assert_not_called()
+        assert "AI is not configured" in out.getvalue()
@@ -61,34 +61,34 @@ class TestUpdatePreferences:
         assert response.status_code == 200
         assert response.json()["theme"] == "dark"
 
-    def test_unit_preference_writes_disabled(self, client, settings):
-        """v1.64+: unit_preference UI is hidden because conversion is only wired
-        into AI scaling, not display/scrape/cook. The endpoint rejects writes to
-        prevent silent partial behavior. Stored value (default 'metric') is
-        preserved for the AI scaling read-path."""
+    def test_passkey_mode_unit_preference(self, client, settings):
         settings.AUTH_MODE = "passkey"
         user = _create_user("imperial")
         _login(client, user)
-        response = self._patch(client, user.profile.id, {"unit_preference": "imperial"})
-        assert response.status_code == 400
-        assert response.json()["error"] == "feature_disabled"
+        response = self._patch(client, user.profile.id, {"unit_preference": "imperial", "convert_units": True})
+        assert response.status_code == 200
+        assert response.json()["unit_preference"] == "imperial"
+        assert response.json()["convert_units"] is True
         user.profile.refresh_from_db()
-        assert user.profile.unit_preference == "metric"  # stored value untouched
+        assert user.profile.unit_preference == "imperial"
+        assert user.profile.convert_units is True
 
-    def test_combined_payload_rejected_when_unit_set(self, client, settings):
-        """If a payload includes unit_preference alongside theme, the whole
-        request is rejected — theme must NOT be partially applied. Atomic."""
+    def test_invalid_unit_rejected_atomically(self, client, settings):
+        """A bad unit_preference rejects the whole request — theme must NOT be
+        partially applied."""
         settings.AUTH_MODE = "passkey"
         user = _create_user("both")
         _login(client, user)
         response = self._patch(
             client,
             user.profile.id,
-            {"theme": "dark", "unit_preference": "imperial"},
+            {"theme": "dark", "unit_preference": "us"},
         )
         assert response.status_code == 400
+        assert response.json()["error"] == "validation_error"
         user.profile.refresh_from_db()
         assert user.profile.theme == "light"  # unchanged — not partially applied
+        assert user.profile.unit_preference == "metric"
 
     def test_cross_profile_forbidden(self, client, settings):
         """Callers may only modify their OWN profile. No cross-user update."""
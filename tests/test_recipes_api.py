@@ -8,6 +8,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from django.core.cache import cache
 from django.test import Client
 
+from tests._http_test_helpers import stream_body
+
 
 @pytest.fixture
 def client():
@@ -347,6 +349,7 @@ class TestScrapeRecipe:
             language = ""
             links = []
             ai_tips = []
+            step_timers = []
             is_remix = False
             remix_profile_id = None
             scraped_at = datetime.now()
@@ -809,9 +812,9 @@ class TestSearchRecipesAPI:
 class TestRecipeScrapeCreatesNewRecords:
     """Test that re-scraping same URL creates new records."""
 
-    @patch("apps.recipes.services.scraper.threading")
+    @patch("apps.recipes.services.scraper.enqueue_job")
     @patch("apps.recipes.services.scraper.AsyncSession")
-    async def test_scrape_same_url_twice_creates_two_records(self, mock_session_class, mock_threading, test_profile):
+    async def test_scrape_same_url_twice_creates_two_records(self, mock_session_class, mock_enqueue_job, test_profile):
         """Test that scraping same URL twice creates two recipes."""
         from apps.recipes.models import Recipe
         from apps.recipes.services.scraper import RecipeScraper
@@ -835,10 +838,7 @@ class TestRecipeScrapeCreatesNewRecords:
         </html>
         """
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = mock_html
-        mock_response.headers = {}
+        mock_response = stream_body(MagicMock(status_code=200, headers={}), mock_html)
 
         mock_session = MagicMock()
         mock_session.get = AsyncMock(return_value=mock_response)
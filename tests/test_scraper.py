@@ -2,10 +2,15 @@
 Tests for recipe scraper service.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from django.core.files.base import ContentFile
+
 from apps.recipes.services.scraper import RecipeScraper, FetchError, ParseError
+from tests._http_test_helpers import stream_body
 
 
 class TestScraperHelpers:
@@ -186,6 +191,23 @@ class TestScraperParseRecipe:
             self.scraper._parse_recipe("<html></html>", "https://example.com")
 
 
+class TestScraperStreamedFetch:
+    """Tests for streamed page fetches."""
+
+    @patch("apps.recipes.services.scraper.AsyncSession")
+    async def test_fetch_aborts_when_body_exceeds_limit(self, mock_session_class):
+        mock_response = stream_body(MagicMock(status_code=200, headers={}), b"x" * 200, chunk_size=50)
+        mock_session = MagicMock()
+        mock_session.get = AsyncMock(return_value=mock_response)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session_class.return_value = mock_session
+
+        with pytest.raises(FetchError, match="too large"):
+            await RecipeScraper()._fetch_with_redirects("https://example.com/r", "chrome", 100)
+        assert mock_session.get.call_args.kwargs["stream"] is True
+
+
 @pytest.mark.django_db(transaction=True)
 class TestScraperIntegration:
     """Integration tests for recipe scraper."""
@@ -236,7 +258,7 @@ class TestScraperIntegration:
         # Mock the session and response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = mock_html_response
+        stream_body(mock_response, mock_html_response)
         mock_response.headers = {"content-type": "text/html"}
 
         mock_session = MagicMock()
@@ -284,12 +306,12 @@ class TestScraperIntegration:
         # Mock HTML response
         mock_html_resp = MagicMock()
         mock_html_resp.status_code = 200
-        mock_html_resp.text = mock_html_response
+        stream_body(mock_html_resp, mock_html_response)
 
         # Mock image response
         mock_img_resp = MagicMock()
         mock_img_resp.status_code = 200
-        mock_img_resp.content = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"  # PNG header
+        stream_body(mock_img_resp, b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")  # PNG header
         mock_img_resp.headers = {"content-type": "image/png"}
 
         mock_session = MagicMock()
@@ -304,3 +326,117 @@ class TestScraperIntegration:
         assert recipe.image_url == "https://example.com/cookie.jpg"
         # Image should be attached
         assert recipe.image.name != ""
+
+
+@pytest.mark.django_db(transaction=True)
+class TestScrapeUrlPipeline:
+    """The image fetch overlaps parsing and saving the recipe."""
+
+    URL = "https://www.example.com/recipe/test"
+    HTML = (
+        '<html><head><script type="application/ld+json">{"@type": "Recipe", "name": "Cookies",'
+        ' "image": "https://example.com/cookie.jpg", "recipeIngredient": ["flour"],'
+        ' "recipeInstructions": ["Bake"]}</script></head><body></body></html>'
+    )
+
+    @pytest.fixture
+    def test_profile(self):
+        from apps.profiles.models import Profile
+
+        return Profile.objects.create(name="Test User", avatar_color="#d97850")
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = RecipeScraper()
+        scraper._fetch_html = AsyncMock(return_value=self.HTML)
+        return scraper
+
+    async def test_image_download_starts_before_parse_finishes(self, scraper, test_profile):
+        import time
+
+        events = []
+        parse = scraper._parse_recipe
+
+        def slow_parse(html, url):
+            time.sleep(0.1)
+            events.append("parsed")
+            return parse(html, url)
+
+        async def download(image_url):
+            events.append(f"download {image_url}")
+            return ContentFile(b"\x89PNG\r\n\x1a\n")
+
+        with (
+            patch.object(scraper, "_parse_recipe", side_effect=slow_parse),
+            patch.object(scraper, "_download_image", side_effect=download),
+        ):
+            recipe = await scraper.scrape_url(self.URL, test_profile)
+
+        assert events == ["download https://example.com/cookie.jpg", "parsed"]
+        assert recipe.image.name != ""
+
+    async def test_restarts_image_fetch_when_parsed_url_differs(self, scraper, test_profile):
+        parse = scraper._parse_recipe
+
+        def parse_other_image(html, url):
+            data = parse(html, url)
+            data["image_url"] = "https://example.com/other.jpg"
+            return data
+
+        with (
+            patch.object(scraper, "_parse_recipe", side_effect=parse_other_image),
+            patch.object(scraper, "_download_image", AsyncMock(return_value=None)) as mock_download,
+        ):
+            recipe = await scraper.scrape_url(self.URL, test_profile)
+
+        assert mock_download.await_args_list[-1].args == ("https://example.com/other.jpg",)
+        assert recipe.image_url == "https://example.com/other.jpg"
+
+    async def test_parse_error_cancels_image_fetch(self, scraper, test_profile):
+        tasks = []
+        start_image_task = scraper._start_image_task
+
+        def capture(image_url):
+            tasks.append(start_image_task(image_url))
+            return tasks[-1]
+
+        with (
+            patch.object(scraper, "_start_image_task", side_effect=capture),
+            patch.object(scraper, "_parse_recipe", side_effect=ParseError("bad page")),
+        ):
+            with pytest.raises(ParseError):
+                await scraper.scrape_url(self.URL, test_profile)
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert len(tasks) == 1
+        assert tasks[0].cancelled()
+
+    async def test_image_failure_keeps_recipe_without_image(self, scraper, test_profile):
+        with patch.object(scraper, "_download_image", AsyncMock(side_effect=FileNotFoundError("gone"))):
+            recipe = await scraper.scrape_url(self.URL, test_profile)
+
+        assert recipe.pk is not None
+        assert recipe.image.name == ""
+
+    async def test_reuses_cached_search_image(self, scraper, test_profile):
+        from asgiref.sync import sync_to_async
+
+        from apps.recipes.models import CachedSearchImage
+
+        @sync_to_async
+        def create_cached():
+            cached = CachedSearchImage(
+                external_url="https://example.com/cookie.jpg", status=CachedSearchImage.STATUS_SUCCESS
+            )
+            cached.image.save("search_test.jpg", ContentFile(b"\xff\xd8cached"), save=True)
+            return cached
+
+        cached = await create_cached()
+        with patch.object(scraper, "_download_image", AsyncMock()) as mock_download:
+            recipe = await scraper.scrape_url(self.URL, test_profile)
+
+        mock_download.assert_not_called()
+        with recipe.image.open("rb") as f:
+            assert f.read() == b"\xff\xd8cached"
+        await sync_to_async(cached.refresh_from_db)()
+        assert cached.last_accessed_at is not None
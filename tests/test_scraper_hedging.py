@@ -0,0 +1,118 @@
+"""
+Tests for hedged browser-profile fetches in the recipe scraper.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from apps.recipes.services import fingerprint
+from apps.recipes.services.fingerprint import BROWSER_PROFILES, get_profiles_for_host, remember_profile
+from apps.recipes.services.hedging import AllAttemptsFailed, first_success
+from apps.recipes.services.scraper import FetchError, RecipeScraper
+
+
+@pytest.fixture(autouse=True)
+def _forget_profiles():
+    fingerprint._last_good_profiles.clear()
+    yield
+    fingerprint._last_good_profiles.clear()
+
+
+def _attempts(behaviours):
+    """Build an attempt() whose per-candidate behaviour is (delay, result-or-exception)."""
+    started, cancelled = [], []
+
+    async def attempt(candidate):
+        started.append(candidate)
+        delay, outcome = behaviours[candidate]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(candidate)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return attempt, started, cancelled
+
+
+class TestFirstSuccess:
+    async def test_fast_first_candidate_wins_alone(self):
+        attempt, started, _ = _attempts({"a": (0, "A"), "b": (0, "B")})
+
+        assert await first_success(["a", "b"], attempt, hedge_delay=1) == ("a", "A")
+        assert started == ["a"]
+
+    async def test_slow_candidate_is_hedged_and_cancelled(self):
+        attempt, started, cancelled = _attempts({"a": (5, "A"), "b": (0, "B")})
+
+        assert await first_success(["a", "b"], attempt, hedge_delay=0.01) == ("b", "B")
+        assert started == ["a", "b"]
+        assert cancelled == ["a"]
+
+    async def test_failure_starts_next_without_waiting(self):
+        attempt, started, _ = _attempts({"a": (0, RuntimeError("403")), "b": (0, None), "c": (0, "C")})
+
+        assert await first_success(["a", "b", "c"], attempt, hedge_delay=60) == ("c", "C")
+        assert started == ["a", "b", "c"]
+
+    async def test_fatal_error_cancels_pending_and_propagates(self):
+        attempt, _, cancelled = _attempts({"a": (5, "A"), "b": (0, LookupError("404"))})
+
+        with pytest.raises(LookupError):
+            await first_success(["a", "b"], attempt, hedge_delay=0.01, fatal=(LookupError,))
+        assert cancelled == ["a"]
+
+    async def test_all_failed_collects_errors(self):
+        attempt, _, _ = _attempts({"a": (0, RuntimeError("boom")), "b": (0, None)})
+
+        with pytest.raises(AllAttemptsFailed) as exc_info:
+            await first_success(["a", "b"], attempt, hedge_delay=1)
+        assert exc_info.value.errors == ["a: boom", "b: empty response"]
+
+
+class TestProfileMemory:
+    def test_unknown_host_uses_default_order(self):
+        assert get_profiles_for_host("example.com") == BROWSER_PROFILES
+
+    def test_remembered_profile_goes_first(self):
+        remember_profile("example.com", "safari")
+
+        profiles = get_profiles_for_host("example.com")
+        assert profiles[0] == "safari"
+        assert sorted(profiles) == sorted(BROWSER_PROFILES)
+
+    def test_memory_is_bounded(self):
+        with patch.object(fingerprint, "MAX_REMEMBERED_HOSTS", 2):
+            for host in ("a.com", "b.com", "c.com"):
+                remember_profile(host, "safari")
+        assert list(fingerprint._last_good_profiles) == ["b.com", "c.com"]
+
+
+class TestScraperHedging:
+    async def test_fetch_html_remembers_winning_profile(self):
+        scraper = RecipeScraper()
+        scraper.hedge_delay = 0.01
+
+        async def fetch(url, profile, max_size, curl_resolve=None):
+            if profile == "chrome":
+                await asyncio.sleep(5)
+            return f"<html>{profile}</html>"
+
+        with patch.object(scraper, "_fetch_with_redirects", side_effect=fetch) as mock_fetch:
+            assert await scraper._fetch_html("https://www.example.com/r") == "<html>safari</html>"
+            assert get_profiles_for_host("www.example.com")[0] == "safari"
+
+            mock_fetch.reset_mock()
+            await scraper._fetch_html("https://www.example.com/other")
+        assert mock_fetch.call_args_list[0].args[1] == "safari"
+
+    async def test_fetch_error_is_not_hedged_over(self):
+        scraper = RecipeScraper()
+
+        with patch.object(scraper, "_fetch_with_redirects", side_effect=FetchError("Recipe page not found")):
+            with pytest.raises(FetchError, match="not found"):
+                await scraper._fetch_html("https://example.com/missing")
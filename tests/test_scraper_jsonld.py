@@ -0,0 +1,201 @@
+"""
+Tests for the JSON-LD recipe extraction fast path.
+"""
+
+import json
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.recipes.services.jsonld import extract_jsonld_recipe, iter_jsonld_blocks, peek_image_url
+from apps.recipes.services.scraper import RecipeScraper
+
+URL = "https://www.example.com/recipes/cookies"
+
+RECIPE = {
+    "@context": "https://schema.org",
+    "@type": "Recipe",
+    "name": "Chocolate Chip Cookies",
+    "author": {"@type": "Person", "name": "Jane Baker"},
+    "description": "Classic cookies.",
+    "image": ["https://example.com/cookies.jpg"],
+    "recipeIngredient": ["2 cups flour", "1 cup  sugar", ""],
+    "recipeInstructions": [
+        {"@type": "HowToStep", "text": "Mix ingredients."},
+        {"@type": "HowToStep", "text": "Bake at 350F."},
+    ],
+    "prepTime": "PT15M",
+    "cookTime": "PT10M",
+    "recipeYield": "24",
+    "recipeCategory": ["Dessert", "Snack"],
+    "recipeCuisine": "American",
+    "keywords": "cookies, baking, cookies",
+    "nutrition": {"@type": "NutritionInformation", "calories": "150 kcal"},
+    "aggregateRating": {"@type": "AggregateRating", "ratingValue": "4.56", "ratingCount": "120"},
+}
+
+
+def _page(*payloads, head="", body=""):
+    scripts = "".join(f'<script type="application/ld+json">{json.dumps(p)}</script>' for p in payloads)
+    return f'<html lang="en"><head>{head}{scripts}</head><body>{body}</body></html>'
+
+
+class TestIterJsonldBlocks:
+    def test_skips_malformed_block(self):
+        html = '<script type="application/ld+json">{not json</script>' + _page(RECIPE)
+        assert [b["name"] for b in iter_jsonld_blocks(html)] == ["Chocolate Chip Cookies"]
+
+    def test_strips_html_comment_wrapper(self):
+        html = '<script type="application/ld+json"><!-- {"@type": "Recipe"} --></script>'
+        assert list(iter_jsonld_blocks(html)) == [{"@type": "Recipe"}]
+
+
+class TestExtractJsonldRecipe:
+    def test_basic_fields(self):
+        data = extract_jsonld_recipe(_page(RECIPE), URL)
+
+        assert data["title"] == "Chocolate Chip Cookies"
+        assert data["author"] == "Jane Baker"
+        assert data["image_url"] == "https://example.com/cookies.jpg"
+        assert data["ingredients"] == ["2 cups flour", "1 cup sugar"]
+        assert data["ingredient_groups"] == [{"purpose": None, "ingredients": data["ingredients"]}]
+        assert data["instructions"] == ["Mix ingredients.", "Bake at 350F."]
+        assert data["instructions_text"] == "Mix ingredients.\nBake at 350F."
+        assert (data["prep_time"], data["cook_time"], data["total_time"]) == (15, 10, 25)
+        assert data["yields"] == "24 servings"
+        assert data["category"] == "Dessert,Snack"
+        assert data["keywords"] == ["cookies", "baking"]
+        assert data["nutrition"] == {"calories": "150 kcal"}
+        assert data["rating"] == 4.56
+        assert data["rating_count"] == 120
+        assert data["language"] == "en"
+        assert data["canonical_url"] == URL
+
+    def test_graph_with_referenced_author_and_site(self):
+        recipe = {**RECIPE, "author": {"@id": "#jane"}}
+        del recipe["@context"]
+        graph = {
+            "@context": "https://schema.org",
+            "@graph": [
+                {"@type": "WebSite", "name": "Example Kitchen"},
+                {"@type": "Person", "@id": "#jane", "name": "Jane Baker"},
+                recipe,
+            ],
+        }
+        data = extract_jsonld_recipe(_page(graph), URL)
+
+        assert data["author"] == "Jane Baker"
+        assert data["site_name"] == "Example Kitchen"
+
+    def test_list_payload_and_head_metadata(self):
+        recipe = {**RECIPE, "image": None}
+        head = (
+            '<link rel="canonical" href="/recipes/cookies-canonical">'
+            '<meta property="og:site_name" content="Example">'
+            '<meta property="og:image" content="https://example.com/og.jpg">'
+        )
+        data = extract_jsonld_recipe(_page([{"@type": "Organization"}, recipe], head=head), URL)
+
+        assert data["canonical_url"] == "https://www.example.com/recipes/cookies-canonical"
+        assert data["site_name"] == "Example"
+        assert data["image_url"] == "https://example.com/og.jpg"
+
+    def test_how_to_sections_are_flattened(self):
+        recipe = {
+            **RECIPE,
+            "recipeInstructions": [
+                {
+                    "@type": "HowToSection",
+                    "name": "Dough",
+                    "itemListElement": [{"@type": "HowToStep", "text": "Cream butter."}],
+                },
+                {"@type": "HowToSection", "name": "Bake", "itemListElement": {"@type": "HowToStep", "text": "Bake."}},
+            ],
+        }
+        data = extract_jsonld_recipe(_page(recipe), URL)
+
+        assert data["instructions"] == ["Dough", "Cream butter.", "Bake", "Bake."]
+
+    def test_recipe_as_webpage_main_entity(self):
+        page = {"@type": "WebPage", "mainEntity": RECIPE}
+        assert extract_jsonld_recipe(_page(page), URL)["title"] == "Chocolate Chip Cookies"
+
+    @pytest.mark.parametrize("field", ["name", "recipeIngredient", "recipeInstructions"])
+    def test_missing_required_field_returns_none(self, field):
+        recipe = {k: v for k, v in RECIPE.items() if k != field}
+        assert extract_jsonld_recipe(_page(recipe), URL) is None
+
+    def test_no_recipe_returns_none(self):
+        assert extract_jsonld_recipe(_page({"@type": "Article", "name": "News"}), URL) is None
+        assert extract_jsonld_recipe("<html><body>No schema</body></html>", URL) is None
+
+    def test_grouped_ingredient_markup_returns_none(self):
+        html = _page(RECIPE, body='<div class="wprm-recipe-group-name">For the dough</div>')
+        assert extract_jsonld_recipe(html, URL) is None
+
+
+class TestPeekImageUrl:
+    def test_prefers_recipe_image(self):
+        head = '<meta property="og:image" content="https://example.com/og.jpg">'
+        assert peek_image_url(_page(RECIPE, head=head)) == "https://example.com/cookies.jpg"
+
+    def test_falls_back_to_og_image(self):
+        head = '<meta property="og:image" content="https://example.com/og.jpg">'
+        assert peek_image_url(f"<html><head>{head}</head></html>") == "https://example.com/og.jpg"
+        assert peek_image_url("<html></html>") == ""
+
+
+class TestParseRecipeFastPath:
+    def setup_method(self):
+        self.scraper = RecipeScraper()
+
+    @patch("apps.recipes.services.scraper.scrape_html")
+    def test_jsonld_page_skips_recipe_scrapers(self, mock_scrape_html):
+        data = self.scraper._parse_recipe(_page(RECIPE), URL)
+
+        mock_scrape_html.assert_not_called()
+        assert data["host"] == "example.com"
+        assert data["servings"] == 24
+        assert data["title"] == "Chocolate Chip Cookies"
+
+    def test_fast_path_output_is_sanitized(self):
+        recipe = {**RECIPE, "description": "<b>Bold</b> cookies"}
+        data = self.scraper._parse_recipe(_page(recipe), URL)
+
+        assert data["description"] == "Bold cookies"
+
+    @patch("apps.recipes.services.scraper.scrape_html")
+    def test_grouped_page_uses_recipe_scrapers(self, mock_scrape_html):
+        mock_scrape_html.return_value.title.return_value = "Grouped Recipe"
+        mock_scrape_html.return_value.yields.return_value = "4 servings"
+        html = _page(RECIPE, body='<div class="wprm-recipe-group-name">Sauce</div>')
+
+        data = self.scraper._parse_recipe(html, URL)
+
+        mock_scrape_html.assert_called_once()
+        assert data["title"] == "Grouped Recipe"
+
+
+class TestBenchmarkCommand:
+    def test_reports_fast_path_coverage(self, tmp_path):
+        (tmp_path / "jsonld.html").write_text(_page(RECIPE))
+        (tmp_path / "plain.html").write_text("<html><body><h1>Not a recipe</h1></body></html>")
+        out = StringIO()
+
+        call_command("benchmark_recipe_parser", str(tmp_path), "--repeat=1", stdout=out)
+
+        output = out.getvalue()
+        assert "plain.html: fallback to recipe-scrapers" in output
+        assert "Fast path handled 1/2 page(s) (50%)" in output
+        assert "faster" in output
+
+    def test_missing_corpus_raises(self, tmp_path):
+        with pytest.raises(CommandError, match="not found"):
+            call_command("benchmark_recipe_parser", str(tmp_path / "missing"))
+
+    def test_empty_corpus_raises(self, tmp_path):
+        with pytest.raises(CommandError, match="No \\*.html files"):
+            call_command("benchmark_recipe_parser", str(tmp_path))
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from apps.recipes.services.search import RecipeSearch, SearchResult
 from apps.recipes.services.search_parsers import extract_result_from_element
+from tests._http_test_helpers import stream_body
 
 
 class TestSearchResultDataclass:
@@ -218,6 +219,45 @@ class TestParseSearchResults:
         assert result.rating_count == 1
 
 
+class TestFetchUrlStreaming:
+    """Tests for streamed search page fetches."""
+
+    @staticmethod
+    def _session_returning(response):
+        mock_session = MagicMock()
+        mock_session.get = AsyncMock(return_value=response)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        return mock_session
+
+    @patch("apps.recipes.services.search.AsyncSession")
+    async def test_stops_reading_after_main_closes(self, mock_session_class):
+        html = "<html><body><main><article>Result</article></main><footer>" + "x" * 5000 + "</footer></body></html>"
+        mock_response = stream_body(MagicMock(status_code=200, headers={}), html, chunk_size=32)
+        mock_session = self._session_returning(mock_response)
+        mock_session_class.return_value = mock_session
+
+        status_code, body = await RecipeSearch()._fetch_url(mock_session, "https://www.allrecipes.com/search?q=x")
+
+        assert status_code == 200
+        assert body == "<html><body><main><article>Result</article></main>"
+        assert mock_session.get.call_args.kwargs["stream"] is True
+
+    @patch("apps.recipes.services.search.AsyncSession")
+    async def test_oversized_page_raises(self, mock_session_class):
+        mock_response = MagicMock(status_code=200, headers={"content-length": str(20 * 1024 * 1024)})
+        mock_session_class.return_value = self._session_returning(mock_response)
+
+        with pytest.raises(ValueError, match="too large"):
+            await RecipeSearch()._fetch_url(MagicMock(), "https://www.allrecipes.com/search?q=x")
+
+    @patch("apps.recipes.services.search.AsyncSession")
+    async def test_non_200_returns_empty_body(self, mock_session_class):
+        mock_session_class.return_value = self._session_returning(MagicMock(status_code=503, headers={}))
+
+        assert await RecipeSearch()._fetch_url(MagicMock(), "https://www.allrecipes.com/search?q=x") == (503, "")
+
+
 @pytest.mark.django_db(transaction=True)
 class TestSearchService:
     """Integration tests for RecipeSearch service."""
@@ -253,7 +293,9 @@ class TestSearchService:
         # Mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = """
+        stream_body(
+            mock_response,
+            """
         <html><body>
             <article>
                 <a href="/recipe/123/cookies">
@@ -261,7 +303,8 @@ class TestSearchService:
                 </a>
             </article>
         </body></html>
-        """
+        """,
+        )
 
         mock_session = MagicMock()
         mock_session.get = AsyncMock(return_value=mock_response)
@@ -329,7 +372,9 @@ class TestSearchService:
         # Create mock response with multiple results
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = """
+        stream_body(
+            mock_response,
+            """
         <html><body>
             <article><a href="/recipe/1/r1"><h2>Recipe 1</h2></a></article>
             <article><a href="/recipe/2/r2"><h2>Recipe 2</h2></a></article>
@@ -337,7 +382,8 @@ class TestSearchService:
             <article><a href="/recipe/4/r4"><h2>Recipe 4</h2></a></article>
             <article><a href="/recipe/5/r5"><h2>Recipe 5</h2></a></article>
         </body></html>
-        """
+        """,
+        )
 
         mock_session = MagicMock()
         mock_session.get = AsyncMock(return_value=mock_response)
@@ -366,12 +412,15 @@ class TestSearchService:
         """Test that duplicate URLs are removed from results."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = """
+        stream_body(
+            mock_response,
+            """
         <html><body>
             <article><a href="/recipe/123/cookies"><h2>Cookies A</h2></a></article>
             <article><a href="/recipe/123/cookies"><h2>Cookies B</h2></a></article>
         </body></html>
-        """
+        """,
+        )
 
         mock_session = MagicMock()
         mock_session.get = AsyncMock(return_value=mock_response)
@@ -499,7 +548,9 @@ class TestSearchSourceTracking:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '<html><body><article><a href="/recipe/123/test"><h2>Test</h2></a></article></body></html>'
+        stream_body(
+            mock_response, '<html><body><article><a href="/recipe/123/test"><h2>Test</h2></a></article></body></html>'
+        )
 
         mock_session = MagicMock()
         mock_session.get = AsyncMock(return_value=mock_response)
@@ -0,0 +1,185 @@
+"""
+Tests for local similar-recipe recommendations.
+
+Tests apps/recipes/services/similar.py and apps/recipes/api_recommendations.py:
+- Recipes are described by ingredient, keyword, cuisine, category and title terms
+- "More like this" ranks the profile's recipes by cosine similarity
+- The per-profile index picks up added, edited and deleted recipes, locked per profile
+- "Because you favorited" rows skip favorites and repeat recommendations
+- Endpoints are scoped to the current profile
+"""
+
+import pytest
+from django.test import Client
+
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe, RecipeFavorite
+from apps.recipes.services import similar
+from apps.recipes.services.similar import favorite_recommendations, recipe_terms, similar_recipes
+
+CURRY = ["500 g chicken thighs", "1 onion, diced", "2 tbsp curry paste", "400 ml coconut milk"]
+KORMA = ["600 g chicken breasts", "2 onions", "3 tbsp korma paste", "200 ml coconut milk"]
+DAL = ["250 g red lentils", "1 onion", "1 tbsp curry powder", "400 ml coconut milk"]
+BROWNIES = ["200 g dark chocolate", "150 g butter", "3 eggs", "200 g caster sugar"]
+COOKIES = ["125 g butter", "100 g brown sugar", "1 egg", "150 g dark chocolate chips"]
+
+
+@pytest.fixture
+def profile(db):
+    return Profile.objects.create(name="Cook", avatar_color="#d97850")
+
+
+@pytest.fixture
+def recipes(profile):
+    def make(title, ingredients, **fields):
+        return Recipe.objects.create(
+            profile=profile, host="example.com", title=title, ingredients=ingredients, **fields
+        )
+
+    return {
+        "curry": make("Chicken Curry", CURRY, cuisine="Indian", category="Dinner", keywords=["curry"]),
+        "korma": make("Chicken Korma", KORMA, cuisine="Indian", category="Dinner", keywords=["curry", "mild"]),
+        "dal": make("Coconut Dal", DAL, cuisine="Indian", category="Dinner"),
+        "brownies": make("Fudgy Brownies", BROWNIES, category="Dessert", keywords=["chocolate"]),
+        "cookies": make("Chocolate Chip Cookies", COOKIES, category="Dessert", keywords=["chocolate"]),
+    }
+
+
+def titles(recipes):
+    return [recipe.title for recipe in recipes]
+
+
+class TestRecipeTerms:
+    def test_fields_become_prefixed_terms(self):
+        recipe = Recipe(
+            title="Quick Chicken Curry",
+            ingredients=["2 large onions, finely sliced", "Salt to taste"],
+            keywords=["Weeknight Dinners"],
+            cuisine="Indian, Asian",
+            category="Main",
+        )
+
+        terms = recipe_terms(recipe)
+
+        assert terms["ingredient:onion"] == 1.0
+        assert terms["ingredient:salt"] == 1.0
+        assert terms["keyword:weeknight dinner"] == 1.5
+        assert terms["cuisine:indian"] == terms["cuisine:asian"] == 2.0
+        assert terms["category:main"] == 1.5
+        assert {"title:chicken", "title:curry"} <= set(terms)
+        assert "title:quick" not in terms
+
+    def test_multi_word_ingredients_are_also_whole_names(self):
+        terms = recipe_terms(Recipe(title="", ingredients=["100 g brown sugar"]))
+
+        assert set(terms) == {"ingredient:brown", "ingredient:sugar", "name:brown sugar"}
+
+
+@pytest.mark.django_db
+class TestSimilarRecipes:
+    def test_most_alike_first(self, profile, recipes):
+        similar = similar_recipes(profile, recipes["curry"].id)
+
+        assert titles(similar)[:2] == ["Chicken Korma", "Coconut Dal"]
+        assert "Chicken Curry" not in titles(similar)
+
+    def test_unrelated_recipes_are_left_out(self, profile, recipes):
+        similar = similar_recipes(profile, recipes["brownies"].id)
+
+        assert titles(similar) == ["Chocolate Chip Cookies"]
+
+    def test_limit(self, profile, recipes):
+        assert len(similar_recipes(profile, recipes["curry"].id, limit=1)) == 1
+
+    def test_index_follows_changes(self, profile, recipes):
+        assert titles(similar_recipes(profile, recipes["brownies"].id)) == ["Chocolate Chip Cookies"]
+
+        blondies = Recipe.objects.create(
+            profile=profile, host="example.com", title="Blondies", ingredients=BROWNIES, category="Dessert"
+        )
+        assert "Blondies" in titles(similar_recipes(profile, recipes["brownies"].id))
+
+        blondies.ingredients = DAL
+        blondies.category = "Dinner"
+        blondies.save()
+        recipes["cookies"].delete()
+        assert titles(similar_recipes(profile, recipes["brownies"].id)) == []
+
+    def test_other_profiles_recipes_are_never_suggested(self, profile, recipes):
+        other = Profile.objects.create(name="Other", avatar_color="#000000")
+        Recipe.objects.create(profile=other, host="example.com", title="Chicken Curry", ingredients=CURRY)
+
+        similar = similar_recipes(profile, recipes["korma"].id)
+
+        assert all(recipe.profile_id == profile.id for recipe in similar)
+
+    def test_profiles_sync_independently(self, profile, recipes):
+        similar_recipes(profile, recipes["curry"].id)
+        other = Profile.objects.create(name="Other", avatar_color="#000000")
+        curry = Recipe.objects.create(profile=other, host="example.com", title="Chicken Curry", ingredients=CURRY)
+        korma = Recipe.objects.create(profile=other, host="example.com", title="Chicken Korma", ingredients=KORMA)
+
+        # Syncing another profile doesn't wait on this profile's index
+        with similar._indexes[profile.id].lock:
+            assert similar_recipes(other, curry.id) == [korma]
+
+
+@pytest.mark.django_db
+class TestFavoriteRecommendations:
+    def test_rows_per_favorite(self, profile, recipes):
+        RecipeFavorite.objects.create(profile=profile, recipe=recipes["curry"])
+        RecipeFavorite.objects.create(profile=profile, recipe=recipes["brownies"])
+
+        rows = favorite_recommendations(profile)
+
+        assert [row["favorite"].title for row in rows] == ["Fudgy Brownies", "Chicken Curry"]
+        assert titles(rows[0]["recipes"]) == ["Chocolate Chip Cookies"]
+        assert titles(rows[1]["recipes"])[:2] == ["Chicken Korma", "Coconut Dal"]
+
+    def test_favorites_and_repeats_are_not_recommended(self, profile, recipes):
+        RecipeFavorite.objects.create(profile=profile, recipe=recipes["curry"])
+        RecipeFavorite.objects.create(profile=profile, recipe=recipes["korma"])
+
+        rows = favorite_recommendations(profile)
+        recommended = [recipe.title for row in rows for recipe in row["recipes"]]
+
+        assert "Chicken Curry" not in recommended
+        assert "Chicken Korma" not in recommended
+        assert recommended.count("Coconut Dal") == 1
+
+    def test_no_favorites(self, profile, recipes):
+        assert favorite_recommendations(profile) == []
+
+
+@pytest.mark.django_db
+class TestEndpoints:
+    @pytest.fixture
+    def client(self, profile):
+        client = Client()
+        client.post(f"/api/profiles/{profile.id}/select/")
+        return client
+
+    def test_more_like_this(self, client, recipes):
+        response = client.get(f"/api/recommendations/{recipes['curry'].id}/?limit=1")
+
+        assert response.status_code == 200
+        assert [recipe["title"] for recipe in response.json()] == ["Chicken Korma"]
+
+    def test_more_like_this_other_profile(self, client):
+        other = Profile.objects.create(name="Other", avatar_color="#000000")
+        recipe = Recipe.objects.create(profile=other, host="example.com", title="Chicken Curry", ingredients=CURRY)
+
+        assert client.get(f"/api/recommendations/{recipe.id}/").status_code == 404
+
+    def test_because_you_favorited(self, client, profile, recipes):
+        RecipeFavorite.objects.create(profile=profile, recipe=recipes["brownies"])
+
+        response = client.get("/api/recommendations/")
+
+        assert response.status_code == 200
+        row = response.json()[0]
+        assert row["favorite"]["title"] == "Fudgy Brownies"
+        assert [recipe["title"] for recipe in row["recipes"]] == ["Chocolate Chip Cookies"]
+
+    def test_requires_a_profile(self):
+        assert Client().get("/api/recommendations/").status_code == 401
@@ -8,11 +8,14 @@ from apps.core.validators import (
     validate_redirect_url,
     check_response_size,
     check_content_size,
+    read_limited_body,
+    decode_body,
     is_blocked_ip,
     MAX_HTML_SIZE,
     MAX_IMAGE_SIZE,
     MAX_REDIRECT_HOPS,
 )
+from tests._http_test_helpers import stream_body
 
 
 # ---------------------------------------------------------------------------
@@ -193,6 +196,47 @@ class TestResponseSizeLimits:
             check_content_size(b"x" * (MAX_HTML_SIZE + 1), MAX_HTML_SIZE)
 
 
+class TestReadLimitedBody:
+    """read_limited_body enforces size limits while the body streams in."""
+
+    async def test_reads_whole_body(self):
+        response = stream_body(MagicMock(headers={}), b"a" * 100, chunk_size=7)
+        assert await read_limited_body(response, MAX_HTML_SIZE) == b"a" * 100
+
+    async def test_rejects_content_length_before_reading(self):
+        response = stream_body(MagicMock(headers={"content-length": "101"}), b"")
+        response.aiter_content = MagicMock()
+        with pytest.raises(ValueError, match="too large"):
+            await read_limited_body(response, 100)
+        response.aiter_content.assert_not_called()
+
+    async def test_aborts_mid_stream_once_limit_exceeded(self):
+        chunks_read = []
+
+        async def aiter_content():
+            for i in range(1000):
+                chunks_read.append(i)
+                yield b"x" * 10
+
+        response = MagicMock(headers={}, aiter_content=aiter_content)
+        with pytest.raises(ValueError, match="too large"):
+            await read_limited_body(response, 100)
+        assert len(chunks_read) == 11
+
+    async def test_stop_marker_split_across_chunks(self):
+        html = b"<main><a>1</a></MA" + b"IN><footer>" + b"x" * 500
+        response = stream_body(MagicMock(headers={}), html, chunk_size=16)
+        assert await read_limited_body(response, MAX_HTML_SIZE, b"</main>") == b"<main><a>1</a></MAIN>"
+
+    def test_decode_body_uses_response_charset(self):
+        response = MagicMock(encoding="latin-1")
+        assert decode_body(response, "café".encode("latin-1")) == "café"
+
+    def test_decode_body_unknown_charset_falls_back_to_utf8(self):
+        response = MagicMock(encoding="x-unknown")
+        assert decode_body(response, "café".encode()) == "café"
+
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -249,7 +293,7 @@ class TestImageUrlSsrf:
         from apps.recipes.services.scraper import RecipeScraper
 
         scraper = RecipeScraper()
-        with patch("apps.core.validators.resolve_hostname", return_value="169.254.169.254"):
+        with patch("apps.core.validators.resolve_hostname_async", return_value="169.254.169.254"):
             result = await scraper._download_image("http://evil.com/image.jpg")
         assert result is None
 
@@ -259,7 +303,7 @@ class TestImageUrlSsrf:
         from apps.recipes.services.scraper import RecipeScraper
 
         scraper = RecipeScraper()
-        with patch("apps.core.validators.resolve_hostname", return_value="127.0.0.1"):
+        with patch("apps.core.validators.resolve_hostname_async", return_value="127.0.0.1"):
             result = await scraper._download_image("http://evil.com/image.jpg")
         assert result is None
 
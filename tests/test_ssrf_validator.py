@@ -5,12 +5,23 @@ Verifies that the URL validator blocks internal IPs, private networks,
 dangerous schemes, and DNS rebinding attacks.
 """
 
+import asyncio
 import socket
 from unittest.mock import patch
 
 import pytest
 
-from apps.core.validators import is_blocked_ip, resolve_hostname, validate_url
+from apps.core.validators import (
+    DNS_CACHE_TTL,
+    is_blocked_ip,
+    resolve_hostname,
+    resolve_hostname_async,
+    validate_redirect_url_async,
+    validate_url,
+    validate_url_async,
+)
+
+PUBLIC_ADDRINFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
 
 
 class TestIsBlockedIp:
@@ -166,3 +177,68 @@ class TestValidateUrl:
         mock_getaddrinfo.side_effect = socket.gaierror("Name resolution failed")
         with pytest.raises(ValueError, match="Could not resolve hostname"):
             validate_url("https://definitely-not-real.invalid/page")
+
+
+class TestValidateUrlAsync:
+    """Tests for the non-blocking validator and its validated-IP cache."""
+
+    @patch("apps.core.validators.socket.getaddrinfo", return_value=PUBLIC_ADDRINFO)
+    async def test_resolve_hostname_async_uses_getaddrinfo(self, mock_getaddrinfo):
+        assert await resolve_hostname_async("example.com") == "93.184.216.34"
+
+    @patch("apps.core.validators.socket.getaddrinfo", side_effect=socket.gaierror("Name resolution failed"))
+    async def test_resolve_hostname_async_unresolvable_raises(self, mock_getaddrinfo):
+        with pytest.raises(ValueError, match="Could not resolve hostname"):
+            await resolve_hostname_async("nope.invalid")
+
+    @patch("apps.core.validators.resolve_hostname_async", return_value="93.184.216.34")
+    async def test_pins_same_ip_as_sync_validator(self, mock_resolve):
+        result = await validate_url_async("https://example.com/recipe")
+        assert result.ip == "93.184.216.34"
+        assert "example.com:443:93.184.216.34" in result.curl_resolve
+
+    @patch("apps.core.validators.resolve_hostname_async", return_value="93.184.216.34")
+    async def test_repeat_lookups_hit_cache(self, mock_resolve):
+        for i in range(20):
+            await validate_url_async(f"https://cdn.example.com/img{i}.jpg")
+        assert mock_resolve.await_count == 1
+
+    async def test_concurrent_lookups_share_one_resolution(self):
+        calls = 0
+
+        async def slow_resolve(hostname):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "93.184.216.34"
+
+        with patch("apps.core.validators.resolve_hostname_async", side_effect=slow_resolve):
+            results = await asyncio.gather(*(validate_url_async(f"https://cdn.example.com/{i}") for i in range(20)))
+        assert calls == 1
+        assert {r.ip for r in results} == {"93.184.216.34"}
+
+    @patch("apps.core.validators.resolve_hostname_async", return_value="93.184.216.34")
+    async def test_cache_entry_expires_after_ttl(self, mock_resolve):
+        with patch("apps.core.validators.time.monotonic", return_value=1000.0):
+            await validate_url_async("https://example.com/a")
+        with patch("apps.core.validators.time.monotonic", return_value=1000.0 + DNS_CACHE_TTL + 1):
+            await validate_url_async("https://example.com/b")
+        assert mock_resolve.await_count == 2
+
+    @patch("apps.core.validators.resolve_hostname_async", return_value="169.254.169.254")
+    async def test_blocked_ip_is_rejected_and_not_cached(self, mock_resolve):
+        for _ in range(2):
+            with pytest.raises(ValueError, match="blocked IP range"):
+                await validate_url_async("http://evil.example.com/")
+        assert mock_resolve.await_count == 2
+
+    async def test_rejects_bad_scheme_without_lookup(self):
+        with patch("apps.core.validators.resolve_hostname_async") as mock_resolve:
+            with pytest.raises(ValueError, match="scheme not allowed"):
+                await validate_url_async("file:///etc/passwd")
+        mock_resolve.assert_not_called()
+
+    @patch("apps.core.validators.resolve_hostname_async", return_value="127.0.0.1")
+    async def test_redirect_to_blocked_ip_raises(self, mock_resolve):
+        with pytest.raises(ValueError, match="blocked IP range"):
+            await validate_redirect_url_async("http://rebind.example.com/")
@@ -0,0 +1,176 @@
+"""
+Tests for cook mode step timers.
+
+Tests apps/recipes/services/timers.py and label_recipe_timers() in
+apps/ai/services/timer.py:
+- Durations are parsed from instruction text locally, with heuristic labels
+- Older recipes get their timers extracted the first time they are opened
+- One AI call relabels all of a recipe's timers and the labels are stored
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.ai.services.timer import label_recipe_timers, run_timer_labels_job
+from apps.ai.services.validator import ValidationError
+from apps.core.models import AppSettings, BackgroundJob
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe
+from apps.recipes.services.timers import ensure_step_timers, extract_step_timers, timer_label
+
+
+class TestExtractStepTimers:
+    @pytest.mark.parametrize(
+        "step,seconds",
+        [
+            ("Simmer for 20 minutes.", [1200]),
+            ("Bake for 25-30 minutes until golden.", [1500]),
+            ("Cook pasta for 8 to 10 mins.", [480]),
+            ("Roast for 1 hour 15 minutes.", [4500]),
+            ("Braise for 2 hrs and 30 mins.", [9000]),
+            ("Let rise for 1½ hours.", [5400]),
+            ("Chill for half an hour.", [1800]),
+            ("Microwave for 30 seconds.", [30]),
+            ("Bake 1.5 hours.", [5400]),
+            ("Simmer 2.5 minutes. Serve.", [150]),
+            ("Fry for five minutes, then rest for a minute.", [300, 60]),
+            ("Steam for 10 minutes. Rest for 10 minutes.", [600]),
+            ("Preheat the oven to 200C. Add 2 medium onions.", []),
+            ("Bake for 2h, then 30m more.", [7200, 1800]),
+            ("Microwave for 45s.", [45]),
+            ("Simmer for 5 m and stir.", [300]),
+            ("Roast for 1 hour 30m.", [5400]),
+            ("Place the 2 s-shaped cookies on a tray.", []),
+            ("Scatter over 4 M&Ms per cookie.", []),
+        ],
+    )
+    def test_durations(self, step, seconds):
+        assert [timer["seconds"] for timer in extract_step_timers([step])[0]] == seconds
+
+    @pytest.mark.parametrize(
+        "sentence,label",
+        [
+            ("Simmer the sauce for 20 minutes.", "Simmer Sauce"),
+            ("Let the dough rest for 1 hour.", "Rest Dough"),
+            ("Leave the batter to stand for 10 minutes.", "Rest Batter"),
+            ("Fry the onions in a large pan for 5 minutes.", "Fry Onions"),
+            ("Bake at 180C for 25 minutes.", "Bake"),
+            ("Place in the oven for 45 minutes.", None),
+        ],
+    )
+    def test_labels(self, sentence, label):
+        assert timer_label(sentence) == label
+
+    def test_one_list_per_step_with_fallback_label(self):
+        step_timers = extract_step_timers(["Chop the onions.", "Place in the oven for 45 minutes."])
+
+        assert step_timers == [[], [{"seconds": 2700, "label": "Step 2", "source": "local"}]]
+
+    def test_decimal_duration_keeps_its_label(self):
+        assert extract_step_timers(["Bake the loaf for 1.5 hours."]) == [
+            [{"seconds": 5400, "label": "Bake Loaf", "source": "local"}]
+        ]
+
+
+@pytest.fixture
+def recipe(db):
+    profile = Profile.objects.create(name="Test", avatar_color="#d97850")
+    return Recipe.objects.create(
+        profile=profile,
+        title="Bolognese",
+        host="example.com",
+        instructions=["Fry the onions for 5 minutes.", "Add the mince.", "Simmer the sauce for 1 hour."],
+    )
+
+
+@pytest.mark.django_db
+class TestEnsureStepTimers:
+    def test_extracts_and_saves_for_older_recipes(self, recipe):
+        ensure_step_timers(recipe)
+
+        recipe.refresh_from_db()
+        assert [[t["label"] for t in step] for step in recipe.step_timers] == [["Fry Onions"], [], ["Simmer Sauce"]]
+
+    def test_stored_timers_are_kept(self, recipe, django_assert_num_queries):
+        stored = [[], [], [{"seconds": 3600, "label": "Slow Simmer", "source": "ai"}]]
+        recipe.step_timers = stored
+        recipe.save()
+
+        with django_assert_num_queries(0):
+            assert ensure_step_timers(recipe) == stored
+
+    def test_recipe_api_includes_step_timers(self, client, recipe):
+        client.post(f"/api/profiles/{recipe.profile_id}/select/")
+
+        response = client.get(f"/api/recipes/{recipe.id}/")
+
+        assert response.status_code == 200
+        assert response.json()["step_timers"][2] == [{"seconds": 3600, "label": "Simmer Sauce", "source": "local"}]
+
+
+def _ai(response):
+    service = MagicMock()
+    service.complete.return_value = response
+    return patch("apps.ai.services.timer.OpenRouterService", return_value=service), service
+
+
+@pytest.mark.django_db
+class TestLabelRecipeTimers:
+    def test_one_call_labels_every_timer(self, recipe):
+        service_patch, service = _ai(["Soften onions", "Simmer ragu"])
+
+        with service_patch:
+            step_timers = label_recipe_timers(recipe.id)
+
+        service.complete.assert_called_once()
+        user_prompt = service.complete.call_args.kwargs["user_prompt"]
+        assert "1. 5 minutes - Fry the onions for 5 minutes." in user_prompt
+        assert "2. 1 hour - Simmer the sauce for 1 hour." in user_prompt
+        assert step_timers[0] == [{"seconds": 300, "label": "Soften onions", "source": "ai"}]
+        recipe.refresh_from_db()
+        assert recipe.step_timers[2][0]["label"] == "Simmer ragu"
+
+    def test_labelled_recipe_is_not_sent_again(self, recipe):
+        service_patch, service = _ai(["Soften onions", "Simmer ragu"])
+        with service_patch:
+            label_recipe_timers(recipe.id)
+            label_recipe_timers(recipe.id)
+
+        service.complete.assert_called_once()
+
+    def test_wrong_number_of_labels_keeps_local_labels(self, recipe):
+        service_patch, _ = _ai(["Soften onions"])
+
+        with service_patch, pytest.raises(ValidationError):
+            label_recipe_timers(recipe.id)
+
+        recipe.refresh_from_db()
+        assert recipe.step_timers[0][0] == {"seconds": 300, "label": "Fry Onions", "source": "local"}
+
+    def test_job_skips_without_api_key(self, recipe):
+        with patch("apps.ai.services.timer.OpenRouterService") as service_class:
+            run_timer_labels_job(BackgroundJob(job_type="label_timers", recipe_id=recipe.id))
+
+        service_class.assert_not_called()
+
+    def test_job_skips_deleted_recipe(self, recipe):
+        settings = AppSettings.get()
+        settings.openrouter_api_key = "sk-or-test"
+        settings.save()
+        recipe_id = recipe.id
+        recipe.delete()
+
+        run_timer_labels_job(BackgroundJob(job_type="label_timers", recipe_id=recipe_id))
+
+
+@pytest.mark.django_db
+def test_legacy_play_mode_serves_stored_labels(client, recipe):
+    client.post(f"/api/profiles/{recipe.profile_id}/select/")
+
+    response = client.get(f"/legacy/recipe/{recipe.id}/play/")
+
+    content = response.content.decode()
+    data = content.split('id="recipe-step-timers" type="application/json">')[1].split("</script>")[0]
+    assert json.loads(data)[0][0]["label"] == "Fry Onions"
@@ -0,0 +1,162 @@
+"""
+Tests for stored metric and imperial ingredient views.
+
+Tests apps/recipes/services/units.py and where it is used:
+- Ingredient lines are parsed into (quantity, unit, item) records
+- Lines are rendered in both unit systems, keeping lines that can't be converted
+- Views are stored at import and remix, and backfilled when a recipe is opened
+- GET /api/recipes/{id}/ and the legacy page show ingredients as written unless
+  the profile converts units, in which case its preferred view is shown
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.test import Client
+
+from apps.profiles.models import Profile
+from apps.recipes.models import Recipe
+from apps.recipes.services.units import build_unit_views, ensure_unit_views, parse_record
+
+CAKE = ["1 cup all-purpose flour", "8 oz butter, softened", "200 g sugar", "2 tbsp milk", "3 eggs", "Salt to taste"]
+GROUPS = [{"purpose": "Icing", "ingredients": ["1 cup milk", "1 cup aquafaba"]}]
+
+
+class TestBuildUnitViews:
+    def test_parse_record(self):
+        assert parse_record("1-2 cups milk, warmed") == {
+            "quantity": 1.0,
+            "quantity_max": 2.0,
+            "unit": "cup",
+            "item": "milk, warmed",
+        }
+        assert parse_record("Salt to taste") is None
+
+    def test_both_unit_systems(self):
+        views = build_unit_views(CAKE, GROUPS)
+
+        assert views["metric"]["ingredients"] == [
+            "125 g all-purpose flour",
+            "225 g butter, softened",
+            "200 g sugar",
+            "2 tbsp milk",
+            "3 eggs",
+            "Salt to taste",
+        ]
+        assert views["imperial"]["ingredients"][:3] == [
+            "1 cup all-purpose flour",
+            "8 oz butter, softened",
+            "7.1 oz sugar",
+        ]
+        assert [record and record["unit"] for record in views["parsed"]] == ["cup", "oz", "g", "tbsp", None, None]
+
+    def test_groups_keep_their_purpose_and_unconvertible_lines(self):
+        group = build_unit_views([], GROUPS)["metric"]["ingredient_groups"][0]
+
+        assert group == {"purpose": "Icing", "ingredients": ["235 ml milk", "1 cup aquafaba"]}
+
+
+@pytest.mark.django_db
+class TestStoredViews:
+    @pytest.fixture
+    def profile(self):
+        return Profile.objects.create(name="Cook", avatar_color="#d97850")
+
+    @pytest.fixture
+    def recipe(self, profile):
+        return Recipe.objects.create(
+            profile=profile, title="Cake", host="example.com", ingredients=CAKE, ingredient_groups=GROUPS
+        )
+
+    def test_backfilled_once_when_opened(self, recipe):
+        assert recipe.unit_views == {}
+
+        ensure_unit_views(recipe)
+        recipe.refresh_from_db()
+        assert recipe.unit_views["metric"]["ingredients"][0] == "125 g all-purpose flour"
+
+        with patch("apps.recipes.services.units.build_unit_views") as build:
+            ensure_unit_views(recipe)
+        build.assert_not_called()
+
+    def test_api_returns_lines_as_written_by_default(self, profile, recipe):
+        client = Client()
+        client.post(f"/api/profiles/{profile.id}/select/")
+
+        data = client.get(f"/api/recipes/{recipe.id}/").json()
+
+        assert data["ingredients"] == CAKE
+        assert data["ingredient_groups"] == GROUPS
+        assert data["unit_system"] is None
+        assert "unit_views" not in data
+        recipe.refresh_from_db()
+        assert recipe.unit_views == {}  # Not built for profiles that don't convert
+
+    @pytest.mark.parametrize(
+        "system,first_lines",
+        [
+            ("metric", ["125 g all-purpose flour", "225 g butter, softened", "200 g sugar"]),
+            ("imperial", ["1 cup all-purpose flour", "8 oz butter, softened", "7.1 oz sugar"]),
+        ],
+    )
+    def test_api_returns_preferred_units_when_converting(self, profile, recipe, system, first_lines):
+        Profile.objects.filter(pk=profile.pk).update(unit_preference=system, convert_units=True)
+        client = Client()
+        client.post(f"/api/profiles/{profile.id}/select/")
+
+        data = client.get(f"/api/recipes/{recipe.id}/").json()
+
+        assert data["ingredients"][:3] == first_lines
+        assert data["unit_system"] == system
+        recipe.refresh_from_db()
+        assert recipe.ingredients == CAKE  # Stored lines as written are untouched
+
+    def test_legacy_page_shows_preferred_units(self, profile, recipe):
+        Profile.objects.filter(pk=profile.pk).update(unit_preference="metric", convert_units=True)
+        client = Client()
+        client.post(f"/api/profiles/{profile.id}/select/")
+
+        content = client.get(f"/legacy/recipe/{recipe.id}/").content.decode()
+
+        assert "235 ml milk" in content  # The grouped lines are the ones shown
+        assert "1 cup milk" not in content
+
+    @patch("apps.ai.services.remix.enqueue_job")
+    @patch("apps.ai.services.remix.AIPrompt.get_prompt")
+    @patch("apps.ai.services.remix.OpenRouterService")
+    def test_stored_at_remix(self, mock_service_cls, mock_get_prompt, mock_enqueue, recipe):
+        from apps.ai.services.remix import create_remix
+
+        mock_service_cls.return_value.complete.return_value = {
+            "title": "Oat Cake",
+            "description": "With oats",
+            "ingredients": ["1 cup oats", "8 oz butter"],
+            "instructions": ["Mix.", "Bake."],
+            "yields": "8 servings",
+        }
+
+        remix = create_remix(recipe.id, "Add oats", recipe.profile)
+
+        assert remix.unit_views["metric"]["ingredients"] == ["90 g oats", "225 g butter"]
+
+
+def test_stored_at_import():
+    from apps.recipes.services.scraper import RecipeScraper
+
+    data = {"host": "example.com", "title": "Cake", "ingredients": CAKE, "ingredient_groups": GROUPS}
+    with (
+        patch("apps.recipes.models.Recipe") as recipe_cls,
+        patch("apps.recipes.services.scraper.sync_to_async", side_effect=_as_async),
+    ):
+        recipe_cls.side_effect = lambda **fields: MagicMock(**fields)
+        recipe = asyncio.run(RecipeScraper()._save_recipe(data, "https://example.com/c", MagicMock(), None))
+
+    assert recipe.unit_views == build_unit_views(CAKE, GROUPS)
+
+
+def _as_async(func):
+    async def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper